@@ -0,0 +1,20 @@
+import sys
+from pathlib import Path
+import os
+
+# Configuración de rutas del proyecto
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from app.asgi import create_asgi_app
+from config.settings import ProductionConfig
+
+# Crear la aplicación ASGI (endpoints de conversación asíncronos + Flask para el resto)
+app = create_asgi_app(ProductionConfig)
+
+# Punto de entrada: uvicorn api.asgi:app --host 0.0.0.0 --port $PORT
+if __name__ == '__main__':
+    port = int(os.environ.get('PORT', 5000))
+    import uvicorn
+    uvicorn.run(app, host='0.0.0.0', port=port)
@@ -0,0 +1,245 @@
+# app/asgi.py
+import re
+import json
+import time
+import asyncio
+import logging
+from urllib.parse import parse_qs
+
+from asgiref.wsgi import WsgiToAsgi
+from werkzeug.http import parse_cookie, dump_cookie
+
+from config.settings import DevelopmentConfig
+from app.factory import create_app
+from app.routes.conversation_routes import controllers
+from app.routes.ai.voiceRoutes import sse_event, voice_job_event, SSE_MAX_SECONDS, SSE_HEARTBEAT_SECONDS
+from app.constants.language import (
+    new_conversation_id,
+    set_current_conversation_id,
+    reset_current_conversation_id
+)
+from src.utils.tracing import start_trace, end_trace, current_trace, JsonlSpanExporter
+from src.utils.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_FLIGHT
+
+logger = logging.getLogger(__name__)
+
+# Endpoints de conversación servidos en el event loop: ruta -> (controlador, método asíncrono)
+ASYNC_ROUTES = {
+    '/api/ai/email/capture': ('email_capture', 'capture_email_async'),
+    '/api/ai/name/capture': ('name_capture', 'capture_name_async'),
+    '/api/ai/expert-connection/ask': ('expert_connection', 'ask_expert_connection_async'),
+    '/api/ai/test/process-text': ('text_processing', 'process_text_async'),
+}
+
+# Stream SSE de los trabajos de voz: en el event loop no ocupa un hilo de WSGI
+VOICE_JOB_EVENTS = re.compile(r'^/api/ai/voice/jobs/([^/]+)/events$')
+# Cada cuánto se comprueba el estado del trabajo mientras el stream está abierto
+SSE_POLL_SECONDS = 0.25
+
+
+class ConversationASGI:
+    """
+    Aplicación ASGI con modo asíncrono para los endpoints de conversación
+
+    Las rutas de ASYNC_ROUTES se atienden directamente en el event loop con
+    el cliente asíncrono de OpenAI: una conversación esperando al LLM no
+    ocupa ningún hilo, así que cientos de ellas caben en un solo proceso. El
+    resto de rutas (y los preflight OPTIONS) se delegan en la app Flask a
+    través de WsgiToAsgi.
+
+    Los streams SSE de los trabajos de voz también se sirven aquí, para que
+    un cliente esperando su transcripción no retenga un hilo durante un minuto.
+    """
+
+    def __init__(self, flask_app):
+        self.flask_app = flask_app
+        self.wsgi = WsgiToAsgi(flask_app)
+        self.allowed_origins = flask_app.config.get('ALLOWED_ORIGINS', [])
+        self.tracing_enabled = flask_app.config.get('TRACING_ENABLED', True)
+        self.config = flask_app.config
+        export_path = flask_app.config.get('TRACE_EXPORT_PATH')
+        self.trace_exporter = JsonlSpanExporter(export_path) if export_path else None
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+        elif scope['type'] == 'http' and scope['method'] == 'POST' and scope['path'] in ASYNC_ROUTES:
+            await self._handle_conversation(scope, receive, send)
+        elif scope['type'] == 'http' and scope['method'] == 'GET' and VOICE_JOB_EVENTS.match(scope['path']):
+            await self._stream_voice_job(scope, send, VOICE_JOB_EVENTS.match(scope['path']).group(1))
+        else:
+            await self.wsgi(scope, receive, send)
+
+    async def _lifespan(self, receive, send):
+        # Los servicios ya se crean en create_app; no hay nada que arrancar aquí
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _handle_conversation(self, scope, receive, send):
+        started = time.perf_counter()
+        HTTP_REQUESTS_IN_FLIGHT.inc(server='asgi')
+        try:
+            status_code = await self._serve_conversation(scope, receive, send)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec(server='asgi')
+        HTTP_REQUEST_DURATION.observe(
+            time.perf_counter() - started, method='POST', route=scope['path'], status=status_code
+        )
+
+    async def _serve_conversation(self, scope, receive, send) -> int:
+        headers = {
+            name.decode('latin-1').lower(): value.decode('latin-1')
+            for name, value in scope.get('headers', [])
+        }
+        body = await self._read_body(receive)
+
+        try:
+            data = json.loads(body) if body else None
+        except ValueError as e:
+            await self._send_json(send, headers, None, {'success': False, 'error': f"Invalid JSON: {str(e)}"}, 400)
+            return 400
+
+        # Misma asociación petición -> conversación que bind_conversation en la factory
+        query = parse_qs(scope.get('query_string', b'').decode('latin-1'))
+        conversation_id = (
+            headers.get('x-conversation-id') or
+            query.get('conversation_id', [None])[0] or
+            (data.get('conversation_id') if isinstance(data, dict) else None) or
+            parse_cookie(headers.get('cookie', '')).get(self.config['CONVERSATION_COOKIE'])
+        )
+        minted = not conversation_id
+        if minted:
+            conversation_id = new_conversation_id()
+        token = set_current_conversation_id(conversation_id)
+        controller_name, method_name = ASYNC_ROUTES[scope['path']]
+        trace_token = (
+            start_trace(controller_name, method='POST', path=scope['path'])
+            if self.tracing_enabled else None
+        )
+
+        try:
+            response = await getattr(self._controller(controller_name), method_name)(data)
+            status_code = 200 if response.get('success', False) else 400
+        except Exception as e:
+            logger.error("Error in async route %s: %s", scope['path'], e)
+            response = {'success': False, 'error': str(e)}
+            status_code = 500
+        finally:
+            reset_current_conversation_id(token)
+
+        try:
+            await self._send_json(send, headers, conversation_id, response, status_code, minted)
+        finally:
+            if trace_token is not None:
+                end_trace(trace_token, self.trace_exporter, status=status_code, conversation_id=conversation_id)
+        return status_code
+
+    async def _stream_voice_job(self, scope, send, job_id):
+        headers = {
+            name.decode('latin-1').lower(): value.decode('latin-1')
+            for name, value in scope.get('headers', [])
+        }
+        job_queue = self.flask_app.config['voice_jobs']
+        job = job_queue.get(job_id)
+        if not job:
+            await self._send_json(send, headers, None, {'success': False, 'error': 'Voice job not found or expired'}, 404)
+            return
+
+        await send({
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': [
+                (b'content-type', b'text/event-stream; charset=utf-8'),
+                (b'cache-control', b'no-cache'),
+                (b'x-accel-buffering', b'no')
+            ] + self._cors_headers(headers)
+        })
+
+        deadline = time.monotonic() + SSE_MAX_SECONDS
+        next_status = 0
+        while True:
+            event, payload, last = voice_job_event(job, deadline)
+            if last or time.monotonic() >= next_status:
+                await send({
+                    'type': 'http.response.body',
+                    'body': sse_event(event, payload).encode('utf-8'),
+                    'more_body': not last
+                })
+                next_status = time.monotonic() + SSE_HEARTBEAT_SECONDS
+            if last:
+                return
+            await asyncio.sleep(SSE_POLL_SECONDS)
+            job = job_queue.get(job_id)
+
+    def _controller(self, name: str):
+        # El registro resuelve los servicios compartidos desde app.config
+        with self.flask_app.app_context():
+            return controllers.get(name)
+
+    @staticmethod
+    async def _read_body(receive) -> bytes:
+        chunks = []
+        while True:
+            message = await receive()
+            chunks.append(message.get('body', b''))
+            if not message.get('more_body', False):
+                return b''.join(chunks)
+
+    def _cors_headers(self, headers):
+        # Mismas cabeceras CORS que after_request en la factory
+        origin = headers.get('origin')
+        if origin not in self.allowed_origins:
+            return []
+        return [
+            (b'access-control-allow-origin', origin.encode('latin-1')),
+            (b'access-control-allow-credentials', b'true'),
+            (b'access-control-allow-headers', b'Content-Type,Authorization,Accept,Origin,X-Conversation-Id'),
+            (b'access-control-allow-methods', b'GET,PUT,POST,DELETE,OPTIONS'),
+            (b'access-control-expose-headers', b'X-Conversation-Id')
+        ]
+
+    async def _send_json(self, send, headers, conversation_id, payload, status_code, minted=False):
+        body = json.dumps(payload).encode('utf-8')
+        response_headers = [
+            (b'content-type', b'application/json'),
+            (b'content-length', str(len(body)).encode('latin-1'))
+        ]
+
+        origin = headers.get('origin')
+        response_headers.extend(self._cors_headers(headers))
+        if conversation_id:
+            response_headers.append((b'x-conversation-id', conversation_id.encode('latin-1')))
+        if minted:
+            cookie = dump_cookie(
+                self.config['CONVERSATION_COOKIE'],
+                conversation_id,
+                max_age=self.config['CONVERSATION_COOKIE_MAX_AGE'],
+                httponly=True,
+                secure=self.config['CONVERSATION_COOKIE_SECURE'],
+                samesite=self.config['CONVERSATION_COOKIE_SAMESITE']
+            )
+            response_headers.append((b'set-cookie', cookie.encode('latin-1')))
+
+        trace = current_trace()
+        if trace is not None:
+            response_headers.append((b'server-timing', trace.server_timing().encode('latin-1')))
+            if origin in self.allowed_origins:
+                response_headers.append((b'timing-allow-origin', origin.encode('latin-1')))
+
+        await send({'type': 'http.response.start', 'status': status_code, 'headers': response_headers})
+        await send({'type': 'http.response.body', 'body': body})
+
+
+def create_asgi_app(config_class=DevelopmentConfig):
+    """
+    Crear la aplicación ASGI (servir con: uvicorn api.asgi:app)
+
+    :param config_class: Clase de configuración de la app Flask subyacente
+    :return: Aplicación ASGI
+    """
+    return ConversationASGI(create_app(config_class))
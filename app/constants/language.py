@@ -1,15 +1,26 @@
 # language.py - Módulo mejorado de detección y consistencia de idioma
 
 import re
+import threading
+from collections import OrderedDict, deque
 from typing import Dict, List, Optional, Tuple
 import os
 
-# Estado del módulo de idioma
+# La conversación en curso vive en un módulo hoja (sin imports de la app); se
+# reexporta aquí para los llamadores existentes
+from src.utils.conversation_context import (
+    DEFAULT_CONVERSATION_ID,
+    new_conversation_id,
+    set_current_conversation_id,
+    reset_current_conversation_id,
+    get_current_conversation_id
+)
+
+# Configuración compartida del módulo de idioma (patrones, mapeos, palabras ambiguas).
+# El estado que cambia en cada turno vive en SessionLanguageState, uno por conversación.
 class LanguageState:
     def __init__(self):
-        self.current_language = 'en-US'  # Idioma actual
-        self.language_history = []       # Historial de idiomas detectados
-        self.conversation_context = []   # Historial simplificado de la conversación
+        self.current_language = 'en-US'  # Idioma por defecto de las sesiones nuevas
         self.max_history = 10           # Número máximo de entradas en el historial
         
         # Mapeo de códigos ISO a códigos regionales
@@ -176,8 +187,103 @@ class LanguageState:
             ':)', ':(', ':D', ';)', '?', '!', '...', '♥', '👍', '🙏', '😊', '😂', '🤔', '👀', '🔥'
         ])
 
-# Instancia global del estado de idioma
+class SessionLanguageState:
+    """Estado de idioma de una conversación"""
+    __slots__ = ('current_language', 'language_history', 'conversation_context')
+
+    def __init__(self, default_language: str = 'en-US', max_history: int = 10):
+        self.current_language = default_language
+        # deque con maxlen: append atómico y descarte automático de las entradas antiguas
+        self.language_history = deque(maxlen=max_history)
+        self.conversation_context = deque(maxlen=max_history)
+
+
+class LanguageSessionStore:
+    """
+    Almacén de estados de idioma por conversación con expulsión LRU
+
+    Las lecturas no toman el lock (dict.get es atómico); sólo la creación,
+    el reinicio y la actualización del orden LRU lo hacen.
+    """
+
+    def __init__(self, max_sessions: int = 5000):
+        self.max_sessions = max_sessions
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, conversation_id: str) -> Optional[SessionLanguageState]:
+        return self._sessions.get(conversation_id)
+
+    def get_or_create(self, conversation_id: str) -> SessionLanguageState:
+        state = self._sessions.get(conversation_id)
+        with self._lock:
+            if state is None:
+                state = self._sessions.get(conversation_id)
+            if state is None:
+                state = SessionLanguageState(
+                    _language_state.current_language,
+                    _language_state.max_history
+                )
+                self._sessions[conversation_id] = state
+                while len(self._sessions) > self.max_sessions:
+                    self._sessions.popitem(last=False)
+            else:
+                self._sessions.move_to_end(conversation_id)
+        return state
+
+    def discard(self, conversation_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(conversation_id, None)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+# Configuración compartida y estados por conversación
 _language_state = LanguageState()
+_language_sessions = LanguageSessionStore()
+
+def _current_session() -> Optional[SessionLanguageState]:
+    """Estado de la conversación en curso sin crearlo (lectura sin lock)"""
+    return _language_sessions.get(get_current_conversation_id())
+
+def _current_language() -> str:
+    session = _current_session()
+    return session.current_language if session else _language_state.current_language
+
+def _compile_language_tables(language_patterns: Dict) -> Tuple[List[str], Dict[str, int], Dict[str, int], int]:
+    """
+    Compila los patrones de idioma en tablas de búsqueda (una sola vez al importar)
+    
+    Cada idioma ocupa un bit. La tabla de caracteres mapea cada carácter al
+    conjunto (máscara) de idiomas que lo usan y el índice invertido hace lo
+    mismo con las palabras comunes.
+    
+    Returns:
+        Tupla (idiomas en orden de bit, carácter -> máscara, palabra -> máscara,
+        máscara de idiomas con caracteres propios)
+    """
+    languages = list(language_patterns.keys())
+    char_masks: Dict[str, int] = {}
+    word_masks: Dict[str, int] = {}
+    languages_with_chars = 0
+
+    for bit, lang in enumerate(languages):
+        flag = 1 << bit
+        patterns = language_patterns[lang]
+        if patterns['chars']:
+            languages_with_chars |= flag
+        for char in patterns['chars']:
+            char_masks[char] = char_masks.get(char, 0) | flag
+        for word in set(patterns['common_words']):
+            word_masks[word] = word_masks.get(word, 0) | flag
+
+    return languages, char_masks, word_masks, languages_with_chars
+
+_LANGUAGES, _CHAR_MASKS, _WORD_MASKS, _LANGUAGES_WITH_CHARS = _compile_language_tables(
+    _language_state.language_patterns
+)
+_WORD_PATTERN = re.compile(r'\b\w+\b')
 
 def normalize_language_code(language_code: str) -> str:
     """
@@ -190,7 +296,7 @@ def normalize_language_code(language_code: str) -> str:
         Código de idioma normalizado
     """
     if not language_code or not isinstance(language_code, str):
-        return _language_state.current_language
+        return _current_language()
     
     # Eliminar espacios y convertir a minúsculas
     language_code = language_code.strip().lower()
@@ -211,7 +317,7 @@ def normalize_language_code(language_code: str) -> str:
         )
     
     # Si no se puede normalizar, devolver el idioma actual
-    return _language_state.current_language
+    return _current_language()
 
 def is_text_ambiguous(text: str) -> bool:
     """
@@ -246,10 +352,26 @@ def is_text_ambiguous(text: str) -> bool:
         
     return False
 
+def _expand_mask_counts(mask_counts: Dict[int, int]) -> List[int]:
+    """Reparte los contadores por máscara entre los idiomas de cada máscara"""
+    counts = [0] * len(_LANGUAGES)
+    for mask, count in mask_counts.items():
+        bit = 0
+        while mask:
+            if mask & 1:
+                counts[bit] += count
+            mask >>= 1
+            bit += 1
+    return counts
+
 def analyze_language_patterns(text: str) -> Dict[str, float]:
     """
     Analiza los patrones lingüísticos en el texto para determinar el idioma probable
     
+    Recorre el texto y sus palabras una sola vez usando las tablas compiladas
+    (_CHAR_MASKS, _WORD_MASKS) y acumula las puntuaciones de todos los idiomas
+    a la vez.
+    
     Args:
         text: Texto a analizar
         
@@ -258,29 +380,38 @@ def analyze_language_patterns(text: str) -> Dict[str, float]:
     """
     # Texto limpio para análisis
     cleaned_text = text.lower()
-    words = re.findall(r'\b\w+\b', cleaned_text)
+    words = _WORD_PATTERN.findall(cleaned_text)
+    
+    # Contar coincidencias agrupadas por máscara de idiomas
+    char_mask_counts: Dict[int, int] = {}
+    char_masks_get = _CHAR_MASKS.get
+    for char in cleaned_text:
+        mask = char_masks_get(char)
+        if mask:
+            char_mask_counts[mask] = char_mask_counts.get(mask, 0) + 1
+
+    word_mask_counts: Dict[int, int] = {}
+    word_masks_get = _WORD_MASKS.get
+    for word in words:
+        mask = word_masks_get(word)
+        if mask:
+            word_mask_counts[mask] = word_mask_counts.get(mask, 0) + 1
+
+    char_matches = _expand_mask_counts(char_mask_counts)
+    word_matches = _expand_mask_counts(word_mask_counts)
+    text_length = max(len(cleaned_text), 1)
+    word_count = max(len(words), 1)
     
     scores = {}
-    
-    # Analizar patrones para cada idioma
-    for lang, patterns in _language_state.language_patterns.items():
-        score = 0.0
-        
-        # Puntuación por caracteres específicos
-        char_matches = sum(1 for c in cleaned_text if c in patterns['chars'])
-        char_score = char_matches / max(len(cleaned_text), 1) * 100
-        
-        # Puntuación por palabras comunes
-        word_matches = sum(1 for word in words if word in patterns['common_words'])
-        word_score = word_matches / max(len(words), 1) * 100
+    for bit, lang in enumerate(_LANGUAGES):
+        char_score = char_matches[bit] / text_length * 100
+        word_score = word_matches[bit] / word_count * 100
         
         # Combinación de puntuaciones (caracteres tienen más peso para idiomas distintivos)
-        if patterns['chars']:
-            score = (char_score * 0.7) + (word_score * 0.3)
+        if _LANGUAGES_WITH_CHARS >> bit & 1:
+            scores[lang] = (char_score * 0.7) + (word_score * 0.3)
         else:
-            score = word_score
-            
-        scores[lang] = score
+            scores[lang] = word_score
     
     return scores
 
@@ -294,23 +425,25 @@ def evaluate_context_consistency(detected_lang: str) -> float:
     Returns:
         Puntuación de consistencia (0-1)
     """
-    if not _language_state.language_history:
+    session = _current_session()
+    language_history = list(session.language_history) if session else []
+    if not language_history:
         return 0.5  # Neutral si no hay historial
     
     # Contar frecuencia de idiomas en el historial
     lang_counts = {}
-    for lang in _language_state.language_history:
+    for lang in language_history:
         base_lang = lang.split('-')[0]
         lang_counts[base_lang] = lang_counts.get(base_lang, 0) + 1
     
     # Calcular consistencia basada en frecuencia
     detected_base = detected_lang.split('-')[0]
-    total_entries = len(_language_state.language_history)
+    total_entries = len(language_history)
     
     consistency = lang_counts.get(detected_base, 0) / total_entries
     
     # Dar más peso a entradas recientes
-    if _language_state.language_history and detected_base == _language_state.language_history[-1].split('-')[0]:
+    if detected_base == language_history[-1].split('-')[0]:
         consistency += 0.2  # Bonus por coincidencia con el último idioma
     
     return min(consistency, 1.0)  # Limitar a 1.0
@@ -327,17 +460,17 @@ def detect_language(text: str) -> Tuple[str, float]:
     """
     # Si el texto está vacío, mantener el idioma actual
     if not text or not text.strip():
-        return _language_state.current_language, 1.0
+        return _current_language(), 1.0
     
     # Para textos ambiguos, preferir el idioma actual
     if is_text_ambiguous(text):
-        return _language_state.current_language, 0.8
+        return _current_language(), 0.8
     
     # Analizar patrones lingüísticos
     lang_scores = analyze_language_patterns(text)
     
     if not lang_scores:
-        return _language_state.current_language, 0.5
+        return _current_language(), 0.5
     
     # Encontrar el idioma con mayor puntuación
     best_lang = max(lang_scores.items(), key=lambda x: x[1])
@@ -354,7 +487,7 @@ def detect_language(text: str) -> Tuple[str, float]:
     
     # Si la confianza es muy baja, mantener el idioma actual
     if combined_confidence < 0.4:
-        return _language_state.current_language, 0.5
+        return _current_language(), 0.5
     
     # Obtener código regional del idioma
     detected_language = normalize_language_code(lang_code)
@@ -363,7 +496,7 @@ def detect_language(text: str) -> Tuple[str, float]:
 
 def update_last_detected_language(language: Optional[str] = None, text: Optional[str] = None) -> str:
     """
-    Actualiza el último idioma detectado con lógica avanzada
+    Actualiza el último idioma detectado de la conversación en curso
     
     Args:
         language: Código de idioma proporcionado externamente (opcional)
@@ -372,7 +505,7 @@ def update_last_detected_language(language: Optional[str] = None, text: Optional
     Returns:
         Código de idioma actualizado
     """
-    detected_language = _language_state.current_language
+    detected_language = _current_language()
     confidence = 0.5
     
     # Si se proporciona texto pero no idioma, detectar idioma
@@ -383,42 +516,38 @@ def update_last_detected_language(language: Optional[str] = None, text: Optional
         detected_language = normalize_language_code(language)
         confidence = 0.9  # Alta confianza para detecciones externas
     
+    session = _language_sessions.get_or_create(get_current_conversation_id())
+    
     # Actualizar el historial solo si hay suficiente confianza
+    # (el deque descarta las entradas más antiguas al superar max_history)
     if confidence >= 0.5:
-        _language_state.current_language = detected_language
-        _language_state.language_history.append(detected_language)
-        
-        # Mantener historial con tamaño máximo
-        if len(_language_state.language_history) > _language_state.max_history:
-            _language_state.language_history.pop(0)
+        session.current_language = detected_language
+        session.language_history.append(detected_language)
     
     # Actualizar contexto de conversación si se proporciona texto
     if text:
-        _language_state.conversation_context.append(text[:100])  # Guardar solo los primeros 100 caracteres
-        
-        # Mantener contexto con tamaño máximo
-        if len(_language_state.conversation_context) > _language_state.max_history:
-            _language_state.conversation_context.pop(0)
+        session.conversation_context.append(text[:100])  # Guardar solo los primeros 100 caracteres
     
-    return _language_state.current_language
+    return session.current_language
 
 def get_last_detected_language() -> str:
     """
-    Obtiene el último idioma detectado
+    Obtiene el último idioma detectado de la conversación en curso
     
     Returns:
         Código de idioma actual
     """
-    return _language_state.current_language
+    return _current_language()
 
 def get_language_history() -> List[str]:
     """
-    Obtiene el historial de idiomas detectados
+    Obtiene el historial de idiomas detectados de la conversación en curso
     
     Returns:
         Lista de códigos de idioma detectados
     """
-    return _language_state.language_history.copy()
+    session = _current_session()
+    return list(session.language_history) if session else []
 
 def reset_last_detected_language(default_language: str = 'en-US') -> str:
     """
@@ -431,7 +560,7 @@ def reset_last_detected_language(default_language: str = 'en-US') -> str:
 
 def reset_language_state(default_language: str = 'en-US') -> str:
     """
-    Reinicia el estado del idioma
+    Reinicia el estado del idioma de la conversación en curso
     
     Args:
         default_language: Idioma por defecto
@@ -439,9 +568,10 @@ def reset_language_state(default_language: str = 'en-US') -> str:
     Returns:
         Idioma por defecto establecido
     """
-    _language_state.current_language = default_language
-    _language_state.language_history = []
-    _language_state.conversation_context = []
+    session = _language_sessions.get_or_create(get_current_conversation_id())
+    session.current_language = default_language
+    session.language_history.clear()
+    session.conversation_context.clear()
     return default_language
 
 def process_message(text: str) -> Dict:
@@ -454,7 +584,7 @@ def process_message(text: str) -> Dict:
     Returns:
         Diccionario con información de detección
     """
-    previous_language = _language_state.current_language
+    previous_language = _current_language()
     
     # Si el texto está vacío, mantener el idioma actual
     if not text or not text.strip():
@@ -1,3 +1,4 @@
+import logging
 from src.utils.chatgpt_helper import ChatGPTHelper
 from src.services.external.zoho_services import ZohoService
 from app.services.excluded_companies_service import ExcludedCompaniesService
@@ -9,6 +10,8 @@ from app.constants.language import (
     update_last_detected_language
 )
 
+logger = logging.getLogger(__name__)
+
 class ClientPerspectiveController:
     def __init__(
         self, 
@@ -38,19 +41,19 @@ class ClientPerspectiveController:
         :param data: Datos de la solicitud
         :return: Resultado de validación
         """
-        print("\n=== Input Validation ===")
+        logger.debug("Input Validation")
         if not data:
-            print("No data provided")
+            logger.debug("No data provided")
             return {
                 'is_valid': False,
                 'error': 'No data provided'
             }
         
-        print(f"Received data: {data}")
+        logger.debug("Received data: %s", data)
         
         # Verificar si el campo 'answer' contiene texto sin sentido
         if 'answer' in data and self._is_nonsense_text(data['answer']):
-            print("Nonsense text detected in answer")
+            logger.debug("Nonsense text detected in answer")
             return {
                 'is_valid': False,
                 'error': 'nonsense_input',
@@ -90,22 +93,22 @@ class ClientPerspectiveController:
         :param data: Datos de la solicitud
         :return: Idioma detectado
         """
-        print("\n=== Language Processing ===")
+        logger.debug("Language Processing")
         current_language = get_last_detected_language()
-        print(f"Current detected language: {current_language}")
+        logger.debug("Current detected language: %s", current_language)
         
         try:
             # Priorizar idioma proporcionado explícitamente
             if 'detected_language' in data:
                 detected_language = data['detected_language']
-                print(f"Language from data: {detected_language}")
+                logger.debug("Language from data: %s", detected_language)
                 update_last_detected_language(detected_language)
                 return detected_language
             
             # También verificar si hay un idioma en 'language'
             if 'language' in data:
                 detected_language = data['language']
-                print(f"Language from data 'language' field: {detected_language}")
+                logger.debug("Language from data 'language' field: %s", detected_language)
                 update_last_detected_language(detected_language)
                 return detected_language
             
@@ -118,12 +121,12 @@ class ClientPerspectiveController:
                 )
                 detected_language = text_processing_result.get('detected_language', current_language)
                 
-                print(f"Input answer: {data['answer']}")
-                print(f"Detected language: {detected_language}")
+                logger.debug("Input answer: %s", data['answer'])
+                logger.debug("Detected language: %s", detected_language)
                 
                 # CLAVE: Mantener el idioma original de la conversación
                 if detected_language != current_language:
-                    print(f"Language detection attempted to change from {current_language} to {detected_language}")
+                    logger.debug("Language detection attempted to change from %s to %s", current_language, detected_language)
                     detected_language = current_language
                 
                 # Actualizar el último idioma detectado
@@ -135,7 +138,7 @@ class ClientPerspectiveController:
             return current_language
         
         except Exception as e:
-            print(f"Error in language detection: {e}")
+            logger.error("Error in language detection: %s", e)
             return current_language
 
     def process_client_perspective(self, data):
@@ -146,24 +149,24 @@ class ClientPerspectiveController:
         :return: Respuesta procesada
         """
         try:
-            print("\n=== Processing Client Perspective ===")
+            logger.debug("Processing Client Perspective")
             
             # Importante: Verificar si hay un idioma explícito en los datos
             if data and isinstance(data, dict):
                 if 'language' in data:
                     explicit_language = data['language']
-                    print(f"Using explicit language from data: {explicit_language}")
+                    logger.debug("Using explicit language from data: %s", explicit_language)
                     update_last_detected_language(explicit_language)
                 elif 'detected_language' in data:
                     explicit_language = data['detected_language']
-                    print(f"Using detected_language from data: {explicit_language}")
+                    logger.debug("Using detected_language from data: %s", explicit_language)
                     update_last_detected_language(explicit_language)
                 # Verificar en filtersApplied dentro de phase3_data
                 elif 'phase3_data' in data and isinstance(data['phase3_data'], dict):
                     filters = data['phase3_data'].get('filtersApplied', {})
                     if filters and isinstance(filters, dict) and 'detected_language' in filters:
                         explicit_language = filters['detected_language']
-                        print(f"Using language from phase3_data.filtersApplied: {explicit_language}")
+                        logger.debug("Using language from phase3_data.filtersApplied: %s", explicit_language)
                         update_last_detected_language(explicit_language)
             
             # Validar entrada
@@ -196,7 +199,7 @@ class ClientPerspectiveController:
             
             # Procesar idioma - usando exactamente el mismo método que ExcludeCompaniesController
             detected_language = self._process_language(validation_result['data'])
-            print(f"Detected Language: {detected_language}")
+            logger.debug("Detected Language: %s", detected_language)
             
             # IMPORTANTE: Asegurarse de que el idioma detectado se actualice correctamente
             update_last_detected_language(detected_language)
@@ -209,24 +212,23 @@ class ClientPerspectiveController:
             
             # Si no hay respuesta, solicitar perspectiva
             if not validation_result['data'].get('answer'):
-                print("No answer provided, requesting initial perspective")
+                logger.debug("No answer provided, requesting initial perspective")
                 response = self._request_initial_perspective(detected_language, validation_result['data'])
             else:
                 # Procesar respuesta de perspectiva
-                print(f"Processing answer: {validation_result['data']['answer']}")
+                logger.debug("Processing answer: %s", validation_result['data']['answer'])
                 response = self._process_perspective_response(validation_result['data'], detected_language)
             
             # Añadir código de estado a la respuesta
             response['status_code'] = 200 if response.get('success', False) else 400
             
-            print("\n=== Final Response ===")
-            print(f"Response: {response}")
+            logger.debug("Final Response")
+            logger.debug("Response: %s", response)
             
             return response
 
         except Exception as e:
-            print(f"\n=== Error in process_client_perspective ===")
-            print(f"Error details: {str(e)}")
+            logger.exception("Error in process_client_perspective")
             
             # Usar el mensaje base y traducirlo si es necesario
             current_language = get_last_detected_language()
@@ -251,7 +253,7 @@ class ClientPerspectiveController:
         :param data: Datos de la solicitud
         :return: Respuesta procesada
         """
-        print("\n=== Negative Response Handling ===")
+        logger.debug("Negative Response Handling")
         
         # Traducir mensaje de respuesta negativa
         response_message = self.chatgpt.translate_message(
@@ -259,7 +261,7 @@ class ClientPerspectiveController:
             detected_language
         )
         
-        print(f"Response message: {response_message}")
+        logger.debug("Response message: %s", response_message)
         
         return {
             'success': True,
@@ -279,7 +281,7 @@ class ClientPerspectiveController:
         :param detected_language: Idioma detectado
         :return: Respuesta procesada
         """
-        print("\n=== Unclear Response Handling ===")
+        logger.debug("Unclear Response Handling")
         
         # Traducir mensaje de solicitud de aclaración
         response_message = self.chatgpt.translate_message(
@@ -287,7 +289,7 @@ class ClientPerspectiveController:
             detected_language
         )
         
-        print(f"Response message: {response_message}")
+        logger.debug("Response message: %s", response_message)
         
         return {
             'success': False,
@@ -302,7 +304,7 @@ class ClientPerspectiveController:
         
         :param language: Idioma por defecto
         """
-        print(f"\n=== Resetting Last Detected Language to: {language} ===")
+        logger.debug("Resetting Last Detected Language to: %s", language)
         reset_last_detected_language()
 
     def _request_initial_perspective(self, detected_language, data):
@@ -313,8 +315,8 @@ class ClientPerspectiveController:
         :param data: Datos de la solicitud
         :return: Respuesta inicial
         """
-        print("\n=== Initial Perspective Request ===")
-        print(f"Detected language: {detected_language}")
+        logger.debug("Initial Perspective Request")
+        logger.debug("Detected language: %s", detected_language)
         
         # Traducir el mensaje base al idioma detectado
         initial_message = self.chatgpt.translate_message(
@@ -322,8 +324,8 @@ class ClientPerspectiveController:
             detected_language
         )
         
-        print(f"Base message: {self.BASE_MESSAGES['ask_client_perspective']}")
-        print(f"Translated message: {initial_message}")
+        logger.debug("Base message: %s", self.BASE_MESSAGES['ask_client_perspective'])
+        logger.debug("Translated message: %s", initial_message)
         
         return {
             'success': True,
@@ -342,16 +344,16 @@ class ClientPerspectiveController:
         :param detected_language: Idioma detectado
         :return: Respuesta procesada
         """
-        print("\n=== Perspective Response Processing ===")
+        logger.debug("Perspective Response Processing")
         answer = data['answer'].strip()
-        print(f"Input answer: '{answer}'")
-        print(f"Using language: {detected_language}")
+        logger.debug("Input answer: '%s'", answer)
+        logger.debug("Using language: %s", detected_language)
         
         # Usar extract_intention para todas las respuestas
         intention_result = self.chatgpt.extract_intention(answer)
         intention = intention_result.get('intention') if intention_result.get('success') else None
         
-        print(f"Extracted intention: {intention}")
+        logger.debug("Extracted intention: %s", intention)
 
         # Manejar respuesta basado en la intención
         if intention == 'yes':
@@ -369,18 +371,18 @@ class ClientPerspectiveController:
         :param detected_language: Idioma detectado
         :return: Respuesta con empresas cliente
         """
-        print("\n=== Positive Response Handling ===")
-        print(f"Sector: {data.get('sector', 'Financial Services')}")
-        print(f"Region: {data.get('region', 'Europe')}")
+        logger.debug("Positive Response Handling")
+        logger.debug("Sector: %s", data.get('sector', 'Financial Services'))
+        logger.debug("Region: %s", data.get('region', 'Europe'))
         
         try:
             # Obtener empresas excluidas si están disponibles
             excluded_companies = []
             try:
                 excluded_companies = self.excluded_companies_service.get_excluded_companies()
-                print(f"Found {len(excluded_companies)} excluded companies")
+                logger.debug("Found %s excluded companies", len(excluded_companies))
             except Exception as e:
-                print(f"Error getting excluded companies: {e}")
+                logger.error("Error getting excluded companies: %s", e)
         
             # Usar get_client_side_companies
             client_companies_result = self.chatgpt.get_client_side_companies(
@@ -389,8 +391,8 @@ class ClientPerspectiveController:
                 excluded_companies=excluded_companies
             )
             
-            print(f"Client Companies Result Success: {client_companies_result.get('success', False)}")
-            print(f"Number of companies found: {len(client_companies_result.get('content', []))}")
+            logger.debug("Client Companies Result Success: %s", client_companies_result.get('success', False))
+            logger.debug("Number of companies found: %s", len(client_companies_result.get('content', [])))
             
             if not client_companies_result.get('success', False):
                 error_message = "Error generating client companies"
@@ -427,7 +429,7 @@ class ClientPerspectiveController:
                 'status_code': 200
             }
         except Exception as e:
-            print(f"Error in _handle_positive_response: {str(e)}")
+            logger.error("Error in _handle_positive_response: %s", e)
             error_message = self.chatgpt.translate_message(
                 self.BASE_MESSAGES['processing_error'],
                 detected_language
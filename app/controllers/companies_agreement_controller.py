@@ -1,9 +1,12 @@
+import logging
 from src.utils.chatgpt_helper import ChatGPTHelper
 from app.constants.language import get_last_detected_language, update_last_detected_language
 
+logger = logging.getLogger(__name__)
+
 class CompaniesAgreementController:
-    def __init__(self):
-        self.chatgpt = ChatGPTHelper()
+    def __init__(self, chatgpt=None):
+        self.chatgpt = chatgpt or ChatGPTHelper()
         # Utilizar el sistema global de idioma en lugar de variable local
         # self.last_detected_language = get_last_detected_language() or 'en-US'
         
@@ -76,8 +79,8 @@ class CompaniesAgreementController:
             intention = self.chatgpt.extract_intention(input_text)
             
             # Log de depuración
-            print(f"\n=== Intention Extraction ===")
-            print(f"Raw Intention: {intention}")
+            logger.debug("Intention Extraction")
+            logger.debug("Raw Intention: %s", intention)
             
             # Validar intención
             if intention is None or (isinstance(intention, dict) and intention.get('success') is False):
@@ -96,8 +99,8 @@ class CompaniesAgreementController:
             response['status_code'] = 200
             
             # Log de depuración de la respuesta final
-            print("\n=== Final Response ===")
-            print(f"Response: {response}")
+            logger.debug("Final Response")
+            logger.debug("Response: %s", response)
             
             return response
 
@@ -116,9 +119,7 @@ class CompaniesAgreementController:
                 translated_error = error_message
 
             # Log de error detallado
-            print("\n=== Error Handling ===")
-            print(f"Error type: {type(e)}")
-            print(f"Error details: {str(e)}")
+            logger.exception("Error in process_companies_agreement")
             
             return {
                 'success': False,
@@ -137,8 +138,8 @@ class CompaniesAgreementController:
         :return: Diccionario de respuesta
         """
         # Depuración de la intención de entrada
-        print("\n=== Response Generation ===")
-        print(f"Input Intention: {intention}")
+        logger.debug("Response Generation")
+        logger.debug("Input Intention: %s", intention)
         
         # Manejar diferentes formatos de intención
         is_positive = False
@@ -186,7 +187,7 @@ class CompaniesAgreementController:
                 }
         
         # Log de depuración de la interpretación
-        print(f"Interpreted as Positive: {is_positive}")
+        logger.debug("Interpreted as Positive: %s", is_positive)
         
         # Seleccionar mensaje base
         response_message = (
@@ -209,7 +210,7 @@ class CompaniesAgreementController:
         }
         
         # Log de depuración de la respuesta generada
-        print(f"Generated Response: {response}")
+        logger.debug("Generated Response: %s", response)
         
         return response
 
@@ -158,7 +158,7 @@ class LanguageManagementService:
                     update_last_detected_language(detected_language)
             
         except Exception as e:
-            self.logger.warning(f"Language detection failed: {str(e)}")
+            self.logger.warning("Language detection failed: %s", e)
             # Mantener el idioma actual
             # No forzar cambio a inglés si ya hay un idioma establecido
             
@@ -169,7 +169,7 @@ class LanguageManagementService:
         :param language: Idioma a establecer (predeterminado: 'en-US')
         """
         reset_last_detected_language(language)
-        self.logger.info(f"Last detected language reset to: {language}")
+        self.logger.info("Last detected language reset to: %s", language)
 
 class CompanyProcessingService:
     """
@@ -304,9 +304,9 @@ class CompanyProcessingService:
         }
 
 class CompanySuggestionsController:
-    def __init__(self):
-        self.chatgpt = ChatGPTHelper()
-        self.zoho_service = ZohoService()
+    def __init__(self, chatgpt=None, zoho_service=None):
+        self.chatgpt = chatgpt or ChatGPTHelper()
+        self.zoho_service = zoho_service or ZohoService()
         self.logger = logging.getLogger(__name__)
         self.excluded_companies = set()
         
@@ -349,7 +349,7 @@ class CompanySuggestionsController:
             region_text = region.get('name') or region.get('region') or region.get('original_location')
             # Si no podemos extraer un valor de texto, convertir a string
             if not region_text:
-                self.logger.warning(f"Region is a dictionary without expected keys: {region}")
+                self.logger.warning("Region is a dictionary without expected keys: %s", region)
                 region_text = str(region)
             region = region_text
         
@@ -453,7 +453,7 @@ class CompanySuggestionsController:
             preselected_companies = validation_result['preselected_companies']
 
             # Registro de información
-            self.logger.info(f"Processing company suggestions - Sector: {sector}, Region: {region}")
+            self.logger.info("Processing company suggestions - Sector: %s, Region: %s", sector, region)
 
             # Obtener sugerencias de empresas
             companies_result = self.company_service.get_companies_suggestions(
@@ -6,8 +6,8 @@ from app.services.registration_service import RegistrationService
 from app.constants.language import get_last_detected_language, update_last_detected_language, reset_last_detected_language
 
 class EmailCaptureController:
-    def __init__(self):
-        self.chatgpt = ChatGPTHelper()
+    def __init__(self, chatgpt=None):
+        self.chatgpt = chatgpt or ChatGPTHelper()
         self.logger = logging.getLogger(__name__)
 
     def validate_input(self, data):
@@ -41,11 +41,19 @@ class EmailCaptureController:
         :param data: Datos de la solicitud
         :return: Respuesta procesada
         """
+        return self.chatgpt.run_steps(self.capture_email_steps(data))
+
+    async def capture_email_async(self, data):
+        """Igual que capture_email, esperando al LLM sin bloquear el event loop (modo ASGI)"""
+        return await self.chatgpt.run_steps_async(self.capture_email_steps(data))
+
+    def capture_email_steps(self, data):
+        """Flujo de captura de email; cede cada llamada al LLM (ver ChatGPTHelper.run_steps)"""
         try:
             # Validar entrada
             validation_result = self.validate_input(data)
             if not validation_result['is_valid']:
-                self.logger.error(f"Input validation failed: {validation_result['error']}")
+                self.logger.error("Input validation failed: %s", validation_result['error'])
                 return {
                     'success': False,
                     'error': validation_result['error'],
@@ -55,10 +63,10 @@ class EmailCaptureController:
             input_text = validation_result['text']
             
             # Registro de depuración
-            self.logger.info(f"Processing email capture for input: {input_text}")
+            self.logger.info("Processing email capture for input: %s", input_text)
             
             # Extracción de email
-            email_extraction_result = self.chatgpt.extract_email(input_text)
+            email_extraction_result = yield from self.chatgpt.extract_email_steps(input_text)
             
             if not email_extraction_result['success']:
                 self.logger.warning("Email extraction failed")
@@ -68,7 +76,7 @@ class EmailCaptureController:
                 
                 # Traducir mensaje de error sobre formato de email inválido
                 error_base_message = "Please provide a valid email address (e.g. example@domain.com)"
-                translated_error = self.chatgpt.translate_message(error_base_message, current_language)
+                translated_error = yield from self.chatgpt.translate_message_steps(error_base_message, current_language)
                 
                 return {
                     'success': False,
@@ -83,7 +91,7 @@ class EmailCaptureController:
             current_language = get_last_detected_language()
             
             # Procesamiento de idioma
-            text_processing_result = self.chatgpt.process_text_input(
+            text_processing_result = yield from self.chatgpt.process_text_input_steps(
                 input_text, 
                 current_language
             )
@@ -97,7 +105,7 @@ class EmailCaptureController:
             
             # Preparar mensaje base
             base_message = "Thank you for your email. What is your name?"
-            translated_message = self.chatgpt.translate_message(base_message, detected_language)
+            translated_message = yield from self.chatgpt.translate_message_steps(base_message, detected_language)
             
             # Preparar respuesta
             response = {
@@ -109,11 +117,14 @@ class EmailCaptureController:
                 'message': translated_message,
                 'next_action': 'provide_name'
             }
+            # Posibles erratas en el dominio: el frontend puede preguntar "¿quisiste decir...?"
+            if email_extraction_result.get('suggestions'):
+                response['suggestions'] = email_extraction_result['suggestions']
 
             # Información adicional si no está registrado
             if not is_registered:
                 booking_base_message = "Please book a call to complete your registration"
-                booking_message = self.chatgpt.translate_message(booking_base_message, detected_language)
+                booking_message = yield from self.chatgpt.translate_message_steps(booking_base_message, detected_language)
                 
                 response.update({
                     'action_required': "book_call",
@@ -122,7 +133,7 @@ class EmailCaptureController:
                 })
 
             # Registro de éxito
-            self.logger.info(f"Email capture successful for email: {email}")
+            self.logger.info("Email capture successful for email: %s", email)
             
             return response
 
@@ -136,7 +147,7 @@ class EmailCaptureController:
                 current_language = get_last_detected_language()
                 
                 # Intentar traducir mensaje de error
-                translated_error = self.chatgpt.translate_message(
+                translated_error = yield from self.chatgpt.translate_message_steps(
                     "An error occurred while processing your request.", 
                     current_language
                 )
@@ -155,4 +166,4 @@ class EmailCaptureController:
         :param language: Idioma por defecto
         """
         reset_last_detected_language()
-        self.logger.info(f"Last detected language reset to: {language}")
\ No newline at end of file
+        self.logger.info("Last detected language reset to: %s", language)
\ No newline at end of file
@@ -1,3 +1,4 @@
+import logging
 from src.utils.chatgpt_helper import ChatGPTHelper
 from src.services.external.zoho_services import ZohoService
 import re
@@ -8,10 +9,12 @@ from app.constants.language import (
     reset_last_detected_language
 )
 
+logger = logging.getLogger(__name__)
+
 class EmploymentStatusController:
-    def __init__(self):
-        self.chatgpt = ChatGPTHelper()
-        self.zoho_service = ZohoService()
+    def __init__(self, chatgpt=None, zoho_service=None):
+        self.chatgpt = chatgpt or ChatGPTHelper()
+        self.zoho_service = zoho_service or ZohoService()
         
         self.BASE_MESSAGES = {
             'ask_preference': "Would you prefer experts who currently work at these companies, who worked there previously, or both options?",
@@ -33,19 +36,19 @@ class EmploymentStatusController:
         :param data: Datos de la solicitud
         :return: Resultado de validación
         """
-        print("\n=== Input Validation ===")
+        logger.debug("Input Validation")
         if not data:
-            print("No data provided")
+            logger.debug("No data provided")
             return {
                 'is_valid': False,
                 'error': 'No data provided'
             }
         
-        print(f"Received data: {data}")
+        logger.debug("Received data: %s", data)
         
         # Verificar si tiene un status y si es texto sin sentido
         if 'status' in data and self._is_nonsense_text(data['status']):
-            print("Nonsense text detected in status")
+            logger.debug("Nonsense text detected in status")
             return {
                 'is_valid': False,
                 'error': 'nonsense_input',
@@ -110,7 +113,7 @@ class EmploymentStatusController:
         :return: Respuesta procesada
         """
         try:
-            print("\n=== Processing Employment Status ===")
+            logger.debug("Processing Employment Status")
             
             # Validar entrada
             validation_result = self.validate_input(data)
@@ -143,19 +146,19 @@ class EmploymentStatusController:
             
             # Procesamiento de idioma
             detected_language = self._process_language(validation_result['data'])
-            print(f"Detected Language: {detected_language}")
+            logger.debug("Detected Language: %s", detected_language)
             
             # Si no hay estado, solicitar preferencia
             if 'status' not in validation_result['data']:
-                print("No status provided, requesting initial preference")
+                logger.debug("No status provided, requesting initial preference")
                 response = self._request_initial_preference(detected_language)
                 response['status_code'] = 200
                 return response
 
             # Procesar estado de empleo
-            print(f"Processing status: {validation_result['data']['status']}")
+            logger.debug("Processing status: %s", validation_result['data']['status'])
             status = self._extract_employment_status(validation_result['data']['status'])
-            print(f"Extracted status: {status}")
+            logger.debug("Extracted status: %s", status)
             
             # Generar respuesta
             result = self._generate_response(status, detected_language)
@@ -166,8 +169,7 @@ class EmploymentStatusController:
             return result
 
         except Exception as e:
-            print(f"\n=== Error in process_employment_status ===")
-            print(f"Error details: {str(e)}")
+            logger.exception("Error in process_employment_status")
             
             error_message = self.chatgpt.translate_message(
                 self.BASE_MESSAGES['processing_error'], 
@@ -189,15 +191,15 @@ class EmploymentStatusController:
         :param data: Datos de la solicitud
         :return: Idioma detectado
         """
-        print("\n=== Language Processing ===")
+        logger.debug("Language Processing")
         current_language = get_last_detected_language()
-        print(f"Current detected language: {current_language}")
+        logger.debug("Current detected language: %s", current_language)
         
         try:
             # Priorizar el idioma si está explícitamente proporcionado
             if 'detected_language' in data:
                 detected_language = data['detected_language']
-                print(f"Language from data: {detected_language}")
+                logger.debug("Language from data: %s", detected_language)
                 return detected_language
             
             # Si hay un estado, procesar su idioma
@@ -208,18 +210,18 @@ class EmploymentStatusController:
                 )
                 detected_language = text_processing_result.get('detected_language', current_language)
                 
-                print(f"Input status: {data['status']}")
-                print(f"Detected language: {detected_language}")
+                logger.debug("Input status: %s", data['status'])
+                logger.debug("Detected language: %s", detected_language)
                 
                 return detected_language
             
             else:
                 # Usar el último idioma detectado o el predeterminado
-                print("No status provided, using previous language")
+                logger.debug("No status provided, using previous language")
                 return current_language
         
         except Exception as e:
-            print(f"Error in language detection: {e}")
+            logger.error("Error in language detection: %s", e)
             # Fallback al idioma actual en caso de error
             return current_language
 
@@ -230,8 +232,8 @@ class EmploymentStatusController:
         :param detected_language: Idioma detectado
         :return: Respuesta inicial
         """
-        print("\n=== Initial Preference Request ===")
-        print(f"Detected language: {detected_language}")
+        logger.debug("Initial Preference Request")
+        logger.debug("Detected language: %s", detected_language)
         
         # Traducir el mensaje base directamente
         translated_question = self.chatgpt.translate_message(
@@ -239,8 +241,8 @@ class EmploymentStatusController:
             detected_language
         )
         
-        print(f"Original message: {self.BASE_MESSAGES['ask_preference']}")
-        print(f"Translated message: {translated_question}")
+        logger.debug("Original message: %s", self.BASE_MESSAGES['ask_preference'])
+        logger.debug("Translated message: %s", translated_question)
         
         return {
             'success': True,
@@ -256,20 +258,20 @@ class EmploymentStatusController:
         :param status_text: Texto de estado de empleo
         :return: Estado de empleo normalizado
         """
-        print("\n=== Employment Status Extraction ===")
-        print(f"Input status text: {status_text}")
+        logger.debug("Employment Status Extraction")
+        logger.debug("Input status text: %s", status_text)
         
         # Traducir la respuesta del usuario al inglés SOLO para procesar la intención
         translated_status = self.chatgpt.translate_message(status_text, 'en-US')
-        print(f"Translated status text: {translated_status}")
+        logger.debug("Translated status text: %s", translated_status)
         
         # Intentar extraer estado de trabajo
         status = self.chatgpt.extract_work_timing(translated_status)
-        print(f"Extracted by work timing: {status}")
+        logger.debug("Extracted by work timing: %s", status)
         
         if not status:
             status = self._normalize_status(translated_status)
-            print(f"Normalized status: {status}")
+            logger.debug("Normalized status: %s", status)
 
             if status is None:
                 normalize_prompt = (
@@ -280,10 +282,10 @@ class EmploymentStatusController:
                     normalize_prompt, 
                     'en-US'
                 ).strip().lower()
-                print(f"Normalized prompt result: {normalized_status}")
+                logger.debug("Normalized prompt result: %s", normalized_status)
                 
                 status = self._normalize_status(normalized_status)
-                print(f"Final normalized status: {status}")
+                logger.debug("Final normalized status: %s", status)
         
         return status
 
@@ -294,8 +296,8 @@ class EmploymentStatusController:
         :param status_text: Texto de estado de empleo
         :return: Estado de empleo normalizado
         """
-        print("\n=== Status Normalization ===")
-        print(f"Input status text: {status_text}")
+        logger.debug("Status Normalization")
+        logger.debug("Input status text: %s", status_text)
         
         status_text = status_text.strip().lower()
         
@@ -307,10 +309,10 @@ class EmploymentStatusController:
         
         for status, variants in status_mapping.items():
             if any(variant in status_text for variant in variants):
-                print(f"Matched status: {status}")
+                logger.debug("Matched status: %s", status)
                 return status
         
-        print("No status match found")
+        logger.debug("No status match found")
         return None
 
     def _generate_response(self, status, detected_language):
@@ -321,9 +323,9 @@ class EmploymentStatusController:
         :param detected_language: Idioma detectado
         :return: Respuesta generada
         """
-        print("\n=== Response Generation ===")
-        print(f"Employment Status: {status}")
-        print(f"Detected Language: {detected_language}")
+        logger.debug("Response Generation")
+        logger.debug("Employment Status: %s", status)
+        logger.debug("Detected Language: %s", detected_language)
 
         if status:
             # Convertir el status a criterios de búsqueda
@@ -335,12 +337,12 @@ class EmploymentStatusController:
                 # Obtener el mensaje de estado correspondiente
                 status_message = self.BASE_MESSAGES['status_options'][status]
                 
-                print(f"Original status message: {status_message}")
+                logger.debug("Original status message: %s", status_message)
                 
                 # Traducir el mensaje
                 response_message = self.chatgpt.translate_message(status_message, detected_language)
                 
-                print(f"Translated status message: {response_message}")
+                logger.debug("Translated status message: %s", response_message)
                 
                 return {
                     'success': True,
@@ -353,7 +355,7 @@ class EmploymentStatusController:
                 }
             
             except Exception as zoho_error:
-                print(f"Zoho Search Error: {zoho_error}")
+                logger.error("Zoho Search Error: %s", zoho_error)
                 
                 status_message = self.BASE_MESSAGES['status_options'][status]
                 response_message = self.chatgpt.translate_message(status_message, detected_language)
@@ -387,8 +389,8 @@ class EmploymentStatusController:
         :param status: Estado de empleo
         :return: Criterios de búsqueda
         """
-        print("\n=== Search Criteria Generation ===")
-        print(f"Status: {status}")
+        logger.debug("Search Criteria Generation")
+        logger.debug("Status: %s", status)
         
         if status == 'current':
             return "(Candidate_Status:equals:Active)"
@@ -403,5 +405,5 @@ class EmploymentStatusController:
         
         :param language: Idioma por defecto
         """
-        print(f"\n=== Resetting Last Detected Language to: {language} ===")
+        logger.debug("Resetting Last Detected Language to: %s", language)
         reset_last_detected_language()
\ No newline at end of file
@@ -1,7 +1,10 @@
+import logging
 from app.services.evaluation_service import EvaluationService
 import re
 from src.utils.chatgpt_helper import ChatGPTHelper  # Asegúrate de importar ChatGPTHelper
 
+logger = logging.getLogger(__name__)
+
 class EvaluationController:
     def __init__(self, evaluation_service=None, chatgpt=None):
         """
@@ -27,22 +30,22 @@ class EvaluationController:
         :param data: Datos de la solicitud
         :return: Resultado de validación
         """
-        print("\n=== Input Validation ===")
+        logger.debug("Input Validation")
         if not data:
-            print("No data provided")
+            logger.debug("No data provided")
             return {
                 'is_valid': False,
                 'error': 'No data provided'
             }
         
-        print(f"Received data: {data}")
+        logger.debug("Received data: %s", data)
         
         # Validar campos requeridos
         required_fields = ['project_id', 'evaluation_data']
         missing_fields = [field for field in required_fields if field not in data]
         
         if missing_fields:
-            print(f"Missing fields: {missing_fields}")
+            logger.debug("Missing fields: %s", missing_fields)
             return {
                 'is_valid': False,
                 'error': f'Missing required fields: {", ".join(missing_fields)}'
@@ -52,7 +55,7 @@ class EvaluationController:
         if isinstance(data.get('evaluation_data'), dict):
             for field, value in data['evaluation_data'].items():
                 if isinstance(value, str) and self._is_nonsense_text(value):
-                    print(f"Nonsense text detected in field '{field}': {value}")
+                    logger.debug("Nonsense text detected in field '%s': %s", field, value)
                     return {
                         'is_valid': False,
                         'error': 'nonsense_input',
@@ -119,12 +122,12 @@ class EvaluationController:
         :return: Resultado de la operación
         """
         try:
-            print("\n=== Save Evaluation ===")
+            logger.debug("Save Evaluation")
             
             # Validar entrada
             validation_result = self.validate_input(data)
             if not validation_result['is_valid']:
-                print(f"Validation failed: {validation_result['error']}")
+                logger.warning("Validation failed: %s", validation_result['error'])
                 
                 # Verificar si es por texto sin sentido
                 if validation_result.get('error') == 'nonsense_input':
@@ -155,26 +158,24 @@ class EvaluationController:
             project_id = validation_result['project_id']
             evaluation_data = validation_result['evaluation_data']
 
-            print(f"Project ID: {project_id}")
-            print(f"Evaluation Data: {evaluation_data}")
+            logger.debug("Project ID: %s", project_id)
+            logger.debug("Evaluation Data: %s", evaluation_data)
 
             # Guardar evaluación
-            print("Calling evaluation service to save evaluation")
+            logger.debug("Calling evaluation service to save evaluation")
             result = self.evaluation_service.save_evaluation(project_id, evaluation_data)
             
-            print(f"Evaluation Service Result: {result}")
+            logger.debug("Evaluation Service Result: %s", result)
             
             # Añadir código de estado a la respuesta
             result['status_code'] = 200 if result.get('success', False) else 500
             
-            print(f"Final Result: {result}")
+            logger.debug("Final Result: %s", result)
             
             return result
 
         except Exception as e:
-            print("\n=== Error in Save Evaluation ===")
-            print(f"Error Type: {type(e)}")
-            print(f"Error Details: {str(e)}")
+            logger.exception("Error in Save Evaluation")
             
             # Usar el mensaje base y traducirlo si es necesario
             current_language = self.last_detected_language
@@ -199,7 +200,7 @@ class EvaluationController:
         
         :param language: Idioma por defecto
         """
-        print(f"\n=== Resetting Last Detected Language to: {language} ===")
+        logger.debug("Resetting Last Detected Language to: %s", language)
         self.last_detected_language = language
 
     def _process_language(self, data):
@@ -209,23 +210,23 @@ class EvaluationController:
         :param data: Datos de la solicitud
         :return: Idioma detectado
         """
-        print("\n=== Language Processing ===")
+        logger.debug("Language Processing")
         current_language = self.last_detected_language
-        print(f"Current detected language: {current_language}")
+        logger.debug("Current detected language: %s", current_language)
         
         try:
             # Priorizar el idioma si está explícitamente proporcionado
             if isinstance(data, dict):
                 if 'detected_language' in data:
                     detected_language = data['detected_language']
-                    print(f"Language from data: {detected_language}")
+                    logger.debug("Language from data: %s", detected_language)
                     self.last_detected_language = detected_language
                     return detected_language
                 
                 # También verificar si hay un idioma en 'language'
                 if 'language' in data:
                     detected_language = data['language']
-                    print(f"Language from data 'language' field: {detected_language}")
+                    logger.debug("Language from data 'language' field: %s", detected_language)
                     self.last_detected_language = detected_language
                     return detected_language
                 
@@ -234,14 +235,14 @@ class EvaluationController:
                     # Buscar el primer valor de texto
                     for field, value in data['evaluation_data'].items():
                         if isinstance(value, str) and len(value) > 10:  # Solo textos suficientemente largos
-                            print(f"Attempting to detect language from field '{field}'")
+                            logger.debug("Attempting to detect language from field '%s'", field)
                             text_processing_result = self.chatgpt.process_text_input(
                                 value, 
                                 current_language
                             )
                             detected_language = text_processing_result.get('detected_language', current_language)
                             
-                            print(f"Detected language from field '{field}': {detected_language}")
+                            logger.debug("Detected language from field '%s': %s", field, detected_language)
                             self.last_detected_language = detected_language
                             return detected_language
             
@@ -249,5 +250,5 @@ class EvaluationController:
             return current_language
         
         except Exception as e:
-            print(f"Error in language detection: {e}")
+            logger.error("Error in language detection: %s", e)
             return current_language
\ No newline at end of file
@@ -1,3 +1,4 @@
+import logging
 from src.utils.chatgpt_helper import ChatGPTHelper
 import re
 # Importar funciones de gestión de idioma global
@@ -7,6 +8,8 @@ from app.constants.language import (
     reset_last_detected_language
 )
 
+logger = logging.getLogger(__name__)
+
 class EvaluationQuestionsController:
     def __init__(self, chatgpt=None):
         self.chatgpt = chatgpt or ChatGPTHelper()
@@ -27,7 +30,7 @@ class EvaluationQuestionsController:
         try:
             return self.chatgpt.translate_message(message, detected_language)
         except Exception as e:
-            print(f"Translation error: {e}")
+            logger.error("Translation error: %s", e)
             return message
 
     def validate_input(self, data):
@@ -37,9 +40,9 @@ class EvaluationQuestionsController:
         :param data: Datos de la solicitud
         :return: Resultado de validación
         """
-        print("\n=== Input Validation ===")
+        logger.debug("Input Validation")
         if not data:
-            print("No data provided")
+            logger.debug("No data provided")
             return {
                 'is_valid': False,
                 'error': 'No data provided'
@@ -49,11 +52,11 @@ class EvaluationQuestionsController:
         if 'text' in data and 'answer' not in data:
             data['answer'] = data['text']
         
-        print(f"Received data: {data}")
+        logger.debug("Received data: %s", data)
         
         # Verificar si el campo 'answer' contiene texto sin sentido
         if 'answer' in data and self._is_nonsense_text(data['answer']):
-            print("Nonsense text detected in answer")
+            logger.debug("Nonsense text detected in answer")
             return {
                 'is_valid': False,
                 'error': 'nonsense_input',
@@ -123,24 +126,24 @@ class EvaluationQuestionsController:
         :return: Respuesta procesada
         """
         try:
-            print("\n=== Processing Evaluation Questions ===")
+            logger.debug("Processing Evaluation Questions")
             
             # Importante: Verificar si hay un idioma explícito en los datos
             if data and isinstance(data, dict):
                 if 'language' in data:
                     explicit_language = data['language']
-                    print(f"Using explicit language from data: {explicit_language}")
+                    logger.debug("Using explicit language from data: %s", explicit_language)
                     update_last_detected_language(explicit_language)
                 elif 'detected_language' in data:
                     explicit_language = data['detected_language']
-                    print(f"Using detected_language from data: {explicit_language}")
+                    logger.debug("Using detected_language from data: %s", explicit_language)
                     update_last_detected_language(explicit_language)
                 # Verificar en filtersApplied dentro de phase3_data
                 elif 'phase3_data' in data and isinstance(data['phase3_data'], dict):
                     filters = data['phase3_data'].get('filtersApplied', {})
                     if filters and isinstance(filters, dict) and 'detected_language' in filters:
                         explicit_language = filters['detected_language']
-                        print(f"Using language from phase3_data.filtersApplied: {explicit_language}")
+                        logger.debug("Using language from phase3_data.filtersApplied: %s", explicit_language)
                         update_last_detected_language(explicit_language)
             
             # Validar entrada
@@ -173,7 +176,7 @@ class EvaluationQuestionsController:
             
             # Procesar idioma usando el método mejorado
             detected_language = self._process_language(validation_result['data'])
-            print(f"Detected Language: {detected_language}")
+            logger.debug("Detected Language: %s", detected_language)
             
             # IMPORTANTE: Asegurarse de que el idioma detectado se actualice correctamente
             update_last_detected_language(detected_language)
@@ -184,23 +187,22 @@ class EvaluationQuestionsController:
             
             # Manejar diferentes etapas
             if not answer:
-                print("No answer provided, requesting initial perspective")
+                logger.debug("No answer provided, requesting initial perspective")
                 response = self._request_initial_perspective(detected_language, validation_result['data'])
             else:
-                print(f"Processing answer: {answer}")
+                logger.debug("Processing answer: %s", answer)
                 response = self._process_perspective_response(validation_result['data'], detected_language)
             
             # Añadir código de estado a la respuesta
             response['status_code'] = 200 if response.get('success', False) else 400
             
-            print("\n=== Final Response ===")
-            print(f"Response: {response}")
+            logger.debug("Final Response")
+            logger.debug("Response: %s", response)
             
             return response
 
         except Exception as e:
-            print(f"\n=== Error in process_evaluation_questions ===")
-            print(f"Error details: {str(e)}")
+            logger.exception("Error in process_evaluation_questions")
             
             # Usar el mensaje base y traducirlo si es necesario
             current_language = get_last_detected_language()
@@ -224,20 +226,20 @@ class EvaluationQuestionsController:
         :param data: Datos de la solicitud
         :return: Idioma detectado
         """
-        print("\n=== Language Processing ===")
+        logger.debug("Language Processing")
         current_language = get_last_detected_language()
-        print(f"Current detected language: {current_language}")
+        logger.debug("Current detected language: %s", current_language)
         
         # Priorizar idiomas explícitamente proporcionados
         if 'detected_language' in data:
             detected_language = data['detected_language']
-            print(f"Language from data: {detected_language}")
+            logger.debug("Language from data: %s", detected_language)
             update_last_detected_language(detected_language)
             return detected_language
         
         if 'language' in data:
             detected_language = data['language']
-            print(f"Language from 'language' field: {detected_language}")
+            logger.debug("Language from 'language' field: %s", detected_language)
             update_last_detected_language(detected_language)
             return detected_language
         
@@ -248,9 +250,9 @@ class EvaluationQuestionsController:
             ' '.join(data.get('evaluation_questions', {}).keys())
         ])
         
-        print(f"=== Language Detection Debug ===")
-        print(f"Input Text: {text_to_detect}")
-        print(f"Previous Language: {current_language}")
+        logger.debug("Language Detection Debug")
+        logger.debug("Input Text: %s", text_to_detect)
+        logger.debug("Previous Language: %s", current_language)
         
         text_processing_result = self.chatgpt.process_text_input(
             text_to_detect if text_to_detect.strip() else "test", 
@@ -258,11 +260,11 @@ class EvaluationQuestionsController:
         )
         detected_language = text_processing_result.get('detected_language', current_language)
         
-        print(f"Detected Language: {detected_language}")
+        logger.debug("Detected Language: %s", detected_language)
         
         # Forzar el idioma original si la detección intenta cambiarlo
         if detected_language != current_language:
-            print(f"FORCE: Maintaining original language {current_language}")
+            logger.debug("FORCE: Maintaining original language %s", current_language)
             detected_language = current_language
         
         # Actualizar el idioma detectado
@@ -278,8 +280,8 @@ class EvaluationQuestionsController:
         :param data: Datos de la solicitud
         :return: Respuesta inicial
         """
-        print("\n=== Initial Perspective Request ===")
-        print(f"Detected language: {detected_language}")
+        logger.debug("Initial Perspective Request")
+        logger.debug("Detected language: %s", detected_language)
         
         # Traducir el mensaje base al idioma detectado
         initial_message = self._translate_message(
@@ -287,8 +289,8 @@ class EvaluationQuestionsController:
             detected_language
         )
         
-        print(f"Base message: {self.BASE_MESSAGES['ask_preference']}")
-        print(f"Translated message: {initial_message}")
+        logger.debug("Base message: %s", self.BASE_MESSAGES['ask_preference'])
+        logger.debug("Translated message: %s", initial_message)
         
         return {
             'success': True,
@@ -307,26 +309,26 @@ class EvaluationQuestionsController:
         :param detected_language: Idioma detectado
         :return: Respuesta procesada
         """
-        print("\n=== Perspective Response Processing ===")
+        logger.debug("Perspective Response Processing")
         answer = data['answer'].strip().lower()
-        print(f"Input answer: '{answer}'")
-        print(f"Using language: {detected_language}")
+        logger.debug("Input answer: '%s'", answer)
+        logger.debug("Using language: %s", detected_language)
         
         # Detectar directamente respuestas negativas comunes
         if answer in ['no', 'n', 'nope', 'no,', 'noo']:
-            print("Direct negative response detected")
+            logger.debug("Direct negative response detected")
             return self._handle_negative_response(detected_language, data)
             
         # Detectar directamente respuestas positivas comunes
         if answer in ['yes', 'y', 'yeah', 'yep', 'si', 'sí', 'yes,', 'yess']:
-            print("Direct positive response detected")
+            logger.debug("Direct positive response detected")
             return self._handle_positive_response(data, detected_language)
         
         # Para respuestas más complejas, usar el chatgpt para extraer la intención
         intention_result = self.chatgpt.extract_intention(answer)
         intention = intention_result.get('intention') if intention_result.get('success') else None
         
-        print(f"Extracted intention: {intention}")
+        logger.debug("Extracted intention: %s", intention)
 
         # Manejar respuesta basado en la intención
         if intention == 'yes':
@@ -344,7 +346,7 @@ class EvaluationQuestionsController:
         :param detected_language: Idioma detectado
         :return: Respuesta procesada
         """
-        print("\n=== Positive Response Handling ===")
+        logger.debug("Positive Response Handling")
         
         # Traducir mensaje de confirmación
         confirmation_message = self._translate_message(
@@ -352,7 +354,7 @@ class EvaluationQuestionsController:
             detected_language
         )
         
-        print(f"Response message: {confirmation_message}")
+        logger.debug("Response message: %s", confirmation_message)
         
         return {
         'success': True,
@@ -374,7 +376,7 @@ class EvaluationQuestionsController:
         :param data: Datos de la solicitud
         :return: Respuesta procesada
         """
-        print("\n=== Negative Response Handling ===")
+        logger.debug("Negative Response Handling")
         
         # Traducir mensaje de confirmación
         confirmation_message = self._translate_message(
@@ -382,7 +384,7 @@ class EvaluationQuestionsController:
             detected_language
         )
         
-        print(f"Response message: {confirmation_message}")
+        logger.debug("Response message: %s", confirmation_message)
         
         return {
             'success': True,
@@ -400,7 +402,7 @@ class EvaluationQuestionsController:
         :param detected_language: Idioma detectado
         :return: Respuesta procesada
         """
-        print("\n=== Unclear Response Handling ===")
+        logger.debug("Unclear Response Handling")
         
         # Traducir mensaje de aclaración
         clarification_message = self._translate_message(
@@ -408,7 +410,7 @@ class EvaluationQuestionsController:
             detected_language
         )
         
-        print(f"Response message: {clarification_message}")
+        logger.debug("Response message: %s", clarification_message)
         
         return {
             'success': False,
@@ -423,5 +425,5 @@ class EvaluationQuestionsController:
         
         :param language: Idioma por defecto
         """
-        print(f"\n=== Resetting Last Detected Language to: {language} ===")
+        logger.debug("Resetting Last Detected Language to: %s", language)
         reset_last_detected_language()
\ No newline at end of file
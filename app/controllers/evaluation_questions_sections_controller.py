@@ -1,3 +1,4 @@
+import logging
 from src.utils.chatgpt_helper import ChatGPTHelper
 # Importar funciones de gestión de idioma global
 from app.constants.language import (
@@ -6,6 +7,8 @@ from app.constants.language import (
     reset_last_detected_language
 )
 
+logger = logging.getLogger(__name__)
+
 class EvaluationQuestionsSectionsController:
     def __init__(self, chatgpt=None):
         self.chatgpt = chatgpt or ChatGPTHelper()
@@ -25,7 +28,7 @@ class EvaluationQuestionsSectionsController:
         try:
             return self.chatgpt.translate_message(message, detected_language)
         except Exception as e:
-            print(f"Translation error: {e}")
+            logger.error("Translation error: %s", e)
             return message
 
     def validate_input(self, data):
@@ -35,9 +38,9 @@ class EvaluationQuestionsSectionsController:
         :param data: Datos de la solicitud
         :return: Resultado de validación
         """
-        print("\n=== Input Validation ===")
+        logger.debug("Input Validation")
         if not data:
-            print("No data provided")
+            logger.debug("No data provided")
             return {
                 'is_valid': False,
                 'error': 'No data provided'
@@ -47,13 +50,13 @@ class EvaluationQuestionsSectionsController:
         missing_fields = [field for field in required_fields if field not in data]
         
         if missing_fields:
-            print(f"Missing required fields: {', '.join(missing_fields)}")
+            logger.debug("Missing required fields: %s", ', '.join(missing_fields))
             return {
                 'is_valid': False,
                 'error': f'Missing required fields: {", ".join(missing_fields)}'
             }
         
-        print(f"Received data: {data}")
+        logger.debug("Received data: %s", data)
         return {
             'is_valid': True,
             'data': data
@@ -67,24 +70,24 @@ class EvaluationQuestionsSectionsController:
         :return: Respuesta procesada
         """
         try:
-            print("\n=== Processing Evaluation Questions Sections ===")
+            logger.debug("Processing Evaluation Questions Sections")
             
             # Importante: Verificar si hay un idioma explícito en los datos
             if data and isinstance(data, dict):
                 if 'language' in data:
                     explicit_language = data['language']
-                    print(f"Using explicit language from data: {explicit_language}")
+                    logger.debug("Using explicit language from data: %s", explicit_language)
                     update_last_detected_language(explicit_language)
                 elif 'detected_language' in data:
                     explicit_language = data['detected_language']
-                    print(f"Using detected_language from data: {explicit_language}")
+                    logger.debug("Using detected_language from data: %s", explicit_language)
                     update_last_detected_language(explicit_language)
                 # Verificar en filtersApplied dentro de phase3_data
                 elif 'phase3_data' in data and isinstance(data['phase3_data'], dict):
                     filters = data['phase3_data'].get('filtersApplied', {})
                     if filters and isinstance(filters, dict) and 'detected_language' in filters:
                         explicit_language = filters['detected_language']
-                        print(f"Using language from phase3_data.filtersApplied: {explicit_language}")
+                        logger.debug("Using language from phase3_data.filtersApplied: %s", explicit_language)
                         update_last_detected_language(explicit_language)
             
             # Validar entrada
@@ -98,7 +101,7 @@ class EvaluationQuestionsSectionsController:
             
             # Procesar idioma usando el método mejorado
             detected_language = self._process_language(validation_result['data'])
-            print(f"Detected Language: {detected_language}")
+            logger.debug("Detected Language: %s", detected_language)
             
             # IMPORTANTE: Asegurarse de que el idioma detectado se actualice correctamente
             update_last_detected_language(detected_language)
@@ -109,14 +112,13 @@ class EvaluationQuestionsSectionsController:
             # Añadir código de estado a la respuesta
             response['status_code'] = 200 if response.get('success', False) else 400
             
-            print("\n=== Final Response ===")
-            print(f"Response: {response}")
+            logger.debug("Final Response")
+            logger.debug("Response: %s", response)
             
             return response
 
         except Exception as e:
-            print(f"\n=== Error in process_evaluation_questions_sections ===")
-            print(f"Error details: {str(e)}")
+            logger.exception("Error in process_evaluation_questions_sections")
             
             error_response = self._handle_error(e, get_last_detected_language())
             error_response['status_code'] = 500
@@ -129,22 +131,22 @@ class EvaluationQuestionsSectionsController:
         :param data: Datos de la solicitud
         :return: Idioma detectado
         """
-        print("\n=== Language Processing ===")
+        logger.debug("Language Processing")
         current_language = get_last_detected_language()
-        print(f"Current detected language: {current_language}")
+        logger.debug("Current detected language: %s", current_language)
         
         try:
             # Priorizar el idioma si está explícitamente proporcionado
             if 'detected_language' in data:
                 detected_language = data['detected_language']
-                print(f"Language from data: {detected_language}")
+                logger.debug("Language from data: %s", detected_language)
                 update_last_detected_language(detected_language)
                 return detected_language
             
             # También verificar si hay un idioma en 'language'
             if 'language' in data:
                 detected_language = data['language']
-                print(f"Language from data 'language' field: {detected_language}")
+                logger.debug("Language from data 'language' field: %s", detected_language)
                 update_last_detected_language(detected_language)
                 return detected_language
             
@@ -157,12 +159,12 @@ class EvaluationQuestionsSectionsController:
                 )
                 detected_language = text_processing_result.get('detected_language', current_language)
                 
-                print(f"Input answer: {data['answer']}")
-                print(f"Detected language: {detected_language}")
+                logger.debug("Input answer: %s", data['answer'])
+                logger.debug("Detected language: %s", detected_language)
                 
                 # CLAVE: Mantener el idioma original de la conversación
                 if detected_language != current_language:
-                    print(f"Language detection attempted to change from {current_language} to {detected_language}")
+                    logger.debug("Language detection attempted to change from %s to %s", current_language, detected_language)
                     detected_language = current_language
                 
                 # Actualizar el último idioma detectado
@@ -174,7 +176,7 @@ class EvaluationQuestionsSectionsController:
             return current_language
         
         except Exception as e:
-            print(f"Error in language detection: {e}")
+            logger.error("Error in language detection: %s", e)
             return current_language
 
     def _process_questions(self, data, detected_language):
@@ -185,7 +187,7 @@ class EvaluationQuestionsSectionsController:
         :param detected_language: Idioma detectado
         :return: Respuesta procesada
         """
-        print("\n=== Processing Questions ===")
+        logger.debug("Processing Questions")
         current_questions = data.get('current_questions', {})
         selected_categories = data.get('selected_categories', {})
         current_category = data.get('current_category')
@@ -193,14 +195,14 @@ class EvaluationQuestionsSectionsController:
         client_perspective = data.get('clientPerspective', False)
         supply_chain_perspective = data.get('supplyChainPerspective', False)
 
-        print(f"Current category: {current_category}")
-        print(f"Answer received: {answer}")
-        print(f"Client perspective: {client_perspective}")
-        print(f"Supply chain perspective: {supply_chain_perspective}")
+        logger.debug("Current category: %s", current_category)
+        logger.debug("Answer received: %s", answer)
+        logger.debug("Client perspective: %s", client_perspective)
+        logger.debug("Supply chain perspective: %s", supply_chain_perspective)
 
         # Guardar respuesta si existe
         if current_category and answer:
-            print(f"Saving answer for category: {current_category}")
+            logger.debug("Saving answer for category: %s", current_category)
             current_questions[current_category] = answer
 
         # Determinar categorías pendientes
@@ -210,7 +212,7 @@ class EvaluationQuestionsSectionsController:
             client_perspective, 
             supply_chain_perspective
         )
-        print(f"Pending categories: {pending_categories}")
+        logger.debug("Pending categories: %s", pending_categories)
 
         # Generar respuesta
         if pending_categories:
@@ -272,14 +274,14 @@ class EvaluationQuestionsSectionsController:
         :param detected_language: Idioma detectado
         :return: Respuesta de categorías pendientes
         """
-        print("\n=== Generating Pending Response ===")
+        logger.debug("Generating Pending Response")
         next_category = pending_categories[0]
         message = self.CATEGORY_MESSAGES.get(next_category)
         translated_message = self._translate_message(message, detected_language)
         
-        print(f"Next category: {next_category}")
-        print(f"Original message: {message}")
-        print(f"Translated message: {translated_message}")
+        logger.debug("Next category: %s", next_category)
+        logger.debug("Original message: %s", message)
+        logger.debug("Translated message: %s", translated_message)
         
         return {
             'success': True,
@@ -300,14 +302,14 @@ class EvaluationQuestionsSectionsController:
         :param detected_language: Idioma detectado
         :return: Respuesta de finalización
         """
-        print("\n=== Generating Completion Response ===")
+        logger.debug("Generating Completion Response")
         translated_message = self._translate_message(
             self.COMPLETION_MESSAGE, 
             detected_language
         )
         
-        print(f"Original message: {self.COMPLETION_MESSAGE}")
-        print(f"Translated message: {translated_message}")
+        logger.debug("Original message: %s", self.COMPLETION_MESSAGE)
+        logger.debug("Translated message: %s", translated_message)
         
         return {
             'success': True,
@@ -325,12 +327,12 @@ class EvaluationQuestionsSectionsController:
         :param detected_language: Idioma detectado
         :return: Respuesta de error
         """
-        print(f"\n=== Error Handling ===")
+        logger.warning("Error Handling")
         error_message = "An error occurred while processing your request."
         translated_error = self._translate_message(error_message, detected_language)
         
-        print(f"Error: {str(error)}")
-        print(f"Translated error message: {translated_error}")
+        logger.warning("%s", error)
+        logger.warning("Translated error message: %s", translated_error)
         
         return {
             'success': False,
@@ -345,5 +347,5 @@ class EvaluationQuestionsSectionsController:
         
         :param language: Idioma por defecto
         """
-        print(f"\n=== Resetting Language to: {language} ===")
+        logger.debug("Resetting Language to: %s", language)
         reset_last_detected_language(language)
\ No newline at end of file
@@ -1,3 +1,4 @@
+import logging
 from src.utils.chatgpt_helper import ChatGPTHelper
 from src.services.external.zoho_services import ZohoService
 from app.services.excluded_companies_service import ExcludedCompaniesService
@@ -9,6 +10,8 @@ from app.constants.language import (
     reset_last_detected_language
 )
 
+logger = logging.getLogger(__name__)
+
 class ExcludeCompaniesController:
     def __init__(self, 
                  chatgpt=None, 
@@ -181,15 +184,15 @@ class ExcludeCompaniesController:
         :param data: Datos de la solicitud
         :return: Idioma detectado
         """
-        print("\n=== Language Processing ===")
+        logger.debug("Language Processing")
         current_language = get_last_detected_language()
-        print(f"Current detected language: {current_language}")
+        logger.debug("Current detected language: %s", current_language)
         
         try:
             # Priorizar el idioma si está explícitamente proporcionado
             if 'detected_language' in data:
                 detected_language = data['detected_language']
-                print(f"Language from data: {detected_language}")
+                logger.debug("Language from data: %s", detected_language)
                 update_last_detected_language(detected_language)
                 return detected_language
             
@@ -201,12 +204,12 @@ class ExcludeCompaniesController:
                 )
                 detected_language = text_processing_result.get('detected_language', current_language)
                 
-                print(f"Input answer: {data['answer']}")
-                print(f"Detected language: {detected_language}")
+                logger.debug("Input answer: %s", data['answer'])
+                logger.debug("Detected language: %s", detected_language)
                 
                 # CLAVE: Mantener el idioma original de la conversación
                 if detected_language != current_language:
-                    print(f"Language detection attempted to change from {current_language} to {detected_language}")
+                    logger.debug("Language detection attempted to change from %s to %s", current_language, detected_language)
                     detected_language = current_language
                 
                 # Actualizar el último idioma detectado
@@ -218,7 +221,7 @@ class ExcludeCompaniesController:
             return current_language
         
         except Exception as e:
-            print(f"Error in language detection: {e}")
+            logger.error("Error in language detection: %s", e)
             return current_language
 
     def _request_initial_exclusions(self, detected_language):
@@ -395,5 +398,5 @@ class ExcludeCompaniesController:
         
         :param language: Idioma por defecto
         """
-        print(f"\n=== Resetting Last Detected Language to: {language} ===")
+        logger.debug("Resetting Last Detected Language to: %s", language)
         reset_last_detected_language()
\ No newline at end of file
@@ -1,10 +1,13 @@
+import logging
 from src.utils.chatgpt_helper import ChatGPTHelper
 # Importar funciones de gestión de idioma global
 from app.constants.language import get_last_detected_language, update_last_detected_language, reset_last_detected_language
 
+logger = logging.getLogger(__name__)
+
 class ExpertConnectionController:
-    def __init__(self):
-        self.chatgpt = ChatGPTHelper()
+    def __init__(self, chatgpt=None):
+        self.chatgpt = chatgpt or ChatGPTHelper()
 
     def validate_input(self, data):
         """
@@ -41,6 +44,14 @@ class ExpertConnectionController:
         :param data: Datos de la solicitud
         :return: Respuesta procesada
         """
+        return self.chatgpt.run_steps(self.ask_expert_connection_steps(data))
+
+    async def ask_expert_connection_async(self, data):
+        """Igual que ask_expert_connection, esperando al LLM sin bloquear el event loop (modo ASGI)"""
+        return await self.chatgpt.run_steps_async(self.ask_expert_connection_steps(data))
+
+    def ask_expert_connection_steps(self, data):
+        """Flujo de la pregunta de conexión con expertos; cede cada llamada al LLM (ver ChatGPTHelper.run_steps)"""
         try:
             # Validar entrada
             validation_result = self.validate_input(data)
@@ -61,7 +72,7 @@ class ExpertConnectionController:
             current_language = get_last_detected_language()
             
             # Procesamiento de idioma
-            text_processing_result = self.chatgpt.process_text_input(
+            text_processing_result = yield from self.chatgpt.process_text_input_steps(
                 text, 
                 current_language
             )
@@ -78,12 +89,12 @@ class ExpertConnectionController:
             input_validation = self._validate_text_input(text)
             if not input_validation['is_valid']:
                 # Obtener opciones traducidas al idioma detectado
-                yes_option = self.chatgpt.translate_message("yes", detected_language)
-                no_option = self.chatgpt.translate_message("no", detected_language)
+                yes_option = yield from self.chatgpt.translate_message_steps("yes", detected_language)
+                no_option = yield from self.chatgpt.translate_message_steps("no", detected_language)
                 
                 # Mensaje de error traducido
                 error_base_message = "I couldn't understand your response. Would you like to connect with our experts? Please answer with yes or no."
-                translated_error = self.chatgpt.translate_message(error_base_message, detected_language)
+                translated_error = yield from self.chatgpt.translate_message_steps(error_base_message, detected_language)
                 
                 return {
                     'success': False,
@@ -99,17 +110,17 @@ class ExpertConnectionController:
                 }
 
             # Extracción de intención usando la función existente
-            intention_result = self.chatgpt.extract_intention(text)
+            intention_result = yield from self.chatgpt.extract_intention_steps(text)
 
             # Modificación aquí: Si la intención no es clara, proporcionar un mensaje claro pidiendo sí o no
             if not intention_result['success'] or intention_result.get('intention') == 'unclear':
                 # Obtener opciones traducidas al idioma detectado
-                yes_option = self.chatgpt.translate_message("yes", detected_language)
-                no_option = self.chatgpt.translate_message("no", detected_language)
+                yes_option = yield from self.chatgpt.translate_message_steps("yes", detected_language)
+                no_option = yield from self.chatgpt.translate_message_steps("no", detected_language)
                 
                 # Mensaje claro solicitando una respuesta de sí o no
                 clarification_message = "Would you like to connect with our experts? Please answer with yes or no."
-                translated_message = self.chatgpt.translate_message(clarification_message, detected_language)
+                translated_message = yield from self.chatgpt.translate_message_steps(clarification_message, detected_language)
                 
                 return {
                     'success': True,  # Cambiado a True para que no sea un error
@@ -126,7 +137,7 @@ class ExpertConnectionController:
             intention = intention_result['intention']
 
             # Generación de respuesta
-            response = self._generate_response(intention, name, detected_language)
+            response = yield from self._generate_response_steps(intention, name, detected_language)
             
             # Añadir código de estado a la respuesta
             response['status_code'] = 200 if response.get('success', False) else 400
@@ -141,7 +152,7 @@ class ExpertConnectionController:
             
             error_message = f"An error occurred while processing your request: {str(e)}"
             try:
-                error_message = self.chatgpt.translate_message(
+                error_message = yield from self.chatgpt.translate_message_steps(
                     error_message, 
                     current_language
                 )
@@ -179,7 +190,7 @@ class ExpertConnectionController:
         # Si tiene letras, considerar como entrada potencialmente válida para procesar
         return {'is_valid': True}
 
-    def _generate_response(self, intention, name, detected_language):
+    def _generate_response_steps(self, intention, name, detected_language):
         """
         Generar respuesta basada en la intención
         
@@ -190,7 +201,7 @@ class ExpertConnectionController:
         """
         if intention == 'yes':
             base_message = f"Excellent! Please tell me about the sector or field you are most interested in exploring with our experts."
-            translated_message = self.chatgpt.translate_message(base_message, detected_language)
+            translated_message = yield from self.chatgpt.translate_message_steps(base_message, detected_language)
             
             return {
                 'success': True,
@@ -203,7 +214,7 @@ class ExpertConnectionController:
 
         elif intention == 'no':
             base_message = f"I understand, {name}. Feel free to come back when you'd like to connect with our experts. Have a great day!"
-            translated_message = self.chatgpt.translate_message(base_message, detected_language)
+            translated_message = yield from self.chatgpt.translate_message_steps(base_message, detected_language)
             
             return {
                 'success': True,
@@ -216,10 +227,10 @@ class ExpertConnectionController:
 
         else:  # intention is 'unclear'
             base_message = "I'm not sure if that's a yes or no. Could you please clarify?"
-            translated_message = self.chatgpt.translate_message(base_message, detected_language)
+            translated_message = yield from self.chatgpt.translate_message_steps(base_message, detected_language)
             
-            yes_option = self.chatgpt.translate_message("yes", detected_language)
-            no_option = self.chatgpt.translate_message("no", detected_language)
+            yes_option = yield from self.chatgpt.translate_message_steps("yes", detected_language)
+            no_option = yield from self.chatgpt.translate_message_steps("no", detected_language)
             
             return {
                 'success': True,
@@ -236,5 +247,5 @@ class ExpertConnectionController:
         
         :param language: Idioma por defecto
         """
-        print(f"\n=== Resetting Last Detected Language to: {language} ===")
+        logger.debug("Resetting Last Detected Language to: %s", language)
         reset_last_detected_language()
\ No newline at end of file
@@ -1,3 +1,4 @@
+import logging
 from app.services.expert_selection_service import ExpertSelectionService
 from src.utils.chatgpt_helper import ChatGPTHelper
 # Importar funciones de gestión de idioma global
@@ -7,6 +8,8 @@ from app.constants.language import (
     reset_last_detected_language
 )
 
+logger = logging.getLogger(__name__)
+
 class ExpertSelectionController:
     def __init__(self, expert_selection_service=None, chatgpt=None):
         self.expert_selection_service = (
@@ -29,54 +32,58 @@ class ExpertSelectionController:
         :param data: Datos de la solicitud
         :return: Resultado de validación
         """
-        print("\n=== Input Validation ===")
+        logger.debug("Input Validation")
         if not data:
-            print("No data provided")
+            logger.debug("No data provided")
             return {
                 'is_valid': False,
                 'error': 'No data provided'
             }
         
-        print(f"Received data: {data}")
+        logger.debug("Received data: %s", data)
         
         # Validaciones específicas para selección de expertos
-        required_fields = [
-            'selected_experts', 
-            'all_experts_data', 
-            'evaluation_questions'
-        ]
+        # Los expertos se pueden referenciar por id dentro de un conjunto de
+        # resultados guardado (result_set_id) o enviando el payload completo
+        required_fields = ['evaluation_questions']
+        if 'result_set_id' not in data:
+            required_fields.append('all_experts_data')
+        if 'selected_expert_ids' not in data:
+            required_fields.insert(0, 'selected_experts')
         missing_fields = [field for field in required_fields if field not in data]
         
         if missing_fields:
-            print(f"Missing fields: {missing_fields}")
+            logger.debug("Missing fields: %s", missing_fields)
             return {
                 'is_valid': False,
                 'error': f'Missing required fields: {", ".join(missing_fields)}'
             }
         
         # Validar estructura de all_experts_data
-        experts_data = data.get('all_experts_data', {}).get('experts', {})
-        required_expert_categories = ['main', 'client', 'supply_chain']
-        
-        for category in required_expert_categories:
-            if category not in experts_data:
-                print(f"Missing expert category: {category}")
-                return {
-                    'is_valid': False,
-                    'error': f'Missing expert category: {category}'
-                }
+        if 'all_experts_data' in data and 'result_set_id' not in data:
+            experts_data = data.get('all_experts_data', {}).get('experts', {})
+            required_expert_categories = ['main', 'client', 'supply_chain']
             
-            # Validar que cada categoría tenga una lista de expertos
-            if not isinstance(experts_data[category].get('experts', []), list):
-                print(f"Invalid experts list for category: {category}")
-                return {
-                    'is_valid': False,
-                    'error': f'Invalid experts list for category: {category}'
-                }
-        
-        # Validar selected_experts
-        if not isinstance(data['selected_experts'], list) or len(data['selected_experts']) == 0:
-            print("Invalid selected experts")
+            for category in required_expert_categories:
+                if category not in experts_data:
+                    logger.debug("Missing expert category: %s", category)
+                    return {
+                        'is_valid': False,
+                        'error': f'Missing expert category: {category}'
+                    }
+                
+                # Validar que cada categoría tenga una lista de expertos
+                if not isinstance(experts_data[category].get('experts', []), list):
+                    logger.warning("Invalid experts list for category: %s", category)
+                    return {
+                        'is_valid': False,
+                        'error': f'Invalid experts list for category: {category}'
+                    }
+        
+        # Validar selected_experts / selected_expert_ids
+        selection = data.get('selected_expert_ids', data.get('selected_experts'))
+        if not isinstance(selection, list) or len(selection) == 0:
+            logger.warning("Invalid selected experts")
             return {
                 'is_valid': False,
                 'error': 'Selected experts must be a non-empty list'
@@ -84,7 +91,7 @@ class ExpertSelectionController:
         
         # Validar evaluation_questions
         if not isinstance(data['evaluation_questions'], dict):
-            print("Invalid evaluation questions")
+            logger.warning("Invalid evaluation questions")
             return {
                 'is_valid': False,
                 'error': 'Evaluation questions must be a dictionary'
@@ -103,7 +110,7 @@ class ExpertSelectionController:
         :return: Respuesta de selección
         """
         try:
-            print("\n=== Processing Expert Selection ===")
+            logger.debug("Processing Expert Selection")
             
             # Validar entrada
             validation_result = self.validate_input(data)
@@ -119,7 +126,7 @@ class ExpertSelectionController:
                     detected_language
                 )
                 
-                print(f"Validation failed: {validation_result['error']}")
+                logger.warning("Validation failed: %s", validation_result['error'])
                 return {
                     'success': False,
                     'error': error_message,
@@ -132,18 +139,18 @@ class ExpertSelectionController:
             data['detected_language'] = detected_language
 
             # Registro de datos validados
-            print("Validated Data:")
-            print(f"Selected Experts: {data['selected_experts']}")
-            print(f"Experts Categories: {list(data['all_experts_data']['experts'].keys())}")
-            print(f"Evaluation Questions: {list(data['evaluation_questions'].keys())}")
+            logger.debug("Validated Data:")
+            logger.debug("Selected Experts: %s", data.get('selected_expert_ids', data.get('selected_experts')))
+            logger.debug("Result Set: %s", data.get('result_set_id', 'inline all_experts_data'))
+            logger.debug("Evaluation Questions: %s", list(data['evaluation_questions'].keys()))
 
             # Seleccionar expertos
             result = self.expert_selection_service.select_experts(data)
             
             # Registro de resultado
-            print("\n=== Expert Selection Result ===")
-            print(f"Success: {result.get('success', False)}")
-            print(f"Expert Details: {result.get('expert_details', 'No details')}")
+            logger.debug("Expert Selection Result")
+            logger.debug("Success: %s", result.get('success', False))
+            logger.debug("Expert Details: %s", result.get('expert_details', 'No details'))
             
             # Añadir código de estado a la respuesta
             result['status_code'] = 200 if result.get('success', False) else 404
@@ -152,9 +159,7 @@ class ExpertSelectionController:
             return result
 
         except Exception as e:
-            print("\n=== Error in Expert Selection ===")
-            print(f"Error Type: {type(e)}")
-            print(f"Error Details: {str(e)}")
+            logger.exception("Error in Expert Selection")
             
             # Procesar idioma para el mensaje de error
             current_language = get_last_detected_language()
@@ -178,14 +183,14 @@ class ExpertSelectionController:
         :param data: Datos de la solicitud
         :return: Idioma detectado
         """
-        print("\n=== Language Processing ===")
+        logger.debug("Language Processing")
         current_language = get_last_detected_language()
-        print(f"Current detected language: {current_language}")
+        logger.debug("Current detected language: %s", current_language)
         
         # Intentar obtener texto para detección de idioma
         text_to_detect = ' '.join([
             str(data.get('language', '')),
-            ' '.join(data.get('selected_experts', [])),
+            ' '.join(str(name) for name in data.get('selected_experts', [])),
             ' '.join(data.get('evaluation_questions', {}).keys())
         ])
         
@@ -195,7 +200,7 @@ class ExpertSelectionController:
         )
         detected_language = text_processing_result.get('detected_language', 'en')
         
-        print(f"Detected language: {detected_language}")
+        logger.debug("Detected language: %s", detected_language)
         
         # Actualizar idioma si es diferente de inglés
         if detected_language != 'en':
@@ -209,5 +214,5 @@ class ExpertSelectionController:
         
         :param language: Idioma por defecto
         """
-        print(f"\n=== Resetting Last Detected Language to: {language} ===")
+        logger.debug("Resetting Last Detected Language to: %s", language)
         reset_last_detected_language()
\ No newline at end of file
@@ -6,24 +6,14 @@ from app.constants.language import (
     update_last_detected_language, 
     reset_last_detected_language
 )
+from src.utils.structured_logging import lazy_json
 import logging
-import traceback
-import json
-import sys
 
-# Configurar logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
-)
-logger = logging.getLogger('IndustryExpertsController')
+logger = logging.getLogger(__name__)
 
 class IndustryExpertsController:
     def __init__(self, industry_experts_service=None, chatgpt=None):
-        logger.info("Inicializando IndustryExpertsController")
+        logger.debug("Inicializando IndustryExpertsController")
         self.industry_experts_service = (
             industry_experts_service or 
             IndustryExpertsService()
@@ -44,8 +34,8 @@ class IndustryExpertsController:
         :param data: Datos de la solicitud
         :return: Resultado de validación
         """
-        logger.info("=== Iniciando validación de entrada ===")
-        logger.debug(f"Datos recibidos para validación: {json.dumps(data, default=str) if data else 'None'}")
+        logger.debug("=== Iniciando validación de entrada ===")
+        logger.debug("Datos recibidos para validación: %s", lazy_json(data))
         
         if not data:
             logger.warning("No se proporcionaron datos")
@@ -59,13 +49,13 @@ class IndustryExpertsController:
         missing_fields = [field for field in required_fields if field not in data]
         
         if missing_fields:
-            logger.warning(f"Faltan campos requeridos: {missing_fields}")
+            logger.warning("Faltan campos requeridos: %s", missing_fields)
             return {
                 'is_valid': False,
                 'error': f'Missing required fields: {", ".join(missing_fields)}'
             }
         
-        logger.info("Validación exitosa")
+        logger.debug("Validación exitosa")
         return {
             'is_valid': True,
             'data': data
@@ -79,31 +69,35 @@ class IndustryExpertsController:
         :return: Respuesta de expertos
         """
         try:
-            logger.info("=== Iniciando búsqueda de expertos de la industria ===")
-            logger.debug(f"Datos de entrada: {json.dumps(data, default=str) if data else 'None'}")
+            logger.debug("=== Iniciando búsqueda de expertos de la industria ===")
+            logger.debug("Datos de entrada: %s", lazy_json(data))
+
+            # Paginar un conjunto de resultados ya calculado
+            if data and data.get('result_set_id') and not data.get('sector'):
+                return self.get_result_page(data)
             
             # Validar entrada
             validation_result = self.validate_input(data)
             if not validation_result['is_valid']:
                 # Procesar idioma para el mensaje de error
-                logger.info("Validación fallida, procesando idioma para mensaje de error")
+                logger.debug("Validación fallida, procesando idioma para mensaje de error")
                 detected_language = self._process_language(data)
-                logger.debug(f"Idioma detectado: {detected_language}")
+                logger.debug("Idioma detectado: %s", detected_language)
                 
                 error_key = 'missing_fields' if 'Missing required fields' in validation_result['error'] else 'no_data'
-                logger.debug(f"Utilizando mensaje de error: {error_key}")
+                logger.debug("Utilizando mensaje de error: %s", error_key)
                 
                 try:
                     error_message = self.chatgpt.translate_message(
                         self.BASE_MESSAGES.get(error_key), 
                         detected_language
                     )
-                    logger.debug(f"Mensaje de error traducido: {error_message}")
+                    logger.debug("Mensaje de error traducido: %s", error_message)
                 except Exception as e:
-                    logger.error(f"Error al traducir mensaje: {str(e)}")
+                    logger.error("Error al traducir mensaje: %s", e)
                     error_message = self.BASE_MESSAGES.get(error_key)
                 
-                logger.warning(f"Retornando error de validación: {validation_result['error']}")
+                logger.warning("Retornando error de validación: %s", validation_result['error'])
                 return {
                     'success': False,
                     'error': error_message,
@@ -112,41 +106,38 @@ class IndustryExpertsController:
                 }
             
             # Procesar idioma
-            logger.info("Procesando idioma para la solicitud")
+            logger.debug("Procesando idioma para la solicitud")
             detected_language = self._process_language(data)
             data['detected_language'] = detected_language
-            logger.info(f"Idioma detectado configurado: {detected_language}")
+            logger.debug("Idioma detectado configurado: %s", detected_language)
 
             # Obtener expertos
-            logger.info("Llamando a industry_experts_service.get_industry_experts")
+            logger.debug("Llamando a industry_experts_service.get_industry_experts")
             result = self.industry_experts_service.get_industry_experts(data)
-            logger.debug(f"Resultado del servicio: {json.dumps(result, default=str)}")
+            logger.debug("Resultado del servicio: %s", lazy_json(result))
             
             # Añadir código de estado a la respuesta
             result['status_code'] = 200 if result.get('success', False) else 400
             result['detected_language'] = detected_language
             
-            logger.info(f"Retornando respuesta. Éxito: {result.get('success', False)}, Código: {result['status_code']}")
+            logger.info("Retornando respuesta. Éxito: %s, Código: %s", result.get('success', False), result['status_code'])
             return result
 
         except Exception as e:
-            logger.error("=== Error en Get Industry Experts ===")
-            logger.error(f"Tipo de error: {type(e)}")
-            logger.error(f"Detalles del error: {str(e)}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("Error en get_industry_experts")
             
             # Procesar idioma para el mensaje de error
             try:
                 current_language = get_last_detected_language()
-                logger.info(f"Idioma actual para mensaje de error: {current_language}")
+                logger.debug("Idioma actual para mensaje de error: %s", current_language)
                 
                 error_message = self.chatgpt.translate_message(
                     self.BASE_MESSAGES['processing_error'], 
                     current_language
                 )
-                logger.debug(f"Mensaje de error traducido: {error_message}")
+                logger.debug("Mensaje de error traducido: %s", error_message)
             except Exception as translation_error:
-                logger.error(f"Error al traducir mensaje de error: {str(translation_error)}")
+                logger.error("Error al traducir mensaje de error: %s", translation_error)
                 error_message = self.BASE_MESSAGES['processing_error']
             
             return {
@@ -157,6 +148,31 @@ class IndustryExpertsController:
                 'detected_language': current_language if 'current_language' in locals() else 'en'
             }
 
+    def get_result_page(self, data):
+        """
+        Obtener una página de un conjunto de resultados guardado
+        
+        :param data: 'result_set_id' y opcionalmente 'cursor', 'limit' y 'fields'
+        :return: Página de expertos
+        """
+        logger.debug("=== Obteniendo página del conjunto de resultados %s ===", data.get('result_set_id'))
+        detected_language = get_last_detected_language()
+        result = self.industry_experts_service.get_result_page(data)
+
+        if not result.get('success', True):
+            try:
+                result['message'] = self.chatgpt.translate_message(
+                    result['message'], 
+                    detected_language
+                )
+            except Exception as e:
+                logger.error("Error al traducir mensaje: %s", e)
+
+        result.setdefault('success', True)
+        result['status_code'] = 200 if result['success'] else 404
+        result['detected_language'] = detected_language
+        return result
+
     def _process_language(self, data):
         """
         Procesar y detectar idioma
@@ -164,10 +180,10 @@ class IndustryExpertsController:
         :param data: Datos de la solicitud
         :return: Idioma detectado
         """
-        logger.info("=== Iniciando procesamiento de idioma ===")
+        logger.debug("=== Iniciando procesamiento de idioma ===")
         try:
             current_language = get_last_detected_language()
-            logger.info(f"Idioma detectado actual: {current_language}")
+            logger.debug("Idioma detectado actual: %s", current_language)
             
             # Intentar obtener texto para detección de idioma
             text_to_detect = (
@@ -175,32 +191,31 @@ class IndustryExpertsController:
                 data.get('region', '') + ' ' + 
                 data.get('language', '')
             )
-            logger.debug(f"Texto para detección de idioma: {text_to_detect}")
+            logger.debug("Texto para detección de idioma: %s", text_to_detect)
             
             if not text_to_detect.strip():
-                logger.info("No hay texto para detectar, usando 'test'")
+                logger.debug("No hay texto para detectar, usando 'test'")
                 text_to_detect = "test"
             
-            logger.info("Llamando a chatgpt.process_text_input para detección de idioma")
+            logger.debug("Llamando a chatgpt.process_text_input para detección de idioma")
             text_processing_result = self.chatgpt.process_text_input(
                 text_to_detect, 
                 current_language
             )
-            logger.debug(f"Resultado de procesamiento de texto: {json.dumps(text_processing_result, default=str)}")
+            logger.debug("Resultado de procesamiento de texto: %s", lazy_json(text_processing_result))
             
             detected_language = text_processing_result.get('detected_language', 'en')
-            logger.info(f"Idioma detectado: {detected_language}")
+            logger.debug("Idioma detectado: %s", detected_language)
             
             # Actualizar idioma si es diferente de inglés
             if detected_language != 'en':
-                logger.info(f"Actualizando último idioma detectado a: {detected_language}")
+                logger.debug("Actualizando último idioma detectado a: %s", detected_language)
                 update_last_detected_language(detected_language)
             
             return detected_language
         except Exception as e:
-            logger.error(f"Error en procesamiento de idioma: {str(e)}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
-            logger.info("Retornando idioma por defecto 'en'")
+            logger.exception("Error en procesamiento de idioma: %s", e)
+            logger.debug("Retornando idioma por defecto 'en'")
             return 'en'
 
     def reset_last_detected_language(self, language='en'):
@@ -209,5 +224,5 @@ class IndustryExpertsController:
         
         :param language: Idioma por defecto
         """
-        logger.info(f"=== Reseteando último idioma detectado a: {language} ===")
+        logger.debug("=== Reseteando último idioma detectado a: %s ===", language)
         reset_last_detected_language()
\ No newline at end of file
@@ -1,12 +1,14 @@
-import traceback
+import logging
 from src.utils.chatgpt_helper import ChatGPTHelper
 # Importar funciones de gestión de idioma global
 from app.constants.language import get_last_detected_language, update_last_detected_language
 import re
 
+logger = logging.getLogger(__name__)
+
 class NameCaptureController:
-    def __init__(self):
-        self.chatgpt = ChatGPTHelper()
+    def __init__(self, chatgpt=None):
+        self.chatgpt = chatgpt or ChatGPTHelper()
 
     def capture_name(self, data):
         """
@@ -15,15 +17,23 @@ class NameCaptureController:
         :param data: Datos de la solicitud
         :return: Respuesta procesada
         """
+        return self.chatgpt.run_steps(self.capture_name_steps(data))
+
+    async def capture_name_async(self, data):
+        """Igual que capture_name, esperando al LLM sin bloquear el event loop (modo ASGI)"""
+        return await self.chatgpt.run_steps_async(self.capture_name_steps(data))
+
+    def capture_name_steps(self, data):
+        """Flujo de captura de nombre; cede cada llamada al LLM (ver ChatGPTHelper.run_steps)"""
         try:
-            print("\n=== Language Detection Debug ===")
+            logger.debug("Language Detection Debug")
             # Obtener el último idioma detectado globalmente
             previous_language = get_last_detected_language()
-            print(f"Previous detected language (global): {previous_language}")
+            logger.debug("Previous detected language (global): %s", previous_language)
             
             # Validar datos de entrada
             if 'text' not in data or 'is_registered' not in data:
-                print("Error: Missing required fields")
+                logger.warning("Missing required fields")
                 return {
                     'success': False,
                     'message': 'Text and registration status are required',
@@ -31,8 +41,8 @@ class NameCaptureController:
                     'isError': True
                 }
 
-            print(f"Received data: {data}")
-            print(f"Language from request: {previous_language}")
+            logger.debug("Received data: %s", data)
+            logger.debug("Language from request: %s", previous_language)
             
             # SOLUCIÓN: Prioridad estricta para el idioma
             # 1. Usar el idioma proporcionado en la solicitud si existe
@@ -42,7 +52,7 @@ class NameCaptureController:
             if 'detected_language' in data and data['detected_language']:
                 # Usar el idioma proporcionado en la solicitud con prioridad máxima
                 detected_language = data['detected_language']
-                print(f"STRICT RULE: Using language from request data: {detected_language}")
+                logger.debug("STRICT RULE: Using language from request data: %s", detected_language)
             else:
                 # Verificar si el texto parece ser solo un nombre (corto, sin @ o números)
                 is_likely_just_name = (len(data['text']) <= 30 and 
@@ -52,37 +62,37 @@ class NameCaptureController:
                 if is_likely_just_name:
                     # REGLA ESTRICTA: Para textos que parecen ser solo un nombre, mantener el idioma anterior
                     detected_language = previous_language
-                    print(f"STRICT RULE: Text appears to be just a name, STRICTLY maintaining previous language: {previous_language}")
+                    logger.debug("STRICT RULE: Text appears to be just a name, STRICTLY maintaining previous language: %s", previous_language)
                 else:
                     # Para textos más complejos, usar el proceso normal
-                    print("\n=== Language Processing for Complex Text ===")
-                    text_processing_result = self.chatgpt.process_text_input(
+                    logger.debug("Language Processing for Complex Text")
+                    text_processing_result = yield from self.chatgpt.process_text_input_steps(
                         data['text'], 
                         previous_language
                     )
                     detected_language = text_processing_result.get('detected_language', previous_language)
-                    print(f"Processed language from helper: {detected_language}")
+                    logger.debug("Processed language from helper: %s", detected_language)
             
             # IMPORTANTE: Actualizar el idioma global con el valor que hemos determinado
             # El ChatGPTHelper es responsable de formatear correctamente el código de idioma
             update_last_detected_language(detected_language)
-            print(f"Updated global language to: {detected_language}")
+            logger.debug("Updated global language to: %s", detected_language)
             
             # Verificar que la actualización fue exitosa
             current_language = get_last_detected_language()
-            print(f"Verified current global language: {current_language}")
+            logger.debug("Verified current global language: %s", current_language)
 
             # Extracción de nombre
-            print("\n=== Name Extraction ===")
-            name_extraction_result = self.chatgpt.extract_name(data['text'])
-            print(f"Name extraction result: {name_extraction_result}")
+            logger.debug("Name Extraction")
+            name_extraction_result = yield from self.chatgpt.extract_name_steps(data['text'])
+            logger.debug("Name extraction result: %s", name_extraction_result)
 
             if not name_extraction_result['success']:
-                print("Error: No valid name found")
+                logger.warning("No valid name found")
                 
                 # Crear mensaje de error personalizado según el idioma detectado
                 error_base_message = "Please provide a valid name (avoid using only numbers or symbols)"
-                translated_error = self.chatgpt.translate_message(error_base_message, detected_language)
+                translated_error = yield from self.chatgpt.translate_message_steps(error_base_message, detected_language)
                 
                 return {
                     'success': False, 
@@ -95,18 +105,18 @@ class NameCaptureController:
 
             name = name_extraction_result['name']
             is_registered = data['is_registered']
-            print(f"Extracted name: {name}")
-            print(f"Is registered: {is_registered}")
+            logger.debug("Extracted name: %s", name)
+            logger.debug("Is registered: %s", is_registered)
             
             # DEBUG: Verificar idioma antes de la generación de respuesta
-            print(f"Language for response generation: {detected_language}")
+            logger.debug("Language for response generation: %s", detected_language)
 
             # Generación de respuesta - pasar el idioma determinado directamente
-            print("\n=== Message Translation ===")
+            logger.debug("Message Translation")
             if is_registered:
-                response = self._handle_registered_user(name, detected_language)
+                response = yield from self._handle_registered_user_steps(name, detected_language)
             else:
-                response = self._handle_unregistered_user(name, detected_language)
+                response = yield from self._handle_unregistered_user_steps(name, detected_language)
 
             # Añadir campos adicionales para el frontend
             response['type'] = 'bot'
@@ -118,26 +128,25 @@ class NameCaptureController:
                 response['detected_language'] = detected_language
             
             # DEBUG: Verificar el idioma en la respuesta final
-            print(f"Final response language: {response.get('detected_language')}")
+            logger.debug("Final response language: %s", response.get('detected_language'))
 
-            print("\n=== Final Response ===")
-            print(f"Sending response: {response}")
+            logger.debug("Final Response")
+            logger.debug("Sending response: %s", response)
             return response
 
         except Exception as e:
-            print(f"\n=== Detailed Error Handling ===")
-            print(f"Full error details: {traceback.format_exc()}")
+            logger.exception("Error in capture_name")
             
             error_message = f"An error occurred while processing your request: {str(e)}"
             try:
-                error_message = self.chatgpt.translate_message(
+                error_message = yield from self.chatgpt.translate_message_steps(
                     error_message, 
                     previous_language
                 )
             except Exception:
                 pass
 
-            print(f"Translated error message: {error_message}")
+            logger.debug("Translated error message: %s", error_message)
             return {
                 'success': False,
                 'error': error_message,
@@ -145,7 +154,7 @@ class NameCaptureController:
                 'isError': True
             }
 
-    def _handle_registered_user(self, name, detected_language):
+    def _handle_registered_user_steps(self, name, detected_language):
         """
         Manejar respuesta para usuario registrado
         
@@ -154,7 +163,7 @@ class NameCaptureController:
         :return: Diccionario de respuesta
         """
         # SOLUCIÓN: Confiar ESTRICTAMENTE en el idioma pasado por la función principal
-        print(f"STRICT RULE: Using passed language in _handle_registered_user: {detected_language}")
+        logger.debug("STRICT RULE: Using passed language in _handle_registered_user: %s", detected_language)
         
         # Comprobar si el nombre es válido o es "No_name"
         if name and name != "No_name":
@@ -163,16 +172,16 @@ class NameCaptureController:
             base_message = "Welcome back! Would you like to connect with our experts?"
         
         # DEBUG: Registro antes de traducción
-        print(f"Base message before translation: '{base_message}'")
-        print(f"Using language for translation: '{detected_language}'")
+        logger.debug("Base message before translation: '%s'", base_message)
+        logger.debug("Using language for translation: '%s'", detected_language)
         
         # Hacer una llamada directa a translate_message con el idioma exacto
-        translated_message = self.chatgpt.translate_message(base_message, detected_language)
-        print(f"Translated welcome message: '{translated_message}'")
+        translated_message = yield from self.chatgpt.translate_message_steps(base_message, detected_language)
+        logger.debug("Translated welcome message: '%s'", translated_message)
         
-        yes_option = self.chatgpt.translate_message("yes", detected_language)
-        no_option = self.chatgpt.translate_message("no", detected_language)
-        print(f"Translated options: yes='{yes_option}', no='{no_option}'")
+        yes_option = yield from self.chatgpt.translate_message_steps("yes", detected_language)
+        no_option = yield from self.chatgpt.translate_message_steps("no", detected_language)
+        logger.debug("Translated options: yes='%s', no='%s'", yes_option, no_option)
 
         # No es necesario actualizar el idioma global aquí, ya se hizo en la función principal
 
@@ -189,7 +198,7 @@ class NameCaptureController:
             'isError': False
         }
 
-    def _handle_unregistered_user(self, name, detected_language):
+    def _handle_unregistered_user_steps(self, name, detected_language):
         """
         Manejar respuesta para usuario no registrado
         
@@ -198,17 +207,17 @@ class NameCaptureController:
         :return: Diccionario de respuesta
         """
         # SOLUCIÓN: Confiar ESTRICTAMENTE en el idioma pasado por la función principal
-        print(f"STRICT RULE: Using passed language in _handle_unregistered_user: {detected_language}")
+        logger.debug("STRICT RULE: Using passed language in _handle_unregistered_user: %s", detected_language)
         
         base_message = f"Thank you {name}! To better assist you, we recommend speaking with one of our agents."
-        translated_message = self.chatgpt.translate_message(base_message, detected_language)
-        print(f"Translated thank you message: '{translated_message}'")
+        translated_message = yield from self.chatgpt.translate_message_steps(base_message, detected_language)
+        logger.debug("Translated thank you message: '%s'", translated_message)
         
-        booking_message = self.chatgpt.translate_message(
+        booking_message = yield from self.chatgpt.translate_message_steps(
             "Would you like to schedule a call?",
             detected_language
         )
-        print(f"Translated booking message: '{booking_message}'")
+        logger.debug("Translated booking message: '%s'", booking_message)
         
         # No es necesario actualizar el idioma global aquí, ya se hizo en la función principal
 
@@ -1,10 +1,13 @@
+import logging
 from src.utils.chatgpt_helper import ChatGPTHelper
 # Importar funciones de gestión de idioma global
 from app.constants.language import get_last_detected_language, update_last_detected_language, reset_last_detected_language
 
+logger = logging.getLogger(__name__)
+
 class SectorExperienceController:
-    def __init__(self):
-        self.chatgpt = ChatGPTHelper()
+    def __init__(self, chatgpt=None):
+        self.chatgpt = chatgpt or ChatGPTHelper()
         
         self.BASE_MESSAGES = {
             'sector_received': "Thank you.",
@@ -268,5 +271,5 @@ class SectorExperienceController:
         
         :param language: Idioma por defecto
         """
-        print(f"\n=== Resetting Last Detected Language to: {language} ===")
+        logger.debug("Resetting Last Detected Language to: %s", language)
         reset_last_detected_language()
\ No newline at end of file
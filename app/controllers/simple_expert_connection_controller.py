@@ -3,8 +3,8 @@ import re
 from app.constants.language import get_last_detected_language, update_last_detected_language, reset_last_detected_language
 
 class SimpleExpertConnectionController:
-    def __init__(self):
-        self.chatgpt = ChatGPTHelper()
+    def __init__(self, chatgpt=None):
+        self.chatgpt = chatgpt or ChatGPTHelper()
         # Ya no necesitamos self.last_detected_language
 
     def validate_input(self, data):
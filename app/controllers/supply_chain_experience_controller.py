@@ -43,19 +43,19 @@ class SupplyChainExperienceController:
         :param data: Datos de la solicitud
         :return: Resultado de validación
         """
-        print("\n=== Input Validation ===")
+        logger.debug("Input Validation")
         if not data:
-            print("No data provided")
+            logger.debug("No data provided")
             return {
                 'is_valid': False,
                 'error': 'No data provided'
             }
         
-        print(f"Received data: {data}")
+        logger.debug("Received data: %s", data)
         
         # Verificar si el campo 'answer' contiene texto sin sentido
         if 'answer' in data and self._is_nonsense_text(data['answer']):
-            print("Nonsense text detected in answer")
+            logger.debug("Nonsense text detected in answer")
             return {
                 'is_valid': False,
                 'error': 'nonsense_input',
@@ -102,24 +102,24 @@ class SupplyChainExperienceController:
         :return: Respuesta procesada
         """
         try:
-            print("\n=== Processing Supply Chain Experience ===")
+            logger.debug("Processing Supply Chain Experience")
             
             # Importante: Verificar si hay un idioma explícito en los datos
             if data and isinstance(data, dict):
                 if 'language' in data:
                     explicit_language = data['language']
-                    print(f"Using explicit language from data: {explicit_language}")
+                    logger.debug("Using explicit language from data: %s", explicit_language)
                     update_last_detected_language(explicit_language)
                 elif 'detected_language' in data:
                     explicit_language = data['detected_language']
-                    print(f"Using detected_language from data: {explicit_language}")
+                    logger.debug("Using detected_language from data: %s", explicit_language)
                     update_last_detected_language(explicit_language)
                 # Verificar en filtersApplied dentro de phase3_data
                 elif 'phase3_data' in data and isinstance(data['phase3_data'], dict):
                     filters = data['phase3_data'].get('filtersApplied', {})
                     if filters and isinstance(filters, dict) and 'detected_language' in filters:
                         explicit_language = filters['detected_language']
-                        print(f"Using language from phase3_data.filtersApplied: {explicit_language}")
+                        logger.debug("Using language from phase3_data.filtersApplied: %s", explicit_language)
                         update_last_detected_language(explicit_language)
             
             # Validar entrada
@@ -152,31 +152,30 @@ class SupplyChainExperienceController:
             
             # Procesar idioma usando el método mejorado
             detected_language = self._process_language(validation_result['data'])
-            print(f"Detected Language: {detected_language}")
+            logger.debug("Detected Language: %s", detected_language)
             
             # IMPORTANTE: Asegurarse de que el idioma detectado se actualice correctamente
             update_last_detected_language(detected_language)
             
             # Si no hay respuesta, solicitar perspectiva
             if not validation_result['data'].get('answer'):
-                print("No answer provided, requesting initial perspective")
+                logger.debug("No answer provided, requesting initial perspective")
                 response = self._request_initial_perspective(detected_language, validation_result['data'])
             else:
                 # Procesar respuesta de perspectiva
-                print(f"Processing answer: {validation_result['data']['answer']}")
+                logger.debug("Processing answer: %s", validation_result['data']['answer'])
                 response = self._process_perspective_response(validation_result['data'], detected_language)
             
             # Añadir código de estado a la respuesta
             response['status_code'] = 200 if response.get('success', False) else 400
             
-            print("\n=== Final Response ===")
-            print(f"Response: {response}")
+            logger.debug("Final Response")
+            logger.debug("Response: %s", response)
             
             return response
 
         except Exception as e:
-            print(f"\n=== Error in process_supply_chain_experience ===")
-            print(f"Error details: {str(e)}")
+            logger.exception("Error in process_supply_chain_experience")
             
             # Usar el mensaje base y traducirlo si es necesario
             current_language = get_last_detected_language()
@@ -200,22 +199,22 @@ class SupplyChainExperienceController:
         :param data: Datos de la solicitud
         :return: Idioma detectado
         """
-        print("\n=== Language Processing ===")
+        logger.debug("Language Processing")
         current_language = get_last_detected_language()
-        print(f"Current detected language: {current_language}")
+        logger.debug("Current detected language: %s", current_language)
         
         try:
             # Priorizar el idioma si está explícitamente proporcionado
             if 'detected_language' in data:
                 detected_language = data['detected_language']
-                print(f"Language from data: {detected_language}")
+                logger.debug("Language from data: %s", detected_language)
                 update_last_detected_language(detected_language)
                 return detected_language
             
             # También verificar si hay un idioma en 'language'
             if 'language' in data:
                 detected_language = data['language']
-                print(f"Language from data 'language' field: {detected_language}")
+                logger.debug("Language from data 'language' field: %s", detected_language)
                 update_last_detected_language(detected_language)
                 return detected_language
             
@@ -228,12 +227,12 @@ class SupplyChainExperienceController:
                 )
                 detected_language = text_processing_result.get('detected_language', current_language)
                 
-                print(f"Input answer: {data['answer']}")
-                print(f"Detected language: {detected_language}")
+                logger.debug("Input answer: %s", data['answer'])
+                logger.debug("Detected language: %s", detected_language)
                 
                 # CLAVE: Mantener el idioma original de la conversación
                 if detected_language != current_language:
-                    print(f"Language detection attempted to change from {current_language} to {detected_language}")
+                    logger.debug("Language detection attempted to change from %s to %s", current_language, detected_language)
                     detected_language = current_language
                 
                 # Actualizar el último idioma detectado
@@ -245,7 +244,7 @@ class SupplyChainExperienceController:
             return current_language
         
         except Exception as e:
-            print(f"Error in language detection: {e}")
+            logger.error("Error in language detection: %s", e)
             return current_language
 
     def _request_initial_perspective(self, detected_language, data):
@@ -256,8 +255,8 @@ class SupplyChainExperienceController:
         :param data: Datos de la solicitud
         :return: Respuesta inicial
         """
-        print("\n=== Initial Perspective Request ===")
-        print(f"Detected language: {detected_language}")
+        logger.debug("Initial Perspective Request")
+        logger.debug("Detected language: %s", detected_language)
         
         # Traducir el mensaje base al idioma detectado
         initial_message = self.chatgpt.translate_message(
@@ -265,8 +264,8 @@ class SupplyChainExperienceController:
             detected_language
         )
         
-        print(f"Base message: {self.BASE_MESSAGES['ask_supply_chain']}")
-        print(f"Translated message: {initial_message}")
+        logger.debug("Base message: %s", self.BASE_MESSAGES['ask_supply_chain'])
+        logger.debug("Translated message: %s", initial_message)
         
         return {
             'success': True,
@@ -285,16 +284,16 @@ class SupplyChainExperienceController:
         :param detected_language: Idioma detectado
         :return: Respuesta procesada
         """
-        print("\n=== Perspective Response Processing ===")
+        logger.debug("Perspective Response Processing")
         answer = data['answer'].strip()
-        print(f"Input answer: '{answer}'")
-        print(f"Using language: {detected_language}")
+        logger.debug("Input answer: '%s'", answer)
+        logger.debug("Using language: %s", detected_language)
         
         # Usar extract_intention para todas las respuestas
         intention_result = self.chatgpt.extract_intention(answer)
         intention = intention_result.get('intention') if intention_result.get('success') else None
         
-        print(f"Extracted intention: {intention}")
+        logger.debug("Extracted intention: %s", intention)
 
         # Manejar respuesta basado en la intención
         if intention == 'yes':
@@ -312,18 +311,18 @@ class SupplyChainExperienceController:
         :param detected_language: Idioma detectado
         :return: Respuesta con empresas de cadena de suministro
         """
-        print("\n=== Positive Response Handling ===")
-        print(f"Sector: {data.get('sector', 'Financial Services')}")
-        print(f"Region: {data.get('region', 'Europe')}")
+        logger.debug("Positive Response Handling")
+        logger.debug("Sector: %s", data.get('sector', 'Financial Services'))
+        logger.debug("Region: %s", data.get('region', 'Europe'))
         
         try:
             # Obtener empresas excluidas si están disponibles
             excluded_companies = []
             try:
                 excluded_companies = self.excluded_companies_service.get_excluded_companies()
-                print(f"Found {len(excluded_companies)} excluded companies")
+                logger.debug("Found %s excluded companies", len(excluded_companies))
             except Exception as e:
-                print(f"Error getting excluded companies: {e}")
+                logger.error("Error getting excluded companies: %s", e)
         
             # Obtener empresas de cadena de suministro
             supply_companies_result = self.chatgpt.get_supply_chain_companies(
@@ -332,8 +331,8 @@ class SupplyChainExperienceController:
                 excluded_companies=excluded_companies
             )
             
-            print(f"Supply Companies Result Success: {supply_companies_result.get('success', False)}")
-            print(f"Number of companies found: {len(supply_companies_result.get('content', []))}")
+            logger.debug("Supply Companies Result Success: %s", supply_companies_result.get('success', False))
+            logger.debug("Number of companies found: %s", len(supply_companies_result.get('content', [])))
             
             if not supply_companies_result.get('success', False):
                 error_message = "Error generating supply chain companies"
@@ -370,7 +369,7 @@ class SupplyChainExperienceController:
                 'status_code': 200
             }
         except Exception as e:
-            print(f"Error in _handle_positive_response: {str(e)}")
+            logger.error("Error in _handle_positive_response: %s", e)
             error_message = self.chatgpt.translate_message(
                 self.BASE_MESSAGES['processing_error'],
                 detected_language
@@ -391,7 +390,7 @@ class SupplyChainExperienceController:
         :param data: Datos de la solicitud
         :return: Respuesta procesada
         """
-        print("\n=== Negative Response Handling ===")
+        logger.debug("Negative Response Handling")
         
         # Traducir mensaje de respuesta negativa
         response_message = self.chatgpt.translate_message(
@@ -399,7 +398,7 @@ class SupplyChainExperienceController:
             detected_language
         )
         
-        print(f"Response message: {response_message}")
+        logger.debug("Response message: %s", response_message)
         
         return {
             'success': True,
@@ -418,7 +417,7 @@ class SupplyChainExperienceController:
         :param detected_language: Idioma detectado
         :return: Respuesta procesada
         """
-        print("\n=== Unclear Response Handling ===")
+        logger.debug("Unclear Response Handling")
         
         # Traducir mensaje de solicitud de aclaración
         response_message = self.chatgpt.translate_message(
@@ -426,7 +425,7 @@ class SupplyChainExperienceController:
             detected_language
         )
         
-        print(f"Response message: {response_message}")
+        logger.debug("Response message: %s", response_message)
         
         return {
             'success': False,
@@ -441,5 +440,5 @@ class SupplyChainExperienceController:
         
         :param language: Idioma por defecto
         """
-        print(f"\n=== Resetting Last Detected Language to: {language} ===")
+        logger.debug("Resetting Last Detected Language to: %s", language)
         reset_last_detected_language()
\ No newline at end of file
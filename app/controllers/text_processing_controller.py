@@ -4,8 +4,8 @@ from src.utils.chatgpt_helper import ChatGPTHelper
 from app.constants.language import get_last_detected_language, update_last_detected_language, reset_last_detected_language
 
 class TextProcessingController:
-    def __init__(self):
-        self.chatgpt = ChatGPTHelper()
+    def __init__(self, chatgpt=None):
+        self.chatgpt = chatgpt or ChatGPTHelper()
         self.logger = logging.getLogger(__name__)
         
         self.BASE_MESSAGES = {
@@ -46,11 +46,19 @@ class TextProcessingController:
         :param data: Datos de la solicitud
         :return: Respuesta procesada
         """
+        return self.chatgpt.run_steps(self.process_text_steps(data))
+
+    async def process_text_async(self, data):
+        """Igual que process_text, esperando al LLM sin bloquear el event loop (modo ASGI)"""
+        return await self.chatgpt.run_steps_async(self.process_text_steps(data))
+
+    def process_text_steps(self, data):
+        """Flujo de extracción de región; cede cada llamada al LLM (ver ChatGPTHelper.run_steps)"""
         try:
             # Validar entrada
             validation_result = self.validate_input(data)
             if not validation_result['is_valid']:
-                self.logger.error(f"Input validation failed: {validation_result['error']}")
+                self.logger.error("Input validation failed: %s", validation_result['error'])
                 return {
                     'success': False,
                     'error': validation_result['error'],
@@ -65,7 +73,7 @@ class TextProcessingController:
                 detected_language = data['language']
                 # Actualizar idioma global
                 update_last_detected_language(detected_language)
-                self.logger.info(f"Using language from request: {detected_language}")
+                self.logger.info("Using language from request: %s", detected_language)
             else:
                 # Si no hay idioma en la solicitud, seguir con el flujo original
                 current_language = get_last_detected_language()
@@ -81,7 +89,7 @@ class TextProcessingController:
                     self.logger.warning("Multilingual region detection failed")
                     
                     # Usar detección de idioma de respaldo
-                    text_processing_result = self.chatgpt.process_text_input(
+                    text_processing_result = yield from self.chatgpt.process_text_input_steps(
                         input_text, 
                         current_language
                     )
@@ -95,7 +103,7 @@ class TextProcessingController:
                 update_last_detected_language(detected_language)
             
             # Registro de idioma detectado/usado
-            self.logger.info(f"Detected language: {detected_language}")
+            self.logger.info("Detected language: %s", detected_language)
             
             # Extracción de región
             if 'region_detection' in locals() and region_detection.get('success', False):
@@ -107,14 +115,14 @@ class TextProcessingController:
                 }
             else:
                 # De lo contrario, intentar extraer región con el método existente
-                region = self.chatgpt.extract_region(input_text)
+                region = yield from self.chatgpt.extract_region_steps(input_text)
             
             # Verificar si se pudo extraer la región
             if not region or not region.get('success', False):
-                self.logger.warning(f"Region extraction failed for input: '{input_text}'")
+                self.logger.warning("Region extraction failed for input: '%s'", input_text)
                 
                 # Traducir mensaje explicativo para entrada no válida
-                explanatory_message = self.chatgpt.translate_message(
+                explanatory_message = yield from self.chatgpt.translate_message_steps(
                     self.BASE_MESSAGES['invalid_region'], 
                     detected_language
                 )
@@ -133,7 +141,7 @@ class TextProcessingController:
             )
             
             # Traducir mensaje
-            next_question = self.chatgpt.translate_message(base_message, detected_language)
+            next_question = yield from self.chatgpt.translate_message_steps(base_message, detected_language)
             
             # Preparar respuesta
             response = {
@@ -145,7 +153,7 @@ class TextProcessingController:
             }
 
             # Registro de éxito
-            self.logger.info(f"Text processing successful for region: {region}")
+            self.logger.info("Text processing successful for region: %s", region)
             
             return response
 
@@ -159,7 +167,7 @@ class TextProcessingController:
                 current_language = get_last_detected_language()
                 
                 # Intentar traducir mensaje de error
-                translated_error = self.chatgpt.translate_message(
+                translated_error = yield from self.chatgpt.translate_message_steps(
                     self.BASE_MESSAGES['processing_error'], 
                     current_language
                 )
@@ -182,4 +190,4 @@ class TextProcessingController:
         :param language: Idioma por defecto
         """
         reset_last_detected_language()
-        self.logger.info(f"Last detected language reset to: {language}")
\ No newline at end of file
+        self.logger.info("Last detected language reset to: %s", language)
\ No newline at end of file
@@ -1,4 +1,6 @@
 from src.handlers.voice_handler import VoiceHandler
+from src.utils.chatgpt_helper import MAX_AUDIO_BYTES, MIN_AUDIO_BYTES
+from app.services.voice_job_queue import QueueFullError
 
 class VoiceProcessingController:
     def __init__(self, voice_handler=None):
@@ -58,7 +60,8 @@ class VoiceProcessingController:
             # Manejar solicitud de voz
             voice_result = self.voice_handler.handle_voice_request(
                 request, 
-                step=process_type
+                step=process_type,
+                preprocess=self._wants_preprocessing(request)
             )
             
             # Preparar respuesta
@@ -74,6 +77,94 @@ class VoiceProcessingController:
             error_response['status_code'] = 500
             return error_response
 
+    def submit_voice_job(self, request, job_queue):
+        """
+        Encolar una solicitud de voz para procesarla en segundo plano
+
+        :param request: Solicitud Flask con el audio en 'audio' (o 'file')
+        :param job_queue: Cola de trabajos de voz
+        :return: Id del trabajo o error (con status_code)
+        """
+        audio_file = request.files.get('audio') or request.files.get('file')
+        if not audio_file:
+            return {
+                'success': False,
+                'error': 'No audio file provided',
+                'status_code': 400
+            }
+
+        # Leer el audio ahora: el archivo subido deja de existir al terminar la petición
+        audio_bytes = audio_file.read(MAX_AUDIO_BYTES + 1)
+        if len(audio_bytes) > MAX_AUDIO_BYTES:
+            return {
+                'success': False,
+                'error': f"Audio file too large (max {MAX_AUDIO_BYTES // (1024 * 1024)} MB)",
+                'status_code': 413
+            }
+        if len(audio_bytes) < MIN_AUDIO_BYTES:
+            return {
+                'success': False,
+                'error': 'Audio file is empty or too short',
+                'status_code': 400
+            }
+
+        process_type = request.args.get('type', 'username')
+        try:
+            job_id = job_queue.submit(
+                audio_bytes,
+                filename=audio_file.filename,
+                step=process_type,
+                content_type=audio_file.content_type,
+                preprocess=self._wants_preprocessing(request)
+            )
+        except QueueFullError as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'retry_after': e.retry_after,
+                'status_code': 503
+            }
+
+        return {
+            'success': True,
+            'job_id': job_id,
+            'status': job_queue.QUEUED,
+            'status_code': 202
+        }
+
+    def get_voice_job(self, job_id, job_queue):
+        """
+        Consultar el estado de un trabajo de voz
+
+        :param job_id: Id del trabajo
+        :param job_queue: Cola de trabajos de voz
+        :return: Estado del trabajo (con la respuesta de voz si ha terminado)
+        """
+        job = job_queue.get(job_id)
+        if not job:
+            return {
+                'success': False,
+                'error': 'Voice job not found or expired',
+                'status_code': 404
+            }
+        return self.describe_voice_job(job)
+
+    def describe_voice_job(self, job):
+        """Formatear el estado de un trabajo con la misma respuesta que /process"""
+        response = {
+            'success': True,
+            'job_id': job['job_id'],
+            'status': job['status'],
+            'status_code': 200
+        }
+        if 'result' in job:
+            result = job['result'] or {}
+            if result.get('error') or not result.get('success', False):
+                response['error'] = result.get('error')
+            else:
+                response['result'] = self._prepare_voice_response(result, job['step'])
+        return response
+
     def _prepare_voice_response(self, voice_result, process_type):
         """
         Preparar respuesta de procesamiento de voz
@@ -86,7 +177,10 @@ class VoiceProcessingController:
             'success': True,
             'detected_language': voice_result.get('detected_language', 'es'),
             'transcription': voice_result.get('transcription'),
-            'original_transcription': voice_result.get('original_transcription')
+            'original_transcription': voice_result.get('original_transcription'),
+            'cached': voice_result.get('cached', False),
+            'preprocessing': voice_result.get('preprocessing'),
+            'timings': voice_result.get('timings')
         }
 
         # Agregar username solo si el tipo de procesamiento es 'username'
@@ -95,6 +189,11 @@ class VoiceProcessingController:
 
         return response
 
+    @staticmethod
+    def _wants_preprocessing(request):
+        """El preprocesado de audio se activa por petición con ?preprocess=true"""
+        return request.args.get('preprocess', '').lower() in ('1', 'true', 'yes')
+
     def _handle_error(self, error):
         """
         Manejar errores de procesamiento de voz
@@ -3,6 +3,7 @@ import re
 import requests
 import logging
 from src.utils.chatgpt_helper import ChatGPTHelper
+from src.utils.structured_logging import redact_headers
 
 class WelcomeController:
     def __init__(self):
@@ -24,14 +25,8 @@ class WelcomeController:
             
             # Puedes añadir más idiomas según sea necesario
         }
-        # Configurar logging
-        self.logger = logging.getLogger('WelcomeController')
-        self.logger.setLevel(logging.DEBUG)
-        if not self.logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-            handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
+        # El nivel lo fija configure_logging (LOG_LEVEL / LOG_LEVELS)
+        self.logger = logging.getLogger(__name__)
 
     def validate_input(self, request):
         """
@@ -76,38 +71,37 @@ class WelcomeController:
         
         client_ip = None
         
-        # Registramos todas las cabeceras para debug
-        self.logger.debug("Headers recibidas:")
-        for header_name, header_value in request.headers.items():
-            self.logger.debug(f"{header_name}: {header_value}")
+        # Cabeceras sólo en DEBUG y sin valores sensibles (cookies, tokens)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Headers recibidas: %s", redact_headers(request.headers))
         
         # Intentamos las cabeceras conocidas
         for header in ip_headers:
             ip_value = request.headers.get(header)
             if ip_value:
-                self.logger.debug(f"Encontrada cabecera {header}: {ip_value}")
+                self.logger.debug("Encontrada cabecera %s: %s", header, ip_value)
                 
                 # Manejar múltiples IPs (primero es generalmente el cliente)
                 if ',' in ip_value:
                     potential_ips = [i.strip() for i in ip_value.split(',')]
-                    self.logger.debug(f"IPs múltiples encontradas: {potential_ips}")
+                    self.logger.debug("IPs múltiples encontradas: %s", potential_ips)
                     valid_ips = [i for i in potential_ips if self.is_valid_ip(i)]
                     if valid_ips:
                         client_ip = valid_ips[0]
-                        self.logger.debug(f"Seleccionada IP: {client_ip}")
+                        self.logger.debug("Seleccionada IP: %s", client_ip)
                         break
                 # IP única
                 elif self.is_valid_ip(ip_value):
                     client_ip = ip_value
-                    self.logger.debug(f"IP única: {client_ip}")
+                    self.logger.debug("IP única: %s", client_ip)
                     break
         
         # Último recurso: remote_addr
         if not client_ip and hasattr(request, 'remote_addr') and self.is_valid_ip(request.remote_addr):
             client_ip = request.remote_addr
-            self.logger.debug(f"Usando remote_addr: {client_ip}")
+            self.logger.debug("Usando remote_addr: %s", client_ip)
         
-        self.logger.info(f"IP de cliente detectada: {client_ip}")
+        self.logger.info("IP de cliente detectada: %s", client_ip)
         return client_ip
 
     def geolocate_ip(self, client_ip):
@@ -150,15 +144,15 @@ class WelcomeController:
 
         for service_name, service_func in detection_services:
             try:
-                self.logger.debug(f"Intentando geolocalizar con: {service_name}")
+                self.logger.debug("Intentando geolocalizar con: %s", service_name)
                 response = service_func(client_ip)
                 
                 if response.status_code != 200:
-                    self.logger.warning(f"{service_name} respondió con código: {response.status_code}")
+                    self.logger.warning("%s respondió con código: %s", service_name, response.status_code)
                     continue
                     
                 data = response.json()
-                self.logger.debug(f"Respuesta de {service_name}: {data}")
+                self.logger.debug("Respuesta de %s: %s", service_name, data)
                 
                 # Extraer el código de país según el servicio
                 if service_name == 'ipapi.co':
@@ -172,19 +166,19 @@ class WelcomeController:
                 elif service_name == 'ipgeolocation.io':
                     country_code = data.get('country_code2', country_code)
                 
-                self.logger.info(f"País detectado por {service_name}: {country_code}")
+                self.logger.info("País detectado por %s: %s", service_name, country_code)
                 
                 # Si encontramos un código de país válido, terminamos
                 if country_code and country_code != 'US':  # Solo aceptamos el default si realmente falla todo
                     break
                     
             except Exception as e:
-                self.logger.warning(f"Error con {service_name}: {str(e)}")
+                self.logger.warning("Error con %s: %s", service_name, e)
                 continue
 
         # Asegurarse que el código de país esté en mayúsculas
         country_code = country_code.upper() if isinstance(country_code, str) else 'US'
-        self.logger.info(f"Código de país final: {country_code}")
+        self.logger.info("Código de país final: %s", country_code)
         return country_code
 
     def generate_welcome_message(self, request):
@@ -206,7 +200,7 @@ class WelcomeController:
 
             # Determinación de idioma con fallback inteligente
             target_language = self.language_map.get(country_code, 'en')
-            self.logger.info(f"Idioma seleccionado: {target_language} para país: {country_code}")
+            self.logger.info("Idioma seleccionado: %s para país: %s", target_language, country_code)
 
             # Actualizar idioma global
             self.last_detected_language = target_language
@@ -222,7 +216,7 @@ class WelcomeController:
             
             # Traducción condicional con mejor manejo
             if target_language != 'en':
-                self.logger.info(f"Traduciendo mensajes a {target_language}")
+                self.logger.info("Traduciendo mensajes a %s", target_language)
                 try:
                     greeting_translated = self.chatgpt.translate_message(
                         f"Translate the following keeping 'Silverlight Research Expert Network' unchanged: {welcome_messages['greeting']['text']}",
@@ -244,9 +238,9 @@ class WelcomeController:
                         }
                     }
                     
-                    self.logger.debug(f"Mensajes traducidos: {translated_messages}")
+                    self.logger.debug("Mensajes traducidos: %s", translated_messages)
                 except Exception as translate_error:
-                    self.logger.error(f"Error en traducción: {str(translate_error)}")
+                    self.logger.error("Error en traducción: %s", translate_error)
                     # Fallback a inglés si falla la traducción
                     translated_messages = {
                         "greeting": {
@@ -278,11 +272,11 @@ class WelcomeController:
                 'status_code': 200
             }
             
-            self.logger.info(f"Respuesta generada exitosamente para {country_code}/{target_language}")
+            self.logger.info("Respuesta generada exitosamente para %s/%s", country_code, target_language)
             return response_data
 
         except Exception as e:
-            self.logger.error(f"Error general: {str(e)}", exc_info=True)
+            self.logger.error("Error general: %s", e, exc_info=True)
             error_message = "Error generating welcome message"
             try:
                 error_message = self.chatgpt.translate_message(
@@ -75,10 +75,12 @@ class ZohoRecruitController:
                 'status_code': 500
             }
 
-    def get_jobs(self):
+    def get_jobs(self, status=None, industry=None):
         """
         Obtener trabajos
         
+        :param status: Filtro opcional por estado de la vacante
+        :param industry: Filtro opcional por industria
         :return: Resultado de obtención de trabajos
         """
         try:
@@ -92,7 +94,7 @@ class ZohoRecruitController:
                 }
 
             # Obtener trabajos
-            result = self.zoho_recruit_service.get_all_jobs()
+            result = self.zoho_recruit_service.get_all_jobs(status, industry)
             
             # Añadir código de estado a la respuesta
             result['status_code'] = 200 if result.get('success', False) else 500
@@ -1,6 +1,7 @@
-from flask import Flask, request
+from flask import Flask, request, g
 from flask_cors import CORS
 from config.settings import DevelopmentConfig
+import time
 import logging
 
 # Importaciones de utilidades
@@ -15,24 +16,39 @@ from app.routes.token_routes import token_routes
 from app.routes.ai.voiceRoutes import voice_routes
 from app.routes.ai.translateRoutes import translate_routes
 from app.routes.welcome_routes import welcome_routes
-from app.routes.conversation_routes import conversation_routes
+from app.routes.conversation_routes import conversation_routes, controllers as conversation_controllers
 from app.routes.test_routes import test_routes
 from app.routes.ai.sector_routes import sector_routes 
 from app.routes.zoho_routes import zoho_routes
 from app.routes.monitoring_routes import monitoring_routes
 
+from app.constants.language import (
+    new_conversation_id,
+    set_current_conversation_id,
+    reset_current_conversation_id
+)
+from src.utils.tracing import start_trace, end_trace, current_trace, JsonlSpanExporter
+from src.utils.structured_logging import configure_logging, parse_module_levels
+from src.utils.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_FLIGHT
+
 # Importaciones de servicios 
 from src.services.external.zoho_services import ZohoService
 from src.handlers.voice_handler import VoiceHandler
 from src.utils.chatgpt_helper import ChatGPTHelper
 from app.services.server_monitoring_service import ServerMonitoringService
+from app.services.voice_job_queue import VoiceJobQueue
+from app.services.metrics_service import MetricsService
 
-# Configurar logging
-logging.basicConfig(level=logging.INFO, 
-                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 def create_app(config_class=DevelopmentConfig):
+    # Configurar logging (niveles por módulo, muestreo y redacción)
+    configure_logging(
+        config_class.LOG_LEVEL,
+        parse_module_levels(config_class.LOG_LEVELS),
+        config_class.LOG_FORMAT
+    )
+
     # Configurar rutas del proyecto
     setup_project_path()
     
@@ -55,12 +71,78 @@ def create_app(config_class=DevelopmentConfig):
                 "Content-Type", 
                 "Authorization",
                 "Accept",
-                "Origin"
+                "Origin",
+                "X-Conversation-Id"
             ],
+            "expose_headers": ["X-Conversation-Id"],
             "supports_credentials": True
         }
     })
     
+    # Métricas HTTP por ruta: se etiqueta con la regla ('/api/recruit/jobs'),
+    # no con la URL, para que el número de series no crezca con los parámetros
+    @app.before_request
+    def begin_request_metrics():
+        g.metrics_started = time.perf_counter()
+        HTTP_REQUESTS_IN_FLIGHT.inc(server='wsgi')
+
+    @app.teardown_request
+    def record_request_metrics(exception=None):
+        started = g.pop('metrics_started', None)
+        if started is None:
+            return
+        HTTP_REQUESTS_IN_FLIGHT.dec(server='wsgi')
+        HTTP_REQUEST_DURATION.observe(
+            time.perf_counter() - started,
+            method=request.method,
+            route=request.url_rule.rule if request.url_rule else 'unmatched',
+            status=g.get('response_status', 500)
+        )
+
+    trace_exporter = JsonlSpanExporter(app.config['TRACE_EXPORT_PATH']) if app.config.get('TRACE_EXPORT_PATH') else None
+
+    # Traza por petición: los spans de ChatGPTHelper, ZohoService y los
+    # servicios se agregan en la cabecera Server-Timing
+    @app.before_request
+    def begin_trace():
+        if app.config.get('TRACING_ENABLED', True):
+            g.trace_token = start_trace(request.endpoint or request.path, method=request.method, path=request.path)
+
+    @app.teardown_request
+    def finish_trace(exception=None):
+        token = g.pop('trace_token', None)
+        if token is not None:
+            end_trace(
+                token,
+                trace_exporter,
+                status=g.get('response_status', 500),
+                conversation_id=g.get('conversation_id'),
+                error=type(exception).__name__ if exception else None
+            )
+
+    # Asociar cada petición a su conversación para el estado de idioma; si el
+    # cliente no envía ninguna se crea una y se le devuelve (cabecera y cookie)
+    @app.before_request
+    def bind_conversation():
+        body = request.get_json(silent=True) if request.is_json else None
+        conversation_id = (
+            request.headers.get('X-Conversation-Id') or
+            request.args.get('conversation_id') or
+            (body.get('conversation_id') if isinstance(body, dict) else None) or
+            request.cookies.get(config_class.CONVERSATION_COOKIE)
+        )
+        if not conversation_id and request.method != 'OPTIONS':
+            conversation_id = new_conversation_id()
+            g.conversation_minted = True
+        g.conversation_id = conversation_id
+        g.conversation_token = set_current_conversation_id(conversation_id)
+
+    @app.teardown_request
+    def unbind_conversation(exception=None):
+        token = g.pop('conversation_token', None)
+        if token is not None:
+            reset_current_conversation_id(token)
+
     # Manejo de CORS para cada respuesta
     @app.after_request
     def after_request(response):
@@ -68,32 +150,67 @@ def create_app(config_class=DevelopmentConfig):
         if origin in config_class.ALLOWED_ORIGINS:
             response.headers.add('Access-Control-Allow-Origin', origin)
             response.headers.add('Access-Control-Allow-Credentials', 'true')
-            response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization,Accept,Origin')
+            response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization,Accept,Origin,X-Conversation-Id')
             response.headers.add('Access-Control-Allow-Methods', 'GET,PUT,POST,DELETE,OPTIONS')
+            response.headers.add('Access-Control-Expose-Headers', 'X-Conversation-Id')
+        if g.get('conversation_id'):
+            response.headers['X-Conversation-Id'] = g.conversation_id
+        if g.get('conversation_minted'):
+            response.set_cookie(
+                config_class.CONVERSATION_COOKIE,
+                g.conversation_id,
+                max_age=config_class.CONVERSATION_COOKIE_MAX_AGE,
+                httponly=True,
+                secure=config_class.CONVERSATION_COOKIE_SECURE,
+                samesite=config_class.CONVERSATION_COOKIE_SAMESITE
+            )
+
+        g.response_status = response.status_code
+        trace = current_trace()
+        if trace is not None:
+            response.headers['Server-Timing'] = trace.server_timing()
+            if origin in config_class.ALLOWED_ORIGINS:
+                response.headers['Timing-Allow-Origin'] = origin
         return response
     
     # Inicializar servicios globales con Singleton
-    logger.info("\n=== Initializing Global Services ===")
+    logger.info("Initializing global services")
     
     try:
         # Crear instancias singleton de servicios
         zoho_service = ZohoService(verify_token=True)
         voice_handler = VoiceHandler()
         chatgpt_helper = ChatGPTHelper()
+        voice_jobs = VoiceJobQueue(
+            voice_handler=voice_handler,
+            workers=app.config.get('VOICE_JOB_WORKERS', 2),
+            max_queue=app.config.get('VOICE_JOB_QUEUE_SIZE', 20)
+        )
 
         # Almacenar servicios en la configuración de la app
         global_services = {
             'zoho_service': zoho_service,
             'voice_handler': voice_handler,
-            'chatgpt': chatgpt_helper
+            'voice_jobs': voice_jobs,
+            'chatgpt': chatgpt_helper,
+            'metrics': MetricsService(voice_jobs, chatgpt_helper, [conversation_controllers])
         }
         
         for service_name, service_instance in global_services.items():
             app.config[service_name] = service_instance
-            logger.info(f"Initialized {service_name}")
+            logger.info("Initialized %s", service_name)
+
+        # Precargar vacantes para que /recruit/jobs se sirva desde memoria
+        zoho_service.prefetch_jobs()
+
+        # Arrancar los workers de la cola de voz
+        voice_jobs.start()
+
+        # Métricas de capacidad para /api/metrics
+        global_services['metrics'].register()
     
     except Exception as e:
-        logger.error(f"Error initializing services: {e}")
+        logger.error("Error initializing services: %s", e)
         raise
     
     # Inicializar servicio de monitoreo
@@ -102,7 +219,7 @@ def create_app(config_class=DevelopmentConfig):
         monitoring_service.start_keep_alive()
         logger.info("Server monitoring service started")
     except Exception as e:
-        logger.error(f"Error starting monitoring service: {e}")
+        logger.error("Error starting monitoring service: %s", e)
     
     # Definir blueprints de forma más clara
     blueprints_config = [
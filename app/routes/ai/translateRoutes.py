@@ -1,14 +1,17 @@
+import logging
 from flask import Blueprint, request, jsonify
 from app.controllers.translation_controller import TranslationController
 
+logger = logging.getLogger(__name__)
+
 translate_routes = Blueprint('translate', __name__)
 translation_controller = TranslationController()
 
 @translate_routes.route('/translate', methods=['POST', 'OPTIONS'])
 def translate():
-    print("\n=== New Request to /api/translate ===")
-    print("Method:", request.method)
-    print("Headers:", dict(request.headers))
+    logger.debug("New Request to /api/translate")
+    logger.debug("Method: %s", request.method)
+    logger.debug("Headers: %s", dict(request.headers))
     
     if request.method == 'OPTIONS':
         return jsonify({"status": "ok"})
@@ -1,9 +1,63 @@
-from flask import Blueprint, request, jsonify
+import json
+import time
+import threading
+from flask import Blueprint, request, jsonify, current_app, Response, stream_with_context, url_for
 from app.controllers.voice_processing_controller import VoiceProcessingController
 
 voice_routes = Blueprint('voice', __name__)
 voice_processing_controller = VoiceProcessingController()
 
+# Duración máxima de un stream SSE y cada cuánto se envía un latido
+SSE_MAX_SECONDS = 60
+SSE_HEARTBEAT_SECONDS = 10
+
+# En WSGI cada stream abierto ocupa un hilo de waitress durante todo el
+# stream; se limitan a VOICE_SSE_MAX_STREAMS y el resto debe usar polling.
+# La app ASGI (app/asgi.py) sirve los streams en el event loop, sin límite.
+_open_streams = 0
+_streams_lock = threading.Lock()
+
+
+def sse_event(event, payload):
+    """Formatear un evento Server-Sent Events"""
+    return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+
+
+def voice_job_event(job, deadline):
+    """
+    Siguiente evento del stream de un trabajo de voz
+
+    :param job: Estado del trabajo (None si no existe o ha caducado)
+    :param deadline: Instante (time.monotonic) en el que se cierra el stream
+    :return: (evento, datos, si es el último evento del stream)
+    """
+    if not job:
+        return 'error', {'error': 'Voice job not found or expired'}, True
+
+    response = voice_processing_controller.describe_voice_job(job)
+    response.pop('status_code', None)
+    if 'result' in job:
+        return 'done', response, True
+    if time.monotonic() >= deadline:
+        # El cliente puede seguir consultando por polling
+        return 'timeout', response, True
+    return 'status', response, False
+
+
+def _acquire_stream(limit):
+    global _open_streams
+    with _streams_lock:
+        if _open_streams >= limit:
+            return False
+        _open_streams += 1
+        return True
+
+
+def _release_stream():
+    global _open_streams
+    with _streams_lock:
+        _open_streams -= 1
+
 @voice_routes.route('/process', methods=['POST'])
 def process_voice():
     try:
@@ -13,4 +67,98 @@ def process_voice():
         return jsonify({
             'success': False,
             'error': str(e)
-        }), 500
\ No newline at end of file
+        }), 500
+
+@voice_routes.route('/jobs', methods=['POST'])
+def submit_voice_job():
+    try:
+        result = voice_processing_controller.submit_voice_job(
+            request,
+            current_app.config['voice_jobs']
+        )
+        status_code = result.pop('status_code', 500)
+
+        if status_code == 202:
+            result['status_url'] = url_for('voice.get_voice_job', job_id=result['job_id'])
+            result['events_url'] = url_for('voice.voice_job_events', job_id=result['job_id'])
+
+        response = jsonify(result)
+        response.status_code = status_code
+        if status_code == 503:
+            response.headers['Retry-After'] = str(result.get('retry_after', 5))
+        return response
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@voice_routes.route('/jobs/<job_id>', methods=['GET'])
+def get_voice_job(job_id):
+    try:
+        result = voice_processing_controller.get_voice_job(
+            job_id,
+            current_app.config['voice_jobs']
+        )
+        status_code = result.pop('status_code', 500)
+        return jsonify(result), status_code
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@voice_routes.route('/stats', methods=['GET'])
+def voice_stats():
+    try:
+        return jsonify({
+            'success': True,
+            'jobs': current_app.config['voice_jobs'].stats(),
+            'transcription_cache': current_app.config['chatgpt'].get_transcription_cache_stats()
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@voice_routes.route('/jobs/<job_id>/events', methods=['GET'])
+def voice_job_events(job_id):
+    job_queue = current_app.config['voice_jobs']
+    if not job_queue.get(job_id):
+        return jsonify({
+            'success': False,
+            'error': 'Voice job not found or expired'
+        }), 404
+
+    if not _acquire_stream(current_app.config.get('VOICE_SSE_MAX_STREAMS', 2)):
+        response = jsonify({
+            'success': False,
+            'error': 'Too many open event streams, poll status_url instead',
+            'status_url': url_for('voice.get_voice_job', job_id=job_id),
+            'retry_after': SSE_HEARTBEAT_SECONDS
+        })
+        response.status_code = 503
+        response.headers['Retry-After'] = str(SSE_HEARTBEAT_SECONDS)
+        return response
+
+    def stream():
+        deadline = time.monotonic() + SSE_MAX_SECONDS
+        while True:
+            job = job_queue.wait(job_id, timeout=SSE_HEARTBEAT_SECONDS)
+            event, payload, last = voice_job_event(job, deadline)
+            yield sse_event(event, payload)
+            if last:
+                return
+
+    response = Response(
+        stream_with_context(stream()),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+    # Se libera también si el cliente se desconecta antes de empezar el stream
+    response.call_on_close(_release_stream)
+    return response
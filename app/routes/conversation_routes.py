@@ -1,53 +1,81 @@
-from flask import Blueprint, request, jsonify
-from app.controllers.email_capture_controller import EmailCaptureController
-from app.controllers.name_capture_controller import NameCaptureController
-from app.controllers.expert_connection_controller import ExpertConnectionController
-from app.controllers.sector_experience_controller import SectorExperienceController
-from app.controllers.text_processing_controller import TextProcessingController
-from app.controllers.simple_expert_connection_controller import SimpleExpertConnectionController
-from app.controllers.company_suggestions_controller import CompanySuggestionsController
-from app.controllers.companies_agreement_controller import CompaniesAgreementController
-from app.controllers.employment_status_controller import EmploymentStatusController
-from app.controllers.exclude_companies_controller import ExcludeCompaniesController
-from app.controllers.client_perspective_controller import ClientPerspectiveController
-from app.controllers.supply_chain_experience_controller import SupplyChainExperienceController
-from app.controllers.evaluation_questions_controller import EvaluationQuestionsController
-
-from app.controllers.evaluation_questions_sections_controller import EvaluationQuestionsSectionsController
-from app.controllers.evaluation_controller import EvaluationController
-from app.controllers.evaluation_retrieval_controller import EvaluationRetrievalController
-from app.controllers.industry_experts_controller import IndustryExpertsController
-from app.controllers.expert_selection_controller import ExpertSelectionController
+import time
+from flask import Blueprint, request, jsonify, current_app, g
+from app.utils.controller_registry import ControllerRegistry
+from app.utils.json_response import json_response, DUPLICATED_FIELDS
 
+_import_started = time.perf_counter()
 
 conversation_routes = Blueprint('conversation', __name__)
 
-email_capture_controller = EmailCaptureController()
-name_capture_controller = NameCaptureController()
-expert_connection_controller = ExpertConnectionController()
-sector_experience_controller = SectorExperienceController()
-text_processing_controller = TextProcessingController()
-simple_expert_connection_controller = SimpleExpertConnectionController()
-company_suggestions_controller = CompanySuggestionsController()
-companies_agreement_controller = CompaniesAgreementController()
-employment_status_controller = EmploymentStatusController()
-exclude_companies_controller = ExcludeCompaniesController()
-client_perspective_controller = ClientPerspectiveController()
-supply_chain_experience_controller = SupplyChainExperienceController()
-evaluation_questions_controller = EvaluationQuestionsController()
-evaluation_questions_sections_controller = EvaluationQuestionsSectionsController()
-evaluation_controller = EvaluationController()
-evaluation_retrieval_controller = EvaluationRetrievalController()
-industry_experts_controller = IndustryExpertsController()
-expert_selection_controller = ExpertSelectionController()
+# Los controladores se crean en su primer uso con los servicios de app.config
+controllers = ControllerRegistry('conversation')
+controllers.register('email_capture', 'app.controllers.email_capture_controller:EmailCaptureController')
+controllers.register('name_capture', 'app.controllers.name_capture_controller:NameCaptureController')
+controllers.register('expert_connection', 'app.controllers.expert_connection_controller:ExpertConnectionController')
+controllers.register('sector_experience', 'app.controllers.sector_experience_controller:SectorExperienceController')
+controllers.register('text_processing', 'app.controllers.text_processing_controller:TextProcessingController')
+controllers.register('simple_expert_connection', 'app.controllers.simple_expert_connection_controller:SimpleExpertConnectionController')
+controllers.register('company_suggestions', 'app.controllers.company_suggestions_controller:CompanySuggestionsController')
+controllers.register('companies_agreement', 'app.controllers.companies_agreement_controller:CompaniesAgreementController')
+controllers.register('employment_status', 'app.controllers.employment_status_controller:EmploymentStatusController')
+controllers.register('exclude_companies', 'app.controllers.exclude_companies_controller:ExcludeCompaniesController')
+controllers.register('client_perspective', 'app.controllers.client_perspective_controller:ClientPerspectiveController')
+controllers.register('supply_chain_experience', 'app.controllers.supply_chain_experience_controller:SupplyChainExperienceController')
+controllers.register('evaluation_questions', 'app.controllers.evaluation_questions_controller:EvaluationQuestionsController')
+controllers.register('evaluation_questions_sections', 'app.controllers.evaluation_questions_sections_controller:EvaluationQuestionsSectionsController')
+controllers.register('evaluation', 'app.controllers.evaluation_controller:EvaluationController')
+controllers.register('evaluation_retrieval', 'app.controllers.evaluation_retrieval_controller:EvaluationRetrievalController')
+controllers.register('industry_experts', 'app.controllers.industry_experts_controller:IndustryExpertsController')
+controllers.register('expert_selection', 'app.controllers.expert_selection_controller:ExpertSelectionController')
 
 
+def _omitted_fields(data):
+    """
+    Campos duplicados que se omiten de la respuesta
+
+    Un cliente que todavía lea formatted_data puede pedirlo con
+    'include=formatted_data' o incluyéndolo en 'fields'.
+    """
+    requested = set()
+    for source in (request.args, data if isinstance(data, dict) else {}):
+        for key in ('include', 'fields'):
+            value = source.get(key) or ''
+            if isinstance(value, str):
+                value = value.split(',')
+            requested.update(field.strip() for field in value)
+    return DUPLICATED_FIELDS - requested
+
+
+@conversation_routes.before_request
+def start_request_timer():
+    g.first_request_started = time.perf_counter()
+
+@conversation_routes.after_request
+def record_first_request(response):
+    started = g.pop('first_request_started', None)
+    if started is not None and not controllers.has_first_request(request.endpoint):
+        controllers.record_first_request(request.endpoint, (time.perf_counter() - started) * 1000)
+    return response
+
+@conversation_routes.route('/controllers/stats', methods=['GET'])
+def controller_stats():
+    try:
+        return jsonify({
+            'success': True,
+            'controllers': controllers.stats()
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @conversation_routes.route('/ai/email/capture', methods=['POST'])
 def capture_email():
     try:
         data = request.json
         # Elimina la asignación de status_code
-        response = email_capture_controller.capture_email(data)
+        response = controllers.get('email_capture').capture_email(data)
         
         # Determina el código de estado basado en la respuesta
         status_code = 200 if response.get('success', False) else 400
@@ -59,12 +87,25 @@ def capture_email():
             'error': str(e)
         }), 500
     
+@conversation_routes.route('/ai/email/stats', methods=['GET'])
+def email_extraction_stats():
+    try:
+        return jsonify({
+            'success': True,
+            'email_extraction': current_app.config['chatgpt'].get_email_extraction_stats()
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @conversation_routes.route('/ai/name/capture', methods=['POST'])
 def capture_name():
     try:
         data = request.json
         # Elimina la asignación de status_code
-        response = name_capture_controller.capture_name(data)
+        response = controllers.get('name_capture').capture_name(data)
         
         # Determina el código de estado basado en la respuesta
         status_code = 200 if response.get('success', False) else 400
@@ -81,7 +122,7 @@ def ask_expert_connection():
     try:
         data = request.json
         # Elimina la asignación de status_code
-        response = expert_connection_controller.ask_expert_connection(data)
+        response = controllers.get('expert_connection').ask_expert_connection(data)
         
         # Determina el código de estado basado en la respuesta
         status_code = 200 if response.get('success', False) else 400
@@ -98,7 +139,7 @@ def sector_experience():
     try:
         data = request.json
         # Elimina la asignación de status_code
-        response = sector_experience_controller.process_sector_experience(data)
+        response = controllers.get('sector_experience').process_sector_experience(data)
         
         # Determina el código de estado basado en la respuesta
         status_code = 200 if response.get('success', False) else 400
@@ -115,7 +156,7 @@ def test_process_text():
     try:
         data = request.json
         # Elimina la asignación de status_code
-        response = text_processing_controller.process_text(data)
+        response = controllers.get('text_processing').process_text(data)
         
         # Determina el código de estado basado en la respuesta
         status_code = 200 if response.get('success', False) else 400
@@ -131,7 +172,7 @@ def simple_expert_connection():
     try:
         data = request.json
         # Elimina la asignación de status_code
-        response = simple_expert_connection_controller.process_simple_expert_connection(data)
+        response = controllers.get('simple_expert_connection').process_simple_expert_connection(data)
         
         # Determina el código de estado basado en la respuesta
         status_code = 200 if response.get('success', False) else 400
@@ -150,24 +191,24 @@ def company_suggestions_test():
     try:
         data = request.json
         # Elimina la asignación de status_code
-        response = company_suggestions_controller.get_company_suggestions(data)
+        response = controllers.get('company_suggestions').get_company_suggestions(data)
         
         # Determina el código de estado basado en la respuesta
         status_code = 200 if response.get('success', False) else 400
         
-        return jsonify(response), status_code
+        return json_response(response, status_code)
     except Exception as e:
-        return jsonify({
+        return json_response({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
     
 @conversation_routes.route('/process-companies-agreement', methods=['POST'])
 def process_companies_agreement():
     try:
         data = request.json
         # Elimina la asignación de status_code
-        response = companies_agreement_controller.process_companies_agreement(data)
+        response = controllers.get('companies_agreement').process_companies_agreement(data)
         
         # Determina el código de estado basado en la respuesta
         status_code = 200 if response.get('success', False) else 400
@@ -186,7 +227,7 @@ def specify_employment_status():
     try:
         data = request.json
         # Elimina la asignación de status_code
-        response = employment_status_controller.process_employment_status(data)
+        response = controllers.get('employment_status').process_employment_status(data)
         
         # Determina el código de estado basado en la respuesta
         status_code = 200 if response.get('success', False) else 400
@@ -204,7 +245,7 @@ def exclude_companies():
     try:
         data = request.json
         # Elimina la asignación de status_code
-        response = exclude_companies_controller.process_exclude_companies(data)
+        response = controllers.get('exclude_companies').process_exclude_companies(data)
         
         # Determina el código de estado basado en la respuesta
         status_code = 200 if response.get('success', False) else 400
@@ -222,7 +263,7 @@ def client_perspective():
     try:
         data = request.json
         # Elimina la asignación de status_code
-        response = client_perspective_controller.process_client_perspective(data)
+        response = controllers.get('client_perspective').process_client_perspective(data)
         
         # Determina el código de estado basado en la respuesta
         status_code = 200 if response.get('success', False) else 400
@@ -240,7 +281,7 @@ def supply_chain_experience():
     try:
         data = request.json
         # Elimina la asignación de status_code
-        response = supply_chain_experience_controller.process_supply_chain_experience(data)
+        response = controllers.get('supply_chain_experience').process_supply_chain_experience(data)
         
         # Determina el código de estado basado en la respuesta
         status_code = 200 if response.get('success', False) else 400
@@ -257,7 +298,7 @@ def evaluation_questions():
     try:
         data = request.json
         # Elimina la asignación de status_code
-        response = evaluation_questions_controller.process_evaluation_questions(data)
+        response = controllers.get('evaluation_questions').process_evaluation_questions(data)
         
         # Determina el código de estado basado en la respuesta
         status_code = 200 if response.get('success', False) else 400
@@ -276,7 +317,7 @@ def evaluation_questions_sections():
     try:
         data = request.json
         # Elimina la asignación de status_code
-        response = evaluation_questions_sections_controller.process_evaluation_questions_sections(data)
+        response = controllers.get('evaluation_questions_sections').process_evaluation_questions_sections(data)
         
         # Determina el código de estado basado en la respuesta
         status_code = 200 if response.get('success', False) else 400
@@ -292,7 +333,7 @@ def save_evaluation():
     try:
         data = request.json
         # Elimina la asignación de status_code
-        response = evaluation_controller.save_evaluation(data)
+        response = controllers.get('evaluation').save_evaluation(data)
         
         # Determina el código de estado basado en la respuesta
         status_code = 200 if response.get('success', False) else 400
@@ -307,7 +348,7 @@ def save_evaluation():
 def get_evaluation(project_id):
     try:
         # Elimina la asignación de status_code
-        response = evaluation_retrieval_controller.get_evaluation(project_id)
+        response = controllers.get('evaluation_retrieval').get_evaluation(project_id)
         
         # Determina el código de estado basado en la respuesta
         status_code = 200 if response.get('success', False) else 404
@@ -326,17 +367,40 @@ def industry_experts():
     try:
         data = request.json
         # Elimina la asignación de status_code
-        response = industry_experts_controller.get_industry_experts(data)
+        response = controllers.get('industry_experts').get_industry_experts(data)
         
         # Determina el código de estado basado en la respuesta
         status_code = 200 if response.get('success', False) else 400
         
-        return jsonify(response), status_code
+        return json_response(response, status_code, _omitted_fields(data))
     except Exception as e:
-        return jsonify({
+        return json_response({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
+
+
+
+@conversation_routes.route('/industry-experts/<result_set_id>', methods=['GET'])
+def industry_experts_page(result_set_id):
+    try:
+        params = {
+            'result_set_id': result_set_id,
+            'cursor': request.args.get('cursor'),
+            'limit': request.args.get('limit', type=int),
+            'fields': request.args.get('fields')
+        }
+        response = controllers.get('industry_experts').get_result_page(params)
+        
+        # Determina el código de estado basado en la respuesta
+        status_code = 200 if response.get('success', False) else 404
+        
+        return json_response(response, status_code, _omitted_fields(params))
+    except Exception as e:
+        return json_response({
+            'success': False,
+            'error': str(e)
+        }, 500)
 
 
 
@@ -345,7 +409,7 @@ def select_experts():
     try:
         data = request.json
         # Elimina la asignación de status_code
-        response = expert_selection_controller.select_experts(data)
+        response = controllers.get('expert_selection').select_experts(data)
         
         # Determina el código de estado basado en la respuesta
         status_code = 200 if response.get('success', False) else 400
@@ -355,4 +419,7 @@ def select_experts():
         return jsonify({
             'success': False,
             'error': str(e)
-        }), 500
\ No newline at end of file
+        }), 500
+
+
+controllers.import_ms = round((time.perf_counter() - _import_started) * 1000, 2)
@@ -1,9 +1,17 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, Response, current_app, jsonify
 from app.controllers.server_monitoring_controller import ServerMonitoringController
+from src.utils.metrics import REGISTRY, CONTENT_TYPE
 
 monitoring_routes = Blueprint('monitoring', __name__)
 server_monitoring_controller = ServerMonitoringController()
 
 @monitoring_routes.route('/ping', methods=['GET'])
 def ping():
-    return jsonify(server_monitoring_controller.ping())
\ No newline at end of file
+    return jsonify(server_monitoring_controller.ping())
+
+@monitoring_routes.route('/metrics', methods=['GET'])
+def metrics():
+    # Formato de texto de Prometheus (scrape: GET /api/metrics)
+    metrics_service = current_app.config.get('metrics')
+    body = metrics_service.render() if metrics_service else REGISTRY.render()
+    return Response(body, content_type=CONTENT_TYPE)
@@ -18,8 +18,20 @@ def get_candidates():
 @zoho_routes.route('/recruit/jobs', methods=['GET'])
 def get_jobs():
     try:
-        response, status_code = zoho_recruit_controller.get_jobs()
-        return jsonify(response), status_code
+        result = zoho_recruit_controller.get_jobs(
+            status=request.args.get('status'),
+            industry=request.args.get('industry')
+        )
+        status_code = result.pop('status_code', 500)
+        etag = result.pop('etag', None)
+
+        response = jsonify(result)
+        response.status_code = status_code
+        if etag and status_code == 200:
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = 'no-cache'
+            return response.make_conditional(request)
+        return response
     except Exception as e:
         return jsonify({
             'success': False,
@@ -1,6 +1,9 @@
+import logging
 from datetime import datetime
 from typing import Dict, Any, Optional
 
+logger = logging.getLogger(__name__)
+
 class EvaluationRetrievalService:
     def __init__(self, database=None):
         """
@@ -28,7 +31,7 @@ class EvaluationRetrievalService:
 
             # Lógica de recuperación (simulada)
             # En un escenario real, aquí recuperarías de base de datos
-            print(f"Retrieving evaluation for project: {project_id}")
+            logger.debug("Retrieving evaluation for project: %s", project_id)
             
             # Mock de evaluación (reemplazar con consulta real a base de datos)
             mock_evaluation = {
@@ -50,14 +53,14 @@ class EvaluationRetrievalService:
             #             'message': 'Evaluation not found'
             #         }
             
-            print(f"Retrieved evaluation data for project {project_id}")
+            logger.debug("Retrieved evaluation data for project %s", project_id)
             return {
                 'success': True,
                 'evaluation': mock_evaluation
             }
         
         except Exception as e:
-            print(f"Error retrieving evaluation: {str(e)}")
+            logger.error("Error retrieving evaluation: %s", e)
             return {
                 'success': False,
                 'message': 'An error occurred while retrieving the evaluation',
@@ -1,6 +1,9 @@
+import logging
 from datetime import datetime
 from typing import Dict, Any
 
+logger = logging.getLogger(__name__)
+
 class EvaluationService:
     def __init__(self, database=None):
         """
@@ -25,8 +28,8 @@ class EvaluationService:
             
             # Lógica de guardado (simulada)
             # En un escenario real, aquí guardarías en base de datos
-            print(f"Saving evaluation for project {project_id}")
-            print(f"Evaluation data: {evaluation_data}")
+            logger.debug("Saving evaluation for project %s", project_id)
+            logger.debug("Evaluation data: %s", evaluation_data)
             
             # Ejemplo de guardado en base de datos (comentado)
             # if self.database:
@@ -43,7 +46,7 @@ class EvaluationService:
             }
         
         except Exception as e:
-            print(f"Error saving evaluation: {str(e)}")
+            logger.error("Error saving evaluation: %s", e)
             return {
                 'success': False,
                 'message': 'An error occurred while saving the evaluation',
@@ -1,13 +1,28 @@
+import logging
+import re
+import threading
+from collections import OrderedDict
 from src.utils.chatgpt_helper import ChatGPTHelper
+from app.utils.name_index import ExpertNameIndex
+from app.services.result_set_store import ResultSetStore
+
+logger = logging.getLogger(__name__)
 
 class ExpertSelectionService:
-    def __init__(self, chatgpt=None):
+    # Número de índices de nombres (uno por conjunto de resultados) en memoria
+    MAX_CACHED_INDEXES = 64
+
+    def __init__(self, chatgpt=None, result_sets=None):
         self.chatgpt = chatgpt or ChatGPTHelper()
+        self.result_sets = result_sets or ResultSetStore()
+        self._name_indexes = OrderedDict()
+        self._name_indexes_lock = threading.Lock()
         
         self.BASE_MESSAGES = {
             'expert_required': 'At least one expert must be selected',
             'no_data_found': 'No expert data found',
             'expert_selected': 'You have selected the expert(s):',
+            'result_set_expired': 'Your expert search has expired. Please search for experts again.',
             'expert_not_found': 'The expert name you provided does not match any expert in the list. Please choose an expert by typing their name exactly as it is shown in the list. For example: "{example_expert}". Which expert would you like to choose?',
             'processing_error': 'An error occurred while processing your request.',
             'thank_you': 'Thank you for your selection! We will process your request.',
@@ -29,50 +44,73 @@ class ExpertSelectionService:
         :return: Resultado de la selección
         """
         try:
-            print("\n=== Processing Expert Selection ===")
-            print(f"Input data: {data}")
+            logger.debug("Processing Expert Selection")
+            logger.debug("Input data: %s", data)
             
             # Validar datos de entrada
             validation_result = self._validate_input(data)
             if not validation_result['success']:
-                print(f"Validation failed: {validation_result}")
+                logger.warning("Validation failed: %s", validation_result)
                 return validation_result
 
-            # Buscar expertos con coincidencia exacta primero
-            found_experts = self._find_experts_exact_match(
-                data['selected_experts'][0], 
-                data['all_experts_data']
-            )
-            
-            # Si no hay coincidencia exacta, buscar coincidencias parciales
-            if not found_experts:
-                print("No exact match found, trying partial match")
-                found_experts = self._find_experts_partial_match(
-                    data['selected_experts'][0], 
-                    data['all_experts_data']
+            # Recuperar el conjunto de resultados guardado en el servidor
+            result_set_id = data.get('result_set_id')
+            all_experts_data = self._resolve_experts_data(data)
+            if all_experts_data is None:
+                logger.warning("Result set not found or expired: %s", result_set_id)
+                return {
+                    'success': False,
+                    'message': self.chatgpt.translate_message(
+                        self.BASE_MESSAGES['result_set_expired'],
+                        data.get('detected_language', 'en')
+                    ),
+                    'error': 'result_set_expired',
+                    'status_code': 404,
+                    'detected_language': data.get('detected_language', 'en')
+                }
+
+            if data.get('selected_expert_ids'):
+                # Selección por id
+                selected_names = [str(expert_id) for expert_id in data['selected_expert_ids']]
+                found_experts, unmatched = self._find_experts_by_id(
+                    selected_names,
+                    all_experts_data,
+                    result_set_id
+                )
+            else:
+                # Buscar cada experto seleccionado en el índice de nombres
+                selected_names = self._split_selected_experts(data['selected_experts'])
+                found_experts, unmatched = self._find_experts(
+                    selected_names, 
+                    all_experts_data,
+                    result_set_id
                 )
 
             # Procesar resultado de búsqueda
             if found_experts:
-                print(f"Found {len(found_experts)} experts matching the criteria")
-                return self._prepare_success_response(
+                logger.debug("Found %s experts matching the criteria", len(found_experts))
+                response = self._prepare_success_response(
                     found_experts, 
                     data.get('evaluation_questions', {}),
                     data.get('detected_language', 'en')
                 )
+                if unmatched:
+                    logger.debug("Unmatched selections: %s", unmatched)
+                    response['unmatched_selections'] = unmatched
+                return response
             else:
-                print("No experts found matching the criteria")
+                logger.debug("No experts found matching the criteria")
                 # Obtener un ejemplo de experto para mostrar en el mensaje de error
-                example_expert = self._get_example_expert(data['all_experts_data'])
+                example_expert = self._get_example_expert(all_experts_data)
                 
                 return self._prepare_not_found_response(
-                    data['selected_experts'][0],
+                    selected_names[0] if selected_names else '',
                     data.get('detected_language', 'en'),
                     example_expert
                 )
 
         except Exception as e:
-            print(f"Error in select_experts: {str(e)}")
+            logger.error("Error in select_experts: %s", e)
             return self._handle_error(e, data.get('detected_language', 'en'))
 
     def _validate_input(self, data):
@@ -82,89 +120,172 @@ class ExpertSelectionService:
         :param data: Datos de la solicitud
         :return: Resultado de validación
         """
-        print("\n=== Validating Input ===")
-        selected_experts = data.get('selected_experts')
+        logger.debug("Validating Input")
+        selected_experts = data.get('selected_expert_ids') or data.get('selected_experts')
         all_experts_data = data.get('all_experts_data')
 
         if not selected_experts:
-            print("No experts selected")
+            logger.debug("No experts selected")
             return {
                 'success': False,
                 'message': self.BASE_MESSAGES['expert_required'],
                 'status_code': 400
             }
 
-        if not all_experts_data or 'experts' not in all_experts_data:
-            print("No expert data found")
+        if not data.get('result_set_id') and (not all_experts_data or 'experts' not in all_experts_data):
+            logger.debug("No expert data found")
             return {
                 'success': False,
                 'message': self.BASE_MESSAGES['no_data_found'],
                 'status_code': 400
             }
 
-        print("Input validation passed")
+        logger.debug("Input validation passed")
         return {'success': True}
 
-    def _find_experts_exact_match(self, expert_name, all_experts_data):
+    def _resolve_experts_data(self, data):
+        """
+        Obtener los datos de expertos del conjunto de resultados o del payload
+        
+        :param data: Datos de la solicitud
+        :return: Datos de todos los expertos o None si el conjunto ha caducado
+        """
+        if data.get('result_set_id'):
+            return self.result_sets.get(data['result_set_id'])
+        return data['all_experts_data']
+
+    def _find_experts_by_id(self, expert_ids, all_experts_data, result_set_id=None):
         """
-        Encontrar expertos con coincidencia exacta
+        Encontrar expertos por id
         
-        :param expert_name: Nombre del experto buscado
+        :param expert_ids: Ids de los expertos seleccionados (como texto)
         :param all_experts_data: Datos de todos los expertos
-        :return: Lista de expertos encontrados
+        :param result_set_id: Id del conjunto de resultados (para reutilizar el mapa)
+        :return: Tupla (expertos encontrados, ids sin coincidencia)
         """
-        print(f"\n=== Finding Experts (Exact Match) for: {expert_name} ===")
-        found_experts = []
-        search_term = expert_name.lower().strip()
+        logger.debug("Finding Experts by Id: %s", expert_ids)
 
-        for category, category_data in all_experts_data['experts'].items():
-            for expert in category_data.get('experts', []):
-                expert_name_lower = expert.get('name', '').lower().strip()
-                
-                # Coincidencia exacta de nombres
-                if expert_name_lower == search_term:
-                    print(f"Exact match found: {expert.get('name')}")
-                    found_experts.append({
+        def build_id_map(experts_data):
+            id_map = {}
+            for category, category_data in experts_data.get('experts', {}).items():
+                for expert in category_data.get('experts', []):
+                    id_map.setdefault(str(expert.get('id')), []).append({
                         'expert': expert,
                         'category': category
                     })
+            return id_map
 
-        return found_experts
+        id_map = None
+        if result_set_id:
+            id_map = self.result_sets.get_or_build(result_set_id, 'id_map', build_id_map)
+        if id_map is None:
+            id_map = build_id_map(all_experts_data)
+
+        found_experts = []
+        unmatched = []
+        for expert_id in expert_ids:
+            matches = id_map.get(expert_id)
+            if not matches:
+                unmatched.append(expert_id)
+                continue
+            for match in matches:
+                found_experts.append(dict(match, match_score=1.0))
+        return found_experts, unmatched
 
-    def _find_experts_partial_match(self, expert_name, all_experts_data):
+    def _split_selected_experts(self, selected_experts):
         """
-        Encontrar expertos con coincidencia parcial
+        Normalizar la selección a una lista de nombres
+        
+        :param selected_experts: Lista de nombres o texto con nombres separados por comas
+        :return: Lista de nombres sin duplicados
+        """
+        if isinstance(selected_experts, str):
+            selected_experts = [selected_experts]
+
+        names = []
+        for selection in selected_experts:
+            for name in re.split(r'[,;\n]', str(selection or '')):
+                name = name.strip()
+                if name and name not in names:
+                    names.append(name)
+        return names
+
+    def _get_name_index(self, all_experts_data, result_set_id=None):
+        """
+        Obtener el índice de nombres del conjunto de resultados (se construye una sola vez)
         
-        :param expert_name: Nombre del experto buscado
         :param all_experts_data: Datos de todos los expertos
-        :return: Lista de expertos encontrados
+        :param result_set_id: Id del conjunto de resultados guardado (opcional)
+        :return: ExpertNameIndex
         """
-        print(f"\n=== Finding Experts (Partial Match) for: {expert_name} ===")
+        if result_set_id:
+            index = self.result_sets.get_or_build(
+                result_set_id, 
+                'name_index', 
+                ExpertNameIndex.from_experts_data
+            )
+            if index is not None:
+                return index
+
+        fingerprint = tuple(
+            (category, expert.get('id'), expert.get('name'))
+            for category, category_data in all_experts_data.get('experts', {}).items()
+            for expert in category_data.get('experts', [])
+        )
+
+        with self._name_indexes_lock:
+            index = self._name_indexes.get(fingerprint)
+            if index is not None:
+                self._name_indexes.move_to_end(fingerprint)
+                return index
+
+        index = ExpertNameIndex.from_experts_data(all_experts_data)
+        logger.debug("Built name index for %s experts", len(index))
+
+        with self._name_indexes_lock:
+            self._name_indexes[fingerprint] = index
+            while len(self._name_indexes) > self.MAX_CACHED_INDEXES:
+                self._name_indexes.popitem(last=False)
+        return index
+
+    def _find_experts(self, selected_names, all_experts_data, result_set_id=None):
+        """
+        Encontrar los expertos seleccionados tolerando erratas y transliteraciones
+        
+        :param selected_names: Nombres escritos por el usuario
+        :param all_experts_data: Datos de todos los expertos
+        :param result_set_id: Id del conjunto de resultados guardado (opcional)
+        :return: Tupla (expertos encontrados, nombres sin coincidencia)
+        """
+        logger.debug("Finding Experts for: %s", selected_names)
+        index = self._get_name_index(all_experts_data, result_set_id)
         found_experts = []
-        search_term = expert_name.lower().strip()
-        name_parts = search_term.split()
+        unmatched = []
+        seen = set()
 
-        for category, category_data in all_experts_data['experts'].items():
-            for expert in category_data.get('experts', []):
-                expert_name_lower = expert.get('name', '').lower()
-                
-                # Comprobar si hay una buena coincidencia (nombre y apellido)
-                if len(name_parts) > 1:
-                    if all(part in expert_name_lower for part in name_parts):
-                        print(f"Good partial match found: {expert.get('name')}")
-                        found_experts.append({
-                            'expert': expert,
-                            'category': category
-                        })
-                # Coincidencia de palabra individual (último recurso)
-                elif any(part in expert_name_lower for part in name_parts):
-                    print(f"Single word match found: {expert.get('name')}")
-                    found_experts.append({
-                        'expert': expert,
-                        'category': category
-                    })
+        for name in selected_names:
+            matches = index.search(name)
+            if not matches:
+                unmatched.append(name)
+                continue
+
+            # Quedarse con la mejor coincidencia y con los empates exactos
+            best_score = matches[0][0]
+            for score, entry in matches:
+                if score < best_score:
+                    break
+                key = (entry['category'], entry['expert'].get('id'), entry['normalized'])
+                if key in seen:
+                    continue
+                seen.add(key)
+                logger.debug("Match found for '%s': %s (score %s)", name, entry['expert'].get('name'), score)
+                found_experts.append({
+                    'expert': entry['expert'],
+                    'category': entry['category'],
+                    'match_score': score
+                })
 
-        return found_experts
+        return found_experts, unmatched
 
     def _get_example_expert(self, all_experts_data):
         """
@@ -173,16 +294,16 @@ class ExpertSelectionService:
         :param all_experts_data: Datos de todos los expertos
         :return: Nombre de ejemplo de un experto
         """
-        print("\n=== Getting Example Expert ===")
+        logger.debug("Getting Example Expert")
         for category, category_data in all_experts_data.get('experts', {}).items():
             experts = category_data.get('experts', [])
             if experts and len(experts) > 0:
                 example = experts[0].get('name', 'Victoria Ricci')
-                print(f"Example expert: {example}")
+                logger.debug("Example expert: %s", example)
                 return example
         
         # Valor por defecto si no hay expertos
-        print("No experts found, using default example")
+        logger.debug("No experts found, using default example")
         return "Victoria Ricci"
 
     def _prepare_success_response(
@@ -199,7 +320,7 @@ class ExpertSelectionService:
         :param detected_language: Idioma detectado
         :return: Respuesta de éxito
         """
-        print("\n=== Preparing Success Response ===")
+        logger.debug("Preparing Success Response")
         
         # Traducir etiquetas de campos
         field_labels = {
@@ -209,38 +330,55 @@ class ExpertSelectionService:
             'location': self.BASE_MESSAGES['field_location']
         }
         
+        # Recopilar los textos únicos (etiquetas, roles, ubicaciones y mensajes de UI)
+        category_titles = {
+            'main': 'Main Companies',
+            'client': 'Client Companies',
+            'supply_chain': 'Supply Chain Companies'
+        }
+        texts_to_translate = list(field_labels.values()) + list(category_titles.values()) + [
+            'years',
+            self.BASE_MESSAGES['screening_questions_title'],
+            self.BASE_MESSAGES['no_questions_available'],
+            self.BASE_MESSAGES['expert_selected'],
+            self.BASE_MESSAGES['thank_you']
+        ]
+        for found_expert in found_experts:
+            expert = found_expert['expert']
+            texts_to_translate.append(expert.get('current_role', 'N/A'))
+            texts_to_translate.extend((expert.get('location', 'N/A') or '').split(", "))
+
+        # Traducir todo en un solo lote
+        translations = self.chatgpt.translate_batch(texts_to_translate, detected_language)
+
+        def translated(text):
+            return translations.get(text, text)
+
         # Traducir etiquetas al idioma detectado
-        translated_labels = {}
-        for key, label in field_labels.items():
-            translated_labels[key] = self.chatgpt.translate_message(label, detected_language)
+        translated_labels = {key: translated(label) for key, label in field_labels.items()}
         
         # Preparar detalles de expertos con etiquetas y valores traducidos
         expert_responses = []
+        years_translated = translated("years")
         for found_expert in found_experts:
             expert = found_expert['expert']
             category = found_expert['category']
             
             # Traducir valores de campos
-            translated_role = self.chatgpt.translate_message(
-                expert.get('current_role', 'N/A'), 
-                detected_language
-            )
+            translated_role = translated(expert.get('current_role', 'N/A'))
             
             # Traducir experiencia (reemplazar "years" con su traducción)
             experience = expert.get('experience', 'N/A')
-            years_translated = self.chatgpt.translate_message("years", detected_language)
             translated_experience = experience.replace("years", years_translated)
             
             # Traducir ubicación
-            location = expert.get('location', 'N/A')
-            location_parts = location.split(", ")
-            translated_location_parts = [
-                self.chatgpt.translate_message(part, detected_language) 
-                for part in location_parts
-            ]
-            translated_location = ", ".join(translated_location_parts)
+            location = expert.get('location', 'N/A') or ''
+            translated_location = ", ".join(
+                translated(part) for part in location.split(", ")
+            )
             
             expert_response = {
+                'id': expert.get('id'),
                 'name': expert['name'],
                 'field_labels': translated_labels,  # Añadir las etiquetas traducidas
                 'current_role': translated_role,
@@ -252,38 +390,22 @@ class ExpertSelectionService:
             expert_responses.append(expert_response)
 
         # Traducir mensajes adicionales para UI
-        screening_title = self.chatgpt.translate_message(
-            self.BASE_MESSAGES['screening_questions_title'],
-            detected_language
-        )
-        
-        no_questions = self.chatgpt.translate_message(
-            self.BASE_MESSAGES['no_questions_available'],
-            detected_language
-        )
+        screening_title = translated(self.BASE_MESSAGES['screening_questions_title'])
+        no_questions = translated(self.BASE_MESSAGES['no_questions_available'])
 
         # Traducir categorías
         category_labels = {
-            'main': self.chatgpt.translate_message('Main Companies', detected_language),
-            'client': self.chatgpt.translate_message('Client Companies', detected_language),
-            'supply_chain': self.chatgpt.translate_message('Supply Chain Companies', detected_language)
+            key: translated(title) for key, title in category_titles.items()
         }
 
         # Copiar y potencialmente traducir preguntas de evaluación
         category_questions = evaluation_questions.copy()
 
         # Traducir mensajes
-        selection_message = self.chatgpt.translate_message(
-            self.BASE_MESSAGES['expert_selected'],
-            detected_language
-        )
-        
-        thank_you_message = self.chatgpt.translate_message(
-            self.BASE_MESSAGES['thank_you'],
-            detected_language
-        )
+        selection_message = translated(self.BASE_MESSAGES['expert_selected'])
+        thank_you_message = translated(self.BASE_MESSAGES['thank_you'])
 
-        print("Success response prepared")
+        logger.debug("Success response prepared")
         return {
             'success': True,
             'message': selection_message,
@@ -315,7 +437,7 @@ class ExpertSelectionService:
         :param example_expert: Nombre de ejemplo para mostrar
         :return: Respuesta de no encontrado
         """
-        print("\n=== Preparing Not Found Response ===")
+        logger.warning("Preparing Not Found Response")
         # Si no tenemos un ejemplo específico, usar valor por defecto
         if not example_expert:
             example_expert = "Victoria Ricci"
@@ -328,7 +450,7 @@ class ExpertSelectionService:
             detected_language
         )
         
-        print(f"Not found message prepared for: {search_term}")
+        logger.warning("Not found message prepared for: %s", search_term)
         return {
             'success': False,
             'message': not_found_message,
@@ -344,7 +466,7 @@ class ExpertSelectionService:
         :param detected_language: Idioma detectado
         :return: Respuesta de error
         """
-        print(f"\n=== Handling Error: {str(error)} ===")
+        logger.warning("Handling Error: %s", error)
         
         error_message = self.chatgpt.translate_message(
             self.BASE_MESSAGES['processing_error'],
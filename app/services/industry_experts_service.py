@@ -1,10 +1,52 @@
+import logging
+import re
+import heapq
 from src.utils.chatgpt_helper import ChatGPTHelper
 from src.services.external.zoho_services import ZohoService
+from app.services.result_set_store import ResultSetStore
+from src.utils.regions import resolve_regions, resolve_candidate_region
+from src.utils.tracing import span
+
+logger = logging.getLogger(__name__)
 
 class IndustryExpertsService:
-    def __init__(self, chatgpt=None, zoho_service=None):
+    # Pesos del modelo de puntuación de expertos (suman 1.0)
+    EMPLOYER_WEIGHT = 0.6
+    EXPERIENCE_WEIGHT = 0.25
+    LOCATION_WEIGHT = 0.15
+    MAX_SCORE = EMPLOYER_WEIGHT + EXPERIENCE_WEIGHT + LOCATION_WEIGHT
+    # Años de experiencia a partir de los cuales la puntuación es máxima
+    EXPERIENCE_CAP_YEARS = 25
+    # Tamaño de página cuando no se indica 'limit' y tamaño máximo admitido
+    DEFAULT_PAGE_SIZE = 50
+    MAX_PAGE_SIZE = 100
+    # Orden en el que se recorren las categorías al paginar
+    CATEGORY_ORDER = ['main', 'client', 'supply_chain']
+    # Mensajes de la respuesta (se traducen junto con los perfiles)
+    BASE_MESSAGES = {
+        'experts_found_title': 'Experts Found',
+        'main_experts_title': 'Main Company Experts',
+        'client_experts_title': 'Client Company Experts',
+        'supply_chain_experts_title': 'Supply Chain Experts',
+        'selection_instructions': 'Please select an expert by entering their name exactly as it appears in the list.',
+        'selection_example': 'For example: "{expert_name}"',
+        'selection_prompt': 'Which expert would you like to select?',
+        # Etiquetas de los datos de expertos
+        'current_role_label': 'Current Role',
+        'company_label': 'Company',
+        'experience_label': 'Experience',
+        'location_label': 'Location',
+        # Traducciones adicionales para UI
+        'screening_questions_title': 'Screening Questions',
+        'no_questions_available': 'No questions available'
+    }
+    # Roles comunes pre-traducidos (opcional - como respaldo)
+    COMMON_ROLES = ['CFO', 'Head of Finance', 'Financial Controller', 'Treasury Manager']
+
+    def __init__(self, chatgpt=None, zoho_service=None, result_sets=None):
         self.chatgpt = chatgpt or ChatGPTHelper()
         self.zoho_service = zoho_service or ZohoService()
+        self.result_sets = result_sets or ResultSetStore()
         self.MAX_TOTAL_EXPERTS = 25
 
     def get_industry_experts(self, params):
@@ -15,34 +57,58 @@ class IndustryExpertsService:
         :return: Expertos encontrados
         """
         try:
+            timings = {}
+
             # Validar parámetros de entrada
             validation_result = self._validate_input(params)
             if not validation_result['success']:
                 return validation_result
 
             # Recopilar empresas
-            all_companies = self._collect_companies(params)
+            with span('experts.collect_companies') as stage:
+                all_companies = self._collect_companies(params)
+            timings['collect_companies_ms'] = stage.duration_ms
 
             # Obtener candidatos
-            all_candidates = self.zoho_service.get_candidates()
+            with span('experts.fetch_candidates') as stage:
+                all_candidates = self.zoho_service.get_candidates()
+            timings['fetch_candidates_ms'] = stage.duration_ms
             if not isinstance(all_candidates, list):
                 return {
                     'success': False,
                     'message': 'Error retrieving candidates'
                 }
 
+            # Filtrar por región antes de puntuar y traducir
+            with span('experts.region_filter') as stage:
+                candidates = self._filter_candidates_by_region(all_candidates, params.get('region'))
+            timings['region_filter_ms'] = stage.duration_ms
+            logger.debug("Region filter kept %s of %s candidates", len(candidates), len(all_candidates))
+
             # Categorizar expertos
-            categorized_experts = self._categorize_experts(
-                all_candidates, 
-                all_companies, 
-                params
-            )
+            with span('experts.rank') as stage:
+                categorized_experts = self._categorize_experts(
+                    candidates, 
+                    all_companies, 
+                    params
+                )
+            timings['rank_experts_ms'] = stage.duration_ms
 
             # Preparar respuesta final
-            return self._prepare_final_response(
-                categorized_experts, 
-                params.get('detected_language', 'en')
-            )
+            with span('experts.prepare_response') as stage:
+                final_response = self._prepare_final_response(
+                    categorized_experts, 
+                    params.get('detected_language', 'en')
+                )
+            timings['prepare_response_ms'] = stage.duration_ms
+
+            timings['total_ms'] = round(sum(timings.values()), 2)
+            logger.debug("Industry experts timings: %s", timings)
+            final_response['timings'] = timings
+
+            # Guardar el resultado completo y devolver sólo la página solicitada
+            result_set_id = self.result_sets.save(final_response)
+            return self._paginate(result_set_id, final_response, params)
 
         except Exception as e:
             return {
@@ -51,6 +117,89 @@ class IndustryExpertsService:
                 'error': str(e)
             }
 
+    def get_result_page(self, params):
+        """
+        Obtener una página de un conjunto de resultados guardado
+        
+        :param params: 'result_set_id' y opcionalmente 'cursor', 'limit' y 'fields'
+        :return: Página de expertos
+        """
+        try:
+            result_set_id = params.get('result_set_id')
+            final_response = self.result_sets.get(result_set_id)
+            if final_response is None:
+                return {
+                    'success': False,
+                    'message': 'Result set not found or expired',
+                    'error': 'result_set_expired'
+                }
+
+            return self._paginate(result_set_id, final_response, params)
+
+        except ValueError as e:
+            return {
+                'success': False,
+                'message': str(e)
+            }
+
+    def _paginate(self, result_set_id, final_response, params):
+        """
+        Construir una página del conjunto de resultados
+        
+        Los expertos se recorren por categoría (main, client, supply_chain) y el
+        cursor indica la posición dentro de ese recorrido. Sin 'limit' se
+        devuelve una página de DEFAULT_PAGE_SIZE expertos; el resto se pide
+        con next_cursor.
+        
+        :param result_set_id: Id del conjunto de resultados
+        :param final_response: Respuesta completa guardada
+        :param params: 'cursor', 'limit' y 'fields' (opcionales)
+        :return: Respuesta con la página de expertos
+        """
+        offset = self.result_sets.decode_cursor(params.get('cursor'))
+        limit = params.get('limit')
+        limit = self.DEFAULT_PAGE_SIZE if limit is None else max(1, min(int(limit), self.MAX_PAGE_SIZE))
+        fields = params.get('fields')
+        if isinstance(fields, str):
+            fields = [field.strip() for field in fields.split(',') if field.strip()]
+
+        categories = [key for key in self.CATEGORY_ORDER if key in final_response['experts']]
+        flat_experts = [
+            (category_key, expert)
+            for category_key in categories
+            for expert in final_response['experts'][category_key]['experts']
+        ]
+        end = min(offset + limit, len(flat_experts))
+
+        page_experts = {
+            category_key: {
+                'experts': [],
+                'total_found': final_response['experts'][category_key]['total_found'],
+                'companies': final_response['experts'][category_key]['companies']
+            }
+            for category_key in categories
+        }
+        for category_key, expert in flat_experts[offset:end]:
+            if fields:
+                expert = {
+                    field: expert[field]
+                    for field in ['id'] + fields
+                    if field in expert
+                }
+            page_experts[category_key]['experts'].append(expert)
+
+        page_response = {
+            key: value for key, value in final_response.items() if key != 'experts'
+        }
+        page_response.update({
+            'experts': page_experts,
+            'result_set_id': result_set_id,
+            'expires_in': self.result_sets.expires_in(result_set_id),
+            'total_experts_shown': max(0, end - offset),
+            'next_cursor': self.result_sets.encode_cursor(end) if end < len(flat_experts) else None
+        })
+        return page_response
+
     def _validate_input(self, params):
         """
         Validar parámetros de entrada
@@ -102,98 +251,209 @@ class IndustryExpertsService:
 
         return all_companies
 
+    def _filter_candidates_by_region(self, all_candidates, region):
+        """
+        Quedarse con los candidatos de la región solicitada
+        
+        Usa un índice región -> posiciones construido una vez por snapshot de
+        candidatos. Los candidatos sin ubicación reconocible se conservan.
+        
+        :param all_candidates: Lista de candidatos
+        :param region: Región, país, ciudad o alias de varias regiones
+        :return: Candidatos de la región o regiones (en el orden original)
+        """
+        target_regions = resolve_regions(region or '')
+        if not target_regions:
+            logger.debug("Region '%s' not recognized, skipping region filter", region)
+            return all_candidates
+
+        region_index = self.zoho_service.get_snapshot_index(
+            'candidates', 
+            'region', 
+            all_candidates, 
+            self._build_region_index
+        )
+        # Los alias de varias regiones ('EMEA', 'APAC') conservan la unión
+        positions = sorted(
+            position
+            for target_region in list(target_regions) + [None]
+            for position in region_index.get(target_region, [])
+        )
+        return [all_candidates[position] for position in positions]
+
+    @staticmethod
+    def _build_region_index(candidates):
+        """
+        Construir el índice región -> posiciones de los candidatos
+        
+        :param candidates: Lista de candidatos
+        :return: Diccionario {región o None: [posiciones]}
+        """
+        region_index = {}
+        for position, candidate in enumerate(candidates):
+            region_index.setdefault(resolve_candidate_region(candidate), []).append(position)
+        return region_index
+
     def _categorize_experts(self, all_candidates, all_companies, params):
         """
-        Categorizar expertos por tipo de empresa
+        Categorizar expertos por tipo de empresa, conservando los mejores de cada categoría
+        
+        Cada candidato recibe una puntuación por categoría y se mantiene un heap
+        acotado de tamaño k por categoría, con lo que la selección es O(N log k).
+        El recorrido termina antes si todos los heaps están llenos con la
+        puntuación máxima posible.
         
         :param all_candidates: Lista de candidatos
         :param all_companies: Empresas por categoría
         :param params: Parámetros de búsqueda
         :return: Expertos categorizados
         """
+        # Calcular expertos por categoría
+        active_categories = ['main_companies']
+        if params.get('clientPerspective', False):
+            active_categories.append('client_companies')
+        if params.get('supplyChainRequired', False):
+            active_categories.append('supply_companies')
+        experts_per_category = self.MAX_TOTAL_EXPERTS // len(active_categories)
+
+        company_matchers = {
+            category: self._build_company_matchers(all_companies.get(category, []))
+            for category in active_categories
+        }
+        region = (params.get('region') or '').strip().lower()
+        target_regions = resolve_regions(region)
+        heaps = {category: [] for category in active_categories}
+
+        for index, candidate in enumerate(all_candidates):
+            current_employer = (candidate.get('Current_Employer') or '').lower()
+            if not current_employer:
+                continue
+
+            base_score = None
+            for category in active_categories:
+                employer_score = self._employer_match_score(
+                    current_employer, 
+                    company_matchers[category]
+                )
+                if not employer_score:
+                    continue
+
+                # La parte independiente de la categoría se calcula una sola vez
+                if base_score is None:
+                    base_score = (
+                        self.EXPERIENCE_WEIGHT * self._experience_score(candidate) +
+                        self.LOCATION_WEIGHT * self._location_score(candidate, region, target_regions)
+                    )
+                score = self.EMPLOYER_WEIGHT * employer_score + base_score
+
+                # Desempate: a igual puntuación gana el candidato que aparece antes
+                entry = (score, -index, candidate)
+                heap = heaps[category]
+                if len(heap) < experts_per_category:
+                    heapq.heappush(heap, entry)
+                elif score > heap[0][0]:
+                    heapq.heapreplace(heap, entry)
+
+            if all(
+                len(heap) == experts_per_category and heap[0][0] >= self.MAX_SCORE
+                for heap in heaps.values()
+            ):
+                logger.debug("Early termination after %s candidates", index + 1)
+                break
+
         categorized_experts = {
             'main_companies': {'experts': [], 'companies_found': set()},
             'client_companies': {'experts': [], 'companies_found': set()},
             'supply_companies': {'experts': [], 'companies_found': set()}
         }
 
-        # Calcular expertos por categoría
-        total_categories = sum([
-            1,  # main_companies siempre cuenta
-            bool(params.get('clientPerspective', False)),
-            bool(params.get('supplyChainRequired', False))
-        ])
-        experts_per_category = self.MAX_TOTAL_EXPERTS // total_categories
-
-        for candidate in all_candidates:
-            current_employer = candidate.get('Current_Employer', '').lower()
-            
-            # Crear datos del experto
-            expert_data = {
-                'id': candidate.get('id'),
-                'name': candidate.get('Full_Name'),
-                'current_role': candidate.get('Current_Job_Title'),
-                'current_employer': candidate.get('Current_Employer'),
-                'experience': f"{candidate.get('Experience_in_Years')} years",
-                'location': f"{candidate.get('City', '')}, {candidate.get('Country', '')}"
-            }
-
-            # Categorizar expertos
-            self._add_expert_to_category(
-                expert_data, 
-                current_employer, 
-                all_companies, 
-                categorized_experts,
-                experts_per_category,
-                params
-            )
+        for category, heap in heaps.items():
+            for score, _, candidate in sorted(heap, key=lambda entry: entry[:2], reverse=True):
+                expert_data = self._build_expert_data(candidate)
+                expert_data['relevance_score'] = round(score, 3)
+                categorized_experts[category]['experts'].append(expert_data)
+                categorized_experts[category]['companies_found'].add(expert_data['current_employer'])
 
         return categorized_experts
 
-    def _add_expert_to_category(
-        self, 
-        expert_data, 
-        current_employer, 
-        all_companies, 
-        categorized_experts,
-        experts_per_category,
-        params
-    ):
-        """
-        Agregar experto a la categoría correspondiente
+    def _build_expert_data(self, candidate):
+        """
+        Crear datos del experto a partir de un candidato de Zoho
         
-        :param expert_data: Datos del experto
-        :param current_employer: Empleador actual
-        :param all_companies: Empresas por categoría
-        :param categorized_experts: Expertos categorizados
-        :param experts_per_category: Máximo de expertos por categoría
-        :param params: Parámetros de búsqueda
+        :param candidate: Candidato de Zoho
+        :return: Datos del experto
         """
-        # Verificar empresas principales
-        for company in all_companies['main_companies']:
-            if company.lower() in current_employer:
-                if len(categorized_experts['main_companies']['experts']) < experts_per_category:
-                    categorized_experts['main_companies']['experts'].append(expert_data)
-                    categorized_experts['main_companies']['companies_found'].add(expert_data['current_employer'])
-                break
+        return {
+            'id': candidate.get('id'),
+            'name': candidate.get('Full_Name'),
+            'current_role': candidate.get('Current_Job_Title'),
+            'current_employer': candidate.get('Current_Employer'),
+            'experience': f"{candidate.get('Experience_in_Years')} years",
+            'location': f"{candidate.get('City', '')}, {candidate.get('Country', '')}"
+        }
 
-        # Verificar empresas cliente
-        if params.get('clientPerspective', False):
-            for company in all_companies['client_companies']:
-                if company.lower() in current_employer:
-                    if len(categorized_experts['client_companies']['experts']) < experts_per_category:
-                        categorized_experts['client_companies']['experts'].append(expert_data)
-                        categorized_experts['client_companies']['companies_found'].add(expert_data['current_employer'])
-                    break
-
-        # Verificar empresas supply chain
-        if params.get('supplyChainRequired', False):
-            for company in all_companies['supply_companies']:
-                if company.lower() in current_employer:
-                    if len(categorized_experts['supply_companies']['experts']) < experts_per_category:
-                        categorized_experts['supply_companies']['experts'].append(expert_data)
-                        categorized_experts['supply_companies']['companies_found'].add(expert_data['current_employer'])
-                    break
+    def _build_company_matchers(self, companies):
+        """
+        Precompilar los patrones de coincidencia para una lista de empresas
+        
+        :param companies: Nombres de empresas
+        :return: Lista de tuplas (nombre en minúsculas, patrón de palabra completa)
+        """
+        matchers = []
+        for company in companies:
+            company_lower = (company or '').strip().lower()
+            if company_lower:
+                pattern = re.compile(r'(?<!\w)' + re.escape(company_lower) + r'(?!\w)')
+                matchers.append((company_lower, pattern))
+        return matchers
+
+    def _employer_match_score(self, current_employer, matchers):
+        """
+        Puntuar la coincidencia entre el empleador actual y las empresas buscadas
+        
+        :param current_employer: Empleador actual en minúsculas
+        :param matchers: Patrones generados por _build_company_matchers
+        :return: 1.0 exacta, 0.8 palabra completa, 0.6 subcadena, 0.0 sin coincidencia
+        """
+        best_score = 0.0
+        for company_lower, pattern in matchers:
+            if company_lower not in current_employer:
+                continue
+            if current_employer.strip() == company_lower:
+                return 1.0
+            best_score = max(best_score, 0.8 if pattern.search(current_employer) else 0.6)
+        return best_score
+
+    def _experience_score(self, candidate):
+        """
+        Puntuar los años de experiencia del candidato (0.0 - 1.0)
+        
+        :param candidate: Candidato de Zoho
+        :return: Puntuación de experiencia
+        """
+        try:
+            years = float(candidate.get('Experience_in_Years') or 0)
+        except (TypeError, ValueError):
+            return 0.0
+        return max(0.0, min(years, self.EXPERIENCE_CAP_YEARS)) / self.EXPERIENCE_CAP_YEARS
+
+    def _location_score(self, candidate, region, target_regions):
+        """
+        Puntuar el ajuste de la ubicación del candidato con la región solicitada
+        
+        :param candidate: Candidato de Zoho
+        :param region: Ubicación solicitada en minúsculas
+        :param target_regions: Regiones que abarca la ubicación solicitada
+        :return: 1.0 misma ubicación, 0.8 misma región, 0.5 desconocida, 0.0 otra región
+        """
+        location = f"{candidate.get('City') or ''} {candidate.get('Country') or ''}".strip().lower()
+        if region and location and (region in location or location in region):
+            return 1.0
+
+        candidate_region = resolve_candidate_region(candidate)
+        if not target_regions or not candidate_region:
+            return 0.5
+        return 0.8 if candidate_region in target_regions else 0.0
 
     def _prepare_final_response(self, categorized_experts, detected_language):
         """
@@ -203,9 +463,6 @@ class IndustryExpertsService:
         :param detected_language: Idioma detectado
         :return: Respuesta final
         """
-        # Traducir mensajes
-        translated_messages = self._translate_messages(detected_language)
-        
         final_response = {
             'success': True,
             'experts': {
@@ -232,7 +489,7 @@ class IndustryExpertsService:
                 'companies': list(categorized_experts['supply_companies']['companies_found'])
             }
         
-        # Procesar y traducir cada experto por categoría
+        # Asignar los expertos de cada categoría
         for category_key, source_category in [
             ('main', 'main_companies'),
             ('client', 'client_companies'),
@@ -240,38 +497,19 @@ class IndustryExpertsService:
         ]:
             # Verificar si esta categoría existe en la respuesta
             if category_key in final_response['experts'] and categorized_experts[source_category]['experts']:
-                for expert in categorized_experts[source_category]['experts']:
-                    # Crear una copia del experto para traducir campos
-                    translated_expert = expert.copy()
-                    
-                    # Traducir el rol
-                    translated_expert['current_role'] = self.chatgpt.translate_message(
-                        expert['current_role'], 
-                        detected_language
-                    )
-                    
-                    # Traducir la experiencia - reemplazar "years" con su traducción
-                    years_translated = self.chatgpt.translate_message("years", detected_language)
-                    translated_expert['experience'] = expert['experience'].replace("years", years_translated)
-                    
-                    # Traducir ubicación - dividir, traducir partes y volver a unir
-                    location_parts = expert['location'].split(', ')
-                    translated_location_parts = [
-                        self.chatgpt.translate_message(part, detected_language) 
-                        for part in location_parts
-                    ]
-                    translated_expert['location'] = ', '.join(translated_location_parts)
-                    
-                    # Crear formatted_data con etiquetas y valores traducidos
-                    translated_expert['formatted_data'] = {
-                        translated_messages['current_role_label']: translated_expert['current_role'],
-                        translated_messages['company_label']: translated_expert['current_employer'],
-                        translated_messages['experience_label']: translated_expert['experience'],
-                        translated_messages['location_label']: translated_expert['location']
-                    }
-                    
-                    # Agregar a la categoría correspondiente en la respuesta final
-                    final_response['experts'][category_key]['experts'].append(translated_expert)
+                final_response['experts'][category_key]['experts'] = categorized_experts[source_category]['experts']
+
+        # Traducir mensajes y perfiles de todas las categorías en un solo lote
+        experts = [
+            expert
+            for category in final_response['experts'].values()
+            for expert in category['experts']
+        ]
+        translations = self.chatgpt.translate_batch(
+            self._collect_translatable(experts), detected_language
+        )
+        translated_messages = self._build_messages(translations)
+        self._localize_profiles(experts, translations, translated_messages)
         
         # Agregar totales
         final_response['total_experts_shown'] = sum(
@@ -286,42 +524,69 @@ class IndustryExpertsService:
         
         return final_response
 
-    def _translate_messages(self, detected_language):
+    def _collect_translatable(self, experts):
         """
-        Traducir mensajes
+        Reunir los textos únicos a traducir para la respuesta
         
-        :param detected_language: Idioma detectado
-        :return: Mensajes traducidos
+        Mensajes y etiquetas fijas, roles comunes y los valores de los perfiles
+        (roles, ciudades, países y la palabra "years"). El lote depende de los
+        valores distintos, no del número de expertos.
+        
+        :param experts: Expertos de todas las categorías
+        :return: Lista ordenada de textos sin duplicados
         """
-        BASE_MESSAGES = {
-            'experts_found_title': 'Experts Found',
-            'main_experts_title': 'Main Company Experts',
-            'client_experts_title': 'Client Company Experts',
-            'supply_chain_experts_title': 'Supply Chain Experts',
-            'selection_instructions': 'Please select an expert by entering their name exactly as it appears in the list.',
-            'selection_example': 'For example: "{expert_name}"',
-            'selection_prompt': 'Which expert would you like to select?',
-            # Etiquetas de los datos de expertos
-            'current_role_label': 'Current Role',
-            'company_label': 'Company',
-            'experience_label': 'Experience',
-            'location_label': 'Location',
-            # Roles comunes pre-traducidos (opcional - como respaldo)
-            'role_translations': {
-                'CFO': self.chatgpt.translate_message('CFO', detected_language),
-                'Head of Finance': self.chatgpt.translate_message('Head of Finance', detected_language),
-                'Financial Controller': self.chatgpt.translate_message('Financial Controller', detected_language),
-                'Treasury Manager': self.chatgpt.translate_message('Treasury Manager', detected_language),
-            },
-            # Traducciones adicionales para UI
-            'screening_questions_title': 'Screening Questions',
-            'no_questions_available': 'No questions available'
-        }
+        unique_values = set(self.BASE_MESSAGES.values()) | set(self.COMMON_ROLES) | {'years'}
+        for expert in experts:
+            if expert.get('current_role'):
+                unique_values.add(expert['current_role'])
+            unique_values.update(
+                part for part in (expert.get('location') or '').split(', ') if part
+            )
+        return sorted(unique_values)
+
+    def _localize_profiles(self, experts, translations, translated_messages):
+        """
+        Reconstruir los perfiles de los expertos con las traducciones del lote
+        
+        :param experts: Expertos a localizar (se modifican en el sitio)
+        :param translations: Texto original -> texto traducido
+        :param translated_messages: Mensajes traducidos (etiquetas)
+        """
+        years_translated = translations.get('years', 'years')
+
+        for expert in experts:
+            # Traducir el rol
+            expert['current_role'] = translations.get(expert['current_role'], expert['current_role'])
+            
+            # Traducir la experiencia - reemplazar "years" con su traducción
+            expert['experience'] = expert['experience'].replace("years", years_translated)
+            
+            # Traducir ubicación - dividir, traducir partes y volver a unir
+            expert['location'] = ', '.join(
+                translations.get(part, part) for part in expert['location'].split(', ')
+            )
+            
+            # Crear formatted_data con etiquetas y valores traducidos
+            expert['formatted_data'] = {
+                translated_messages['current_role_label']: expert['current_role'],
+                translated_messages['company_label']: expert['current_employer'],
+                translated_messages['experience_label']: expert['experience'],
+                translated_messages['location_label']: expert['location']
+            }
 
-        # Traducir todos los mensajes base
+    def _build_messages(self, translations):
+        """
+        Construir los mensajes traducidos a partir del lote
+        
+        :param translations: Texto original -> texto traducido
+        :return: Mensajes traducidos
+        """
         translated_messages = {
-            key: self.chatgpt.translate_message(msg, detected_language) 
-            for key, msg in BASE_MESSAGES.items()
+            key: translations.get(msg, msg) 
+            for key, msg in self.BASE_MESSAGES.items()
+        }
+        translated_messages['role_translations'] = {
+            role: translations.get(role, role) for role in self.COMMON_ROLES
         }
         
-        return translated_messages
\ No newline at end of file
+        return translated_messages
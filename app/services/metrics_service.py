@@ -0,0 +1,115 @@
+import threading
+
+from src.utils.metrics import REGISTRY
+from app.utils.json_response import response_size_stats
+
+
+class MetricsService:
+    """
+    Métricas de capacidad leídas de los servicios compartidos en cada scrape
+
+    Las llamadas a OpenAI y Zoho, la latencia HTTP y las cachés se cuentan
+    donde ocurren (src.utils.metrics); aquí se exponen las estadísticas que
+    ya mantienen los servicios: cola de voz, caché de transcripciones, bytes
+    servidos, extracción de emails y controladores construidos.
+    """
+
+    def __init__(self, voice_jobs=None, chatgpt=None, controller_registries=(), registry=REGISTRY):
+        self.voice_jobs = voice_jobs
+        self.chatgpt = chatgpt
+        self.controller_registries = list(controller_registries)
+        self.registry = registry
+
+    def register(self) -> None:
+        """Registrar las métricas calculadas en el registro del proceso"""
+        self.registry.callback(
+            'voice_job_queue_depth', 'Trabajos de voz esperando a un worker', [], self._queue_depth
+        )
+        self.registry.callback(
+            'voice_job_queue_capacity', 'Tamaño máximo de la cola de voz', [], self._queue_capacity
+        )
+        self.registry.callback(
+            'voice_job_workers', 'Workers de la cola de voz por estado', ['state'], self._voice_workers
+        )
+        self.registry.callback(
+            'voice_job_worker_saturation', 'Fracción de workers de voz ocupados', [], self._voice_saturation
+        )
+        self.registry.callback(
+            'process_threads', 'Hilos vivos en el proceso', [], lambda: [({}, threading.active_count())]
+        )
+        self.registry.callback(
+            'cache_entries', 'Entradas en las cachés en memoria', ['cache'], self._cache_entries
+        )
+        self.registry.callback(
+            'transcription_cache_lookups_total', 'Consultas a la caché de transcripciones',
+            ['result'], self._transcription_lookups, type='counter'
+        )
+        self.registry.callback(
+            'http_response_bytes_total', 'Bytes de las respuestas JSON grandes antes y después de comprimir',
+            ['stage'], self._response_bytes, type='counter'
+        )
+        self.registry.callback(
+            'email_extractions_total', 'Extracciones de email por vía de resolución',
+            ['path'], self._email_extractions, type='counter'
+        )
+        self.registry.callback(
+            'controllers_built', 'Controladores construidos por registro', ['blueprint'], self._controllers_built
+        )
+
+    def render(self) -> str:
+        return self.registry.render()
+
+    def _queue_stats(self):
+        return self.voice_jobs.stats() if self.voice_jobs is not None else None
+
+    def _queue_depth(self):
+        stats = self._queue_stats()
+        return [({}, stats['queued'])] if stats else []
+
+    def _queue_capacity(self):
+        stats = self._queue_stats()
+        return [({}, stats['max_queue'])] if stats else []
+
+    def _voice_workers(self):
+        stats = self._queue_stats()
+        if not stats:
+            return []
+        busy = stats['jobs'].get(self.voice_jobs.PROCESSING, 0)
+        return [({'state': 'busy'}, busy), ({'state': 'idle'}, max(0, stats['workers'] - busy))]
+
+    def _voice_saturation(self):
+        stats = self._queue_stats()
+        if not stats or not stats['workers']:
+            return []
+        busy = stats['jobs'].get(self.voice_jobs.PROCESSING, 0)
+        return [({}, round(busy / stats['workers'], 4))]
+
+    def _cache_entries(self):
+        if self.chatgpt is None:
+            return []
+        return [
+            ({'cache': 'translations'}, len(self.chatgpt._translation_cache)),
+            ({'cache': 'transcriptions'}, self.chatgpt.get_transcription_cache_stats()['entries'])
+        ]
+
+    def _transcription_lookups(self):
+        if self.chatgpt is None:
+            return []
+        stats = self.chatgpt.get_transcription_cache_stats()
+        return [({'result': 'hit'}, stats['hits']), ({'result': 'miss'}, stats['misses'])]
+
+    def _response_bytes(self):
+        stats = response_size_stats.get_stats()
+        return [({'stage': 'json'}, stats['json_bytes']), ({'stage': 'wire'}, stats['wire_bytes'])]
+
+    def _email_extractions(self):
+        if self.chatgpt is None:
+            return []
+        stats = self.chatgpt.get_email_extraction_stats()
+        return [({'path': path}, stats[path]) for path in ('local', 'llm', 'not_found')]
+
+    def _controllers_built(self):
+        return [
+            ({'blueprint': stats['blueprint']}, stats['built'])
+            for stats in (registry.stats() for registry in self.controller_registries)
+        ]
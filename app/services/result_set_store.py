@@ -0,0 +1,133 @@
+import uuid
+import json
+import base64
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+
+class ResultSetStore:
+    """
+    Almacén en memoria de conjuntos de resultados de expertos
+
+    Cada resultado se guarda bajo un id con caducidad (TTL), de modo que el
+    frontend sólo necesita enviar el id para paginar o seleccionar expertos.
+    """
+    _instance = None
+
+    def __new__(cls, ttl_minutes=30, max_entries=500):
+        if not cls._instance:
+            cls._instance = super(ResultSetStore, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self, ttl_minutes=30, max_entries=500):
+        if self._initialized:
+            return
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.ttl = timedelta(minutes=ttl_minutes)
+        self.max_entries = max_entries
+        self._initialized = True
+
+    def save(self, data):
+        """
+        Guardar un conjunto de resultados
+
+        :param data: Respuesta completa del servicio
+        :return: Id del conjunto de resultados
+        """
+        result_set_id = uuid.uuid4().hex
+        now = datetime.now()
+
+        with self._lock:
+            self._purge_expired(now)
+            self._entries[result_set_id] = {
+                'data': data,
+                'expires_at': now + self.ttl,
+                'extras': {}
+            }
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return result_set_id
+
+    def get(self, result_set_id):
+        """
+        Obtener un conjunto de resultados vigente
+
+        :param result_set_id: Id del conjunto de resultados
+        :return: Datos guardados o None si no existe o ha caducado
+        """
+        entry = self._get_entry(result_set_id)
+        return entry['data'] if entry else None
+
+    def get_or_build(self, result_set_id, key, builder):
+        """
+        Obtener (o construir una sola vez) un dato derivado del conjunto de resultados
+
+        :param result_set_id: Id del conjunto de resultados
+        :param key: Nombre del dato derivado (p. ej. 'name_index')
+        :param builder: Función que recibe los datos y construye el derivado
+        :return: Dato derivado o None si el conjunto no existe
+        """
+        entry = self._get_entry(result_set_id)
+        if not entry:
+            return None
+
+        extras = entry['extras']
+        if key not in extras:
+            extras[key] = builder(entry['data'])
+        return extras[key]
+
+    def expires_in(self, result_set_id):
+        """Segundos restantes antes de que caduque el conjunto de resultados"""
+        entry = self._get_entry(result_set_id)
+        if not entry:
+            return 0
+        return max(0, int((entry['expires_at'] - datetime.now()).total_seconds()))
+
+    def _get_entry(self, result_set_id):
+        if not result_set_id:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(result_set_id)
+            if entry is None:
+                return None
+            if entry['expires_at'] <= datetime.now():
+                del self._entries[result_set_id]
+                return None
+            self._entries.move_to_end(result_set_id)
+            return entry
+
+    def _purge_expired(self, now):
+        expired = [key for key, entry in self._entries.items() if entry['expires_at'] <= now]
+        for key in expired:
+            del self._entries[key]
+
+    @staticmethod
+    def encode_cursor(offset):
+        """Codificar un desplazamiento como cursor opaco"""
+        raw = json.dumps({'offset': offset}).encode('utf-8')
+        return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+    @staticmethod
+    def decode_cursor(cursor):
+        """
+        Decodificar un cursor opaco
+
+        :return: Desplazamiento o 0 si el cursor está vacío
+        :raises ValueError: Si el cursor no es válido
+        """
+        if not cursor:
+            return 0
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            offset = int(json.loads(base64.urlsafe_b64decode(padded))['offset'])
+        except Exception:
+            raise ValueError('Invalid cursor')
+        if offset < 0:
+            raise ValueError('Invalid cursor')
+        return offset
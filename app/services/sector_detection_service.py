@@ -1,5 +1,8 @@
+import logging
 from src.utils.chatgpt_helper import ChatGPTHelper
 
+logger = logging.getLogger(__name__)
+
 class SectorDetectionService:
     def __init__(self, chatgpt=None):
         """
@@ -48,7 +51,7 @@ class SectorDetectionService:
             }
 
         except Exception as e:
-            print(f"Error in sector detection: {str(e)}")
+            logger.error("Error in sector detection: %s", e)
             return {
                 'success': False,
                 'message': f'Error processing sector: {str(e)}'
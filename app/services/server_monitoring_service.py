@@ -1,7 +1,10 @@
+import logging
 import threading
 import time
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 class ServerMonitoringService:
     def __init__(self):
         self.last_ping_time = datetime.now()
@@ -21,10 +24,10 @@ class ServerMonitoringService:
         """
         while self.is_server_active:
             try:
-                print(f"Server keep-alive check: {datetime.now()}")
+                logger.debug("Server keep-alive check: %s", datetime.now())
                 time.sleep(30)  # Check cada 30 segundos
             except Exception as e:
-                print(f"Keep-alive error: {e}")
+                logger.error("Keep-alive error: %s", e)
 
     def stop_keep_alive(self):
         """
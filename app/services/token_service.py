@@ -1,7 +1,10 @@
+import logging
 import os
 import requests
 from config.settings import Config
 
+logger = logging.getLogger(__name__)
+
 class TokenService:
     @staticmethod
     def refresh_zoho_token():
@@ -16,11 +19,11 @@ class TokenService:
                 'scope': 'ZohoRecruit.modules.ALL'
             }
             
-            print("\n=== Refreshing Recruit Token ===")
-            print(f"Using refresh token: {params['refresh_token'][:10]}...")
+            logger.debug("Refreshing Recruit Token")
+            logger.debug("Using refresh token: %s...", params['refresh_token'][:10])
             
             response = requests.post(refresh_url, params=params)
-            print(f"Refresh response status: {response.status_code}")
+            logger.debug("Refresh response status: %s", response.status_code)
             
             if response.status_code == 200:
                 new_token = response.json().get('access_token')
@@ -36,7 +39,7 @@ class TokenService:
             return None
         
         except Exception as e:
-            print(f"Error refreshing token: {str(e)}")
+            logger.error("Error refreshing token: %s", e)
             return None
     
     @staticmethod
@@ -52,9 +55,9 @@ class TokenService:
             'target': ['production']
         }
         
-        print("\n=== Updating Vercel Environment ===")
+        logger.debug("Updating Vercel Environment")
         vercel_response = requests.post(vercel_api_url, headers=headers, json=data)
-        print(f"Vercel update status: {vercel_response.status_code}")
+        logger.debug("Vercel update status: %s", vercel_response.status_code)
     
     @staticmethod
     def _update_local_env(new_token):
@@ -73,6 +76,6 @@ class TokenService:
                     else:
                         file.write(line)
             
-            print("\n=== Updated local .env file for Recruit ===")
+            logger.debug("Updated local .env file for Recruit")
         except Exception as e:
-            print(f"Error updating .env file: {str(e)}")
\ No newline at end of file
+            logger.error("Error updating .env file: %s", e)
\ No newline at end of file
@@ -1,5 +1,8 @@
+import logging
 from src.utils.chatgpt_helper import ChatGPTHelper
 
+logger = logging.getLogger(__name__)
+
 class TranslationService:
     def __init__(self, chatgpt=None):
         """
@@ -29,10 +32,10 @@ class TranslationService:
             translated_text = self.chatgpt.translate_message(text, target_language)
 
             # Registrar detalles de traducción
-            print(f"\n=== Translation Result ===")
-            print(f"Original text: {text}")
-            print(f"Target language: {target_language}")
-            print(f"Translated text: {translated_text}")
+            logger.debug("Translation Result")
+            logger.debug("Original text: %s", text)
+            logger.debug("Target language: %s", target_language)
+            logger.debug("Translated text: %s", translated_text)
 
             return {
                 'success': True,
@@ -40,9 +43,7 @@ class TranslationService:
             }
 
         except Exception as e:
-            print(f"\n=== Error in translation ===")
-            print(f"Error type: {type(e).__name__}")
-            print(f"Error message: {str(e)}")
+            logger.exception("Error in translation")
             return {
                 'success': False,
                 'message': 'Error translating text',
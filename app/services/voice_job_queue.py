@@ -0,0 +1,214 @@
+import logging
+import io
+import uuid
+import queue
+import threading
+import contextvars
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+from werkzeug.datastructures import FileStorage
+
+logger = logging.getLogger(__name__)
+
+
+class QueueFullError(Exception):
+    """La cola de trabajos de voz está llena (back-pressure)"""
+
+    def __init__(self, retry_after=5):
+        super().__init__('Voice job queue is full')
+        self.retry_after = retry_after
+
+
+class VoiceJobQueue:
+    """
+    Cola de trabajos de voz con un pool acotado de workers
+
+    La subida se lee en memoria dentro de la petición y se encola; la
+    transcripción y el post-procesado se ejecutan en los workers, de modo que
+    los hilos del servidor quedan libres para el resto de endpoints. Los
+    resultados se conservan durante un TTL para consultarlos por polling o SSE.
+    """
+    _instance = None
+
+    QUEUED = 'queued'
+    PROCESSING = 'processing'
+    DONE = 'done'
+    FAILED = 'failed'
+
+    def __new__(cls, voice_handler=None, workers=2, max_queue=20, ttl_minutes=10, max_jobs=1000):
+        if not cls._instance:
+            cls._instance = super(VoiceJobQueue, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self, voice_handler=None, workers=2, max_queue=20, ttl_minutes=10, max_jobs=1000):
+        if self._initialized:
+            return
+
+        self.voice_handler = voice_handler
+        self.workers = workers
+        self.ttl = timedelta(minutes=ttl_minutes)
+        self.max_jobs = max_jobs
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._threads = []
+        self._initialized = True
+
+    def start(self):
+        """Arrancar los workers (idempotente)"""
+        with self._lock:
+            if self._threads:
+                return
+            for index in range(self.workers):
+                thread = threading.Thread(
+                    target=self._worker,
+                    name=f"voice-worker-{index}",
+                    daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def submit(self, audio_bytes, filename, step='transcribe', content_type=None, preprocess=False):
+        """
+        Encolar un audio para procesarlo en segundo plano
+
+        :param audio_bytes: Contenido del audio ya leído en memoria
+        :param filename: Nombre original (Whisper deduce el formato por la extensión)
+        :param step: Tipo de procesamiento ('transcribe', 'username', ...)
+        :param preprocess: Aplicar el preprocesado de audio antes de Whisper
+        :return: Id del trabajo
+        :raises QueueFullError: Si la cola está llena
+        """
+        self.start()
+
+        job_id = uuid.uuid4().hex
+        now = datetime.now()
+        job = {
+            'id': job_id,
+            'status': self.QUEUED,
+            'step': step,
+            'preprocess': preprocess,
+            'result': None,
+            'created_at': now,
+            'finished_at': None,
+            'expires_at': now + self.ttl,
+            'done': threading.Event()
+        }
+
+        with self._lock:
+            self._purge_expired(now)
+            self._jobs[job_id] = job
+            while len(self._jobs) > self.max_jobs:
+                self._jobs.popitem(last=False)
+
+        # El trabajo se ejecuta con el contexto de la petición (conversación actual)
+        context = contextvars.copy_context()
+        try:
+            self._queue.put_nowait((job, context, audio_bytes, filename, content_type))
+        except queue.Full:
+            with self._lock:
+                self._jobs.pop(job_id, None)
+            raise QueueFullError()
+
+        return job_id
+
+    def get(self, job_id):
+        """
+        Obtener el estado de un trabajo
+
+        :return: Dict con el estado (y el resultado si ha terminado) o None si no existe
+        """
+        job = self._get_job(job_id)
+        return self._describe(job) if job else None
+
+    def wait(self, job_id, timeout):
+        """
+        Esperar a que termine un trabajo
+
+        :return: Estado del trabajo o None si no existe
+        """
+        job = self._get_job(job_id)
+        if not job:
+            return None
+        job['done'].wait(timeout)
+        return self._describe(job)
+
+    def stats(self):
+        """Ocupación de la cola y número de trabajos por estado"""
+        with self._lock:
+            by_status = {}
+            for job in self._jobs.values():
+                by_status[job['status']] = by_status.get(job['status'], 0) + 1
+        return {
+            'queued': self._queue.qsize(),
+            'max_queue': self._queue.maxsize,
+            'workers': self.workers,
+            'jobs': by_status
+        }
+
+    def _worker(self):
+        while True:
+            job, context, audio_bytes, filename, content_type = self._queue.get()
+            try:
+                context.run(self._process, job, audio_bytes, filename, content_type)
+            finally:
+                self._queue.task_done()
+
+    def _process(self, job, audio_bytes, filename, content_type):
+        job['status'] = self.PROCESSING
+        try:
+            audio_file = FileStorage(
+                stream=io.BytesIO(audio_bytes),
+                filename=filename,
+                content_type=content_type
+            )
+            result = self.voice_handler.process_audio(
+                audio_file,
+                step=job['step'],
+                preprocess=job['preprocess']
+            )
+            job['result'] = result
+            job['status'] = self.FAILED if result.get('error') or not result.get('success') else self.DONE
+        except Exception as e:
+            logger.error("Error processing voice job %s: %s", job['id'], e)
+            job['result'] = {'success': False, 'error': str(e)}
+            job['status'] = self.FAILED
+        finally:
+            job['finished_at'] = datetime.now()
+            job['expires_at'] = job['finished_at'] + self.ttl
+            job['done'].set()
+
+    def _describe(self, job):
+        description = {
+            'job_id': job['id'],
+            'status': job['status'],
+            'step': job['step'],
+            'created_at': job['created_at'].isoformat()
+        }
+        if job['done'].is_set():
+            description['finished_at'] = job['finished_at'].isoformat()
+            description['result'] = job['result']
+        return description
+
+    def _get_job(self, job_id):
+        if not job_id:
+            return None
+
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            if job['done'].is_set() and job['expires_at'] <= datetime.now():
+                del self._jobs[job_id]
+                return None
+            return job
+
+    def _purge_expired(self, now):
+        expired = [
+            key for key, job in self._jobs.items()
+            if job['done'].is_set() and job['expires_at'] <= now
+        ]
+        for key in expired:
+            del self._jobs[key]
@@ -1,5 +1,9 @@
+import logging
 from src.services.external.zoho_services import ZohoService
 import requests
+import hashlib
+
+logger = logging.getLogger(__name__)
 
 class ZohoRecruitService:
     def __init__(self, zoho_service=None):
@@ -17,7 +21,7 @@ class ZohoRecruitService:
         :return: Lista de candidatos o mensaje de error
         """
         try:
-            print("\n=== Getting Candidates from Zoho Recruit ===")
+            logger.debug("Getting Candidates from Zoho Recruit")
             candidates = self.zoho_service.get_candidates()
             
             return {
@@ -26,29 +30,38 @@ class ZohoRecruitService:
             }
         
         except Exception as e:
-            print(f"Error getting candidates: {str(e)}")
+            logger.error("Error getting candidates: %s", e)
             return {
                 'success': False,
                 'error': str(e)
             }
 
-    def get_all_jobs(self):
+    def get_all_jobs(self, status=None, industry=None):
         """
-        Obtener todos los trabajos de Zoho Recruit
+        Obtener los trabajos de Zoho Recruit desde el snapshot en memoria
         
+        :param status: Filtro opcional por estado de la vacante
+        :param industry: Filtro opcional por industria
         :return: Lista de trabajos o mensaje de error
         """
         try:
-            print("\n=== Getting Jobs from Zoho Recruit ===")
-            jobs = self.zoho_service.get_jobs()
+            logger.debug("Getting Jobs from Zoho Recruit")
+            snapshot = self.zoho_service.get_jobs_snapshot()
+            jobs = self.zoho_service.filter_jobs(snapshot['data'], status, industry)
+
+            # El ETag depende del snapshot y de los filtros aplicados
+            etag_source = f"{snapshot['etag']}|{status or ''}|{industry or ''}".lower()
             
             return {
                 'success': True,
-                'jobs': jobs
+                'jobs': jobs,
+                'total': len(jobs),
+                'last_synced': snapshot['fetched_at'].isoformat(),
+                'etag': hashlib.md5(etag_source.encode('utf-8')).hexdigest()
             }
         
         except Exception as e:
-            print(f"Error getting jobs: {str(e)}")
+            logger.error("Error getting jobs: %s", e)
             return {
                 'success': False,
                 'error': str(e)
@@ -78,7 +91,7 @@ class ZohoRecruitService:
             }
         
         except Exception as e:
-            print(f"Error searching candidates: {str(e)}")
+            logger.error("Error searching candidates: %s", e)
             return {
                 'success': False,
                 'error': str(e)
@@ -0,0 +1,110 @@
+import time
+import inspect
+import logging
+import threading
+import importlib
+from datetime import datetime
+from typing import Dict
+
+from flask import current_app
+
+logger = logging.getLogger(__name__)
+
+# Argumento del constructor -> servicio singleton en app.config
+SHARED_SERVICES = {
+    'chatgpt': 'chatgpt',
+    'zoho_service': 'zoho_service',
+    'voice_handler': 'voice_handler',
+}
+
+
+class ControllerRegistry:
+    """
+    Registro perezoso de controladores
+
+    Los controladores se declaran por ruta de importación ('modulo:Clase') y
+    se importan e instancian la primera vez que se usan, inyectando los
+    servicios compartidos de app.config (ChatGPTHelper, ZohoService...). Así
+    importar un blueprint no crea clientes ni hace E/S, y un arranque en frío
+    sólo paga por los endpoints que realmente sirve.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.import_ms = None
+        self._specs = {}
+        self._locks = {}
+        self._instances = {}
+        self._timings = {}
+        self._first_requests = {}
+
+    def register(self, name: str, target: str) -> None:
+        """
+        :param name: Nombre corto del controlador ('email_capture')
+        :param target: Ruta de importación 'paquete.modulo:Clase'
+        """
+        self._specs[name] = target
+        self._locks[name] = threading.Lock()
+
+    def get(self, name: str):
+        """Obtener el controlador, creándolo en el primer uso"""
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+
+        with self._locks[name]:
+            instance = self._instances.get(name)
+            if instance is None:
+                instance = self._build(name)
+                self._instances[name] = instance
+        return instance
+
+    def record_first_request(self, endpoint: str, duration_ms: float) -> None:
+        """Guardar la duración de la primera petición servida por un endpoint"""
+        self._first_requests.setdefault(endpoint, round(duration_ms, 2))
+
+    def has_first_request(self, endpoint: str) -> bool:
+        return endpoint in self._first_requests
+
+    def stats(self) -> Dict:
+        return {
+            'blueprint': self.name,
+            'import_ms': self.import_ms,
+            'registered': len(self._specs),
+            'built': len(self._instances),
+            'controllers': {
+                name: self._timings.get(name, {'built': False})
+                for name in self._specs
+            },
+            'first_requests_ms': dict(self._first_requests)
+        }
+
+    def _build(self, name: str):
+        module_path, class_name = self._specs[name].split(':')
+
+        start = time.perf_counter()
+        controller_class = getattr(importlib.import_module(module_path), class_name)
+        imported = time.perf_counter()
+
+        # Inyectar sólo los servicios que el constructor acepta y que ya existen
+        parameters = inspect.signature(controller_class.__init__).parameters
+        services = {
+            argument: current_app.config[config_key]
+            for argument, config_key in SHARED_SERVICES.items()
+            if argument in parameters and current_app.config.get(config_key) is not None
+        }
+        instance = controller_class(**services)
+        built = time.perf_counter()
+
+        self._timings[name] = {
+            'built': True,
+            'import_ms': round((imported - start) * 1000, 2),
+            'init_ms': round((built - imported) * 1000, 2),
+            'injected': sorted(services),
+            'built_at': datetime.now().isoformat()
+        }
+        logger.info(
+            "Controller '%s' built on first use (import %s ms, init %s ms)",
+            name, self._timings[name]['import_ms'], self._timings[name]['init_ms']
+        )
+        return instance
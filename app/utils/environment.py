@@ -1,9 +1,12 @@
+import logging
 import sys
 from pathlib import Path
 import os
 from dotenv import load_dotenv
 import requests
 
+logger = logging.getLogger(__name__)
+
 def setup_project_path():
     """Configura la ruta del proyecto en sys.path"""
     project_root = str(Path(__file__).parent.parent.parent)
@@ -17,10 +20,10 @@ def get_env_path():
 def load_environment_variables():
     """Carga las variables de entorno"""
     env_path = get_env_path()
-    print("\n=== Environment Setup ===")
-    print(f"Project Root: {env_path.parent}")
-    print(f"Env file path: {env_path}")
-    print(f"Env file exists: {env_path.exists()}")
+    logger.debug("Environment Setup")
+    logger.debug("Project Root: %s", env_path.parent)
+    logger.debug("Env file path: %s", env_path)
+    logger.debug("Env file exists: %s", env_path.exists())
     
     load_dotenv(env_path)
 
@@ -33,20 +36,20 @@ def test_zoho_token():
     
     recruit_token = os.getenv('ZOHO_RECRUIT_ACCESS_TOKEN')
     
-    print(f"\n=== Token Verification ===")
-    print(f"Recruit Token loaded: {recruit_token[:10]}...{recruit_token[-10:] if recruit_token else 'None'}")
+    logger.debug("Token Verification")
+    logger.debug("Recruit token loaded: %s", bool(recruit_token))
     
     try:
         # Intentar obtener candidatos para verificar el token
         candidates = zoho_service.get_candidates()
         
-        print("\nTesting Recruit token with Zoho API...")
-        print(f"Token verification successful")
-        print(f"Retrieved {len(candidates)} candidates")
+        logger.debug("Testing Recruit token with Zoho API...")
+        logger.debug("Token verification successful")
+        logger.debug("Retrieved %s candidates", len(candidates))
         
         return True
     
     except Exception as e:
-        print(f"Recruit Token test failed: {str(e)}")
-        print("WARNING: Recruit functionality may not work correctly")
+        logger.error("Recruit Token test failed: %s", e)
+        logger.warning("Recruit functionality may not work correctly")
         return False
\ No newline at end of file
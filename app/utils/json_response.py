@@ -0,0 +1,136 @@
+import gzip
+import json
+import threading
+from typing import Any, Dict, Iterable, Optional
+
+from flask import Response, request
+
+try:
+    import orjson
+except ImportError:  # Opcional: sin orjson se serializa con el módulo json estándar
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # Opcional: sin brotli sólo se negocia gzip
+    brotli = None
+
+# Por debajo de este tamaño comprimir no compensa la cabecera ni la CPU
+COMPRESSION_MIN_BYTES = 1024
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+# Claves cuyo null tiene significado para el cliente (fin de la paginación)
+KEEP_NULL_KEYS = frozenset(['next_cursor'])
+
+# Campos que repiten datos ya presentes en el mismo objeto: formatted_data son
+# los campos planos del experto con las etiquetas traducidas, que ya viajan en
+# 'messages' (current_role_label, company_label...)
+DUPLICATED_FIELDS = frozenset(['formatted_data'])
+
+
+class ResponseSizeStats:
+    """Bytes servidos por la capa de respuesta: JSON generado frente a bytes enviados"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {'responses': 0, 'json_bytes': 0, 'wire_bytes': 0, 'gzip': 0, 'br': 0, 'identity': 0}
+
+    def record(self, json_bytes: int, wire_bytes: int, encoding: Optional[str]) -> None:
+        with self._lock:
+            self._stats['responses'] += 1
+            self._stats['json_bytes'] += json_bytes
+            self._stats['wire_bytes'] += wire_bytes
+            self._stats[encoding or 'identity'] += 1
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+        stats['compression_ratio'] = (
+            round(stats['wire_bytes'] / stats['json_bytes'], 3) if stats['json_bytes'] else 1.0
+        )
+        return stats
+
+
+response_size_stats = ResponseSizeStats()
+
+
+def compact(value: Any, drop_keys: Iterable[str] = ()) -> Any:
+    """
+    Eliminar recursivamente los valores null y las claves indicadas
+
+    :param value: Payload (dict, lista o valor simple)
+    :param drop_keys: Claves a eliminar en cualquier nivel
+    :return: Copia compactada del payload
+    """
+    drop_keys = frozenset(drop_keys)
+
+    def walk(node):
+        if isinstance(node, dict):
+            return {
+                key: walk(item)
+                for key, item in node.items()
+                if key not in drop_keys and (item is not None or key in KEEP_NULL_KEYS)
+            }
+        if isinstance(node, (list, tuple)):
+            return [walk(item) for item in node]
+        return node
+
+    return walk(value)
+
+
+def dumps(payload: Any) -> bytes:
+    """Serializar a JSON compacto en UTF-8 (orjson si está instalado)"""
+    if orjson is not None:
+        return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, default=str, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def negotiate_encoding(accept_encodings) -> Optional[str]:
+    """
+    Elegir la codificación a partir de Accept-Encoding
+
+    :param accept_encodings: request.accept_encodings de Werkzeug
+    :return: 'br', 'gzip' o None
+    """
+    if brotli is not None and accept_encodings['br'] > 0:
+        return 'br'
+    if accept_encodings['gzip'] > 0:
+        return 'gzip'
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+
+def json_response(payload: Any, status_code: int = 200, drop_keys: Iterable[str] = ()) -> Response:
+    """
+    Respuesta JSON compacta y, por encima de COMPRESSION_MIN_BYTES, comprimida
+
+    Sustituye a jsonify en los endpoints con payloads grandes (listas de
+    expertos y empresas): quita los null y los campos duplicados, serializa
+    con orjson y negocia brotli o gzip con el cliente.
+
+    :param payload: Datos de la respuesta
+    :param status_code: Código HTTP
+    :param drop_keys: Claves a eliminar del payload (p. ej. DUPLICATED_FIELDS)
+    :return: Respuesta Flask
+    """
+    body = dumps(compact(payload, drop_keys))
+    json_bytes = len(body)
+
+    response = Response(body, status=status_code, mimetype='application/json')
+    response.vary.add('Accept-Encoding')
+
+    encoding = None
+    if json_bytes >= COMPRESSION_MIN_BYTES:
+        encoding = negotiate_encoding(request.accept_encodings)
+        if encoding:
+            response.set_data(compress(body, encoding))
+            response.headers['Content-Encoding'] = encoding
+
+    response_size_stats.record(json_bytes, response.content_length, encoding)
+    return response
@@ -0,0 +1,156 @@
+import re
+from collections import defaultdict
+from unidecode import unidecode
+
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+
+def normalize_name(name):
+    """
+    Normalizar un nombre: transliterar a ASCII, minúsculas y sin signos
+
+    'José  Müller-Øst' -> 'jose muller ost', 'Иван Петров' -> 'ivan petrov'
+    """
+    if not name:
+        return ''
+    return _NON_ALNUM.sub(' ', unidecode(str(name)).lower()).strip()
+
+
+def trigrams(text):
+    """Obtener los trigramas de un texto normalizado (con relleno en los bordes)"""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a, b, max_distance=None):
+    """
+    Distancia de Levenshtein entre dos cadenas
+
+    :param max_distance: Si se indica, corta en cuanto la distancia lo supera
+    """
+    if a == b:
+        return 0
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            ))
+        if max_distance is not None and min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+    return previous[-1]
+
+
+class ExpertNameIndex:
+    """
+    Índice de trigramas sobre los nombres de un conjunto de expertos
+
+    Se construye una vez por conjunto de resultados. Las búsquedas sólo
+    puntúan los expertos que comparten algún trigrama con la consulta, por lo
+    que el coste depende de los candidatos y no del tamaño total del conjunto.
+    """
+
+    MIN_SCORE = 0.45
+
+    def __init__(self, entries):
+        """
+        :param entries: Iterable de dicts con 'expert' y 'category'
+        """
+        self.entries = []
+        self.exact = defaultdict(list)
+        self.postings = defaultdict(set)
+
+        for entry in entries:
+            normalized = normalize_name(entry['expert'].get('name'))
+            if not normalized:
+                continue
+            position = len(self.entries)
+            self.entries.append({
+                'expert': entry['expert'],
+                'category': entry['category'],
+                'normalized': normalized,
+                'tokens': normalized.split(),
+                'trigrams': trigrams(normalized)
+            })
+            self.exact[normalized].append(position)
+            for gram in self.entries[position]['trigrams']:
+                self.postings[gram].add(position)
+
+    @classmethod
+    def from_experts_data(cls, all_experts_data):
+        """Construir el índice a partir del payload {'experts': {categoria: {'experts': [...]}}}"""
+        return cls(
+            {'expert': expert, 'category': category}
+            for category, category_data in all_experts_data.get('experts', {}).items()
+            for expert in category_data.get('experts', [])
+        )
+
+    def __len__(self):
+        return len(self.entries)
+
+    def search(self, query, limit=5, min_score=None):
+        """
+        Buscar expertos por nombre tolerando erratas y transliteraciones
+
+        :param query: Nombre escrito por el usuario
+        :param limit: Número máximo de resultados
+        :param min_score: Puntuación mínima (0-1)
+        :return: Lista de (puntuación, entrada) ordenada de mayor a menor
+        """
+        min_score = self.MIN_SCORE if min_score is None else min_score
+        normalized = normalize_name(query)
+        if not normalized:
+            return []
+
+        if normalized in self.exact:
+            return [(1.0, self.entries[position]) for position in self.exact[normalized]][:limit]
+
+        query_grams = trigrams(normalized)
+        shared = defaultdict(int)
+        for gram in query_grams:
+            for position in self.postings.get(gram, ()):
+                shared[position] += 1
+
+        query_tokens = normalized.split()
+        results = []
+        for position, common in shared.items():
+            entry = self.entries[position]
+            # Coeficiente de Dice sobre trigramas
+            score = 2.0 * common / (len(query_grams) + len(entry['trigrams']))
+            score = max(score, self._token_score(query_tokens, entry['tokens']))
+            if score >= min_score:
+                results.append((round(score, 3), entry))
+
+        results.sort(key=lambda result: result[0], reverse=True)
+        return results[:limit]
+
+    @staticmethod
+    def _token_score(query_tokens, name_tokens):
+        """
+        Puntuar por palabras: cada palabra de la consulta se empareja con la más
+        parecida del nombre (prefijo o distancia de edición pequeña)
+        """
+        total = 0.0
+        for query_token in query_tokens:
+            best = 0.0
+            for name_token in name_tokens:
+                if query_token == name_token:
+                    best = 1.0
+                    break
+                if len(query_token) >= 3 and name_token.startswith(query_token):
+                    best = max(best, 0.85)
+                    continue
+                max_distance = 1 if len(query_token) <= 5 else 2
+                distance = edit_distance(query_token, name_token, max_distance)
+                if distance <= max_distance:
+                    best = max(best, 1.0 - distance / max(len(query_token), len(name_token)))
+            total += best
+        # Penalizar consultas de una sola palabra frente al nombre completo
+        coverage = min(len(query_tokens), len(name_tokens)) / max(len(name_tokens), 1)
+        return (total / len(query_tokens)) * (0.7 + 0.3 * coverage)
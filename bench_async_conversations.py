@@ -0,0 +1,149 @@
+# bench_async_conversations.py
+
+import os
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import openai
+
+# Latencia simulada de cada llamada a OpenAI (segundos)
+LLM_LATENCY = float(os.getenv('BENCH_LLM_LATENCY', '0.3'))
+
+
+def _fake_completion(request):
+    """Respuesta plausible según el prompt, para recorrer el flujo completo"""
+    system_prompt = request['messages'][0]['content']
+    if 'language detector' in system_prompt:
+        content = 'es'
+    elif 'intention classifier' in system_prompt:
+        content = 'yes'
+    elif 'translator' in system_prompt:
+        content = f"[es] {request['messages'][-1]['content']}"
+    else:
+        content = 'ok'
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class _SyncCompletions:
+    def create(self, **request):
+        time.sleep(LLM_LATENCY)
+        return _fake_completion(request)
+
+
+class _AsyncCompletions:
+    async def create(self, **request):
+        await asyncio.sleep(LLM_LATENCY)
+        return _fake_completion(request)
+
+
+class FakeOpenAI:
+    def __init__(self, **kwargs):
+        self.chat = SimpleNamespace(completions=_SyncCompletions())
+
+
+class FakeAsyncOpenAI:
+    def __init__(self, **kwargs):
+        self.chat = SimpleNamespace(completions=_AsyncCompletions())
+
+
+# Sustituir los clientes de OpenAI por dobles con latencia fija (sin red) antes
+# de importar la app: al importarla ya se crea el ChatGPTHelper compartido
+os.environ.setdefault('OPENAI_API_KEY', 'bench')
+openai.OpenAI = FakeOpenAI
+openai.AsyncOpenAI = FakeAsyncOpenAI
+
+# La app antes que chatgpt_helper (que importa app.constants.language y, con él, la app)
+from app.controllers.expert_connection_controller import ExpertConnectionController
+from app.constants.language import set_current_conversation_id, reset_current_conversation_id
+from src.utils.chatgpt_helper import ChatGPTHelper
+
+
+def _conversation(index):
+    # Textos distintos por conversación para que la caché de traducciones no lo oculte todo
+    return f"conv-{index}", {
+        'text': f"Sí, me gustaría hablar con sus expertos ({index})",
+        'name': f"Ana {index}"
+    }
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def _report(mode, workers, latencies, elapsed, peak_threads):
+    print(
+        f"{mode:<10}{workers:>9}{len(latencies):>8}{elapsed:>10.2f}"
+        f"{len(latencies) / elapsed:>11.1f}{_percentile(latencies, 0.5) * 1000:>10.0f}"
+        f"{_percentile(latencies, 0.95) * 1000:>10.0f}{peak_threads:>9}"
+    )
+
+
+def bench_threaded(controller, conversations, workers):
+    """Modo WSGI: cada conversación ocupa un hilo del servidor mientras espera al LLM"""
+    peak_threads = threading.active_count()
+
+    def handle(conversation, submitted):
+        nonlocal peak_threads
+        conversation_id, data = conversation
+        token = set_current_conversation_id(conversation_id)
+        try:
+            result = controller.ask_expert_connection(data)
+        finally:
+            reset_current_conversation_id(token)
+        peak_threads = max(peak_threads, threading.active_count())
+        assert result['success'], result
+        return time.perf_counter() - submitted
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(handle, conversation, time.perf_counter()) for conversation in conversations]
+        latencies = [future.result() for future in futures]
+    _report('threaded', workers, latencies, time.perf_counter() - start, peak_threads)
+
+
+def bench_async(controller, conversations):
+    """Modo ASGI: todas las conversaciones esperan al LLM en el mismo event loop"""
+
+    async def handle(conversation):
+        conversation_id, data = conversation
+        submitted = time.perf_counter()
+        token = set_current_conversation_id(conversation_id)
+        try:
+            result = await controller.ask_expert_connection_async(data)
+        finally:
+            reset_current_conversation_id(token)
+        assert result['success'], result
+        return time.perf_counter() - submitted
+
+    async def run():
+        return await asyncio.gather(*(handle(conversation) for conversation in conversations))
+
+    start = time.perf_counter()
+    latencies = asyncio.run(run())
+    _report('async', 1, latencies, time.perf_counter() - start, threading.active_count())
+
+
+def bench_async_conversations(concurrency=(50, 200, 500), thread_counts=(4, 32)):
+    helper = ChatGPTHelper()
+    controller = ExpertConnectionController(chatgpt=helper)
+
+    print(f"\n=== BENCHMARK expert-connection/ask (LLM latency {LLM_LATENCY * 1000:.0f} ms) ===\n")
+    print(
+        f"{'mode':<10}{'workers':>9}{'convs':>8}{'wall (s)':>10}"
+        f"{'conv/s':>11}{'p50 (ms)':>10}{'p95 (ms)':>10}{'threads':>9}"
+    )
+
+    for total in concurrency:
+        for workers in thread_counts:
+            helper._translation_cache.clear()
+            bench_threaded(controller, [_conversation(i) for i in range(total)], workers)
+        helper._translation_cache.clear()
+        bench_async(controller, [_conversation(i) for i in range(total)])
+        print()
+
+if __name__ == "__main__":
+    bench_async_conversations()
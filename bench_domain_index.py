@@ -0,0 +1,71 @@
+# bench_domain_index.py
+
+import random
+import timeit
+
+from src.utils.domain_index import POPULAR_EMAIL_DOMAINS, BKTree, DomainSuggestionIndex, typo_distance
+
+TLDS = ['com', 'net', 'org', 'es', 'fr', 'de', 'it', 'co.uk', 'com.br', 'com.mx', 'ru', 'nl', 'pl', 'io']
+QUERIES = ['gmial.com', 'hotmial.es', 'gmail.con', 'yaho.co.uk', 'outlok.fr', 'protonmial.com', 'icloud.cmo']
+SYLLABLES = ['ma', 'il', 'net', 'web', 'co', 'pro', 'lu', 'xa', 'ti', 'ra', 'no', 'ver', 'ka', 'so', 'mi', 'dex']
+
+
+def _domains(count, seed=11):
+    """Dominios populares más dominios sintéticos con nombres de 2-4 sílabas"""
+    rng = random.Random(seed)
+    domains = list(POPULAR_EMAIL_DOMAINS)
+    seen = set(domains)
+    while len(domains) < count:
+        label = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+        domain = f"{label}.{rng.choice(TLDS)}"
+        if domain not in seen:
+            seen.add(domain)
+            domains.append(domain)
+    return domains
+
+
+def suggest_bktree(tree, domain, max_distance):
+    """Búsqueda anterior: BK-tree de Levenshtein con radio max_distance + 1 para las transposiciones"""
+    return sorted(
+        (distance, candidate)
+        for distance, candidate in (
+            (typo_distance(domain, candidate), candidate)
+            for _, candidate in tree.search(domain, max_distance + 1)
+        )
+        if distance <= max_distance
+    )
+
+
+def bench_domain_index(sizes=(54, 1000, 5000), number=20):
+    print("\n=== BENCHMARK domain suggestions (uncached, max_distance=2) ===\n")
+    print(f"{'domains':>8}{'build (ms)':>12}{'linear (us)':>13}{'bk-tree (us)':>14}{'index (us)':>12}")
+
+    for size in sizes:
+        domains = _domains(size)
+        start = timeit.default_timer()
+        index = DomainSuggestionIndex(domains, TLDS)
+        build_ms = (timeit.default_timer() - start) * 1000
+        tree = BKTree(domains)
+
+        linear = lambda query: sorted(
+            (distance, domain) for distance, domain in ((typo_distance(query, domain), domain) for domain in domains)
+            if distance <= 2
+        )
+        for query in QUERIES:
+            # Mismos dominios completos que el BK-tree y que la búsqueda lineal
+            expected = linear(query)
+            assert sorted(index.domain_tree.search(query, 2)) == expected == suggest_bktree(tree, query, 2), query
+
+        def per_query(function):
+            return min(timeit.repeat(
+                lambda: [function(query) for query in QUERIES], repeat=3, number=number
+            )) / (number * len(QUERIES)) * 1e6
+
+        linear_us = per_query(linear)
+        bktree_us = per_query(lambda query: suggest_bktree(tree, query, 2))
+        index_us = per_query(lambda query: index._suggest(query, 2))
+
+        print(f"{size:>8}{build_ms:>12.1f}{linear_us:>13.1f}{bktree_us:>14.1f}{index_us:>12.1f}")
+
+if __name__ == "__main__":
+    bench_domain_index()
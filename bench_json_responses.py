@@ -0,0 +1,123 @@
+# bench_json_responses.py
+
+import json
+import gzip
+import random
+import timeit
+
+from app.services.industry_experts_service import IndustryExpertsService
+from app.utils.json_response import DUPLICATED_FIELDS, compact, dumps, compress, brotli, orjson
+
+COMPANIES = [
+    'Banco Santander', 'BBVA', 'CaixaBank', 'Deutsche Bank', 'BNP Paribas', 'ING Group',
+    'HSBC', 'Barclays', 'UniCredit', 'Société Générale', 'Allianz', 'AXA', 'Zurich Insurance'
+]
+CLIENT_COMPANIES = ['Inditex', 'Telefónica', 'Iberdrola', 'Repsol', 'Siemens', 'Nestlé']
+SUPPLY_COMPANIES = ['Accenture', 'Deloitte', 'Indra', 'Capgemini', 'SAP', 'Oracle']
+ROLES = [
+    'Chief Financial Officer', 'Head of Finance', 'Financial Controller', 'Treasury Manager',
+    'Head of Risk Management', 'Director of Corporate Development', 'VP Strategy'
+]
+CITIES = [('Madrid', 'Spain'), ('Barcelona', 'Spain'), ('Paris', 'France'), ('Frankfurt', 'Germany'),
+          ('London', 'United Kingdom'), ('Milan', 'Italy'), ('Amsterdam', 'Netherlands')]
+
+
+class _FakeZoho:
+    def __init__(self, candidates):
+        self.candidates = candidates
+
+    def get_candidates(self):
+        return self.candidates
+
+    def get_snapshot_index(self, name, key, data, builder):
+        return builder(data)
+
+
+class _FakeChatGPT:
+    """Traducción simulada con longitud parecida a la real (sin llamadas a la API)"""
+
+    def translate_batch(self, messages, target_language):
+        return {message: f"{message} ({target_language[:2]})" for message in messages}
+
+    def get_client_side_companies(self, sector, geography):
+        return {'success': True, 'content': CLIENT_COMPANIES}
+
+    def get_supply_chain_companies(self, sector, geography):
+        return {'success': True, 'content': SUPPLY_COMPANIES}
+
+
+def _candidates(count, seed=7):
+    rng = random.Random(seed)
+    employers = COMPANIES + CLIENT_COMPANIES + SUPPLY_COMPANIES
+    candidates = []
+    for index in range(count):
+        city, country = rng.choice(CITIES)
+        candidates.append({
+            'id': str(180000000000000000 + index),
+            'Full_Name': f"Candidate {index} {rng.choice(['García', 'Müller', 'Dubois', 'Rossi', 'Smith'])}",
+            'Current_Job_Title': rng.choice(ROLES),
+            'Current_Employer': rng.choice(employers),
+            'Experience_in_Years': rng.randint(3, 30),
+            'City': city,
+            'Country': country
+        })
+    return candidates
+
+
+def _payloads():
+    """Respuestas reales del servicio de expertos (3 categorías) y de sugerencias de empresas"""
+    service = IndustryExpertsService(
+        chatgpt=_FakeChatGPT(),
+        zoho_service=_FakeZoho(_candidates(5000)),
+        result_sets=None
+    )
+    params = {
+        'sector': 'Financial Services', 'region': 'Europe', 'companies': COMPANIES,
+        'clientPerspective': True, 'supplyChainRequired': True, 'detected_language': 'es-ES'
+    }
+    full = service.get_industry_experts(dict(params))
+    page = service.get_result_page({'result_set_id': full['result_set_id'], 'limit': 10})
+    suggestions = {
+        'success': True,
+        'message': "Aquí están las empresas recomendadas, con las empresas verificadas primero. ¿Está de acuerdo con esta lista?",
+        'companies': COMPANIES + CLIENT_COMPANIES[:4] + SUPPLY_COMPANIES[:3],
+        'db_companies_count': 13,
+        'total_companies': 20,
+        'language': 'es-ES',
+        'specific_area': None,
+        'status_code': 200
+    }
+    return {'experts (default)': full, 'experts (page 10)': page, 'company suggestions': suggestions}
+
+
+def _jsonify(payload):
+    # Serialización por defecto de jsonify (claves ordenadas, ASCII escapado)
+    return json.dumps(payload, ensure_ascii=True, sort_keys=True, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
+def bench_json_responses(number=500):
+    print("\n=== BENCHMARK conversation response sizes ===")
+    print(f"encoder: {'orjson' if orjson else 'json (orjson not installed)'}, "
+          f"brotli: {'yes' if brotli else 'not installed'}\n")
+    print(f"{'payload':<22}{'jsonify (B)':>13}{'compact (B)':>13}{'gzip (B)':>10}{'br (B)':>9}"
+          f"{'jsonify (us)':>14}{'layer (us)':>12}")
+
+    for name, payload in _payloads().items():
+        baseline = _jsonify(payload)
+        body = dumps(compact(payload, DUPLICATED_FIELDS))
+        gzipped = compress(body, 'gzip')
+        brotlied = len(compress(body, 'br')) if brotli else '-'
+
+        jsonify_us = min(timeit.repeat(lambda: _jsonify(payload), repeat=5, number=number)) / number * 1e6
+        layer_us = min(timeit.repeat(
+            lambda: dumps(compact(payload, DUPLICATED_FIELDS)), repeat=5, number=number
+        )) / number * 1e6
+
+        print(f"{name:<22}{len(baseline):>13}{len(body):>13}{len(gzipped):>10}{brotlied:>9}"
+              f"{jsonify_us:>14.1f}{layer_us:>12.1f}")
+
+        # Sin pérdida: el payload compacto es el original sin nulls ni duplicados
+        assert json.loads(gzip.decompress(gzipped)) == compact(payload, DUPLICATED_FIELDS)
+
+if __name__ == "__main__":
+    bench_json_responses()
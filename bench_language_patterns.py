@@ -0,0 +1,58 @@
+# bench_language_patterns.py
+
+import re
+import timeit
+
+from app.constants.language import analyze_language_patterns, _language_state
+
+
+def analyze_language_patterns_reference(text):
+    """Implementación original (un recorrido del texto por idioma), usada como referencia"""
+    cleaned_text = text.lower()
+    words = re.findall(r'\b\w+\b', cleaned_text)
+
+    scores = {}
+    for lang, patterns in _language_state.language_patterns.items():
+        char_matches = sum(1 for c in cleaned_text if c in patterns['chars'])
+        char_score = char_matches / max(len(cleaned_text), 1) * 100
+
+        word_matches = sum(1 for word in words if word in patterns['common_words'])
+        word_score = word_matches / max(len(words), 1) * 100
+
+        if patterns['chars']:
+            scores[lang] = (char_score * 0.7) + (word_score * 0.3)
+        else:
+            scores[lang] = word_score
+
+    return scores
+
+
+def bench_language_patterns(repeat=5, number=2000):
+    # Textos de prueba de distintos idiomas y longitudes
+    samples = {
+        'es': "Me gustaría hablar con expertos del sector financiero en España, ¿es posible?",
+        'fr': "Je voudrais parler avec les experts de la finance et de la technologie en Europe",
+        'ru': "Я хочу поговорить с экспертами в области финансов и технологий",
+        'ja': "私は金融とテクノロジーの専門家と話したいです",
+        'en': "I would like to talk with experts in the financial services sector in North America",
+        'long': "Quiero expertos en banca y seguros que hayan trabajado en Madrid o Barcelona. " * 20
+    }
+
+    print("\n=== BENCHMARK analyze_language_patterns ===\n")
+    print(f"{'sample':<8}{'reference (us)':>18}{'compiled (us)':>18}{'speedup':>10}")
+
+    for name, text in samples.items():
+        # Ambas implementaciones deben devolver exactamente las mismas puntuaciones
+        assert analyze_language_patterns(text) == analyze_language_patterns_reference(text), name
+
+        reference = min(timeit.repeat(
+            lambda: analyze_language_patterns_reference(text), repeat=repeat, number=number
+        )) / number * 1e6
+        compiled = min(timeit.repeat(
+            lambda: analyze_language_patterns(text), repeat=repeat, number=number
+        )) / number * 1e6
+
+        print(f"{name:<8}{reference:>18.1f}{compiled:>18.1f}{reference / compiled:>9.1f}x")
+
+if __name__ == "__main__":
+    bench_language_patterns()
@@ -22,8 +22,33 @@ class Config:
     ZOHO_CLIENT_SECRET = os.getenv('ZOHO_CLIENT_SECRET')
     ENVIRONMENT = os.getenv('ENVIRONMENT', 'development')
 
+    # Cola de trabajos de voz
+    VOICE_JOB_WORKERS = int(os.getenv('VOICE_JOB_WORKERS', '2'))
+    VOICE_JOB_QUEUE_SIZE = int(os.getenv('VOICE_JOB_QUEUE_SIZE', '20'))
+    # Streams SSE simultáneos servidos por WSGI (cada uno ocupa un hilo); con ASGI no se limitan
+    VOICE_SSE_MAX_STREAMS = int(os.getenv('VOICE_SSE_MAX_STREAMS', '2'))
+
+    # Trazas por petición: cabecera Server-Timing y, si se indica ruta, exportación JSONL
+    TRACING_ENABLED = os.getenv('TRACING_ENABLED', 'true').lower() == 'true'
+    TRACE_EXPORT_PATH = os.getenv('TRACE_EXPORT_PATH')
+
+    # Logging: nivel global, niveles por módulo ('app.controllers=DEBUG,src.services=WARNING') y formato text|json
+    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+    LOG_LEVELS = os.getenv('LOG_LEVELS', '')
+    LOG_FORMAT = os.getenv('LOG_FORMAT', 'text')
+
+    # Conversación: a las peticiones sin X-Conversation-Id se les asigna uno,
+    # que se devuelve en la cabecera y en esta cookie
+    CONVERSATION_COOKIE = 'conversation_id'
+    CONVERSATION_COOKIE_MAX_AGE = int(os.getenv('CONVERSATION_COOKIE_MAX_AGE', str(24 * 60 * 60)))
+    CONVERSATION_COOKIE_SAMESITE = 'Lax'
+    CONVERSATION_COOKIE_SECURE = False
+
 class DevelopmentConfig(Config):
     DEBUG = True
 
 class ProductionConfig(Config):
-    DEBUG = False
\ No newline at end of file
+    DEBUG = False
+    # Los frontales están en otro dominio: la cookie debe viajar en peticiones cross-site
+    CONVERSATION_COOKIE_SAMESITE = 'None'
+    CONVERSATION_COOKIE_SECURE = True
\ No newline at end of file
@@ -239,6 +239,8 @@ NEW_LANGUAGE_PATTERNS = {
 
     'fa': {  # Persa/Farsi
         'pattern': r'[\u0600-\u06FF]',
+        # Letras que el árabe no usa: distinguen el persa dentro del mismo bloque
+        'distinctive_chars': 'پچژگکی',
         'keywords': ['نقطه', 'خط_زیر', 'اَت', 'خط_تیره'],
         'common_domains': ['ir', 'iran', 'tehran'],
         'email_terms': {
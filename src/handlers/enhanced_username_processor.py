@@ -13,9 +13,12 @@ class EnhancedUsernameProcessor(UsernameProcessor):
     """
     Versión mejorada del UsernameProcessor con soporte para idiomas adicionales
     """
+    # Singleton propio: con el heredado se devolvería el UsernameProcessor ya creado
+    _instance = None
+
     def __init__(self, client=None):
-        # Inicializar la clase padre
-        super().__init__(client)
+        # La clase padre se inicializa en __new__ (singleton): object.__init__ no admite argumentos
+        super().__init__()
         
         # Agregar las nuevas configuraciones
         self.new_language_patterns = NEW_LANGUAGE_PATTERNS
@@ -24,6 +27,7 @@ class EnhancedUsernameProcessor(UsernameProcessor):
         
         # Combinar patrones existentes con nuevos
         self.language_patterns.update(self.new_language_patterns)
+        self._build_script_classifier()
         
         # Inicializar mapeos específicos para nuevos idiomas
         self._initialize_enhanced_mappings()
@@ -39,17 +43,30 @@ class EnhancedUsernameProcessor(UsernameProcessor):
             'hu', 'tr', 'uk', 'ro', 'bg', 'hr', 'sk', 'sl'
         ])
 
+        # Orden de detección: RTL, asiáticos y europeos, cada grupo en el orden de configuración
+        self.detection_order = [
+            lang
+            for group in (self.rtl_languages, self.asian_languages, self.european_languages)
+            for lang in self.new_language_patterns if lang in group
+        ]
+
+        # Caracteres admitidos en nombres de usuario vietnamitas
+        self.vietnamese_chars = frozenset(
+            'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._-'
+            'àáạảãâầấậẩẫăằắặẳẵèéẹẻẽêềếệểễìíịỉĩòóọỏõôồốộổỗơờớợởỡùúụủũưừứựửữỳýỵỷỹđ'
+        )
+
     def process_username_enhanced(self, text: str, detected_lang: str = None) -> Dict:
         """
         Versión mejorada del procesamiento de nombres de usuario
         """
         try:
-            logger.debug(f"Processing enhanced username: {text}")
+            logger.debug("Processing enhanced username: %s", text)
             
             # Detectar idioma si no se proporciona
             if not detected_lang:
                 detected_lang = self._detect_language_enhanced(text)
-            logger.debug(f"Detected language (enhanced): {detected_lang}")
+            logger.debug("Detected language (enhanced): %s", detected_lang)
 
             # Procesar con GPT-4
             processed_text = self._process_with_gpt4(text)
@@ -81,7 +98,7 @@ class EnhancedUsernameProcessor(UsernameProcessor):
             }
 
         except Exception as e:
-            logger.error(f"Error in enhanced username processing: {str(e)}")
+            logger.error("Error in enhanced username processing: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -114,7 +131,7 @@ class EnhancedUsernameProcessor(UsernameProcessor):
                 processed_text = processed_text.split("es_")[-1]
             return self._clean_username(processed_text)
         except Exception as e:
-            logger.error(f"Error in GPT-4 processing: {str(e)}")
+            logger.error("Error in GPT-4 processing: %s", e)
             return text
     def _process_rtl_text(self, text: str, lang: str) -> str:
         """
@@ -140,7 +157,7 @@ class EnhancedUsernameProcessor(UsernameProcessor):
             
             return text
         except Exception as e:
-            logger.error(f"Error processing RTL text: {str(e)}")
+            logger.error("Error processing RTL text: %s", e)
             return text
 
     def _process_asian_text(self, text: str, lang: str) -> str:
@@ -166,7 +183,7 @@ class EnhancedUsernameProcessor(UsernameProcessor):
 
             return text
         except Exception as e:
-            logger.error(f"Error processing Asian text: {str(e)}")
+            logger.error("Error processing Asian text: %s", e)
             return text
 
     def _process_european_text(self, text: str, lang: str) -> str:
@@ -191,7 +208,7 @@ class EnhancedUsernameProcessor(UsernameProcessor):
 
             return text
         except Exception as e:
-            logger.error(f"Error processing European text: {str(e)}")
+            logger.error("Error processing European text: %s", e)
             return text
 
     def _detect_language_enhanced(self, text: str) -> str:
@@ -199,24 +216,18 @@ class EnhancedUsernameProcessor(UsernameProcessor):
         Detección mejorada de idioma con soporte para nuevos idiomas
         """
         text_lower = text.lower()
-
-        # Verificar idiomas RTL primero
-        for lang in self.rtl_languages:
-            pattern = self.new_language_patterns[lang]['pattern']
-            if re.search(pattern, text):
-                return lang
-
-        # Verificar idiomas asiáticos
-        for lang in self.asian_languages:
-            pattern = self.new_language_patterns[lang]['pattern']
-            if re.search(pattern, text):
-                return lang
-
-        # Verificar idiomas europeos
-        for lang in self.european_languages:
-            pattern = self.new_language_patterns[lang]['pattern']
-            if re.search(pattern, text):
-                return lang
+        profile = self.script_classifier.classify(text)
+
+        # Verificar idiomas RTL primero, después asiáticos y europeos
+        candidates = [lang for lang in self.detection_order if profile.has_language(lang)]
+        if candidates:
+            # Idiomas que comparten bloque (árabe y persa): gana el que tenga
+            # letras propias en el texto sobre el genérico
+            for lang in candidates:
+                distinctive = self.new_language_patterns[lang].get('distinctive_chars')
+                if distinctive and any(char in distinctive for char in text):
+                    return lang
+            return candidates[0]
 
         # Verificar palabras clave
         for lang, config in self.new_language_patterns.items():
@@ -448,39 +459,24 @@ class EnhancedUsernameProcessor(UsernameProcessor):
     def _has_mixed_rtl_ltr(self, text: str) -> bool:
         """
         Verifica si hay mezcla incorrecta de texto RTL y LTR
+
+        Números y símbolos no cuentan como dirección, así que sólo es
+        incorrecta la mezcla de letras RTL con letras LTR.
         """
-        rtl_chars = re.compile(r'[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF\u0590-\u05FF]')
-        ltr_chars = re.compile(r'[a-zA-Z]')
-        
-        has_rtl = bool(rtl_chars.search(text))
-        has_ltr = bool(ltr_chars.search(text))
-        
-        # Permitir números y símbolos especiales
-        if has_rtl and has_ltr:
-            # Verificar si la mezcla es válida
-            valid_mixed_patterns = [
-                r'^[a-zA-Z0-9_.-]+$',  # Patrón occidental estándar
-                r'^[\u0600-\u06FF0-9_.-]+$'  # Patrón árabe/persa estándar
-            ]
-            return not any(re.match(pattern, text) for pattern in valid_mixed_patterns)
-        
-        return False
+        return self.script_classifier.classify(text).is_mixed_direction
 
     def _validate_asian_chars(self, text: str, lang: str) -> bool:
         """
         Valida caracteres para idiomas asiáticos
         """
-        valid_patterns = {
-            'hi': r'[\u0900-\u097F\w.-]+$',  # Devanagari y caracteres latinos
-            'th': r'[\u0E00-\u0E7F\w.-]+$',  # Thai y caracteres latinos
-            'vi': r'[a-zA-Z0-9àáạảãâầấậẩẫăằắặẳẵèéẹẻẽêềếệểễìíịỉĩòóọỏõôồốộổỗơờớợởỡùúụủũưừứựửữỳýỵỷỹđ._-]+$',
-            'id': r'[\w.-]+$',  # Caracteres latinos básicos
-            'ms': r'[\w.-]+$',  # Caracteres latinos básicos
-            'tl': r'[\w.-]+$'   # Caracteres latinos básicos
-        }
-        
-        if lang in valid_patterns:
-            return bool(re.match(valid_patterns[lang], text))
+        if lang == 'vi':
+            return bool(text) and all(char in self.vietnamese_chars for char in text)
+
+        if lang in ('hi', 'th', 'id', 'ms', 'tl'):
+            # Letras de cualquier script (devanagari, thai, latinos...), dígitos y ._-
+            profile = self.script_classifier.classify(text)
+            histogram = profile.histogram
+            return profile.length > 0 and 'symbol' not in histogram and 'space' not in histogram
         return True
 
     def get_language_info(self, text: str) -> Dict:
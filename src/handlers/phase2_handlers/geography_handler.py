@@ -2,7 +2,6 @@ from flask import jsonify
 from src.utils.chatgpt_helper import ChatGPTHelper
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 def handle_geography_capture(request_json):
@@ -48,7 +47,7 @@ def handle_geography_capture(request_json):
         })
     
     except Exception as e:
-        logger.error(f"Error in geography handler: {str(e)}")
+        logger.error("Error in geography handler: %s", e)
         return jsonify({
             "fulfillmentText": f"An error occurred: {str(e)}"
         })
\ No newline at end of file
@@ -12,6 +12,17 @@ import tempfile
 from unidecode import unidecode
 import requests
 import unicodedata 
+from src.utils.spoken_symbols import (
+    SYMBOL_MAPPING,
+    TRANSLITERATION_MAP,
+    rewrite_spoken_symbols,
+    transliterate,
+    clean_username
+)
+from src.utils.domain_index import DomainSuggestionIndex
+from src.utils.script_classifier import ScriptClassifier
+from src.utils.metrics import instrument_openai
+from src.handlers.enhanced_language_configs import INTERNATIONAL_TLDS as ENHANCED_INTERNATIONAL_TLDS
 
 logger = logging.getLogger(__name__)
 
@@ -19,58 +30,7 @@ logger = logging.getLogger(__name__)
 EMAIL_REGEX = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
 MAX_USERNAME_LENGTH = 64
 MAX_DOMAIN_LENGTH = 253
-# Mapeo mejorado de símbolos por idioma (COMPLETO)
-SYMBOL_MAPPING = {
-    '.': {
-        'es': ['punto', 'puntos', 'dot'],
-        'en': ['dot', 'point', 'period', 'full stop'],
-        'fr': ['point', 'points'],
-        'de': ['punkt'],
-        'it': ['punto'],
-        'pt': ['ponto'],
-        'ru': ['точка', 'точки'],
-        'ja': ['テン', 'ドット'],
-        'zh': ['点', '點', 'dian'],
-        'ko': ['점', '닷']
-    },
-    '_': {
-        'es': ['guion bajo', 'subrayado', 'subraya'],
-        'en': ['underscore', 'underline'],
-        'fr': ['souligne', 'soulignement'],
-        'de': ['unterstrich'],
-        'it': ['sottolineato', 'sottolineatura'],
-        'pt': ['sublinhado'],
-        'ru': ['подчеркивание', 'нижнее подчеркивание'],
-        'ja': ['アンダースコア', 'アンダーバー'],
-        'zh': ['下划线', '底線'],
-        'ko': ['밑줄']
-    },
-    '-': {
-        'es': ['guion', 'raya', 'menos'],
-        'en': ['hyphen', 'dash', 'minus'],
-        'fr': ['tiret', 'trait'],
-        'de': ['bindestrich', 'strich'],
-        'it': ['trattino', 'tratto'],
-        'pt': ['hífen', 'traço'],
-        'ru': ['дефис', 'тире'],
-        'ja': ['ハイフン'],
-        'zh': ['连字符', '破折号'],
-        'ko': ['하이픈', '대시']
-    },
-    '@': {
-        'es': ['arroba', 'at'],
-        'en': ['at', 'at sign'],
-        'fr': ['arobase', 'at'],
-        'de': ['at', 'klammeraffe'],
-        'it': ['chiocciola'],
-        'pt': ['arroba'],
-        'ru': ['собака', 'собачка'],
-        'ja': ['アット', 'アットマーク'],
-        'zh': ['艾特', '@符号'],
-        'ko': ['골뱅이']
-    }
-}
-
+# SYMBOL_MAPPING y TRANSLITERATION_MAP se definen (y compilan) en src/utils/spoken_symbols.py
 # Patrones de detección de idioma mejorados (COMPLETO)
 LANGUAGE_PATTERNS = {
     'ru': {
@@ -134,47 +94,6 @@ COMMON_DOMAINS = {
     }
 }
 
-# Nuevo mapa de transliteración completo
-TRANSLITERATION_MAP = {
-    'russian': {
-        'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'д': 'd', 'е': 'e', 'ё': 'yo',
-        'ж': 'zh', 'з': 'z', 'и': 'i', 'й': 'y', 'к': 'k', 'л': 'l', 'м': 'm',
-        'н': 'n', 'о': 'o', 'п': 'p', 'р': 'r', 'с': 's', 'т': 't', 'у': 'u',
-        'ф': 'f', 'х': 'h', 'ц': 'ts', 'ч': 'ch', 'ш': 'sh', 'щ': 'sch',
-        'ъ': '', 'ы': 'y', 'ь': '', 'э': 'e', 'ю': 'yu', 'я': 'ya',
-        'А': 'a', 'Б': 'b', 'В': 'v', 'Г': 'g', 'Д': 'd', 'Е': 'e', 'Ё': 'yo',
-        'Ж': 'zh', 'З': 'z', 'И': 'i', 'Й': 'y', 'К': 'k', 'Л': 'l', 'М': 'm',
-        'Н': 'n', 'О': 'o', 'П': 'p', 'Р': 'r', 'С': 's', 'Т': 't', 'У': 'u',
-        'Ф': 'f', 'Х': 'h', 'Ц': 'ts', 'Ч': 'ch', 'Ш': 'sh', 'Щ': 'sch',
-        'Ъ': '', 'Ы': 'y', 'Ь': '', 'Э': 'e', 'Ю': 'yu', 'Я': 'ya'
-    },
-    'japanese': {
-        'あ': 'a', 'い': 'i', 'う': 'u', 'え': 'e', 'お': 'o',
-        'か': 'ka', 'き': 'ki', 'く': 'ku', 'け': 'ke', 'こ': 'ko',
-        'さ': 'sa', 'し': 'shi', 'す': 'su', 'せ': 'se', 'そ': 'so',
-        'た': 'ta', 'ち': 'chi', 'つ': 'tsu', 'て': 'te', 'と': 'to',
-        'な': 'na', 'に': 'ni', 'ぬ': 'nu', 'ね': 'ne', 'の': 'no',
-        'は': 'ha', 'ひ': 'hi', 'ふ': 'fu', 'へ': 'he', 'ほ': 'ho',
-        'ま': 'ma', 'み': 'mi', 'む': 'mu', 'め': 'me', 'も': 'mo',
-        'や': 'ya', 'ゆ': 'yu', 'よ': 'yo',
-        'ら': 'ra', 'り': 'ri', 'る': 'ru', 'れ': 're', 'ろ': 'ro',
-        'わ': 'wa', 'を': 'wo', 'ん': 'n'
-    },
-    'chinese': {
-        '阿': 'a', '伯': 'bo', '茨': 'ci', '德': 'de', '俄': 'e',
-        '佛': 'fo', '哥': 'ge', '海': 'hai', '艾': 'ai', '杰': 'jie',
-        '卡': 'ka', '拉': 'la', '马': 'ma', '娜': 'na', '欧': 'ou',
-        '帕': 'pa', '奇': 'qi', '热': 're', '萨': 'sa', '特': 'te',
-        '维': 'wei', '西': 'xi', '雅': 'ya', '扎': 'zha'
-    },
-    'korean': {
-        '김': 'kim', '이': 'lee', '박': 'park', '정': 'jung', '최': 'choi',
-        '강': 'kang', '조': 'cho', '윤': 'yoon', '장': 'jang', '임': 'lim',
-        '한': 'han', '오': 'oh', '서': 'seo', '신': 'shin', '권': 'kwon',
-        '황': 'hwang', '안': 'ahn', '송': 'song', '전': 'jeon', '홍': 'hong'
-    }
-}
-
 # TLDs internacionales completos
 INTERNATIONAL_TLDS = {
     'us': ['com', 'org', 'net', 'edu', 'gov', 'mil'],
@@ -185,6 +104,13 @@ INTERNATIONAL_TLDS = {
     'other': ['info', 'biz', 'name', 'mobi', 'asia', 'tel', 'pro']
 }
 
+# Índice de sugerencias de dominio (BK-tree) construido una vez al importar
+DOMAIN_INDEX = DomainSuggestionIndex.from_common_domains(
+    COMMON_DOMAINS,
+    INTERNATIONAL_TLDS,
+    ENHANCED_INTERNATIONAL_TLDS
+)
+
 class UsernameProcessor:
     _instance = None
 
@@ -211,7 +137,7 @@ class UsernameProcessor:
                 api_key = os.getenv('OPENAI_API_KEY')
                 if not api_key:
                     raise ValueError("OPENAI_API_KEY not found in environment variables")
-                self.client = OpenAI(api_key=api_key)
+                self.client = instrument_openai(OpenAI(api_key=api_key))
             
             logger.info("OpenAI client initialized successfully")
 
@@ -221,11 +147,19 @@ class UsernameProcessor:
             self.common_domains = COMMON_DOMAINS
             self.transliteration_map = TRANSLITERATION_MAP
             self.international_tlds = INTERNATIONAL_TLDS
+            self.domain_index = DOMAIN_INDEX
+            self._build_script_classifier()
 
         except Exception as e:
-            logger.error(f"Failed to initialize UsernameProcessor: {str(e)}")
+            logger.error("Failed to initialize UsernameProcessor: %s", e)
             raise
 
+    def _build_script_classifier(self):
+        """Compilar los patrones de idioma actuales en el clasificador de scripts"""
+        self.script_classifier = ScriptClassifier({
+            lang: info['pattern'] for lang, info in self.language_patterns.items()
+        })
+
     def _process_with_gpt4(self, text: str) -> str:
         """
         Procesa el texto usando GPT-4
@@ -249,20 +183,14 @@ class UsernameProcessor:
             processed_text = response.choices[0].message.content.strip()
             return self._clean_username(processed_text)
         except Exception as e:
-            logger.error(f"Error in GPT-4 processing: {str(e)}")
+            logger.error("Error in GPT-4 processing: %s", e)
             return text
 
     def _clean_username(self, username: str) -> str:
         """
         Limpia y formatea el nombre de usuario
         """
-        # Convertir a minúsculas y eliminar espacios extras
-        cleaned = username.lower().strip()
-        # Reemplazar espacios con guiones bajos
-        cleaned = "_".join(cleaned.split())
-        # Eliminar caracteres no permitidos
-        cleaned = ''.join(c for c in cleaned if c.isalnum() or c in '_.-')
-        return cleaned
+        return clean_username(username)
 
     def _clean_text(self, text: str) -> str:
         """
@@ -282,12 +210,12 @@ class UsernameProcessor:
         Procesa el nombre de usuario con mejor manejo de símbolos y caracteres especiales
         """
         try:
-            logger.debug(f"Processing username: {text}")
+            logger.debug("Processing username: %s", text)
             
             # Detectar idioma si no se proporciona
             if not detected_lang:
                 detected_lang = self._detect_language(text)
-            logger.debug(f"Detected language: {detected_lang}")
+            logger.debug("Detected language: %s", detected_lang)
 
             # Procesar con GPT-4
             processed_text = self._process_with_gpt4(text)
@@ -315,7 +243,7 @@ class UsernameProcessor:
             }
 
         except Exception as e:
-            logger.error(f"Error processing username: {str(e)}")
+            logger.error("Error processing username: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -330,7 +258,7 @@ class UsernameProcessor:
             # Detectar idiomas
             username_lang = self._detect_language(username_part)
             domain_lang = self._detect_language(domain_part)
-            logger.debug(f"Detected languages - Username: {username_lang}, Domain: {domain_lang}")
+            logger.debug("Detected languages - Username: %s, Domain: %s", username_lang, domain_lang)
 
             # Procesar username
             username_result = self.process_username(username_part, username_lang)
@@ -371,7 +299,7 @@ class UsernameProcessor:
             }
 
         except Exception as e:
-            logger.error(f"Error processing email: {str(e)}")
+            logger.error("Error processing email: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -383,11 +311,11 @@ class UsernameProcessor:
         Procesa el dominio con mejor manejo de formatos internacionales
         """
         try:
-            logger.debug(f"Processing domain: {text}")
+            logger.debug("Processing domain: %s", text)
             
             if not detected_lang:
                 detected_lang = self._detect_language(text)
-            logger.debug(f"Detected language: {detected_lang}")
+            logger.debug("Detected language: %s", detected_lang)
 
             cleaned_text = self._clean_text(text)
             processed_text = self._process_domain_symbols(cleaned_text, detected_lang)
@@ -423,7 +351,7 @@ class UsernameProcessor:
             }
 
         except Exception as e:
-            logger.error(f"Error processing domain: {str(e)}")
+            logger.error("Error processing domain: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -435,10 +363,11 @@ class UsernameProcessor:
         Detección de idioma mejorada con patrones y palabras clave
         """
         text_lower = text.lower()
+        profile = self.script_classifier.classify(text)
 
-        # Verificar patrones de caracteres específicos
+        # Verificar patrones de caracteres específicos (una sola pasada por el texto)
         for lang, info in self.language_patterns.items():
-            if re.search(info['pattern'], text):
+            if profile.has_language(lang):
                 return lang
             # Verificar palabras clave del idioma
             if any(keyword in text_lower for keyword in info['keywords']):
@@ -473,55 +402,28 @@ class UsernameProcessor:
 
     def _process_symbols(self, text: str, lang: str) -> str:
         """
-        Procesamiento mejorado de símbolos según el idioma
+        Procesamiento de símbolos hablados en una sola pasada
+
+        El patrón compilado cubre las formas de todos los idiomas (los usuarios
+        mezclan, p. ej. 'juan punto perez at gmail dot com'), así que el idioma
+        detectado ya no limita la búsqueda.
         """
-        words = text.split()
-        result = []
-        
-        for word in words:
-            word_lower = word.lower()
-            symbol_found = False
-            
-            # Buscar en todos los símbolos
-            for symbol, lang_mappings in self.symbol_mapping.items():
-                # Verificar en el idioma específico
-                if lang in lang_mappings and any(kw in word_lower for kw in lang_mappings[lang]):
-                    result.append(symbol)
-                    symbol_found = True
-                    break
-                
-                # Verificar en inglés como respaldo
-                if not symbol_found and 'en' in lang_mappings:
-                    if any(kw in word_lower for kw in lang_mappings['en']):
-                        result.append(symbol)
-                        symbol_found = True
-                        break
-            
-            if not symbol_found:
-                result.append(word)
-        
-        return ''.join(result)
+        return ''.join(rewrite_spoken_symbols(text).split())
 
     def _transliterate_text(self, text: str, lang: str) -> str:
         """
         Transliteración mejorada según el idioma
         """
-        if lang not in ['ru', 'ja', 'zh', 'ko']:
-            return text
-
-        result = text
         lang_map = {
             'ru': 'russian',
             'ja': 'japanese',
             'zh': 'chinese',
             'ko': 'korean'
         }
+        if lang not in lang_map:
+            return text
 
-        if lang in lang_map and lang_map[lang] in self.transliteration_map:
-            for original, transliterated in self.transliteration_map[lang_map[lang]].items():
-                result = result.replace(original, transliterated)
-
-        return unidecode(result.lower())
+        return unidecode(transliterate(text, lang_map[lang]).lower())
 
     def _validate_username_format(self, username: str) -> bool:
         """
@@ -618,14 +520,17 @@ class UsernameProcessor:
 
     def _get_common_domain(self, domain: str, lang: str) -> Optional[str]:
         """
-        Búsqueda mejorada de dominios comunes con soporte multilingüe
+        Búsqueda de dominios comunes con el índice de dominios
+
+        Acepta el dominio exacto, un alias del proveedor ('hotmail', 'яндекс')
+        o una errata leve ('gmial.com'). Si no, prueba los dominios regionales
+        del idioma por subcadena, como antes.
         """
         domain_lower = domain.lower()
 
-        # Verificar en dominios globales
-        for domain_name, variants in self.common_domains['global'].items():
-            if any(variant in domain_lower for variant in variants):
-                return domain_name
+        resolved = self.domain_index.resolve(domain_lower)
+        if resolved:
+            return resolved
 
         # Verificar en dominios regionales según el idioma
         region_map = {
@@ -646,19 +551,11 @@ class UsernameProcessor:
 
     def _get_domain_suggestions(self, invalid_domain: str, lang: str) -> List[str]:
         """
-        Generación mejorada de sugerencias de dominio
+        Sugerencias "¿quisiste decir...?" ordenadas por distancia de edición
         """
-        suggestions = set()
+        suggestions = [domain for _, domain in self.domain_index.suggest(invalid_domain, limit=5)]
         base_name = invalid_domain.split('.')[0]
 
-        # Sugerir dominios comunes globales
-        for domain_name, variants in self.common_domains['global'].items():
-            if len(base_name) >= 3 and (
-                base_name in domain_name or
-                domain_name.startswith(base_name)
-            ):
-                suggestions.add(domain_name)
-
         # Sugerir dominios regionales según el idioma
         region_map = {
             'ru': 'ru',
@@ -669,20 +566,18 @@ class UsernameProcessor:
         
         if lang in region_map:
             region = region_map[lang]
-            if region in self.common_domains['regional']:
-                for domain_name, variants in self.common_domains['regional'][region].items():
-                    main_domain = variants[0]
-                    suggestions.add(domain_name)
+            for domain_name in self.common_domains['regional'].get(region, {}):
+                if domain_name not in suggestions:
+                    suggestions.append(domain_name)
 
         # Sugerir TLDs comunes
         common_tlds = ['com', 'org', 'net']
         for tld in common_tlds:
             suggestion = f"{base_name}.{tld}"
-            if self._validate_domain_structure(suggestion):
-                suggestions.add(suggestion)
+            if suggestion not in suggestions and self._validate_domain_structure(suggestion):
+                suggestions.append(suggestion)
 
-        # Convertir set a lista y limitar cantidad
-        return list(suggestions)[:5]
+        return suggestions[:5]
 
     def get_domain_info(self, domain: str) -> Dict:
         """
@@ -730,7 +625,7 @@ class UsernameProcessor:
             }
 
         except Exception as e:
-            logger.error(f"Error getting domain info: {str(e)}")
+            logger.error("Error getting domain info: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -758,7 +653,7 @@ class UsernameProcessor:
             return self.process_email(username, domain)
 
         except Exception as e:
-            logger.error(f"Error validating email: {str(e)}")
+            logger.error("Error validating email: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -779,5 +674,5 @@ class UsernameProcessor:
             logger.info("OpenAI connection test successful")
             return True
         except Exception as e:
-            logger.error(f"OpenAI connection test failed: {str(e)}")
+            logger.error("OpenAI connection test failed: %s", e)
             return False
\ No newline at end of file
@@ -10,31 +10,51 @@ class VoiceHandler:
     def __init__(self):
         self.chatgpt_helper = ChatGPTHelper()
 
-    def handle_voice_request(self, request: Request, step: str = 'transcribe') -> Dict:
+    def handle_voice_request(self, request: Request, step: str = 'transcribe', preprocess: bool = False) -> Dict:
         try:
-            print("\n=== Processing Voice Request ===")
-            print("Request files:", request.files)
+            logger.debug("Processing Voice Request")
+            logger.debug("Request files: %s", request.files)
             
             # Verificar archivo de audio
             if 'audio' not in request.files:
-                print("No audio file found in request")
+                logger.debug("No audio file found in request")
                 return {
                     'success': False,
                     'error': "No audio file provided"
                 }
             
             audio_file = request.files['audio']
-            print(f"Audio file received: {audio_file.filename}")
-            print(f"Content type: {audio_file.content_type}")
-            print(f"File size: {audio_file.content_length} bytes")
+            logger.debug("Audio file received: %s", audio_file.filename)
+            logger.debug("Content type: %s", audio_file.content_type)
+            logger.debug("File size: %s bytes", audio_file.content_length)
             
+            return self.process_audio(audio_file, step=step, preprocess=preprocess)
+
+        except Exception as e:
+            logger.exception("Error in voice handler: %s", e)
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
+    def process_audio(self, audio_file, step: str = 'transcribe', preprocess: bool = False) -> Dict:
+        """
+        Procesar un audio ya recibido (petición síncrona o trabajo en cola)
+
+        :param audio_file: Archivo de audio (FileStorage)
+        :param step: Tipo de procesamiento
+        :param preprocess: Recortar silencios y reducir el audio antes de Whisper
+        :return: Resultado del procesamiento de voz
+        """
+        try:
             # Procesar el audio con el step especificado
             voice_result = self.chatgpt_helper.process_voice_input(
                 audio_file=audio_file,
-                step=step
+                step=step,
+                preprocess=preprocess
             )
             
-            print("Voice processing result:", voice_result)
+            logger.debug("Voice processing result: %s", voice_result)
             
             # Ajustar la respuesta según el tipo de procesamiento
             if step == 'username':
@@ -44,7 +64,10 @@ class VoiceHandler:
                     'username': voice_result.get('username'),
                     'original_transcription': voice_result.get('original_transcription'),
                     'transcription': voice_result.get('transcription'),
-                    'error': voice_result.get('error')
+                    'error': voice_result.get('error'),
+                    'cached': voice_result.get('cached', False),
+                    'preprocessing': voice_result.get('preprocessing'),
+                    'timings': voice_result.get('timings')
                 }
             else:
                 return {
@@ -54,12 +77,14 @@ class VoiceHandler:
                     'original_transcription': voice_result.get('original_transcription'),
                     'was_corrected': voice_result.get('was_corrected', False),
                     'error': voice_result.get('error'),
-                    'corrections_applied': voice_result.get('transcription') != voice_result.get('original_transcription')
+                    'corrections_applied': voice_result.get('transcription') != voice_result.get('original_transcription'),
+                    'cached': voice_result.get('cached', False),
+                    'preprocessing': voice_result.get('preprocessing'),
+                    'timings': voice_result.get('timings')
                 }
 
         except Exception as e:
-            logger.error(f"Error in voice handler: {str(e)}")
-            print(f"Error in voice handler: {str(e)}")
+            logger.exception("Error in voice handler: %s", e)
             return {
                 'success': False,
                 'error': str(e)
@@ -69,13 +94,13 @@ class VoiceHandler:
         """
         Registra los detalles del procesamiento de voz
         """
-        print("\n=== Voice Processing Details ===")
+        logger.debug("Voice Processing Details")
         if 'username' in voice_result:
-            print(f"Processed username: {voice_result.get('username')}")
-        print(f"Original transcription: {voice_result.get('original_transcription')}")
-        print(f"Final transcription: {voice_result.get('transcription')}")
-        print(f"Language detected: {voice_result.get('detected_language')}")
+            logger.debug("Processed username: %s", voice_result.get('username'))
+        logger.debug("Original transcription: %s", voice_result.get('original_transcription'))
+        logger.debug("Final transcription: %s", voice_result.get('transcription'))
+        logger.debug("Language detected: %s", voice_result.get('detected_language'))
         if 'was_corrected' in voice_result:
-            print(f"Corrections applied: {voice_result.get('was_corrected')}")
+            logger.debug("Corrections applied: %s", voice_result.get('was_corrected'))
         if voice_result.get('error'):
-            print(f"Errors encountered: {voice_result.get('error')}")
\ No newline at end of file
+            logger.warning("Errors encountered: %s", voice_result.get('error'))
\ No newline at end of file
@@ -1,16 +1,48 @@
+import logging
 import os
 import time
+import json
 import random
+import hashlib
+import threading
 import requests
-import traceback
 from datetime import datetime, timedelta
 from functools import wraps
 from dotenv import load_dotenv
 from pathlib import Path
+from src.utils.tracing import traced, trace_methods
+from src.utils.structured_logging import SAMPLED
+from src.utils.metrics import ZOHO_REQUESTS, ZOHO_ERRORS, ZOHO_REQUEST_DURATION, CACHE_LOOKUPS
+
+logger = logging.getLogger(__name__)
 
 def get_env_path():
     return Path(__file__).parent.parent.parent.parent / '.env'
 
+def zoho_request(method, url, operation, **kwargs):
+    """
+    Petición HTTP a Zoho registrando llamadas, latencia y errores por operación
+
+    :param method: Método HTTP ('GET', 'POST', 'PUT')
+    :param url: URL de la API
+    :param operation: Etiqueta de la métrica ('get_candidates', 'refresh_token'...)
+    :return: Respuesta de requests
+    """
+    started = time.perf_counter()
+    try:
+        response = requests.request(method, url, **kwargs)
+    except Exception as e:
+        ZOHO_REQUESTS.inc(operation=operation, status='exception')
+        ZOHO_ERRORS.inc(operation=operation, reason=type(e).__name__)
+        raise
+    finally:
+        ZOHO_REQUEST_DURATION.observe(time.perf_counter() - started, operation=operation)
+
+    ZOHO_REQUESTS.inc(operation=operation, status=str(response.status_code))
+    if response.status_code >= 400:
+        ZOHO_ERRORS.inc(operation=operation, reason=f"http_{response.status_code}")
+    return response
+
 def retry_with_backoff(retries=3, backoff_in_seconds=1):
     def decorator(func):
         @wraps(func)
@@ -21,10 +53,10 @@ def retry_with_backoff(retries=3, backoff_in_seconds=1):
                     return func(*args, **kwargs)
                 except Exception as e:
                     if retry_count == retries:
-                        print(f"Max retries ({retries}) reached. Last error: {str(e)}")
+                        logger.error("Max retries (%s) reached. Last error: %s", retries, e)
                         raise
                     wait = (backoff_in_seconds * 2 ** retry_count + random.uniform(0, 1))
-                    print(f"Attempt {retry_count + 1} failed. Waiting {wait:.2f} seconds before retry...")
+                    logger.warning("Attempt %s failed. Waiting %.2f seconds before retry...", retry_count + 1, wait)
                     time.sleep(wait)
                     retry_count += 1
         return wrapper
@@ -51,15 +83,16 @@ class TokenManager:
         time_since_last_refresh = datetime.now() - self._last_token_refresh
         return time_since_last_refresh > self._token_refresh_cooldown
 
+    @traced('zoho.refresh_token')
     @retry_with_backoff(retries=3, backoff_in_seconds=2)
     def refresh_zoho_token(self):
         # Verificar si realmente necesitamos refrescar
         if not self.should_refresh_token():
-            print("Token refresh skipped. Recent refresh exists.")
+            logger.debug("Token refresh skipped. Recent refresh exists.")
             return None
 
         try:
-            print("\n=== Refreshing Zoho Recruit Token ===")
+            logger.debug("Refreshing Zoho Recruit Token")
             refresh_url = "https://accounts.zoho.com/oauth/v2/token"
             
             params = {
@@ -70,17 +103,17 @@ class TokenManager:
                 'scope': 'ZohoRecruit.modules.ALL'
             }
             
-            response = requests.post(refresh_url, params=params)
+            response = zoho_request('POST', refresh_url, 'refresh_token', params=params)
             
             # Actualizar el momento del último refresco
             self._last_token_refresh = datetime.now()
             
-            print(f"Refresh Status: {response.status_code}")
+            logger.debug("Refresh Status: %s", response.status_code)
             
             if response.status_code == 200:
                 data = response.json()
                 new_token = data.get('access_token')
-                print(f"New token obtained: {new_token[:10]}...{new_token[-10:]}")
+                logger.debug("New token obtained")
                 
                 if self.environment == 'development':
                     try:
@@ -95,19 +128,20 @@ class TokenManager:
                                     file.write(f'{token_env_key}={new_token}\n')
                                 else:
                                     file.write(line)
-                        print("\n=== Updated local .env file for Recruit ===")
+                        logger.debug("Updated local .env file for Recruit")
                     except Exception as e:
-                        print(f"Error updating .env file: {str(e)}")
+                        logger.error("Error updating .env file: %s", e)
                 
                 return new_token
             
-            print(f"Error refreshing token: {response.text}")
+            logger.warning("Error refreshing token: %s", response.text)
             return None
         
         except Exception as e:
-            print(f"Exception in refresh_zoho_token: {str(e)}")
+            logger.error("Exception in refresh_zoho_token: %s", e)
             return None
 
+@trace_methods('zoho', exclude=['get_snapshot_index', 'prefetch_jobs'])
 class ZohoService:
     _instance = None
 
@@ -122,7 +156,7 @@ class ZohoService:
         if self._initialized:
             return
         
-        print("\n=== ZohoService Initialization ===")
+        logger.debug("ZohoService Initialization")
         env_path = get_env_path()
         load_dotenv(env_path)
         
@@ -130,10 +164,13 @@ class ZohoService:
         self.recruit_access_token = os.getenv('ZOHO_RECRUIT_ACCESS_TOKEN')
         self.token_manager = TokenManager()
         
-        # Cache configuration
-        self._candidates_cache = None
-        self._last_fetch_time = None
+        # Cache configuration: un snapshot por módulo de Zoho ('candidates', 'jobs')
+        self._snapshots = {}
+        self._snapshot_lock = threading.Lock()
+        self._refreshing = set()
         self._cache_duration = timedelta(minutes=15)
+        self._page_size = 200
+        self._max_pages = 50
         
         if verify_token:
             self._verify_token()
@@ -141,116 +178,184 @@ class ZohoService:
         # Marcar como inicializado
         self._initialized = True
 
+    @traced('zoho.verify_token')
     def _verify_token(self):
         try:
-            print("\n=== Recruit Token Verification ===")
-            print(f"Current token: {self.recruit_access_token[:10]}... ")
+            logger.debug("Recruit Token Verification")
             
             url = f"{self.recruit_base_url}/Candidates"
             headers = {
                 'Authorization': f'Zoho-oauthtoken {self.recruit_access_token}'
             }
             
-            response = requests.get(url, headers=headers)
-            print(f"Verification Status: {response.status_code}")
+            response = zoho_request('GET', url, 'verify_token', headers=headers)
+            logger.debug("Verification Status: %s", response.status_code)
             
             if response.status_code == 401:
-                print("Token expired, attempting to refresh...")
+                logger.debug("Token expired, attempting to refresh...")
                 new_token = self.token_manager.refresh_zoho_token()
                 if new_token:
                     self.recruit_access_token = new_token
-                    print(f"Token refreshed successfully. New token: {new_token[:10]}...")
+                    logger.debug("Token refreshed successfully")
                     
                     headers['Authorization'] = f'Zoho-oauthtoken {new_token}'
-                    verify_response = requests.get(url, headers=headers)
-                    print(f"New token verification status: {verify_response.status_code}")
+                    verify_response = zoho_request('GET', url, 'verify_token', headers=headers)
+                    logger.debug("New token verification status: %s", verify_response.status_code)
                     
                     if verify_response.status_code != 200:
-                        print("Warning: New token verification failed")
+                        logger.warning("Warning: New token verification failed")
                 else:
-                    print("Failed to refresh token")
+                    logger.warning("Failed to refresh token")
             elif response.status_code != 200:
-                print(f"Token verification failed: {response.text}")
+                logger.warning("Token verification failed: %s", response.text)
             else:
-                print("Token verification successful")
+                logger.debug("Token verification successful")
                 
         except Exception as e:
-            print(f"Error verifying token: {str(e)}")
-            traceback.print_exc()
+            logger.exception("Error verifying token: %s", e)
 
-    def _get_from_cache_or_fetch(self, fetch_func, *args, **kwargs):
+    def _is_snapshot_fresh(self, snapshot, current_time):
+        return (snapshot is not None and
+                current_time - snapshot['fetched_at'] < self._cache_duration)
+
+    def _store_snapshot(self, cache_key, data, fetched_at):
+        payload = json.dumps(data, sort_keys=True, default=str).encode('utf-8')
+        snapshot = {
+            'data': data,
+            'fetched_at': fetched_at,
+            'etag': hashlib.md5(payload).hexdigest()
+        }
+        with self._snapshot_lock:
+            self._snapshots[cache_key] = snapshot
+        return snapshot
+
+    def _get_snapshot(self, fetch_func, cache_key='candidates', serve_stale=False):
+        """
+        Obtener el snapshot de un módulo, refrescándolo si ha caducado
+
+        :param fetch_func: Función que descarga los datos de Zoho
+        :param cache_key: Nombre del snapshot
+        :param serve_stale: Si es True, un snapshot caducado se sirve de inmediato
+            y se refresca en segundo plano
+        :return: Snapshot con 'data', 'fetched_at' y 'etag'
+        """
         current_time = datetime.now()
-        
-        if (self._candidates_cache is not None and 
-            self._last_fetch_time is not None and 
-            current_time - self._last_fetch_time < self._cache_duration):
-            print("Using cached candidates...")
-            return self._candidates_cache
+        snapshot = self._snapshots.get(cache_key)
 
+        if self._is_snapshot_fresh(snapshot, current_time):
+            CACHE_LOOKUPS.inc(cache=cache_key, result='hit')
+            logger.debug("Using cached %s...", cache_key, extra={'sample_rate': SAMPLED})
+            return snapshot
+
+        if snapshot is not None and serve_stale:
+            CACHE_LOOKUPS.inc(cache=cache_key, result='stale')
+            logger.debug("Serving stale %s while refreshing in background", cache_key)
+            self._refresh_snapshot_async(fetch_func, cache_key)
+            return snapshot
+
+        CACHE_LOOKUPS.inc(cache=cache_key, result='miss')
         try:
-            data = fetch_func(*args, **kwargs)
-            self._candidates_cache = data
-            self._last_fetch_time = current_time
-            return data
+            return self._store_snapshot(cache_key, fetch_func(), current_time)
         except Exception as e:
-            print(f"Error fetching data: {str(e)}")
-            if self._candidates_cache is not None:
-                print("Using cached data due to fetch error")
-                return self._candidates_cache
+            logger.error("Error fetching data: %s", e)
+            if snapshot is not None:
+                logger.warning("Using cached data due to fetch error")
+                return snapshot
             raise
 
+    def get_snapshot_index(self, cache_key, name, data, builder):
+        """
+        Obtener un índice derivado de un snapshot, construido una sola vez por snapshot
+
+        :param cache_key: Nombre del snapshot ('candidates', 'jobs')
+        :param name: Nombre del índice
+        :param data: Datos devueltos por el snapshot (p. ej. get_candidates())
+        :param builder: Función que recibe los datos y construye el índice
+        :return: Índice (se reconstruye si los datos no son los del snapshot actual)
+        """
+        snapshot = self._snapshots.get(cache_key)
+        if snapshot is None or snapshot['data'] is not data:
+            return builder(data)
+
+        indexes = snapshot.setdefault('indexes', {})
+        if name not in indexes:
+            indexes[name] = builder(data)
+        return indexes[name]
+
+    def _refresh_snapshot_async(self, fetch_func, cache_key):
+        with self._snapshot_lock:
+            if cache_key in self._refreshing:
+                return
+            self._refreshing.add(cache_key)
+
+        def refresh():
+            try:
+                self._store_snapshot(cache_key, fetch_func(), datetime.now())
+                logger.debug("Background refresh of %s completed", cache_key)
+            except Exception as e:
+                logger.error("Background refresh of %s failed: %s", cache_key, e)
+            finally:
+                with self._snapshot_lock:
+                    self._refreshing.discard(cache_key)
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def _get_from_cache_or_fetch(self, fetch_func, *args, **kwargs):
+        cache_key = kwargs.pop('cache_key', 'candidates')
+        return self._get_snapshot(lambda: fetch_func(*args, **kwargs), cache_key)['data']
+
     @retry_with_backoff(retries=3, backoff_in_seconds=2)
     def get_candidates(self):
         try:
             return self._get_from_cache_or_fetch(self._fetch_candidates)
         except Exception as e:
-            print(f"Error in get_candidates: {str(e)}")
+            logger.error("Error in get_candidates: %s", e)
             return []
 
     def _fetch_candidates(self):
-        print("\n=== Fetching Fresh Candidates ===")
+        logger.debug("Fetching Fresh Candidates")
         url = f"{self.recruit_base_url}/Candidates"
         headers = {
             'Authorization': f'Zoho-oauthtoken {self.recruit_access_token}'
         }
         
-        response = self._handle_request(url, headers)
+        response = self._handle_request(url, headers, operation='get_candidates')
         if not response:
             raise Exception("No response from server")
             
         if response.status_code == 200:
             data = response.json()
             candidates = data.get('data', [])
-            print(f"Successfully retrieved {len(candidates)} candidates")
+            logger.debug("Successfully retrieved %s candidates", len(candidates))
             return candidates
         else:
             raise Exception(f"Error Response: {response.text}")
 
+    @traced('zoho.http')
     @retry_with_backoff(retries=2, backoff_in_seconds=1)
-    def _handle_request(self, url, headers, params=None):
+    def _handle_request(self, url, headers, params=None, operation='get'):
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = zoho_request('GET', url, operation, headers=headers, params=params)
             
             if response.status_code == 401:
-                print("Token expired, attempting to refresh...")
+                logger.debug("Token expired, attempting to refresh...")
                 new_token = self.token_manager.refresh_zoho_token()
                 if new_token:
                     self.recruit_access_token = new_token
                     headers['Authorization'] = f'Zoho-oauthtoken {new_token}'
-                    response = requests.get(url, headers=headers, params=params)
-                    print(f"Second attempt status: {response.status_code}")
+                    response = zoho_request('GET', url, operation, headers=headers, params=params)
+                    logger.debug("Second attempt status: %s", response.status_code)
                 else:
-                    print("Failed to refresh token")
+                    logger.warning("Failed to refresh token")
             
             return response
         except Exception as e:
-            print(f"Error in _handle_request: {str(e)}")
-            traceback.print_exc()
+            logger.exception("Error in _handle_request: %s", e)
             return None
 
     def search_candidates(self, search_criteria):
         try:
-            print(f"\n=== Searching Candidates with criteria: {search_criteria} ===")
+            logger.debug("Searching Candidates with criteria: %s", search_criteria)
             url = f"{self.recruit_base_url}/Candidates/search"
             headers = {
                 'Authorization': f'Zoho-oauthtoken {self.recruit_access_token}'
@@ -260,80 +365,137 @@ class ZohoService:
             }
             
             self._verify_token()
-            response = self._handle_request(url, headers, params)
+            response = self._handle_request(url, headers, params, operation='search_candidates')
             
             if not response:
                 return {"error": "No response from server"}
                 
-            print(f"Search Response Status: {response.status_code}")
+            logger.debug("Search Response Status: %s", response.status_code)
             
             if response.status_code == 200:
                 data = response.json()
                 candidates = data.get('data', [])
-                print(f"Successfully found {len(candidates)} candidates")
+                logger.debug("Successfully found %s candidates", len(candidates))
                 return candidates
             else:
                 error_message = response.text if hasattr(response, 'text') else "Unknown error"
-                print(f"Error Response: {error_message}")
+                logger.warning("Error Response: %s", error_message)
                 return {"error": error_message}
                 
         except Exception as e:
-            print(f"Exception in search_candidates: {str(e)}")
-            traceback.print_exc()
+            logger.exception("Exception in search_candidates: %s", e)
             return {"error": str(e)}
 
-    def get_jobs(self):
-        try:
-            print("\n=== Getting All Jobs ===")
-            url = f"{self.recruit_base_url}/JobOpenings"
+    def _fetch_module_pages(self, module):
+        """
+        Descargar todas las páginas de un módulo de Zoho Recruit
+
+        :param module: Nombre del módulo (p. ej. 'JobOpenings')
+        :return: Lista con los registros de todas las páginas
+        """
+        url = f"{self.recruit_base_url}/{module}"
+        records = []
+
+        for page in range(1, self._max_pages + 1):
             headers = {
                 'Authorization': f'Zoho-oauthtoken {self.recruit_access_token}'
             }
-            
-            response = self._handle_request(url, headers)
+            params = {'page': page, 'per_page': self._page_size}
+
+            response = self._handle_request(url, headers, params, operation=f"list_{module.lower()}")
             if not response:
-                return []
-                
-            print(f"Response Status: {response.status_code}")
-            
-            if response.status_code == 200:
-                data = response.json()
-                jobs = data.get('data', [])
-                print(f"Successfully retrieved {len(jobs)} jobs")
-                return jobs
-            else:
-                print(f"Error Response: {response.text}")
-                return []
-            
+                raise Exception("No response from server")
+
+            # Zoho responde 204 cuando no hay más registros
+            if response.status_code == 204:
+                break
+            if response.status_code != 200:
+                raise Exception(f"Error Response: {response.text}")
+
+            data = response.json()
+            records.extend(data.get('data', []))
+
+            if not data.get('info', {}).get('more_records', False):
+                break
+        else:
+            logger.debug("Reached max pages (%s) for %s", self._max_pages, module)
+
+        logger.debug("Successfully retrieved %s records from %s (%s pages)", len(records), module, page)
+        return records
+
+    def _fetch_jobs(self):
+        logger.debug("Fetching Fresh Job Openings")
+        return self._fetch_module_pages('JobOpenings')
+
+    def get_jobs_snapshot(self):
+        """
+        Obtener el snapshot de vacantes (se sirve desde memoria y se refresca en segundo plano)
+
+        :return: Snapshot con 'data', 'fetched_at' y 'etag'
+        """
+        return self._get_snapshot(self._fetch_jobs, cache_key='jobs', serve_stale=True)
+
+    def prefetch_jobs(self):
+        """Precargar el snapshot de vacantes en segundo plano"""
+        if 'jobs' not in self._snapshots:
+            self._refresh_snapshot_async(self._fetch_jobs, 'jobs')
+
+    @staticmethod
+    def filter_jobs(jobs, status=None, industry=None):
+        """
+        Filtrar vacantes localmente por estado e industria (sin distinguir mayúsculas)
+
+        :param jobs: Lista de vacantes
+        :param status: Estado de la vacante (Job_Opening_Status)
+        :param industry: Industria (Industry)
+        :return: Lista filtrada
+        """
+        status = status.strip().lower() if status else None
+        industry = industry.strip().lower() if industry else None
+
+        return [
+            job for job in jobs
+            if (not status or str(job.get('Job_Opening_Status') or '').lower() == status)
+            and (not industry or str(job.get('Industry') or '').lower() == industry)
+        ]
+
+    def get_jobs(self, status=None, industry=None):
+        try:
+            logger.debug("Getting All Jobs")
+            jobs = self.get_jobs_snapshot()['data']
+            jobs = self.filter_jobs(jobs, status, industry)
+            logger.debug("Returning %s jobs", len(jobs))
+            return jobs
+
         except Exception as e:
-            print(f"Exception in get_jobs: {str(e)}")
+            logger.error("Exception in get_jobs: %s", e)
             return []
 
     def create_candidate(self, candidate_data):
         try:
-            print("\n=== Creating New Candidate ===")
+            logger.debug("Creating New Candidate")
             url = f"{self.recruit_base_url}/Candidates"
             headers = {
                 'Authorization': f'Zoho-oauthtoken {self.recruit_access_token}',
                 'Content-Type': 'application/json'
             }
             
-            response = requests.post(url, headers=headers, json={'data': [candidate_data]})
-            print(f"Response Status: {response.status_code}")
+            response = zoho_request('POST', url, 'create_candidate', headers=headers, json={'data': [candidate_data]})
+            logger.debug("Response Status: %s", response.status_code)
             
             if response.status_code in [200, 201]:
                 return response.json()
             else:
-                print(f"Error Response: {response.text}")
+                logger.warning("Error Response: %s", response.text)
                 return None
                 
         except Exception as e:
-            print(f"Exception in create_candidate: {str(e)}")
+            logger.error("Exception in create_candidate: %s", e)
             return None
 
     def get_candidate_by_email(self, email):
         try:
-            print(f"\n=== Getting Candidate by Email: {email} ===")
+            logger.debug("Getting Candidate by Email: %s", email)
             url = f"{self.recruit_base_url}/Candidates/search"
             headers = {
                 'Authorization': f'Zoho-oauthtoken {self.recruit_access_token}'
@@ -342,46 +504,46 @@ class ZohoService:
                 'criteria': f"(Email:equals:{email})"
             }
             
-            response = self._handle_request(url, headers, params)
+            response = self._handle_request(url, headers, params, operation='get_candidate_by_email')
             if not response:
                 return None
                 
-            print(f"Response Status: {response.status_code}")
+            logger.debug("Response Status: %s", response.status_code)
             
             if response.status_code == 200:
                 data = response.json()
                 candidates = data.get('data', [])
                 if candidates:
-                    print("Candidate found")
+                    logger.debug("Candidate found")
                     return candidates[0]
-                print("No candidate found with this email")
+                logger.debug("No candidate found with this email")
                 return None
             else:
-                print(f"Error Response: {response.text}")
+                logger.warning("Error Response: %s", response.text)
                 return None
                 
         except Exception as e:
-            print(f"Exception in get_candidate_by_email: {str(e)}")
+            logger.error("Exception in get_candidate_by_email: %s", e)
             return None
 
     def update_candidate(self, candidate_id, update_data):
         try:
-            print(f"\n=== Updating Candidate {candidate_id} ===")
+            logger.debug("Updating Candidate %s", candidate_id)
             url = f"{self.recruit_base_url}/Candidates/{candidate_id}"
             headers = {
                 'Authorization': f'Zoho-oauthtoken {self.recruit_access_token}',
                 'Content-Type': 'application/json'
             }
             
-            response = requests.put(url, headers=headers, json={'data': [update_data]})
-            print(f"Response Status: {response.status_code}")
+            response = zoho_request('PUT', url, 'update_candidate', headers=headers, json={'data': [update_data]})
+            logger.debug("Response Status: %s", response.status_code)
             
             if response.status_code in [200, 201]:
                 return response.json()
             else:
-                print(f"Error Response: {response.text}")
+                logger.warning("Error Response: %s", response.text)
                 return None
                 
         except Exception as e:
-            print(f"Exception in update_candidate: {str(e)}")
+            logger.error("Exception in update_candidate: %s", e)
             return None
\ No newline at end of file
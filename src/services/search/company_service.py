@@ -1,18 +1,22 @@
+import logging
 from openai import OpenAI
 from typing import Dict
 import uuid
 from ..external.zoho_services import ZohoService
+from src.utils.metrics import instrument_openai
+
+logger = logging.getLogger(__name__)
 
 class CompanyService:
     def __init__(self, api_key: str):
-        self.client = OpenAI(api_key=api_key)
+        self.client = instrument_openai(OpenAI(api_key=api_key))
         self.zoho_service = ZohoService()
-        print("CompanyService initialized")
+        logger.debug("CompanyService initialized")
 
     def generate_companies(self, sector: str, geography: str, temperature: float = 0.7) -> Dict:
         try:
-            print(f"\n=== Making API Request ===")
-            print(f"Parameters: sector={sector}, geography={geography}")
+            logger.debug("Making API Request")
+            logger.debug("Parameters: sector=%s, geography=%s", sector, geography)
             
             response = self.client.chat.completions.create(
                 model="gpt-4",
@@ -34,8 +38,8 @@ class CompanyService:
                 companies = response.choices[0].message.content.split(',')
                 companies = [company.strip() for company in companies]
                 
-                print(f"\n=== Success ===")
-                print(f"Generated {len(companies)} companies")
+                logger.debug("Success")
+                logger.debug("Generated %s companies", len(companies))
                 
                 return {
                     "success": True,
@@ -46,9 +50,7 @@ class CompanyService:
                 raise Exception("No content in response")
             
         except Exception as e:
-            print(f"\n=== Error ===")
-            print(f"Type: {type(e)}")
-            print(f"Message: {str(e)}")
+            logger.exception("Error in generate_companies")
             
             return {
                 "success": False,
@@ -62,9 +64,9 @@ class CompanyService:
         """
         try:
             # 1. Buscar en Zoho CRM
-            print(f"\nBuscando empresas en Zoho CRM...")
-            print(f"Sector: {sector}")
-            print(f"Region: {geography}")
+            logger.debug("Buscando empresas en Zoho CRM...")
+            logger.debug("Sector: %s", sector)
+            logger.debug("Region: %s", geography)
             
             zoho_companies = self.zoho_service.get_accounts_by_industry_and_region(
                 industry=sector,
@@ -72,24 +74,24 @@ class CompanyService:
             )
             
             zoho_company_names = [company['name'] for company in zoho_companies]
-            print(f"\nEmpresas encontradas en Zoho: {len(zoho_company_names)}")
+            logger.debug("Empresas encontradas en Zoho: %s", len(zoho_company_names))
             
             # 2. Obtener sugerencias de ChatGPT
-            print("\nObteniendo sugerencias de ChatGPT...")
+            logger.debug("Obteniendo sugerencias de ChatGPT...")
             chatgpt_result = self.generate_companies(
                 sector=sector,
                 geography=geography
             )
             
             if not chatgpt_result['success']:
-                print(f"Error obteniendo sugerencias de ChatGPT: {chatgpt_result.get('error')}")
+                logger.warning("Error obteniendo sugerencias de ChatGPT: %s", chatgpt_result.get('error'))
                 return {
                     'success': False,
                     'error': chatgpt_result.get('error')
                 }
                 
             chatgpt_companies = chatgpt_result['content']
-            print(f"Sugerencias de ChatGPT: {len(chatgpt_companies)}")
+            logger.debug("Sugerencias de ChatGPT: %s", len(chatgpt_companies))
             
             # 3. Filtrar empresas de ChatGPT
             filtered_chatgpt_companies = [
@@ -132,7 +134,7 @@ class CompanyService:
             }
             
         except Exception as e:
-            print(f"Error en get_combined_companies: {str(e)}")
+            logger.error("Error en get_combined_companies: %s", e)
             return {
                 'success': False,
                 'error': str(e)
@@ -0,0 +1,217 @@
+import io
+import time
+import wave
+import shutil
+import logging
+import subprocess
+from typing import Dict, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # El preprocesado es opcional: sin NumPy se envía el audio original
+    np = None
+
+logger = logging.getLogger(__name__)
+
+TARGET_SAMPLE_RATE = 16000
+FRAME_MS = 30
+# Un frame es voz si su energía supera el umbral relativo al pico del audio
+SILENCE_THRESHOLD_DB = -35.0
+SILENCE_FLOOR_DB = -60.0
+# Margen que se conserva alrededor de la voz para no cortar consonantes
+PADDING_MS = 200
+FFMPEG_TIMEOUT_SECONDS = 20
+# Filtro antialiasing del remuestreo: coeficientes y corte relativo a la nueva Nyquist
+LOWPASS_TAPS = 101
+LOWPASS_CUTOFF = 0.9
+
+FFMPEG_PATH = shutil.which('ffmpeg')
+
+
+def is_available() -> bool:
+    """El preprocesado necesita NumPy (y ffmpeg para formatos distintos de WAV)"""
+    return np is not None
+
+
+def preprocess_audio(audio_bytes: bytes, extension: str) -> Tuple[Optional[bytes], Optional[str], Dict]:
+    """
+    Reducir un audio antes de enviarlo a Whisper
+
+    Decodifica, mezcla a mono, remuestrea a 16 kHz, recorta el silencio inicial
+    y final y vuelve a codificar (Opus si hay ffmpeg, WAV PCM 16 bits si no).
+
+    :param audio_bytes: Audio original
+    :param extension: Extensión del audio original ('webm', 'wav', ...)
+    :return: (audio procesado, extensión, estadísticas); audio None si no se
+             pudo procesar o el resultado no es más pequeño que el original
+    """
+    start = time.perf_counter()
+    stats = {'original_bytes': len(audio_bytes), 'applied': False}
+
+    if np is None:
+        stats['skipped'] = 'numpy not installed'
+        return None, None, stats
+
+    try:
+        samples = _decode(audio_bytes, extension)
+        if samples is None:
+            stats['skipped'] = f'cannot decode {extension} without ffmpeg'
+            return None, None, stats
+
+        stats['original_seconds'] = round(len(samples) / TARGET_SAMPLE_RATE, 2)
+        samples = trim_silence(samples, TARGET_SAMPLE_RATE)
+        stats['trimmed_seconds'] = round(len(samples) / TARGET_SAMPLE_RATE, 2)
+
+        if len(samples) == 0:
+            stats['skipped'] = 'no speech detected'
+            return None, None, stats
+
+        processed, processed_extension = _encode(samples)
+        stats['processed_bytes'] = len(processed)
+        if len(processed) >= len(audio_bytes):
+            stats['skipped'] = 'processed audio is not smaller'
+            return None, None, stats
+
+        stats['applied'] = True
+        return processed, processed_extension, stats
+
+    except Exception as e:
+        logger.warning("Audio preprocessing failed, using original audio: %s", e)
+        stats['skipped'] = str(e)
+        return None, None, stats
+
+    finally:
+        stats['preprocess_ms'] = round((time.perf_counter() - start) * 1000, 2)
+
+
+def trim_silence(samples, sample_rate: int):
+    """
+    Recortar el silencio inicial y final con un detector de energía vectorizado
+
+    :param samples: Señal mono float32 en [-1, 1]
+    :return: Señal recortada (vacía si no hay voz)
+    """
+    frame_size = int(sample_rate * FRAME_MS / 1000)
+    frame_count = len(samples) // frame_size
+    if frame_count == 0:
+        return samples
+
+    frames = samples[:frame_count * frame_size].reshape(frame_count, frame_size)
+    rms = np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1))
+    energy_db = 20.0 * np.log10(np.maximum(rms, 1e-10))
+
+    threshold = max(energy_db.max() + SILENCE_THRESHOLD_DB, SILENCE_FLOOR_DB)
+    voiced = np.flatnonzero(energy_db > threshold)
+    if voiced.size == 0:
+        return samples[:0]
+
+    padding = int(sample_rate * PADDING_MS / 1000)
+    first = max(0, voiced[0] * frame_size - padding)
+    last = min(len(samples), (voiced[-1] + 1) * frame_size + padding)
+    return samples[first:last]
+
+
+def _decode(audio_bytes: bytes, extension: str):
+    """Decodificar a mono float32 a 16 kHz (WAV con la librería estándar, el resto con ffmpeg)"""
+    if extension == 'wav':
+        try:
+            return _decode_wav(audio_bytes)
+        except (wave.Error, EOFError, ValueError):
+            pass  # WAV no PCM (p. ej. float): se intenta con ffmpeg
+
+    if not FFMPEG_PATH:
+        return None
+
+    pcm = _run_ffmpeg(
+        ['-i', 'pipe:0', '-ac', '1', '-ar', str(TARGET_SAMPLE_RATE), '-f', 's16le', 'pipe:1'],
+        audio_bytes
+    )
+    return np.frombuffer(pcm, dtype='<i2').astype(np.float32) / 32768.0
+
+
+def _decode_wav(audio_bytes: bytes):
+    with wave.open(io.BytesIO(audio_bytes), 'rb') as reader:
+        channels = reader.getnchannels()
+        sample_width = reader.getsampwidth()
+        sample_rate = reader.getframerate()
+        raw = reader.readframes(reader.getnframes())
+
+    if sample_width == 1:
+        samples = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif sample_width == 2:
+        samples = np.frombuffer(raw, dtype='<i2').astype(np.float32) / 32768.0
+    elif sample_width == 4:
+        samples = np.frombuffer(raw, dtype='<i4').astype(np.float32) / 2147483648.0
+    else:
+        raise ValueError(f"Unsupported WAV sample width: {sample_width}")
+
+    # Mezclar a mono
+    if channels > 1:
+        samples = samples[:len(samples) - len(samples) % channels].reshape(-1, channels).mean(axis=1)
+
+    return _resample(samples, sample_rate, TARGET_SAMPLE_RATE)
+
+
+def _resample(samples, source_rate: int, target_rate: int):
+    """
+    Remuestreo por interpolación lineal (suficiente para voz a 16 kHz)
+
+    Al reducir la frecuencia (44.1/48 kHz -> 16 kHz) se filtra antes con un
+    paso bajo por debajo de la nueva Nyquist; sin él, el contenido por encima
+    de 8 kHz se plegaría sobre la banda de voz.
+    """
+    if source_rate == target_rate or len(samples) == 0:
+        return samples.astype(np.float32)
+    if target_rate < source_rate:
+        samples = _lowpass(samples, LOWPASS_CUTOFF * target_rate / 2, source_rate)
+    target_length = int(round(len(samples) * target_rate / source_rate))
+    source_positions = np.arange(len(samples), dtype=np.float64)
+    target_positions = np.linspace(0, len(samples) - 1, target_length)
+    return np.interp(target_positions, source_positions, samples).astype(np.float32)
+
+
+def _lowpass(samples, cutoff_hz: float, sample_rate: int):
+    """Filtro FIR paso bajo (sinc enventanada con Blackman), sin desfase"""
+    taps = np.arange(LOWPASS_TAPS) - (LOWPASS_TAPS - 1) / 2
+    kernel = np.sinc(2 * cutoff_hz / sample_rate * taps) * np.blackman(LOWPASS_TAPS)
+    kernel /= kernel.sum()
+    return np.convolve(samples, kernel.astype(np.float32), mode='same')
+
+
+def _encode(samples) -> Tuple[bytes, str]:
+    """Codificar la señal procesada: Opus en Ogg si hay ffmpeg, WAV PCM 16 bits si no"""
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767.0).astype('<i2').tobytes()
+
+    if FFMPEG_PATH:
+        try:
+            encoded = _run_ffmpeg(
+                ['-f', 's16le', '-ar', str(TARGET_SAMPLE_RATE), '-ac', '1', '-i', 'pipe:0',
+                 '-c:a', 'libopus', '-b:a', '24k', '-f', 'ogg', 'pipe:1'],
+                pcm
+            )
+            return encoded, 'ogg'
+        except Exception as e:
+            logger.warning("Opus encoding failed, falling back to WAV: %s", e)
+
+    output = io.BytesIO()
+    with wave.open(output, 'wb') as writer:
+        writer.setnchannels(1)
+        writer.setsampwidth(2)
+        writer.setframerate(TARGET_SAMPLE_RATE)
+        writer.writeframes(pcm)
+    return output.getvalue(), 'wav'
+
+
+def _run_ffmpeg(arguments, input_bytes: bytes) -> bytes:
+    """Ejecutar ffmpeg con entrada y salida por tuberías (sin archivos temporales)"""
+    result = subprocess.run(
+        [FFMPEG_PATH, '-hide_banner', '-loglevel', 'error', *arguments],
+        input=input_bytes,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        timeout=FFMPEG_TIMEOUT_SECONDS,
+        check=False
+    )
+    if result.returncode != 0 or not result.stdout:
+        raise RuntimeError(f"ffmpeg failed: {result.stderr.decode('utf-8', 'ignore').strip()[:200]}")
+    return result.stdout
@@ -1,19 +1,31 @@
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
 import logging
 import uuid
 import json
 import re
-from typing import Dict, List, Any, Set, BinaryIO
+from typing import Dict, List, Any, Set, BinaryIO, Generator
 import os
+import io
+import time
+import threading
 from dotenv import load_dotenv
-import tempfile
-from pathlib import Path
 from unidecode import unidecode
 from app.constants.language import update_last_detected_language, get_last_detected_language
 import requests
 import importlib.util
 import sys
-from ..utils.config import VALID_SECTORS
+from ..utils.config import VALID_SECTORS, VALID_REGIONS
+from .transcription_cache import TranscriptionCache
+from . import audio_preprocessing
+from .spoken_symbols import rewrite_spoken_symbols, transliterate, clean_username
+from .email_extraction import extract_email_locally, suggest_email_corrections
+from .regions import resolve_region, resolve_region_language
+from .sector_lexicon import SECTORS, match_sector, sector_display_name, sectors_display_list, language_code
+from .sector_taxonomy import SECTOR_AREA_EXAMPLES, match_specific_area
+from .regions import fold
+from .tracing import span, trace_methods
+from .structured_logging import SAMPLED
+from .metrics import instrument_openai, CACHE_LOOKUPS
 
 BOT_MESSAGES = {
     "region_prompt": "I've identified the region as {}. Please specify the business sector.",
@@ -33,9 +45,58 @@ API_ENDPOINTS = {
     "translate": "http://localhost:8080/api/ai/translate"
 }
 
-logging.basicConfig(level=logging.INFO)
+# Límites del audio enviado a Whisper (la API rechaza archivos de más de 25 MB)
+MAX_AUDIO_BYTES = 25 * 1024 * 1024
+MIN_AUDIO_BYTES = 1024
+VALID_AUDIO_FORMATS = ['flac', 'm4a', 'mp3', 'mp4', 'mpeg', 'mpga', 'oga', 'ogg', 'wav', 'webm']
+
+# Mapeo completo de nombres de idiomas (como los devuelve Whisper) a códigos ISO-639-1
+WHISPER_LANGUAGE_CODES = {
+    'afrikaans': 'af', 'albanian': 'sq', 'amharic': 'am', 'arabic': 'ar',
+    'armenian': 'hy', 'azerbaijani': 'az', 'basque': 'eu', 'belarusian': 'be',
+    'bengali': 'bn', 'bosnian': 'bs', 'bulgarian': 'bg', 'catalan': 'ca',
+    'cebuano': 'ceb', 'chinese': 'zh', 'corsican': 'co', 'croatian': 'hr',
+    'czech': 'cs', 'danish': 'da', 'dutch': 'nl', 'english': 'en',
+    'esperanto': 'eo', 'estonian': 'et', 'finnish': 'fi', 'french': 'fr',
+    'frisian': 'fy', 'galician': 'gl', 'georgian': 'ka', 'german': 'de',
+    'greek': 'el', 'gujarati': 'gu', 'haitian creole': 'ht', 'hausa': 'ha',
+    'hawaiian': 'haw', 'hebrew': 'he', 'hindi': 'hi', 'hmong': 'hmn',
+    'hungarian': 'hu', 'icelandic': 'is', 'igbo': 'ig', 'indonesian': 'id',
+    'irish': 'ga', 'italian': 'it', 'japanese': 'ja', 'javanese': 'jv',
+    'kannada': 'kn', 'kazakh': 'kk', 'khmer': 'km', 'korean': 'ko',
+    'kurdish': 'ku', 'kyrgyz': 'ky', 'lao': 'lo', 'latin': 'la',
+    'latvian': 'lv', 'lithuanian': 'lt', 'luxembourgish': 'lb',
+    'macedonian': 'mk', 'malagasy': 'mg', 'malay': 'ms', 'malayalam': 'ml',
+    'maltese': 'mt', 'maori': 'mi', 'marathi': 'mr', 'mongolian': 'mn',
+    'myanmar': 'my', 'nepali': 'ne', 'norwegian': 'no', 'nyanja': 'ny',
+    'odia': 'or', 'pashto': 'ps', 'persian': 'fa', 'polish': 'pl',
+    'portuguese': 'pt', 'punjabi': 'pa', 'romanian': 'ro', 'russian': 'ru',
+    'samoan': 'sm', 'scots gaelic': 'gd', 'serbian': 'sr', 'sesotho': 'st',
+    'shona': 'sn', 'sindhi': 'sd', 'sinhala': 'si', 'slovak': 'sk',
+    'slovenian': 'sl', 'somali': 'so', 'spanish': 'es', 'sundanese': 'su',
+    'swahili': 'sw', 'swedish': 'sv', 'tagalog': 'tl', 'tajik': 'tg',
+    'tamil': 'ta', 'telugu': 'te', 'thai': 'th', 'turkish': 'tr',
+    'ukrainian': 'uk', 'urdu': 'ur', 'uyghur': 'ug', 'uzbek': 'uz',
+    'vietnamese': 'vi', 'welsh': 'cy', 'xhosa': 'xh', 'yiddish': 'yi',
+    'yoruba': 'yo', 'zulu': 'zu'
+}
+WHISPER_LANGUAGE_NAMES = {code: name for name, code in WHISPER_LANGUAGE_CODES.items()}
+
+_CYRILLIC = re.compile('[а-яёА-ЯЁ]')
+_SPACED_SYMBOL = re.compile(r'\s*([._@-])\s*')
+# Nombres de símbolos que no deben quedar en un nombre de usuario procesado
+_PROHIBITED_USERNAME_WORDS = (
+    'punto', 'point', 'dot', 'ponto', 'punkt',
+    'guion', 'hyphen', 'dash', 'tiret', 'hífen',
+    'underscore', 'souligne', 'sublinhado',
+    'arroba', 'at', 'arobase'
+)
+# Veredictos del LLM sobre áreas específicas que se conservan, por (sector, área)
+SPECIFIC_AREA_CACHE_SIZE = 2048
+
 logger = logging.getLogger(__name__)
 
+@trace_methods('gpt', exclude=['run_steps', 'get_bot_response', 'get_email_extraction_stats', 'get_transcription_cache_stats'])
 class ChatGPTHelper:
     _instance = None
 
@@ -62,13 +123,20 @@ class ChatGPTHelper:
         self._translation_cache = {}
         self._language_detection_cache = {}
         self._company_suggestions_cache = {}
+        self._specific_area_cache = {}
+        self._transcription_cache = TranscriptionCache()
+        self._email_extraction_stats = {'local': 0, 'llm': 0, 'not_found': 0}
+        self._email_stats_lock = threading.Lock()
 
         if not self.api_key:
             logger.error("OPENAI_API_KEY not found in environment variables")
             raise ValueError("OPENAI_API_KEY not found in environment variables")
 
         try:
-            self.client = OpenAI(api_key=self.api_key)
+            # Ambos clientes cuentan llamadas, latencia y tokens para /api/metrics
+            self.client = instrument_openai(OpenAI(api_key=self.api_key))
+            # Cliente asíncrono para el modo ASGI (no abre conexiones hasta el primer uso)
+            self.async_client = instrument_openai(AsyncOpenAI(api_key=self.api_key))
             
             # Inicializar UsernameProcessor
             UsernameProcessor = self._import_username_processor()
@@ -82,7 +150,7 @@ class ChatGPTHelper:
             self._test_connection()
             logger.info("ChatGPT Helper initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize service: {str(e)}")
+            logger.error("Failed to initialize service: %s", e)
             raise
     def _import_username_processor(self):
         """Función auxiliar para importar UsernameProcessor de manera segura"""
@@ -97,7 +165,7 @@ class ChatGPTHelper:
                 processor_path = os.path.join(base_path, "handlers", "username_processor.py")
                 
                 if not os.path.exists(processor_path):
-                    logger.error(f"Username processor not found at: {processor_path}")
+                    logger.error("Username processor not found at: %s", processor_path)
                     return None
                     
                 spec = importlib.util.spec_from_file_location("username_processor", processor_path)
@@ -105,7 +173,7 @@ class ChatGPTHelper:
                 spec.loader.exec_module(module)
                 return module.UsernameProcessor
             except Exception as e:
-                logger.error(f"Failed to import UsernameProcessor: {str(e)}")
+                logger.error("Failed to import UsernameProcessor: %s", e)
                 return None
 
     def _test_connection(self):
@@ -122,9 +190,59 @@ class ChatGPTHelper:
             logger.info("Connection test successful")
             return True
         except Exception as e:
-            logger.error(f"Connection test failed: {str(e)}")
+            logger.error("Connection test failed: %s", e)
             raise
 
+    def run_steps(self, steps: Generator) -> Any:
+        """
+        Ejecutar de forma síncrona un flujo por pasos
+
+        Los métodos *_steps son generadores que ceden los argumentos de cada
+        llamada a chat.completions.create y reciben la respuesta; así la misma
+        lógica sirve para las vistas Flask (este método) y para el modo ASGI
+        (run_steps_async). Los errores de la API se lanzan dentro del
+        generador, en el punto de la llamada, para que sus try/except actúen
+        igual que con una llamada directa.
+
+        :param steps: Generador devuelto por un método *_steps
+        :return: Valor devuelto por el generador
+        """
+        try:
+            request = next(steps)
+            while True:
+                try:
+                    with span(f"openai.{request.get('model')}"):
+                        response = self.client.chat.completions.create(**request)
+                except Exception as e:
+                    request = steps.throw(e)
+                else:
+                    request = steps.send(response)
+        except StopIteration as stop:
+            return stop.value
+
+    async def run_steps_async(self, steps: Generator) -> Any:
+        """
+        Ejecutar un flujo por pasos con el cliente asíncrono de OpenAI
+
+        Mientras espera a la API el event loop atiende otras conversaciones,
+        sin ocupar un hilo por petición.
+
+        :param steps: Generador devuelto por un método *_steps
+        :return: Valor devuelto por el generador
+        """
+        try:
+            request = next(steps)
+            while True:
+                try:
+                    with span(f"openai.{request.get('model')}"):
+                        response = await self.async_client.chat.completions.create(**request)
+                except Exception as e:
+                    request = steps.throw(e)
+                else:
+                    request = steps.send(response)
+        except StopIteration as stop:
+            return stop.value
+
     def detected_language_from_content(self, text: str) -> str:
         try:
             messages = [
@@ -145,14 +263,17 @@ class ChatGPTHelper:
             )
 
             detected_language = response.choices[0].message.content.strip().lower()
-            logger.info(f"Language detected from content: {detected_language}")
+            logger.info("Language detected from content: %s", detected_language)
             return detected_language
 
         except Exception as e:
-            logger.error(f"Error detecting language: {str(e)}")
+            logger.error("Error detecting language: %s", e)
             return "en"
 
     def translate_message(self, message: str, target_language: str) -> str:
+        return self.run_steps(self.translate_message_steps(message, target_language))
+
+    def translate_message_steps(self, message: str, target_language: str) -> Generator:
         try:
             # Si el mensaje está vacío o es None, devolverlo tal cual
             if not message:
@@ -167,10 +288,12 @@ class ChatGPTHelper:
             
             # Verificar si ya está en caché
             if cache_key in self._translation_cache:
-                logger.debug(f"Translation cache hit for key: {cache_key[:30]}...")
+                CACHE_LOOKUPS.inc(cache='translations', result='hit')
+                logger.debug("Translation cache hit for key: %s...", cache_key[:30], extra={'sample_rate': SAMPLED})
                 return self._translation_cache[cache_key]
             
-            logger.debug(f"Translation cache miss for key: {cache_key[:30]}...")
+            CACHE_LOOKUPS.inc(cache='translations', result='miss')
+            logger.debug("Translation cache miss for key: %s...", cache_key[:30], extra={'sample_rate': SAMPLED})
             
             # Si no está en caché, hacer la llamada a la API
             messages = [
@@ -184,7 +307,7 @@ class ChatGPTHelper:
                 }
             ]
 
-            response = self.client.chat.completions.create(
+            response = yield dict(
                 model="gpt-3.5-turbo",
                 messages=messages,
                 temperature=0.3
@@ -198,18 +321,85 @@ class ChatGPTHelper:
             return result
 
         except Exception as e:
-            logger.error(f"Translation error: {str(e)}")
+            logger.error("Translation error: %s", e)
             return message  # Retorna el mensaje original si hay error mensaje original si hay error
+
+    def translate_batch(self, messages: List[str], target_language: str) -> Dict[str, str]:
+        """
+        Traducir varios textos con una sola llamada a la API
+        
+        Los textos se deduplican y se consulta primero la caché de traducciones;
+        sólo los que faltan se envían al modelo como un array JSON.
+        
+        :param messages: Textos a traducir (puede contener duplicados)
+        :param target_language: Idioma destino
+        :return: Diccionario {texto original: texto traducido}
+        """
+        unique_messages = list(dict.fromkeys(message for message in messages if message))
+
+        if not target_language or target_language.lower() in ['en', 'en-us', 'english']:
+            return {message: message for message in unique_messages}
+
+        translations = {}
+        pending = []
+        for message in unique_messages:
+            cache_key = f"{message}_{target_language}"
+            if cache_key in self._translation_cache:
+                translations[message] = self._translation_cache[cache_key]
+            else:
+                pending.append(message)
+
+        CACHE_LOOKUPS.inc(len(translations), cache='translations', result='hit')
+        CACHE_LOOKUPS.inc(len(pending), cache='translations', result='miss')
+        logger.debug("Batch translation: %s cached, %s pending", len(translations), len(pending))
+        if not pending:
+            return translations
+
+        try:
+            response = self.client.chat.completions.create(
+                model="gpt-3.5-turbo",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": f"You are a translator. Translate each string of the JSON array to {target_language}. Respond ONLY with a JSON array of the translated strings, in the same order and with the same length."
+                    },
+                    {
+                        "role": "user",
+                        "content": json.dumps(pending, ensure_ascii=False)
+                    }
+                ],
+                temperature=0.3
+            )
+
+            translated = json.loads(response.choices[0].message.content.strip())
+            if not isinstance(translated, list) or len(translated) != len(pending):
+                raise ValueError("Batch translation returned an unexpected shape")
+
+            for message, result in zip(pending, translated):
+                result = str(result).strip() or message
+                self._translation_cache[f"{message}_{target_language}"] = result
+                translations[message] = result
+
+        except Exception as e:
+            # Respaldo: traducir uno a uno (cada llamada usa y rellena la caché)
+            logger.warning("Batch translation failed, falling back to single translations: %s", e)
+            for message in pending:
+                translations[message] = self.translate_message(message, target_language)
+
+        return translations
     
     def process_text_input(self, text: str, previous_language: str = None) -> Dict:
+        return self.run_steps(self.process_text_input_steps(text, previous_language))
+
+    def process_text_input_steps(self, text: str, previous_language: str = None) -> Generator:
         try:
             # Log de depuración
-            print(f"\n=== Language Detection Debug ===")
-            print(f"Input Text: {text}")
+            logger.debug("Language Detection Debug")
+            logger.debug("Input Text: %s", text)
             
             # Si no se proporciona un idioma previo, obtener el último detectado
             previous_language = previous_language or get_last_detected_language()
-            print(f"Previous Language: {previous_language}")
+            logger.debug("Previous Language: %s", previous_language)
             
             # Asegurar formato correcto del idioma previo
             if previous_language and len(previous_language) == 2 and '-' not in previous_language:
@@ -260,7 +450,7 @@ class ChatGPTHelper:
                 text.strip().lower() in palabras_ambiguas or 
                 sum(c.isalpha() for c in text) / max(len(text), 1) < 0.5):
                 
-                print(f"Maintaining previous language due to short/ambiguous text: {previous_language}")
+                logger.debug("Maintaining previous language due to short/ambiguous text: %s", previous_language)
                 # Normalizar y actualizar el idioma anterior en el estado global
                 detected_language = update_last_detected_language(previous_language)
                 
@@ -292,7 +482,7 @@ class ChatGPTHelper:
             ]
             
             # Realizar detección de idioma
-            detect_response = self.client.chat.completions.create(
+            detect_response = yield dict(
                 model="gpt-4-turbo",  # Usar modelo más preciso para detección
                 messages=messages,
                 temperature=0.1,
@@ -300,7 +490,7 @@ class ChatGPTHelper:
             )
             
             detected_language = detect_response.choices[0].message.content.strip().lower()
-            print(f"Raw Detected Language: {detected_language}")
+            logger.debug("Raw Detected Language: %s", detected_language)
             
             # Mapa de códigos ISO a códigos regionales
             language_map = {
@@ -335,7 +525,7 @@ class ChatGPTHelper:
                 # Si la detección falló completamente
                 detected_language = previous_language or 'en-US'
             
-            print(f"Standardized Detected Language: {detected_language}")
+            logger.debug("Standardized Detected Language: %s", detected_language)
             
             # Validación y confianza en la detección
             # Algunas heurísticas para mejorar la precisión
@@ -345,28 +535,28 @@ class ChatGPTHelper:
             
             # Verificación de caracteres específicos del idioma como respaldo
             if any(marker in text.lower() for marker in spanish_markers) and detected_language != 'es-ES':
-                print(f"Overriding detection to Spanish due to specific characters")
+                logger.debug("Overriding detection to Spanish due to specific characters")
                 detected_language = 'es-ES'
             elif any(marker in text.lower() for marker in french_markers) and detected_language != 'fr-FR':
-                print(f"Overriding detection to French due to specific characters")
+                logger.debug("Overriding detection to French due to specific characters")
                 detected_language = 'fr-FR'
             elif any(marker in text.lower() for marker in german_markers) and detected_language != 'de-DE':
-                print(f"Overriding detection to German due to specific characters")
+                logger.debug("Overriding detection to German due to specific characters")
                 detected_language = 'de-DE'
             
             # Verificar consistencia con mensaje anterior para evitar cambios innecesarios
             # Si la confianza es baja, mantener el idioma anterior para evitar fluctuaciones
             if len(text.split()) <= 3 and previous_language:
                 # Para mensajes muy cortos (1-3 palabras), ser más conservador
-                print(f"Short message: considering consistency with previous language")
+                logger.debug("Short message: considering consistency with previous language")
                 # Sólo cambiar si estamos muy seguros (presencia de caracteres específicos)
                 if not any(char in text for char in ''.join(spanish_markers + french_markers + german_markers)):
-                    print(f"Maintaining previous language for consistency: {previous_language}")
+                    logger.debug("Maintaining previous language for consistency: %s", previous_language)
                     detected_language = previous_language
             
             # Actualizar el idioma global con la función de actualización
             detected_language = update_last_detected_language(detected_language)
-            print(f"Final detected language: {detected_language}")
+            logger.debug("Final detected language: %s", detected_language)
             
             return {
                 "success": True,
@@ -376,7 +566,7 @@ class ChatGPTHelper:
                 "previous_language": previous_language
             }
         except Exception as e:
-            print(f"Error detecting language: {str(e)}")
+            logger.error("Error detecting language: %s", e)
             # En caso de error, usar el idioma anterior o inglés como fallback, normalizando el formato
             fallback_language = update_last_detected_language(previous_language or "en-US")
             return {
@@ -400,55 +590,6 @@ class ChatGPTHelper:
             # Preprocesar texto
             text = text.lower().strip()
             
-            # Mapeo multilingüe de regiones
-            multilingual_regions = {
-                'europe': {
-                    'translations': {
-                        'es': ['europa', 'europeo', 'europea'],
-                        'en': ['europe', 'european'],
-                        'fr': ['europe', 'européen', 'européenne'],
-                        'de': ['europa', 'europäisch'],
-                        'it': ['europa', 'europeo', 'europea'],
-                        'pt': ['europa', 'europeu', 'europeia'],
-                        'ru': ['европа', 'европейский'],
-                        'pl': ['europa', 'europejski'],
-                        'nl': ['europa', 'europees'],
-                        'el': ['ευρώπη', 'ευρωπαϊκός'],
-                        'ar': ['أوروبا', 'أوروبي'],
-                        'zh': ['欧洲', '欧洲的']
-                    },
-                    'iso_code': 'Europe'
-                },
-                'north america': {
-                    'translations': {
-                        'es': ['norteamérica', 'norte de america', 'america del norte'],
-                        'en': ['north america', 'north american'],
-                        'fr': ['amérique du nord', 'nord-américain'],
-                        'pt': ['norte da america', 'america do norte'],
-                        'it': ['nord america', 'nord americano'],
-                        'de': ['nordamerika', 'nordamerikanisch'],
-                        'ru': ['северная америка', 'североамериканский'],
-                        'ar': ['أمريكا الشمالية'],
-                        'zh': ['北美', '北美洲']
-                    },
-                    'iso_code': 'North America'
-                },
-                'asia': {
-                    'translations': {
-                        'es': ['asia', 'asiático', 'asiática'],
-                        'en': ['asia', 'asian'],
-                        'fr': ['asie', 'asiatique'],
-                        'ru': ['азия', 'азиатский'],
-                        'ar': ['آسيا', 'آسيوي'],
-                        'hi': ['एशिया', 'एशियाई'],
-                        'zh': ['亚洲', '亚洲的'],
-                        'ja': ['アジア', 'アジア人'],
-                        'ko': ['아시아', '아시아인']
-                    },
-                    'iso_code': 'Asia'
-                }
-            }
-            
             # Mapeo de códigos de idioma a códigos ISO
             lang_mapping = {
                 'es': 'es-ES', 'en': 'en-US', 'fr': 'fr-FR', 
@@ -458,26 +599,16 @@ class ChatGPTHelper:
                 'el': 'el-GR', 'pl': 'pl-PL', 'nl': 'nl-NL'
             }
             
-            # Función para buscar coincidencias
-            def find_region_match(text):
-                for region, region_data in multilingual_regions.items():
-                    for lang, translations in region_data['translations'].items():
-                        if text in [t.lower() for t in translations]:
-                            return {
-                                'region': region_data['iso_code'],
-                                'language': lang_mapping.get(lang, f'{lang}-{lang.upper()}')
-                            }
-                return None
-            
-            # Buscar coincidencia
-            region_match = find_region_match(text)
+            # Buscar coincidencia en el índice de nombres de región por idioma
+            region_match = resolve_region_language(text)
             
             if region_match:
+                region, lang = region_match
                 return {
                     'success': True,
                     'text': text,
-                    'detected_language': region_match['language'],
-                    'region': region_match['region'],
+                    'detected_language': lang_mapping.get(lang, f'{lang}-{lang.upper()}'),
+                    'region': region,
                     'previous_language': previous_language
                 }
             
@@ -509,7 +640,7 @@ class ChatGPTHelper:
                 }
         
         except Exception as e:
-            logger.error(f"Error in multilingual region detection: {str(e)}")
+            logger.error("Error in multilingual region detection: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -542,43 +673,21 @@ class ChatGPTHelper:
             self.current_language = get_last_detected_language()
             
             # Lista de sectores disponibles (ampliada)
-            available_sectors = [
-                "Technology", "Financial Services", "Manufacturing", 
-                "Healthcare", "Retail", "Energy", "Education", 
-                "Real Estate", "Transportation", "Media", "Agriculture"
-            ]
-            
-            # Primero, verificar si hay una coincidencia exacta con la lista de sectores
-            sector_input_cleaned = sector_input.strip()
+            available_sectors = SECTORS
             
-            # Verificación directa de coincidencia exacta (case sensitive)
-            if sector_input_cleaned in available_sectors:
-                # Si hay coincidencia exacta, devolver inmediatamente como válido
-                english_sector = sector_input_cleaned
-                displayed_sector = self.translate_message(english_sector, self.current_language)
+            # Primero, buscar el sector en el léxico multilingüe (exacto, frase, prefijo o errata)
+            sector_match = match_sector(sector_input)
+            if sector_match and sector_match.confidence >= 0.7:
+                english_sector = sector_match.value
                 
                 return {
                     "is_valid": True,
                     "translated_sector": english_sector,  # Versión en inglés para uso interno
-                    "displayed_sector": displayed_sector,  # Versión traducida para mostrar al usuario
-                    "confidence": 1.0  # Confianza total para coincidencias exactas
+                    "displayed_sector": self._display_sector(english_sector),  # Versión traducida para mostrar al usuario
+                    "confidence": sector_match.confidence
                 }
             
-            # Verificación ignorando mayúsculas/minúsculas
-            for sector in available_sectors:
-                if sector_input_cleaned.lower() == sector.lower():
-                    # Si hay coincidencia ignorando mayúsculas/minúsculas, usar el formato correcto
-                    english_sector = sector  # Usar el formato con mayúsculas correcto de la lista
-                    displayed_sector = self.translate_message(english_sector, self.current_language)
-                    
-                    return {
-                        "is_valid": True,
-                        "translated_sector": english_sector,
-                        "displayed_sector": displayed_sector,
-                        "confidence": 1.0
-                    }
-            
-            # Si no hay coincidencia exacta, continuar con el enfoque basado en ChatGPT
+            # Si el léxico no lo reconoce, continuar con el enfoque basado en ChatGPT
             messages = [
                 {
                     "role": "system",
@@ -632,7 +741,7 @@ class ChatGPTHelper:
                 result = json.loads(response_text)
             except json.JSONDecodeError:
                 # Si hay un error al parsear JSON, intentar extraer información manualmente
-                logger.warning(f"Failed to parse JSON response: {response_text}")
+                logger.warning("Failed to parse JSON response: %s", response_text)
                 
                 # Enfoque de respaldo: Buscar un sector conocido en la respuesta
                 matched_sector = None
@@ -652,13 +761,11 @@ class ChatGPTHelper:
                         "confidence": 0.5
                     }
             
-            # Convertir lista de sectores a texto para mensaje de error
-            available_sectors_text = ", ".join(available_sectors)
-            
             # Caso 1: No es un sector válido
             if result.get("sector_match") == "non_sector" or result.get("confidence", 0) < 0.7:
-                # Traducir lista de sectores disponibles al idioma del usuario
-                translated_sectors = self.translate_message(available_sectors_text, self.current_language)
+                # Lista de sectores disponibles en el idioma del usuario
+                translated_sectors = sectors_display_list(self.current_language) or \
+                    self.translate_message(", ".join(available_sectors), self.current_language)
                 
                 return {
                     "is_valid": False,
@@ -674,7 +781,7 @@ class ChatGPTHelper:
                 english_sector = result.get("sector_match")
                 
                 # Traducir el sector al idioma del usuario para mostrarlo
-                displayed_sector = self.translate_message(english_sector, self.current_language)
+                displayed_sector = self._display_sector(english_sector)
                 
                 return {
                     "is_valid": True,
@@ -684,7 +791,7 @@ class ChatGPTHelper:
                 }
         
         except Exception as e:
-            logger.error(f"Error translating sector: {str(e)}")
+            logger.error("Error translating sector: %s", e)
             return {
                 "is_valid": False,
                 "error": str(e),
@@ -694,6 +801,11 @@ class ChatGPTHelper:
 
 
 
+    def _display_sector(self, sector: str) -> str:
+        """Nombre del sector en el idioma actual: precalculado si existe, traducido si no"""
+        return sector_display_name(sector, self.current_language) or \
+            self.translate_message(sector, self.current_language)
+
     def validate_specific_area(self, specific_area: str, sector: str) -> dict:
         """
         Valida si el área específica proporcionada está relacionada con el sector.
@@ -707,19 +819,7 @@ class ChatGPTHelper:
             self.current_language = get_last_detected_language()
             
             # Lista de ejemplos de áreas específicas por sector para el mensaje de error
-            sector_specific_areas = {
-                "Technology": "Software Development, Cybersecurity, Cloud Computing, AI",
-                "Financial Services": "Banking, Insurance, Investment, Wealth Management",
-                "Manufacturing": "Automotive, Electronics, Textiles, Food Processing",
-                "Healthcare": "Pharmaceuticals, Medical Devices, Healthcare IT, Biotechnology",
-                "Retail": "E-commerce, Fashion, Grocery, Consumer Electronics",
-                "Energy": "Renewable Energy, Oil & Gas, Utilities, Energy Storage",
-                "Education": "K-12, Higher Education, EdTech, Professional Training",
-                "Real Estate": "Commercial, Residential, Property Management, Development",
-                "Transportation": "Logistics, Aviation, Maritime, Railways",
-                "Media": "Digital Media, Publishing, Broadcasting, Social Media",
-                "Agriculture": "Crop Production, Livestock, AgTech, Food Processing"
-            }
+            sector_specific_areas = SECTOR_AREA_EXAMPLES
             
             # Si el área específica es "no" o está vacía, considerar como válida
             if not specific_area or specific_area.lower() == "no":
@@ -729,34 +829,19 @@ class ChatGPTHelper:
                     "displayed_area": "general"
                 }
             
-            # Verificación simple de palabras clave para áreas tecnológicas comunes
-            if sector == "Technology":
-                tech_areas = ["software", "hardware", "cloud", "ai", "artificial intelligence", 
-                            "data", "cybersecurity", "network", "web", "mobile", "app", 
-                            "development", "programming", "computer", "it", "tech", "saas", 
-                            "platform", "digital", "internet", "computing"]
-                
-                # Comprobar si alguna palabra clave está en el área específica
-                if any(keyword in specific_area.lower() for keyword in tech_areas):
-                    return {
-                        "is_valid": True,
-                        "specific_area": specific_area,
-                        "displayed_area": specific_area
-                    }
+            # Taxonomía local de áreas por sector (multilingüe, con erratas)
+            area_match = match_specific_area(sector, specific_area)
+            if area_match:
+                return {
+                    "is_valid": True,
+                    "specific_area": area_match.value,
+                    # El usuario ve el área tal como la escribió, salvo en inglés
+                    "displayed_area": area_match.value if language_code(self.current_language) == 'en' else specific_area,
+                    "confidence": area_match.confidence
+                }
             
-            # Verificación simple para áreas financieras comunes
-            if sector == "Financial Services":
-                finance_areas = ["bank", "insurance", "invest", "wealth", "asset", "capital", 
-                            "money", "financial", "trading", "broker", "credit", "loan", 
-                            "mortgage", "payment", "finance", "accounting", "tax", "fund", 
-                            "equity", "stock", "bond"]
-                
-                if any(keyword in specific_area.lower() for keyword in finance_areas):
-                    return {
-                        "is_valid": True,
-                        "specific_area": specific_area,
-                        "displayed_area": specific_area
-                    }
+            # Sólo las especialidades nuevas llegan al LLM; su veredicto se guarda por (sector, área)
+            cache_key = (sector, fold(specific_area))
             
             # Para otros sectores o casos más complejos, usar ChatGPT con manejo de errores mejorado
             try:
@@ -781,15 +866,21 @@ class ChatGPTHelper:
                     }
                 ]
                 
-                # Llamar a la API de OpenAI sin response_format para compatibilidad
-                response = self.client.chat.completions.create(
-                    model="gpt-4",  # O usar un modelo que sepamos que es compatible
-                    messages=messages,
-                    temperature=0.3
-                )
-                
-                # Extraer la respuesta como texto
-                result_text = response.choices[0].message.content.strip()
+                result_text = self._specific_area_cache.get(cache_key)
+                if result_text is None:
+                    # Llamar a la API de OpenAI sin response_format para compatibilidad
+                    response = self.client.chat.completions.create(
+                        model="gpt-4",  # O usar un modelo que sepamos que es compatible
+                        messages=messages,
+                        temperature=0.3
+                    )
+                    
+                    # Extraer la respuesta como texto
+                    result_text = response.choices[0].message.content.strip()
+                    
+                    if len(self._specific_area_cache) >= SPECIFIC_AREA_CACHE_SIZE:
+                        self._specific_area_cache.pop(next(iter(self._specific_area_cache)))
+                    self._specific_area_cache[cache_key] = result_text
                 
                 # Procesar la respuesta basada en el formato solicitado
                 if result_text.startswith("VALID:"):
@@ -821,20 +912,12 @@ class ChatGPTHelper:
                     
             except Exception as api_error:
                 # Si hay un error con la API, usar un enfoque de respaldo basado en palabras clave
-                logger.warning(f"API error in specific area validation: {str(api_error)}")
+                logger.warning("API error in specific area validation: %s", api_error)
                 
-                # Enfoque de respaldo: considerar válido si hay palabras relacionadas al sector
-                # Este es un enfoque simplificado, idealmente se expandiría
-                sector_keywords = {
-                    "Technology": ["tech", "software", "hardware", "digital", "computer", "network", "data", "cloud", "cyber"],
-                    "Financial Services": ["finance", "bank", "invest", "money", "capital", "fund", "asset", "loan", "credit"],
-                    "Healthcare": ["health", "medical", "patient", "care", "clinical", "hospital", "pharma", "therapy"],
-                    # Añadir más sectores según sea necesario
-                }
+                # Enfoque de respaldo: considerar válido si el texto menciona el propio sector
+                sector_match = match_sector(specific_area)
                 
-                keywords = sector_keywords.get(sector, [sector.lower()])
-                
-                if any(keyword in specific_area.lower() for keyword in keywords):
+                if sector_match and sector_match.value == sector:
                     return {
                         "is_valid": True,
                         "specific_area": specific_area,
@@ -856,7 +939,7 @@ class ChatGPTHelper:
                 }
         
         except Exception as e:
-            logger.error(f"Error validating specific area: {str(e)}")
+            logger.error("Error validating specific area: %s", e)
             # En caso de error, aceptar el área como válida para no bloquear al usuario
             return {
                 "is_valid": True,
@@ -885,63 +968,22 @@ class ChatGPTHelper:
             # Preprocesar la ubicación
             location = location.lower().strip()
             
-            # Mapeo directo de ubicaciones
-            region_mapping = {
-                # Europa
-                'europa': 'Europe',
-                'europe': 'Europe',
-                'españa': 'Europe',
-                'spain': 'Europe',
-                'madrid': 'Europe',
-                'barcelona': 'Europe',
-                'france': 'Europe',
-                'paris': 'Europe',
-                'germany': 'Europe',
-                'berlin': 'Europe',
-                'italia': 'Europe',
-                'italy': 'Europe',
-                'rome': 'Europe',
-                'london': 'Europe',
-                'uk': 'Europe',
-                'united kingdom': 'Europe',
-                'portugal': 'Europe',
-                'netherlands': 'Europe',
-                'amsterdam': 'Europe',
-                
-                # Norte América
-                'usa': 'North America',
-                'united states': 'North America',
-                'canada': 'North America',
-                'mexico': 'North America',
-                'new york': 'North America',
-                'california': 'North America',
-                
-                # Asia
-                'china': 'Asia',
-                'japan': 'Asia',
-                'india': 'Asia',
-                'tokyo': 'Asia',
-                'beijing': 'Asia',
-                'seoul': 'Asia',
-                'singapore': 'Asia'
-            }
-            
-            # Verificación directa
-            if location in region_mapping:
+            # Gazetteer local (países, ciudades, estados y exónimos)
+            region = resolve_region(location)
+            if region in VALID_REGIONS:
                 return {
                     "success": True,
-                    "region": region_mapping[location],
+                    "region": region,
+                    "original_location": location
+                }
+            if region:
+                # Ubicación conocida pero fuera de las regiones con cobertura
+                logger.info("Location '%s' is in %s, outside supported regions", location, region)
+                return {
+                    "success": False,
+                    "error": f"Could not determine region for {location}",
                     "original_location": location
                 }
-            
-            # Verificación parcial
-            for key, region in region_mapping.items():
-                if key in location:
-                    return {
-                        "success": True,
-                        "region": region,
-                        "original_location": location
-                    }
             
             # Usar IA como último recurso
             messages = [
@@ -978,14 +1020,14 @@ class ChatGPTHelper:
             # Validación final
             valid_regions = ["North America", "Europe", "Asia"]
             if region not in valid_regions:
-                logger.warning(f"Uncertain region for location: {location}")
+                logger.warning("Uncertain region for location: %s", location)
                 return {
                     "success": False,
                     "error": f"Could not determine region for {location}",
                     "original_location": location
                 }
 
-            logger.info(f"Location '{location}' identified as {region}")
+            logger.info("Location '%s' identified as %s", location, region)
             return {
                 "success": True,
                 "region": region,
@@ -993,7 +1035,7 @@ class ChatGPTHelper:
             }
 
         except Exception as e:
-            logger.error(f"Comprehensive error identifying region: {str(e)}")
+            logger.error("Comprehensive error identifying region: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -1019,7 +1061,7 @@ class ChatGPTHelper:
             else:
                 sector_description = f"{sector} sector"
 
-            logger.info(f"Generating companies for sector: {sector_description}, geography: {geography}")
+            logger.info("Generating companies for sector: %s, geography: %s", sector_description, geography)
             
             # Filtrar empresas preseleccionadas que estén en la lista de excluidas
             if preselected_companies and excluded_companies:
@@ -1027,15 +1069,15 @@ class ChatGPTHelper:
                     company for company in preselected_companies
                     if not any(excluded.lower() in company.lower() for excluded in excluded_companies)
                 ]
-                logger.info(f"Filtered preselected companies: {preselected_companies}")
+                logger.info("Filtered preselected companies: %s", preselected_companies)
 
             # Construir el prompt incluyendo preseleccionadas y excluidas
             prompt_parts = []
             if preselected_companies:
-                logger.info(f"Including preselected companies: {preselected_companies}")
+                logger.info("Including preselected companies: %s", preselected_companies)
                 prompt_parts.append(f"Please include these specific companies first in your suggestions: {', '.join(preselected_companies)}. ")
             if excluded_companies:
-                logger.info(f"Excluding companies: {excluded_companies}")
+                logger.info("Excluding companies: %s", excluded_companies)
                 prompt_parts.append(f"Do not include these companies in your suggestions: {', '.join(excluded_companies)}. ")
 
             prompt_text = "".join(prompt_parts)
@@ -1096,11 +1138,11 @@ class ChatGPTHelper:
                         final_companies.append(company)
                 companies = final_companies
 
-            logger.info(f"Successfully generated {len(companies)} companies")
+            logger.info("Successfully generated %s companies", len(companies))
             if preselected_companies:
-                logger.info(f"Included {len(preselected_companies)} preselected companies")
+                logger.info("Included %s preselected companies", len(preselected_companies))
             if excluded_companies:
-                logger.info(f"Excluded {len(excluded_companies)} companies")
+                logger.info("Excluded %s companies", len(excluded_companies))
 
             return {
                 "success": True,
@@ -1109,7 +1151,7 @@ class ChatGPTHelper:
             }
 
         except Exception as e:
-            logger.error(f"Error generating companies: {str(e)}")
+            logger.error("Error generating companies: %s", e)
             return {
                 "success": False,
                 "error": "An error occurred while generating companies",
@@ -1118,168 +1160,174 @@ class ChatGPTHelper:
 
 
             
-    def process_voice_input(self, audio_file: BinaryIO, step: str = 'transcribe') -> Dict:
-        temp_path = None
+    def process_voice_input(self, audio_file: BinaryIO, step: str = 'transcribe', preprocess: bool = False) -> Dict:
+        timings = {}
+        preprocessing = None
         try:
-            print("\n=== Processing Voice in ChatGPTHelper ===")
-            print(f"Audio file: {audio_file.filename}")
-            
+            logger.debug("Processing Voice in ChatGPTHelper")
+
             if not audio_file:
                 raise ValueError("No audio file provided")
 
-            # Crear archivo temporal
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.webm') as temp_audio:
-                print(f"Creating temp file: {temp_audio.name}")
-                audio_file.save(temp_audio)
-                temp_path = temp_audio.name
-
-            print(f"Temp file created: {temp_path}")
-            
-            # Verificar que el archivo existe y tiene contenido
-            if not os.path.exists(temp_path) or os.path.getsize(temp_path) == 0:
-                raise ValueError("Failed to save audio file")
-
-            print(f"File size: {os.path.getsize(temp_path)} bytes")
-
-            # Mapeo completo de nombres de idiomas a códigos ISO-639-1
-            language_codes = {
-                'afrikaans': 'af', 'albanian': 'sq', 'amharic': 'am', 'arabic': 'ar',
-                'armenian': 'hy', 'azerbaijani': 'az', 'basque': 'eu', 'belarusian': 'be',
-                'bengali': 'bn', 'bosnian': 'bs', 'bulgarian': 'bg', 'catalan': 'ca',
-                'cebuano': 'ceb', 'chinese': 'zh', 'corsican': 'co', 'croatian': 'hr',
-                'czech': 'cs', 'danish': 'da', 'dutch': 'nl', 'english': 'en',
-                'esperanto': 'eo', 'estonian': 'et', 'finnish': 'fi', 'french': 'fr',
-                'frisian': 'fy', 'galician': 'gl', 'georgian': 'ka', 'german': 'de',
-                'greek': 'el', 'gujarati': 'gu', 'haitian creole': 'ht', 'hausa': 'ha',
-                'hawaiian': 'haw', 'hebrew': 'he', 'hindi': 'hi', 'hmong': 'hmn',
-                'hungarian': 'hu', 'icelandic': 'is', 'igbo': 'ig', 'indonesian': 'id',
-                'irish': 'ga', 'italian': 'it', 'japanese': 'ja', 'javanese': 'jv',
-                'kannada': 'kn', 'kazakh': 'kk', 'khmer': 'km', 'korean': 'ko',
-                'kurdish': 'ku', 'kyrgyz': 'ky', 'lao': 'lo', 'latin': 'la',
-                'latvian': 'lv', 'lithuanian': 'lt', 'luxembourgish': 'lb',
-                'macedonian': 'mk', 'malagasy': 'mg', 'malay': 'ms', 'malayalam': 'ml',
-                'maltese': 'mt', 'maori': 'mi', 'marathi': 'mr', 'mongolian': 'mn',
-                'myanmar': 'my', 'nepali': 'ne', 'norwegian': 'no', 'nyanja': 'ny',
-                'odia': 'or', 'pashto': 'ps', 'persian': 'fa', 'polish': 'pl',
-                'portuguese': 'pt', 'punjabi': 'pa', 'romanian': 'ro', 'russian': 'ru',
-                'samoan': 'sm', 'scots gaelic': 'gd', 'serbian': 'sr', 'sesotho': 'st',
-                'shona': 'sn', 'sindhi': 'sd', 'sinhala': 'si', 'slovak': 'sk',
-                'slovenian': 'sl', 'somali': 'so', 'spanish': 'es', 'sundanese': 'su',
-                'swahili': 'sw', 'swedish': 'sv', 'tagalog': 'tl', 'tajik': 'tg',
-                'tamil': 'ta', 'telugu': 'te', 'thai': 'th', 'turkish': 'tr',
-                'ukrainian': 'uk', 'urdu': 'ur', 'uyghur': 'ug', 'uzbek': 'uz',
-                'vietnamese': 'vi', 'welsh': 'cy', 'xhosa': 'xh', 'yiddish': 'yi',
-                'yoruba': 'yo', 'zulu': 'zu'
-            }
+            logger.debug("Audio file: %s", getattr(audio_file, 'filename', None))
+
+            # Leer el audio en memoria (sin archivo temporal) respetando el límite de tamaño
+            stage_start = time.perf_counter()
+            audio_buffer = self._read_audio_buffer(audio_file)
+            timings['read_audio_ms'] = self._elapsed_ms(stage_start)
+            logger.debug("Audio size: %s bytes", audio_buffer.getbuffer().nbytes)
+
+            # Reintentos con el mismo audio: reutilizar el resultado sin llamar a OpenAI
+            stage_start = time.perf_counter()
+            cache_key = self._transcription_cache.make_key(audio_buffer.getbuffer(), step, preprocess)
+            cached_response = self._transcription_cache.get(cache_key)
+            timings['cache_lookup_ms'] = self._elapsed_ms(stage_start)
+            if cached_response:
+                logger.debug("Transcription cache hit")
+                timings['total_ms'] = round(sum(timings.values()), 2)
+                cached_response['cached'] = True
+                cached_response['timings'] = timings
+                return cached_response
+
+            # Preprocesado opcional: mono, 16 kHz y sin silencios para subir menos audio
+            if preprocess:
+                audio_buffer, preprocessing = self._preprocess_audio_buffer(audio_buffer)
+                timings['preprocess_ms'] = preprocessing['preprocess_ms']
+
+            # Una sola llamada a Whisper: verbose_json devuelve idioma y texto
+            stage_start = time.perf_counter()
+            transcript = self._transcribe_audio(audio_buffer)
+            timings['transcribe_ms'] = self._elapsed_ms(stage_start)
+
+            detected_language = self._whisper_language_code(getattr(transcript, 'language', None))
+            raw_text = (transcript if isinstance(transcript, str) else transcript.text).strip()
+            logger.debug("Detected language code: %s", detected_language)
+            logger.debug("Initial transcription: %s", raw_text)
+
+            # Procesar según el paso indicado
+            stage_start = time.perf_counter()
+            language_name = WHISPER_LANGUAGE_NAMES.get(detected_language, detected_language)
+            if step == 'username':
+                processed_text = self.process_username(raw_text)
+                logger.debug("Processed username: %s", processed_text)
+                response_dict = {
+                    "success": True,
+                    "username": processed_text,
+                    "original_transcription": raw_text,
+                    "detected_language": detected_language,
+                    "language_name": language_name,
+                    "transcription": processed_text  # Para mantener compatibilidad
+                }
+            else:  # step == 'transcribe' u otros casos
+                response_dict = {
+                    "success": True,
+                    "transcription": raw_text,
+                    "detected_language": detected_language,
+                    "language_name": language_name
+                }
+            timings['postprocess_ms'] = self._elapsed_ms(stage_start)
 
-            # Primero detectar el idioma
-            with open(temp_path, 'rb') as audio:
-                print("Detecting language...")
-                language_response = self.client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio,
-                    response_format="verbose_json"
-                )
-                
-                # Obtener el código ISO-639-1 del idioma
-                detected_language = getattr(language_response, 'language', 'en').lower()
-                
-                # Convertir a código ISO si es necesario
-                if detected_language in language_codes:
-                    detected_language = language_codes[detected_language]
-                    
-                print(f"Detected language code: {detected_language}")
-
-            # Luego transcribir con el idioma detectado
-            with open(temp_path, 'rb') as audio:
-                print("Starting transcription...")
-                transcript = self.client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio,
-                    response_format="text",
-                    language=detected_language  # Usar código ISO
-                )
-                
-                # Obtener transcripción inicial
-                raw_text = transcript if isinstance(transcript, str) else transcript.text
-                raw_text = raw_text.strip()
-                print(f"Initial transcription: {raw_text}")
-
-                # Procesar según el paso indicado
-                if step == 'username':
-                    processed_text = self.process_username(raw_text)
-                    print(f"Processed username: {processed_text}")
-                    response_dict = {
-                        "success": True,
-                        "username": processed_text,
-                        "original_transcription": raw_text,
-                        "detected_language": detected_language,
-                        "language_name": next((name for name, code in language_codes.items() 
-                                            if code == detected_language), detected_language),
-                        "transcription": processed_text  # Para mantener compatibilidad
-                    }
-                else:  # step == 'transcribe' u otros casos
-                    response_dict = {
-                        "success": True,
-                        "transcription": raw_text,
-                        "detected_language": detected_language,
-                        "language_name": next((name for name, code in language_codes.items() 
-                                            if code == detected_language), detected_language)
-                    }
+            self._transcription_cache.set(cache_key, response_dict)
+            response_dict['cached'] = False
+            if preprocessing:
+                response_dict['preprocessing'] = preprocessing
 
-                return response_dict
+            timings['total_ms'] = round(sum(timings.values()), 2)
+            logger.debug("Voice processing timings: %s", timings)
+            response_dict['timings'] = timings
+            return response_dict
 
         except Exception as e:
-            print(f"Error in process_voice_input: {str(e)}")
+            logger.error("Error in process_voice_input: %s", e)
             return {
                 "success": False,
-                "error": str(e)
+                "error": str(e),
+                "timings": timings
             }
-        finally:
-            if temp_path and os.path.exists(temp_path):
-                try:
-                    os.remove(temp_path)
-                    print(f"Temp file removed: {temp_path}")
-                except Exception as e:
-                    print(f"Error removing temp file: {str(e)}")
 
+    def _read_audio_buffer(self, audio_file: BinaryIO, default_extension: str = 'webm') -> io.BytesIO:
+        """
+        Leer un audio subido a un buffer en memoria listo para enviar a Whisper
 
+        :param audio_file: Archivo recibido (FileStorage de Flask o similar)
+        :param default_extension: Extensión a usar si el nombre no trae una válida
+        :return: BytesIO con atributo name (Whisper deduce el formato por la extensión)
+        :raises ValueError: Si el audio está vacío, es demasiado grande o el formato no es válido
+        """
+        filename = (getattr(audio_file, 'filename', None) or '').lower()
+        extension = filename.rsplit('.', 1)[-1] if '.' in filename else default_extension
+        if extension not in VALID_AUDIO_FORMATS:
+            raise ValueError(f"Invalid file format. Supported formats: {VALID_AUDIO_FORMATS}")
+
+        declared_size = getattr(audio_file, 'content_length', None) or 0
+        if declared_size > MAX_AUDIO_BYTES:
+            raise ValueError(f"Audio file too large (max {MAX_AUDIO_BYTES // (1024 * 1024)} MB)")
+
+        if hasattr(audio_file, 'seek'):
+            try:
+                audio_file.seek(0)
+            except Exception:
+                pass
+
+        # Leer como máximo un byte más del límite para detectar archivos demasiado grandes
+        data = audio_file.read(MAX_AUDIO_BYTES + 1)
+        if len(data) > MAX_AUDIO_BYTES:
+            raise ValueError(f"Audio file too large (max {MAX_AUDIO_BYTES // (1024 * 1024)} MB)")
+        if len(data) < MIN_AUDIO_BYTES:
+            raise ValueError("Audio file is empty or too short")
+
+        audio_buffer = io.BytesIO(data)
+        audio_buffer.name = f"audio.{extension}"
+        return audio_buffer
+
+    def _preprocess_audio_buffer(self, audio_buffer: io.BytesIO):
+        """
+        Aplicar el preprocesado de audio a un buffer
+
+        :return: (buffer a enviar a Whisper, estadísticas del preprocesado)
+        """
+        extension = audio_buffer.name.rsplit('.', 1)[-1]
+        processed, processed_extension, stats = audio_preprocessing.preprocess_audio(
+            audio_buffer.getvalue(), extension
+        )
+        logger.debug("Audio preprocessing: %s", stats)
+        if not processed:
+            return audio_buffer, stats
+
+        processed_buffer = io.BytesIO(processed)
+        processed_buffer.name = f"audio.{processed_extension}"
+        return processed_buffer, stats
+
+    def _transcribe_audio(self, audio_buffer: io.BytesIO, **options):
+        """Transcribir un buffer de audio con una única llamada a Whisper (verbose_json)"""
+        audio_buffer.seek(0)
+        return self.client.audio.transcriptions.create(
+            model="whisper-1",
+            file=audio_buffer,
+            response_format="verbose_json",
+            **options
+        )
+
+    def get_transcription_cache_stats(self) -> Dict:
+        """Estadísticas de la caché de transcripciones (tasa de aciertos y ocupación)"""
+        return self._transcription_cache.stats()
+
+    @staticmethod
+    def _whisper_language_code(language: str) -> str:
+        """Convertir el idioma devuelto por Whisper ('spanish') a código ISO-639-1 ('es')"""
+        language = (language or 'en').lower()
+        return WHISPER_LANGUAGE_CODES.get(language, language)
+
+    @staticmethod
+    def _elapsed_ms(start: float) -> float:
+        return round((time.perf_counter() - start) * 1000, 2)
 
-    def process_username(self, text: str) -> str:
-        # Diccionario de transliteración ruso-latino
-        russian_to_latin = {
-            'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'д': 'd', 'е': 'e', 'ё': 'yo',
-            'ж': 'zh', 'з': 'z', 'и': 'i', 'й': 'y', 'к': 'k', 'л': 'l', 'м': 'm',
-            'н': 'n', 'о': 'o', 'п': 'p', 'р': 'r', 'с': 's', 'т': 't', 'у': 'u',
-            'ф': 'f', 'х': 'h', 'ц': 'ts', 'ч': 'ch', 'ш': 'sh', 'щ': 'sch',
-            'ъ': '', 'ы': 'y', 'ь': '', 'э': 'e', 'ю': 'yu', 'я': 'ya',
-            'А': 'a', 'Б': 'b', 'В': 'v', 'Г': 'g', 'Д': 'd', 'Е': 'e', 'Ё': 'yo',
-            'Ж': 'zh', 'З': 'z', 'И': 'i', 'Й': 'y', 'К': 'k', 'Л': 'l', 'М': 'm',
-            'Н': 'n', 'О': 'o', 'П': 'p', 'Р': 'r', 'С': 's', 'Т': 't', 'У': 'u',
-            'Ф': 'f', 'Х': 'h', 'Ц': 'ts', 'Ч': 'ch', 'Ш': 'sh', 'Щ': 'sch',
-            'Ъ': '', 'Ы': 'y', 'Ь': '', 'Э': 'e', 'Ю': 'yu', 'Я': 'ya'
-        }
 
-        def transliterate_russian(text: str) -> str:
-            """Convierte texto cirílico a caracteres latinos"""
-            result = ""
-            for char in text:
-                result += russian_to_latin.get(char, char)
-            return result.lower()  # Convertir todo a minúsculas
-
-        def clean_username(username: str) -> str:
-            """Limpia y formatea el nombre de usuario"""
-            # Convertir a minúsculas y eliminar espacios extras
-            cleaned = username.lower().strip()
-            # Reemplazar espacios con guiones bajos
-            cleaned = "_".join(cleaned.split())
-            # Eliminar caracteres no permitidos
-            cleaned = ''.join(c for c in cleaned if c.isalnum() or c in '_.-')
-            return cleaned
 
+    def process_username(self, text: str) -> str:
         try:
             # Primer paso: Procesamiento con GPT-4
-            print(f"\nProcesando username con GPT-4: {text}")
+            logger.debug("Procesando username con GPT-4: %s", text)
             response = self.client.chat.completions.create(
                 model="gpt-4",
                 messages=[
@@ -1299,48 +1347,39 @@ class ChatGPTHelper:
             processed_text = response.choices[0].message.content.strip()
             
             # Transliterar si contiene caracteres cirílicos
-            if any(char in russian_to_latin for char in processed_text):
-                processed_text = transliterate_russian(processed_text)
+            if _CYRILLIC.search(processed_text):
+                processed_text = transliterate(processed_text, 'russian').lower()
             
             # Limpiar y formatear el nombre de usuario
             final_username = clean_username(processed_text)
             
-            print(f"Resultado final: {final_username}")
+            logger.debug("Resultado final: %s", final_username)
 
             # Verificar palabras prohibidas
-            prohibited_words = [
-                'punto', 'point', 'dot', 'ponto', 'punkt',
-                'guion', 'hyphen', 'dash', 'tiret', 'hífen',
-                'underscore', 'souligne', 'sublinhado',
-                'arroba', 'at', 'arobase'
-            ]
-
-            if any(word in final_username for word in prohibited_words):
+            if any(word in final_username for word in _PROHIBITED_USERNAME_WORDS):
                 raise ValueError(f"Palabra prohibida encontrada en el resultado")
 
             return final_username
 
         except Exception as e:
-            print(f"Error en process_username: {str(e)}")
+            logger.error("Error en process_username: %s", e)
             try:
-                # Procesamiento de respaldo
-                if any(char in russian_to_latin for char in text):
-                    backup_processed = transliterate_russian(text)
-                else:
-                    backup_processed = text
+                # Procesamiento de respaldo: símbolos hablados ('punto', 'точка'...) en una pasada
+                backup_processed = _SPACED_SYMBOL.sub(r'\1', rewrite_spoken_symbols(text))
+                if _CYRILLIC.search(backup_processed):
+                    backup_processed = transliterate(backup_processed, 'russian').lower()
                 
                 final_backup = clean_username(backup_processed)
-                print(f"Resultado de respaldo: {final_backup}")
+                logger.debug("Resultado de respaldo: %s", final_backup)
                 return final_backup
                 
             except Exception as backup_error:
-                print(f"Error en procesamiento de respaldo: {str(backup_error)}")
+                logger.error("Error en procesamiento de respaldo: %s", backup_error)
                 # Último recurso: devolver el texto original limpio
                 return clean_username(text)
 
 
     def process_sector_input(self, audio_file: BinaryIO, previous_region: str) -> Dict:
-        temp_path = None
         try:
             # Validación del archivo
             if not audio_file or not hasattr(audio_file, 'filename'):
@@ -1349,32 +1388,24 @@ class ChatGPTHelper:
                     "error": self.get_bot_response('error_no_audio')
                 }
 
-            filename = audio_file.filename.lower()
-            valid_formats = ['flac', 'm4a', 'mp3', 'mp4', 'mpeg', 'mpga', 'oga', 'ogg', 'wav', 'webm']
-            file_extension = filename.split('.')[-1] if '.' in filename else ''
-            
-            if file_extension not in valid_formats:
+            # Leer el audio en memoria y transcribir con una sola llamada
+            try:
+                audio_buffer = self._read_audio_buffer(audio_file, default_extension='')
+            except ValueError as e:
                 return {
                     "success": False,
-                    "error": f"Invalid file format. Supported formats: {valid_formats}"
+                    "error": str(e)
                 }
 
-            # Procesar archivo de audio
-            with tempfile.NamedTemporaryFile(delete=False, suffix=f'.{file_extension}') as temp_audio:
-                audio_file.seek(0)
-                temp_audio.write(audio_file.read())
-                temp_path = Path(temp_audio.name)
-
-            # Transcribir audio
-            with open(temp_path, 'rb') as audio:
-                transcript = self.client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio,
-                    response_format="verbose_json",
-                    temperature=0.7
-                )
+            cache_key = self._transcription_cache.make_key(audio_buffer.getbuffer(), 'sector')
+            cached_transcript = self._transcription_cache.get(cache_key)
+            if cached_transcript:
+                transcribed_text = cached_transcript['transcription']
+            else:
+                transcript = self._transcribe_audio(audio_buffer, temperature=0.7)
+                transcribed_text = transcript.text.strip()
+                self._transcription_cache.set(cache_key, {'transcription': transcribed_text})
 
-            transcribed_text = transcript.text.strip()
             self.current_language = self.detected_language_from_content(transcribed_text)
 
             # Usar translate_sector para procesar el sector
@@ -1421,18 +1452,12 @@ class ChatGPTHelper:
                 }
 
         except Exception as e:
-            logger.error(f"Error processing sector input: {str(e)}")
+            logger.error("Error processing sector input: %s", e)
             return {
                 "success": False,
                 "error": self.get_bot_response('error_general'),
                 "detected_language": self.current_language if hasattr(self, 'current_language') else 'en'
             }
-        finally:
-            if temp_path and temp_path.exists():
-                try:
-                    temp_path.unlink()
-                except Exception as e:
-                    logger.error(f"Error deleting temporary file: {str(e)}")
 
 
 
@@ -1458,6 +1483,15 @@ class ChatGPTHelper:
         
 
     def extract_email(self, text: str) -> Dict:
+        return self.run_steps(self.extract_email_steps(text))
+
+    def extract_email_steps(self, text: str) -> Generator:
+        # Primero en local (regex, símbolos hablados y proveedor sin TLD); el LLM sólo si falla
+        email, method = extract_email_locally(text)
+        if email:
+            self._record_email_extraction('local')
+            return self._email_result(email, method)
+
         try:
             messages = [
                 {
@@ -1482,7 +1516,7 @@ class ChatGPTHelper:
                 }
             ]
 
-            response = self.client.chat.completions.create(
+            response = yield dict(
                 model="gpt-3.5-turbo",
                 messages=messages,
                 temperature=0,
@@ -1492,16 +1526,15 @@ class ChatGPTHelper:
             extracted_email = response.choices[0].message.content.strip()
             
             if extracted_email == 'no_email':
+                self._record_email_extraction('not_found')
                 return {
                     "success": False,
                     "error": "No email address found in the text",
                     "email": None
                 }
 
-            return {
-                "success": True,
-                "email": extracted_email
-            }
+            self._record_email_extraction('llm')
+            return self._email_result(extracted_email, "llm")
 
         except Exception as e:
             return {
@@ -1514,7 +1547,36 @@ class ChatGPTHelper:
 
 
         
+    @staticmethod
+    def _email_result(email: str, method: str) -> Dict:
+        # El email se devuelve tal cual; si el dominio parece una errata se añaden sugerencias
+        result = {
+            "success": True,
+            "email": email,
+            "method": method
+        }
+        suggestions = suggest_email_corrections(email)
+        if suggestions:
+            result["suggestions"] = suggestions
+        return result
+
+    def _record_email_extraction(self, outcome: str) -> None:
+        with self._email_stats_lock:
+            self._email_extraction_stats[outcome] += 1
+
+    def get_email_extraction_stats(self) -> Dict:
+        """Extracciones de email resueltas en local frente a las que necesitaron el LLM"""
+        with self._email_stats_lock:
+            stats = dict(self._email_extraction_stats)
+        total = sum(stats.values())
+        stats['total'] = total
+        stats['local_success_ratio'] = round(stats['local'] / total, 3) if total else 0.0
+        return stats
+
     def extract_name(self, text: str) -> Dict:
+        return self.run_steps(self.extract_name_steps(text))
+
+    def extract_name_steps(self, text: str) -> Generator:
         try:
             messages = [
                 {
@@ -1548,7 +1610,7 @@ class ChatGPTHelper:
                 }
             ]
 
-            response = self.client.chat.completions.create(
+            response = yield dict(
                 model="gpt-3.5-turbo",
                 messages=messages,
                 temperature=0,
@@ -1581,6 +1643,9 @@ class ChatGPTHelper:
 
 
     def extract_intention(self, text: str) -> Dict:
+        return self.run_steps(self.extract_intention_steps(text))
+
+    def extract_intention_steps(self, text: str) -> Generator:
         try:
             # Limpiar el texto de espacios y convertir a minúsculas
             cleaned_text = text.strip().lower()
@@ -1657,7 +1722,7 @@ class ChatGPTHelper:
                 }
             ]
 
-            response = self.client.chat.completions.create(
+            response = yield dict(
                 model="gpt-3.5-turbo",
                 messages=messages,
                 temperature=0,
@@ -1769,73 +1834,46 @@ class ChatGPTHelper:
             
 
     def extract_region(self, location: str) -> Dict:
+        return self.run_steps(self.extract_region_steps(location))
+
+    def extract_region_steps(self, location: str) -> Generator:
         try:
-            # Si el texto es muy corto o no parece una ubicación, rechazarlo de inmediato
-            if len(location.strip()) < 3 or any(char.isdigit() for char in location):
-                logger.warning(f"Invalid location input: {location}")
+            # Si el texto no parece una ubicación, rechazarlo de inmediato
+            if any(char.isdigit() for char in location):
+                logger.warning("Invalid location input: %s", location)
                 return {
                     "success": False,
                     "error": "Please provide a valid geographical location."
                 }
                 
-            logger.info(f"Identifying region for location: {location}")
-            
-            # Primero verificar si la entrada parece una ubicación geográfica
-            validation_messages = [
-                {
-                    "role": "system",
-                    "content": "You are a geography expert. Determine if the input is a valid geographical location or region. Respond with 'YES' if it's a valid location, or 'NO' followed by a brief explanation if it's not."
-                },
-                {
-                    "role": "user",
-                    "content": f"Is '{location}' a geographical location or region? Answer only with YES or NO."
-                }
-            ]
-            
-            validation_response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=validation_messages,
-                temperature=0.3
-            )
-            
-            validation_result = validation_response.choices[0].message.content.strip()
-            
-            # Si no es una ubicación válida, retornar error
-            if validation_result.startswith("NO"):
-                logger.warning(f"Input is not a valid location: {location}")
-                return {
-                    "success": False,
-                    "error": "Please provide a valid geographical location."
-                }
-            
-            # Si parece válido, proceder con la categorización de región
-            messages = [
-                {
-                    "role": "system",
-                    "content": "You are a geography expert. You must categorize locations into one of these regions: North America, Europe, or Asia. Only respond with one of these three options. If the location doesn't clearly belong to any of these regions, respond with 'OTHER'."
-                },
-                {
-                    "role": "user",
-                    "content": f"Which region (North America, Europe, or Asia) does {location} belong to? Only respond with the region name or 'OTHER' if it doesn't fit."
-                }
-            ]
-            
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=messages,
-                temperature=0.3
-            )
-            
-            region = response.choices[0].message.content.strip()
+            logger.info("Identifying region for location: %s", location)
+            
+            # Gazetteer local (admite nombres cortos como '東京'); el LLM sólo se
+            # consulta para ubicaciones desconocidas
+            region = resolve_region(location)
+            if not region:
+                if len(location.strip()) < 3:
+                    logger.warning("Invalid location input: %s", location)
+                    return {
+                        "success": False,
+                        "error": "Please provide a valid geographical location."
+                    }
+                region = yield from self._classify_unknown_location_steps(location)
+                if region.upper().startswith("INVALID"):
+                    logger.warning("Input is not a valid location: %s", location)
+                    return {
+                        "success": False,
+                        "error": "Please provide a valid geographical location."
+                    }
             
-            if region not in ["North America", "Europe", "Asia"]:
-                logger.warning(f"Invalid region response: {region}")
+            if region not in VALID_REGIONS:
+                logger.warning("Invalid region response: %s", region)
                 return {
                     "success": False,
                     "error": "Please specify a location in North America, Europe, or Asia."
                 }
             
-            logger.info(f"Location '{location}' identified as {region}")
+            logger.info("Location '%s' identified as %s", location, region)
             return {
                 "success": True,
                 "region": region,
@@ -1843,7 +1881,7 @@ class ChatGPTHelper:
             }
             
         except Exception as e:
-            logger.error(f"Error identifying region: {str(e)}")
+            logger.error("Error identifying region: %s", e)
             return {
                 "success": False,
                 "error": str(e)
@@ -1851,6 +1889,31 @@ class ChatGPTHelper:
         
 
 
+    def _classify_unknown_location_steps(self, location: str) -> Generator:
+        """
+        Validar y clasificar con GPT-4, en una sola llamada, una ubicación que no está en el gazetteer
+
+        :return: 'North America', 'Europe', 'Asia', 'OTHER' o 'INVALID'
+        """
+        messages = [
+            {
+                "role": "system",
+                "content": "You are a geography expert. First decide if the input is a valid geographical location or region. If it is not, respond with 'INVALID'. If it is, categorize it into one of these regions: North America, Europe, or Asia. If the location doesn't clearly belong to any of these regions, respond with 'OTHER'. Only respond with one of these options."
+            },
+            {
+                "role": "user",
+                "content": f"Which region (North America, Europe, or Asia) does '{location}' belong to? Only respond with the region name, 'OTHER' or 'INVALID'."
+            }
+        ]
+        
+        response = yield dict(
+            model="gpt-4",
+            messages=messages,
+            temperature=0.3
+        )
+        
+        return response.choices[0].message.content.strip().strip('.')
+
     def extract_work_timing(self, text: str) -> str:
         try:
             messages = [
@@ -1987,17 +2050,17 @@ class ChatGPTHelper:
             
             # Verificar directamente si la entrada original es "no" o alguna variante
             if text.lower().strip() in ["no", "n", "nope", "no."]:
-                print(f"Detected direct 'no' response from input: '{text}'")
+                logger.debug("Detected direct 'no' response from input: '%s'", text)
                 return "no"
             
             # Si la respuesta procesada es "no"
             if result.lower().strip() == "no":
-                print(f"GPT interpreted response as 'no': '{result}'")
+                logger.debug("GPT interpreted response as 'no': '%s'", result)
                 return "no"
             
             # Si son palabras simples como "no" (pero GPT no lo interpretó exactamente como "no")
             if len(result.strip().split()) == 1 and len(result.strip()) <= 3:
-                print(f"Short single word response, checking if negative: '{result}'")
+                logger.debug("Short single word response, checking if negative: '%s'", result)
                 # Intentar determinar si es una variante de "no"
                 negative_check_messages = [
                     {"role": "system", "content": "Determine if this is a negative response (meaning 'no'). Respond with ONLY 'yes' or 'no'."},
@@ -2013,24 +2076,24 @@ class ChatGPTHelper:
                 
                 negative_result = negative_check.choices[0].message.content.strip().lower()
                 if negative_result == "yes":
-                    print(f"Confirmed '{result}' is a negative response")
+                    logger.debug("Confirmed '%s' is a negative response", result)
                     return "no"
             
             # Si son compañías, devolver un diccionario
             # Pero primero verificar que no sea solamente "no" mal interpretado
             companies = [company.strip() for company in result.split(',')]
             if len(companies) == 1 and companies[0].lower() in ["no", "n", "nope"]:
-                print(f"Single 'no'-like company detected, treating as a negative response: '{companies[0]}'")
+                logger.debug("Single 'no'-like company detected, treating as a negative response: '%s'", companies[0])
                 return "no"
                 
-            print(f"Interpreted as company list: {companies}")
+            logger.debug("Interpreted as company list: %s", companies)
             return {
                 'interested_in_companies': True,
                 'companies': companies
             }
 
         except Exception as e:
-            print(f"Error in process_company_response: {e}")
+            logger.error("Error in process_company_response: %s", e)
             # En caso de error, verificar la entrada original
             if text.lower().strip() in ["no", "n", "nope", "no."]:
                 return "no"
@@ -2052,17 +2115,17 @@ class ChatGPTHelper:
             else:
                 sector_description = f"{sector} sector"
 
-            logger.info(f"Generating companies for sector: {sector_description}, geography: {geography}")
+            logger.info("Generating companies for sector: %s, geography: %s", sector_description, geography)
 
             # Construir el prompt incluyendo las empresas preseleccionadas y excluidas
             prompt_parts = []
             
             if preselected_companies:
-                logger.info(f"Including preselected companies: {preselected_companies}")
+                logger.info("Including preselected companies: %s", preselected_companies)
                 prompt_parts.append(f"Please include these companies first in your suggestions: {', '.join(preselected_companies)}.")
             
             if excluded_companies:
-                logger.info(f"Excluding companies: {excluded_companies}")
+                logger.info("Excluding companies: %s", excluded_companies)
                 prompt_parts.append(f"Do not include these companies in your suggestions: {', '.join(excluded_companies)}.")
             
             custom_instructions = " ".join(prompt_parts)
@@ -2127,7 +2190,7 @@ class ChatGPTHelper:
                 companies = final_companies
 
             if len(companies) < 20:
-                logger.warning(f"Received only {len(companies)} companies, requesting more")
+                logger.warning("Received only %s companies, requesting more", len(companies))
                 return self.get_companies_suggestions(
                     sector, 
                     geography, 
@@ -2137,11 +2200,11 @@ class ChatGPTHelper:
                     temperature
                 )
 
-            logger.info(f"Successfully generated {len(companies)} companies")
+            logger.info("Successfully generated %s companies", len(companies))
             if preselected_companies:
-                logger.info(f"Included {len(preselected_companies)} preselected companies")
+                logger.info("Included %s preselected companies", len(preselected_companies))
             if excluded_companies:
-                logger.info(f"Excluded {len(excluded_companies)} companies")
+                logger.info("Excluded %s companies", len(excluded_companies))
 
             return {
                 "success": True,
@@ -2152,7 +2215,7 @@ class ChatGPTHelper:
             }
 
         except Exception as e:
-            logger.error(f"Error generating companies: {str(e)}")
+            logger.error("Error generating companies: %s", e)
             return {
                 "success": False,
                 "error": "An error occurred while generating companies",
@@ -2264,9 +2327,9 @@ class ChatGPTHelper:
                 corrected_email = f"{corrected_username}@gmail.com"
                 correction_applied = email.lower() != corrected_email.lower()
 
-                print(f"Processing removal: {remove_word}")
-                print(f"Original email: {email}")
-                print(f"Corrected email: {corrected_email}")
+                logger.debug("Processing removal: %s", remove_word)
+                logger.debug("Original email: %s", email)
+                logger.debug("Corrected email: %s", corrected_email)
                 
                 return {
                     'success': True,
@@ -2288,11 +2351,11 @@ class ChatGPTHelper:
                         corrected_email = f"{corrected_username}@{domain}"
                         correction_applied = email != corrected_email
 
-                        print(f"Processing REPLACE command:")
-                        print(f"Old char: {old_char}")
-                        print(f"New char: {new_char}")
-                        print(f"Original email: {email}")
-                        print(f"Corrected email: {corrected_email}")
+                        logger.debug("Processing REPLACE command:")
+                        logger.debug("Old char: %s", old_char)
+                        logger.debug("New char: %s", new_char)
+                        logger.debug("Original email: %s", email)
+                        logger.debug("Corrected email: %s", corrected_email)
 
                         return {
                             'success': True,
@@ -2302,7 +2365,7 @@ class ChatGPTHelper:
                             'correction_text': instruction
                         }
                 except Exception as e:
-                    print(f"Error processing REPLACE command: {str(e)}")
+                    logger.error("Error processing REPLACE command: %s", e)
 
             # 4. Procesar instrucciones regulares
             username, domain = email.split('@')
@@ -2316,7 +2379,7 @@ class ChatGPTHelper:
                         new_char = instruction.split('"')[3]
                         corrected_username = username.replace(old_char, new_char)
                 except Exception as e:
-                    print(f"Error processing instruction: {str(e)}")
+                    logger.error("Error processing instruction: %s", e)
                     corrected_username = username
 
             # 5. Construir resultado final
@@ -2332,7 +2395,7 @@ class ChatGPTHelper:
             }
 
         except Exception as e:
-            print(f"Error in correct_email: {str(e)}")
+            logger.error("Error in correct_email: %s", e)
             return {
                 "success": False,
                 "original_email": email,
@@ -2353,9 +2416,9 @@ class ChatGPTHelper:
         temperature: float = 0.7
     ) -> Dict:
         try:
-            logger.info(f"Generating client-side companies for sector: {sector}, geography: {geography}")
+            logger.info("Generating client-side companies for sector: %s, geography: %s", sector, geography)
             if excluded_companies:
-                logger.info(f"Excluding companies: {excluded_companies}")
+                logger.info("Excluding companies: %s", excluded_companies)
 
             # Modificar el prompt para incluir exclusiones
             exclusion_text = ""
@@ -2411,9 +2474,9 @@ class ChatGPTHelper:
                     company for company in companies
                     if not any(excluded.lower() in company.lower() for excluded in excluded_companies)
                 ]
-                logger.info(f"Filtered out excluded companies, {len(companies)} remaining")
+                logger.info("Filtered out excluded companies, %s remaining", len(companies))
 
-            logger.info(f"Successfully generated {len(companies)} client-side companies")
+            logger.info("Successfully generated %s client-side companies", len(companies))
 
             return {
                 "success": True,
@@ -2422,7 +2485,7 @@ class ChatGPTHelper:
             }
 
         except Exception as e:
-            logger.error(f"Error generating client-side companies: {str(e)}")
+            logger.error("Error generating client-side companies: %s", e)
             return {
                 "success": False,
                 "error": "An error occurred while generating companies",
@@ -2440,9 +2503,9 @@ class ChatGPTHelper:
         temperature: float = 0.7
     ) -> Dict:
         try:
-            logger.info(f"Generating supply chain companies for sector: {sector}, geography: {geography}")
+            logger.info("Generating supply chain companies for sector: %s, geography: %s", sector, geography)
             if excluded_companies:
-                logger.info(f"Excluding companies: {excluded_companies}")
+                logger.info("Excluding companies: %s", excluded_companies)
 
             # Modificar el prompt para incluir exclusiones
             exclusion_text = ""
@@ -2505,9 +2568,9 @@ class ChatGPTHelper:
                     company for company in companies
                     if not any(excluded.lower() in company.lower() for excluded in excluded_companies)
                 ]
-                logger.info(f"Filtered out excluded companies, {len(companies)} remaining")
+                logger.info("Filtered out excluded companies, %s remaining", len(companies))
 
-            logger.info(f"Successfully generated {len(companies)} supply chain companies")
+            logger.info("Successfully generated %s supply chain companies", len(companies))
 
             return {
                 "success": True,
@@ -2516,7 +2579,7 @@ class ChatGPTHelper:
             }
 
         except Exception as e:
-            logger.error(f"Error generating supply chain companies: {str(e)}")
+            logger.error("Error generating supply chain companies: %s", e)
             return {
                 "success": False,
                 "error": "An error occurred while generating companies",
@@ -20,5 +20,4 @@ VALID_REGIONS = ["North America", "Europe", "Asia"]
 
 # Configuración de logging
 import logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
\ No newline at end of file
@@ -0,0 +1,39 @@
+import uuid
+import contextvars
+from typing import Optional
+
+# Conversación a la que pertenece la petición en curso. Las peticiones HTTP
+# sin identificador reciben uno nuevo (new_conversation_id); la sesión por
+# defecto sólo se usa fuera de una petición.
+#
+# Vive en un módulo sin dependencias de la app para que los logs
+# (structured_logging) y los servicios puedan leerla sin importar Flask.
+DEFAULT_CONVERSATION_ID = 'default'
+_current_conversation_id = contextvars.ContextVar(
+    'current_conversation_id', 
+    default=DEFAULT_CONVERSATION_ID
+)
+
+def set_current_conversation_id(conversation_id: Optional[str]) -> contextvars.Token:
+    """
+    Asociar la petición en curso a una conversación
+    
+    Args:
+        conversation_id: Identificador de la conversación (None usa la sesión por defecto)
+        
+    Returns:
+        Token para restaurar el valor anterior con reset_current_conversation_id
+    """
+    return _current_conversation_id.set(conversation_id or DEFAULT_CONVERSATION_ID)
+
+def new_conversation_id() -> str:
+    """Generar un identificador para una conversación que llega sin él"""
+    return uuid.uuid4().hex
+
+def reset_current_conversation_id(token: contextvars.Token) -> None:
+    """Restaurar la conversación anterior a set_current_conversation_id"""
+    _current_conversation_id.reset(token)
+
+def get_current_conversation_id() -> str:
+    """Obtener el identificador de la conversación en curso"""
+    return _current_conversation_id.get()
@@ -0,0 +1,341 @@
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Dominios de correo frecuentes además de los de COMMON_DOMAINS; el índice
+# admite miles de entradas sin que las búsquedas crezcan con su número
+POPULAR_EMAIL_DOMAINS = [
+    'gmail.com', 'googlemail.com', 'yahoo.com', 'yahoo.es', 'yahoo.fr', 'yahoo.de', 'yahoo.it',
+    'yahoo.co.uk', 'yahoo.com.br', 'yahoo.com.mx', 'ymail.com', 'outlook.com', 'outlook.es',
+    'outlook.fr', 'outlook.de', 'hotmail.com', 'hotmail.es', 'hotmail.fr', 'hotmail.de', 'hotmail.it',
+    'hotmail.co.uk', 'live.com', 'live.co.uk', 'msn.com', 'icloud.com', 'me.com', 'mac.com',
+    'aol.com', 'protonmail.com', 'proton.me', 'gmx.com', 'gmx.de', 'gmx.net', 'web.de', 't-online.de',
+    'orange.fr', 'free.fr', 'laposte.net', 'libero.it', 'virgilio.it', 'terra.com.br', 'uol.com.br',
+    'bol.com.br', 'zoho.com', 'yandex.com', 'mail.com', 'fastmail.com', 'tutanota.com',
+    'comcast.net', 'verizon.net', 'att.net', 'sbcglobal.net', 'btinternet.com', 'telefonica.net',
+]
+
+
+def edit_distance(a: str, b: str, max_distance: int = None) -> int:
+    """
+    Distancia de Levenshtein (métrica válida para el BK-tree)
+
+    :param max_distance: Si se indica, corta en cuanto la distancia lo supera
+                         y devuelve max_distance + 1
+    """
+    if a == b:
+        return 0
+    if len(a) < len(b):
+        a, b = b, a
+    if max_distance is not None and len(a) - len(b) > max_distance:
+        return max_distance + 1
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        row_min = i
+        for j, char_b in enumerate(b, 1):
+            value = previous[j - 1] if char_a == char_b else previous[j - 1] + 1
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            current.append(value)
+            if value < row_min:
+                row_min = value
+        if max_distance is not None and row_min > max_distance:
+            return max_distance + 1
+        previous = current
+    return previous[-1]
+
+
+def typo_distance(a: str, b: str, max_distance: int = None) -> int:
+    """
+    Distancia con transposiciones adyacentes (Damerau restringida)
+
+    Se usa para ordenar y decidir autocorrecciones: 'gmial' está a 1 de 'gmail'.
+
+    :param max_distance: Si se indica, corta en cuanto la distancia lo supera
+                         y devuelve max_distance + 1
+    """
+    if a == b:
+        return 0
+    if max_distance is not None and abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    before = None
+    previous = list(range(len(b) + 1))
+    previous_min = 0
+    for i in range(1, len(a) + 1):
+        char_a = a[i - 1]
+        current = [i]
+        row_min = i
+        for j in range(1, len(b) + 1):
+            char_b = b[j - 1]
+            value = previous[j - 1] if char_a == char_b else previous[j - 1] + 1
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if before is not None and j > 1 and char_a == b[j - 2] and a[i - 2] == char_b \
+                    and before[j - 2] + 1 < value:
+                value = before[j - 2] + 1
+            current.append(value)
+            if value < row_min:
+                row_min = value
+        # Cada fila sale de las dos anteriores: si ambas superan el límite, ya no baja
+        if max_distance is not None and row_min > max_distance and previous_min > max_distance:
+            return max_distance + 1
+        before, previous, previous_min = previous, current, row_min
+    if max_distance is not None and previous[-1] > max_distance:
+        return max_distance + 1
+    return previous[-1]
+
+
+class BKTree:
+    """
+    Árbol BK sobre la distancia de Levenshtein
+
+    Cada hijo cuelga de su padre por la distancia entre ambos; por la
+    desigualdad triangular, una búsqueda con tolerancia d sólo visita los
+    hijos con distancia en [dist - d, dist + d].
+    """
+
+    def __init__(self, words: Iterable[str] = ()):
+        self.root = None
+        self.size = 0
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str) -> None:
+        if self.root is None:
+            self.root = (word, {})
+            self.size = 1
+            return
+
+        node_word, children = self.root
+        while True:
+            distance = edit_distance(word, node_word)
+            if distance == 0:
+                return
+            child = children.get(distance)
+            if child is None:
+                children[distance] = (word, {})
+                self.size += 1
+                return
+            node_word, children = child
+
+    def search(self, word: str, max_distance: int) -> List[Tuple[int, str]]:
+        """Palabras a distancia <= max_distance, como (distancia, palabra)"""
+        if self.root is None:
+            return []
+
+        results = []
+        pending = [self.root]
+        while pending:
+            node_word, children = pending.pop()
+            # Más allá de max_distance + la mayor arista no hay nada que visitar
+            cutoff = max_distance + (max(children) if children else 0)
+            distance = edit_distance(word, node_word, cutoff)
+            if distance <= max_distance:
+                results.append((distance, node_word))
+            if distance > cutoff:
+                continue
+            for child_distance in range(distance - max_distance, distance + max_distance + 1):
+                child = children.get(child_distance)
+                if child is not None:
+                    pending.append(child)
+        return results
+
+    def __len__(self):
+        return self.size
+
+
+class DeleteIndex:
+    """
+    Índice de borrados (SymSpell) sobre la distancia con transposiciones
+
+    Cada palabra se guarda bajo todas las variantes que resultan de borrarle
+    hasta max_distance caracteres. Dos palabras a distancia <= d comparten
+    alguna variante con <= d borrados en cada lado (una transposición se
+    resuelve con un borrado por lado), así que una búsqueda sólo genera los
+    borrados de la consulta y verifica los pocos candidatos que comparten
+    variante: el coste no depende del número de palabras indexadas.
+    """
+
+    def __init__(self, words: Iterable[str] = (), max_distance: int = 2):
+        self.max_distance = max_distance
+        self.words = set()
+        self.deletes = {}
+        for word in words:
+            self.add(word)
+
+    @staticmethod
+    def _variants(word: str, max_distance: int) -> Dict[str, int]:
+        """Variantes de la palabra con hasta max_distance borrados -> borrados necesarios"""
+        variants = {word: 0}
+        frontier = [word]
+        for distance in range(1, max_distance + 1):
+            following = []
+            for current in frontier:
+                for index in range(len(current)):
+                    variant = current[:index] + current[index + 1:]
+                    if variant not in variants:
+                        variants[variant] = distance
+                        following.append(variant)
+            frontier = following
+        return variants
+
+    def add(self, word: str) -> None:
+        if word in self.words:
+            return
+        self.words.add(word)
+        for variant in self._variants(word, self.max_distance):
+            self.deletes.setdefault(variant, []).append(word)
+
+    def search(self, word: str, max_distance: int) -> List[Tuple[int, str]]:
+        """
+        Palabras a distancia <= max_distance, como (distancia, palabra)
+
+        :param max_distance: Se limita a la distancia con la que se construyó el índice
+        """
+        max_distance = min(max_distance, self.max_distance)
+        results = {}
+        for variant, deleted in self._variants(word, max_distance).items():
+            for candidate in self.deletes.get(variant, ()):
+                if candidate in results or abs(len(candidate) - len(word)) > max_distance:
+                    continue
+                # Basta con variantes a <= max_distance borrados de cada lado
+                if max(deleted, len(candidate) - len(variant)) > max_distance:
+                    continue
+                results[candidate] = typo_distance(word, candidate, max_distance)
+        return [(distance, candidate) for candidate, distance in results.items() if distance <= max_distance]
+
+    def __len__(self):
+        return len(self.words)
+
+
+class DomainSuggestionIndex:
+    """
+    Índice de sugerencias "¿quisiste decir...?" para dominios de email
+
+    Combina un índice de borrados de dominios completos ('gmial.com' ->
+    'gmail.com'), otro de nombres de proveedor ('hotmial' -> 'hotmail', para
+    conservar el TLD que dijo el usuario) y otro de TLDs ('gmail.con' -> 'gmail.com').
+    """
+
+    def __init__(self, domains: Iterable[str], tlds: Iterable[str], aliases: Dict[str, str] = None,
+                 max_distance: int = 2):
+        """
+        :param domains: Dominios conocidos, de más a menos frecuentes
+        :param tlds: TLDs válidos ('com', 'co.uk', ...)
+        :param aliases: Nombre de proveedor o variante -> dominio ('hotmail' -> 'hotmail.com')
+        :param max_distance: Mayor distancia que admitirán las búsquedas
+        """
+        self.rank = {}
+        for domain in domains:
+            self.rank.setdefault(domain.lower(), len(self.rank))
+        self.tlds = {tld.lower() for tld in tlds}
+        self.aliases = {alias.lower(): domain for alias, domain in (aliases or {}).items()}
+
+        self.labels = {}
+        for domain in self.rank:
+            self.labels.setdefault(domain.split('.')[0], domain)
+
+        self.domain_tree = DeleteIndex(self.rank, max_distance)
+        self.label_tree = DeleteIndex(self.labels, max_distance)
+        self.tld_tree = DeleteIndex(self.tlds, 1)
+
+        # Los mismos dominios mal escritos se repiten entre usuarios
+        self._suggest_cached = lru_cache(maxsize=4096)(self._suggest)
+
+    @classmethod
+    def from_common_domains(cls, common_domains: Dict, *tld_groups: Dict[str, List[str]]):
+        """Construir el índice a partir de COMMON_DOMAINS y de uno o varios mapas de TLDs por región"""
+        domains = list(POPULAR_EMAIL_DOMAINS)
+        variant_groups = [common_domains['global']] + list(common_domains['regional'].values())
+        for group in variant_groups:
+            domains.extend(group)
+
+        # Una variante que es un dominio por sí misma ('hotmail' -> hotmail.com)
+        # no se redirige al dominio del grupo (outlook.com)
+        known = set(domains)
+        aliases = {}
+        for group in variant_groups:
+            for domain_name, variants in group.items():
+                aliases.setdefault(domain_name.split('.')[0], domain_name)
+                for variant in variants:
+                    own_domain = f"{variant}.com"
+                    aliases.setdefault(variant, own_domain if own_domain in known else domain_name)
+
+        tlds = set()
+        for group in tld_groups:
+            for region_tlds in group.values():
+                tlds.update(region_tlds)
+        return cls(domains, tlds, aliases)
+
+    def is_known(self, domain: str) -> bool:
+        return (domain or '').lower() in self.rank
+
+    def is_valid_tld(self, tld: str) -> bool:
+        return (tld or '').lower() in self.tlds
+
+    def resolve(self, domain: str, max_typos: int = 1) -> Optional[str]:
+        """
+        Resolver un dominio a uno conocido si es exacto, un alias o una errata leve
+
+        :param max_typos: Erratas admitidas (una transposición cuenta como una)
+        :return: Dominio conocido o None
+        """
+        domain = (domain or '').lower().strip('.')
+        if not domain:
+            return None
+        if domain in self.rank:
+            return domain
+        if domain in self.aliases:
+            return self.aliases[domain]
+
+        # Sólo se autocorrige hacia dominios conocidos, nunca hacia combinaciones nuevas
+        for distance, candidate in self.suggest(domain, max_distance=max_typos):
+            if candidate in self.rank:
+                return candidate
+        return None
+
+    def suggest(self, domain: str, limit: int = 5, max_distance: int = 2) -> List[Tuple[int, str]]:
+        """
+        Sugerencias ordenadas para un dominio posiblemente mal escrito
+
+        :return: Lista de (distancia, dominio), de más a menos probable
+        """
+        domain = (domain or '').lower().strip('.')
+        if not domain:
+            return []
+        return list(self._suggest_cached(domain, max_distance)[:limit])
+
+    def _suggest(self, domain: str, max_distance: int) -> Tuple[Tuple[int, str], ...]:
+        candidates = {}
+
+        def consider(candidate, distance):
+            if distance <= max_distance and distance < candidates.get(candidate, max_distance + 1):
+                candidates[candidate] = distance
+
+        # Dominio completo
+        for distance, candidate in self.domain_tree.search(domain, max_distance):
+            consider(candidate, distance)
+
+        # Proveedor corregido manteniendo (o corrigiendo) el TLD del usuario
+        label, _, tld = domain.partition('.')
+        if label and tld:
+            tld_options = [(0, tld)] if tld in self.tlds else self.tld_tree.search(tld, 1)
+            for label_distance, candidate_label in self.label_tree.search(label, max_distance):
+                for tld_distance, tld_option in tld_options:
+                    consider(f"{candidate_label}.{tld_option}", label_distance + tld_distance)
+        elif label:
+            # Sin TLD: proponer el dominio principal del proveedor
+            for distance, candidate_label in self.label_tree.search(label, max_distance):
+                consider(self.labels[candidate_label], distance)
+
+        ranked = sorted(
+            candidates.items(),
+            key=lambda item: (item[1], item[0] not in self.rank, self.rank.get(item[0], 0), item[0])
+        )
+        return tuple((distance, candidate) for candidate, distance in ranked)
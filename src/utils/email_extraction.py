@@ -0,0 +1,131 @@
+import re
+from typing import List, Optional, Tuple
+
+from ..handlers.username_processor import EMAIL_REGEX, DOMAIN_INDEX
+from .spoken_symbols import rewrite_spoken_symbols, rewrite_spoken_domain, transliterate
+
+# Búsqueda (no anclada) de emails dentro de un texto libre
+EMAIL_IN_TEXT = re.compile(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*')
+_VALID_EMAIL = re.compile(EMAIL_REGEX)
+_SPACED_SYMBOL = re.compile(r'\s*([._@-])\s*')
+_CYRILLIC = re.compile('[а-яёА-ЯЁ]')
+
+
+# Sólo se sugieren dominios para proveedores con nombre largo: 'gmial' sí, 'me.co' no
+MIN_CORRECTABLE_LABEL = 5
+MAX_EMAIL_SUGGESTIONS = 3
+
+# TLDs genéricos habituales; cualquier TLD de dos letras se trata como de país
+GENERIC_TLDS = frozenset([
+    'com', 'net', 'org', 'edu', 'gov', 'mil', 'int', 'info', 'biz', 'name', 'pro', 'mobi', 'asia',
+    'tel', 'io', 'ai', 'app', 'dev', 'tech', 'online', 'site', 'xyz', 'cloud', 'email', 'group',
+    'company', 'consulting', 'agency', 'digital', 'global', 'solutions', 'services', 'capital',
+    'finance', 'partners', 'media', 'studio', 'design', 'network', 'systems', 'energy', 'health',
+])
+
+
+def is_valid_email(email: str) -> bool:
+    return bool(email) and bool(_VALID_EMAIL.match(email))
+
+
+def extract_email_locally(text: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Extraer un email sin llamar al LLM
+
+    1. Email escrito tal cual en el texto ('regex')
+    2. Email dictado: símbolos hablados ('punto', 'arroba', 'точка'...),
+       proveedores dichos en cirílico ('яндекс') y transliteración ('spoken').
+       Un dominio transliterado que el índice no conoce no se da por bueno:
+       se resuelve a un dominio conocido o se deja al LLM
+    3. Dominio que no se puede usar tal cual, resuelto con el índice de
+       dominios: proveedor dicho sin TLD ('juan arroba gmail') o TLD inválido
+       ('juan@gmail.con') ('domain')
+
+    Un email con un TLD válido nunca se reescribe, aunque se parezca a otro
+    proveedor ('ana@email.com'); las alternativas se ofrecen con
+    suggest_email_corrections().
+
+    :param text: Texto escrito o transcrito
+    :return: (email, método) o (None, None) si no se puede montar un email válido
+    """
+    if not text:
+        return None, None
+
+    email, method = _first_valid_email(text), 'regex'
+    transliterated = False
+    if not email:
+        normalized = _SPACED_SYMBOL.sub(r'\1', rewrite_spoken_symbols(text))
+        if _CYRILLIC.search(normalized):
+            head, at, domain = normalized.rpartition('@')
+            if at:
+                domain = rewrite_spoken_domain(domain)
+                transliterated = bool(_CYRILLIC.search(domain))
+                normalized = head + at + domain
+            normalized = transliterate(normalized, 'russian')
+        email, method = _first_valid_email(normalized), 'spoken'
+        if email:
+            email = email.lower()
+
+    if email:
+        username, domain = email.rsplit('@', 1)
+        if transliterated and not DOMAIN_INDEX.is_known(domain):
+            # La transliteración puede inventar el dominio ('yandeks.ru'): sólo se
+            # acepta si el índice lo conoce o lo corrige; si no, decide el LLM
+            resolved = DOMAIN_INDEX.resolve(domain)
+            return (f"{username}@{resolved}".lower(), 'domain') if resolved else (None, None)
+        if not has_valid_tld(domain):
+            resolved = DOMAIN_INDEX.resolve(domain)
+            if resolved:
+                return f"{username}@{resolved}".lower(), 'domain'
+        return email, method
+
+    for match in EMAIL_IN_TEXT.finditer(normalized):
+        username, domain = match.group(0).rsplit('@', 1)
+        provider = DOMAIN_INDEX.aliases.get(domain.lower().strip('.-'))
+        if provider:
+            email = f"{username.strip('.-')}@{provider}".lower()
+            if is_valid_email(email):
+                return email, 'domain'
+
+    return None, None
+
+
+def has_valid_tld(domain: str) -> bool:
+    """El dominio termina en un TLD de país (dos letras), genérico o conocido por el índice"""
+    labels = (domain or '').lower().split('.')
+    if len(labels) < 2 or not labels[0]:
+        return False
+    tld = labels[-1]
+    return len(tld) == 2 or tld in GENERIC_TLDS or DOMAIN_INDEX.is_valid_tld(tld)
+
+
+def suggest_email_corrections(email: str) -> List[str]:
+    """
+    Sugerencias "¿quisiste decir...?" para un email con un dominio desconocido
+
+    'ana@gmial.com' -> ['ana@gmail.com']. Sólo se proponen, no sustituyen al
+    email que escribió el usuario.
+
+    :param email: Email extraído
+    :return: Emails alternativos, de más a menos probable (vacío si el dominio es conocido)
+    """
+    if not email or '@' not in email:
+        return []
+    username, domain = email.rsplit('@', 1)
+    domain = domain.lower()
+    if DOMAIN_INDEX.is_known(domain) or len(domain.split('.')[0]) < MIN_CORRECTABLE_LABEL:
+        return []
+    return [
+        f"{username}@{candidate}"
+        for _, candidate in DOMAIN_INDEX.suggest(domain, limit=MAX_EMAIL_SUGGESTIONS + 1, max_distance=1)
+        if candidate != domain
+    ][:MAX_EMAIL_SUGGESTIONS]
+
+
+def _first_valid_email(text: str) -> Optional[str]:
+    for match in EMAIL_IN_TEXT.finditer(text):
+        # Quitar la puntuación final de la frase ('... juan@gmail.com.')
+        email = match.group(0).strip('.-')
+        if is_valid_email(email):
+            return email
+    return None
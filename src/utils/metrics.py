@@ -0,0 +1,304 @@
+import sys
+import math
+import time
+import inspect
+import threading
+from bisect import bisect_left
+from functools import wraps
+from typing import Callable, Dict, Iterable, List, Tuple
+
+# Formato de exposición de texto de Prometheus
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Cubos de latencia (segundos): de peticiones en memoria a llamadas lentas al LLM
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ''
+    pairs = []
+    for name, value in labels.items():
+        escaped = str(value).replace('\\', r'\\').replace('\n', r'\n').replace('"', r'\"')
+        pairs.append(f'{name}="{escaped}"')
+    return '{' + ','.join(pairs) + '}'
+
+
+class Metric:
+    """Métrica con etiquetas; cada combinación de valores es una serie"""
+
+    type = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._series = {}
+
+    def _key(self, labels: Dict) -> Tuple:
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def _labels(self, key: Tuple) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    def samples(self) -> List[Tuple[str, Dict, float]]:
+        with self._lock:
+            return [(self.name, self._labels(key), value) for key, value in self._series.items()]
+
+    def values(self) -> Dict[Tuple, float]:
+        with self._lock:
+            return dict(self._series)
+
+
+class Counter(Metric):
+    type = 'counter'
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._series[key] = self._series.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    type = 'gauge'
+
+    def set(self, value: float, **labels) -> None:
+        with self._lock:
+            self._series[self._key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._series[key] = self._series.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    type = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = {'buckets': [0] * len(self.buckets), 'sum': 0.0, 'count': 0}
+            series['buckets'][index] += 1
+            series['sum'] += value
+            series['count'] += 1
+
+    def samples(self) -> List[Tuple[str, Dict, float]]:
+        with self._lock:
+            series = {key: (list(value['buckets']), value['sum'], value['count']) for key, value in self._series.items()}
+
+        samples = []
+        for key, (buckets, total, count) in series.items():
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, buckets):
+                cumulative += bucket_count
+                samples.append((f'{self.name}_bucket', {**labels, 'le': _format_value(bound)}, cumulative))
+            samples.append((f'{self.name}_sum', labels, round(total, 6)))
+            samples.append((f'{self.name}_count', labels, count))
+        return samples
+
+
+class CallbackMetric(Metric):
+    """
+    Métrica leída en cada scrape a partir de estadísticas que ya existen
+
+    El callback devuelve pares (etiquetas, valor): ocupación de la cola de
+    voz, aciertos de la caché de transcripciones, bytes servidos...
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str],
+                 callback: Callable[[], Iterable[Tuple[Dict, float]]], type: str = 'gauge'):
+        super().__init__(name, documentation, labelnames)
+        self.type = type
+        self.callback = callback
+
+    def samples(self) -> List[Tuple[str, Dict, float]]:
+        return [
+            (self.name, {name: str(labels.get(name, '')) for name in self.labelnames}, value)
+            for labels, value in self.callback()
+        ]
+
+
+class MetricsRegistry:
+    """Métricas del proceso, en orden de registro; una por nombre"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics = {}
+
+    def register(self, metric: Metric) -> Metric:
+        # Registrar de nuevo un nombre lo sustituye (create_app puede llamarse varias veces)
+        with self._lock:
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str] = (), buckets=DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def callback(self, name: str, documentation: str, labelnames: Iterable[str], callback, type: str = 'gauge') -> CallbackMetric:
+        return self.register(CallbackMetric(name, documentation, labelnames, callback, type))
+
+    def render(self) -> str:
+        """
+        Exponer todas las métricas en formato de texto de Prometheus
+
+        :return: Cuerpo de la respuesta de /api/metrics
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines = []
+        for metric in metrics:
+            samples = metric.samples()
+            lines.append(f'# HELP {metric.name} {metric.documentation}')
+            lines.append(f'# TYPE {metric.name} {metric.type}')
+            for name, labels, value in samples:
+                lines.append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    'http_request_duration_seconds', 'Latencia de las peticiones HTTP por ruta', ['method', 'route', 'status']
+)
+HTTP_REQUESTS_IN_FLIGHT = REGISTRY.gauge(
+    'http_requests_in_flight', 'Peticiones HTTP en curso (hilos WSGI o tareas ASGI ocupados)', ['server']
+)
+OPENAI_REQUESTS = REGISTRY.counter(
+    'openai_requests_total', 'Llamadas a la API de OpenAI', ['model', 'method', 'outcome']
+)
+OPENAI_REQUEST_DURATION = REGISTRY.histogram(
+    'openai_request_duration_seconds', 'Latencia de las llamadas a la API de OpenAI', ['model', 'method']
+)
+OPENAI_TOKENS = REGISTRY.counter(
+    'openai_tokens_total', 'Tokens consumidos en OpenAI', ['model', 'method', 'kind']
+)
+ZOHO_REQUESTS = REGISTRY.counter(
+    'zoho_requests_total', 'Peticiones HTTP a Zoho Recruit', ['operation', 'status']
+)
+ZOHO_ERRORS = REGISTRY.counter(
+    'zoho_errors_total', 'Peticiones a Zoho Recruit fallidas (HTTP >= 400 o excepción)', ['operation', 'reason']
+)
+ZOHO_REQUEST_DURATION = REGISTRY.histogram(
+    'zoho_request_duration_seconds', 'Latencia de las peticiones a Zoho Recruit', ['operation']
+)
+CACHE_LOOKUPS = REGISTRY.counter(
+    'cache_lookups_total', 'Consultas a cachés en memoria (hit, stale o miss)', ['cache', 'result']
+)
+
+
+def _cache_hit_ratios():
+    lookups = {}
+    for (cache, result), count in CACHE_LOOKUPS.values().items():
+        hits, total = lookups.get(cache, (0, 0))
+        lookups[cache] = (hits + (count if result != 'miss' else 0), total + count)
+    return [({'cache': cache}, round(hits / total, 4)) for cache, (hits, total) in lookups.items() if total]
+
+
+REGISTRY.callback(
+    'cache_hit_ratio', 'Fracción de consultas servidas desde caché (incluye stale)', ['cache'], _cache_hit_ratios
+)
+
+
+def _caller_method(frame) -> str:
+    """
+    Método de ChatGPTHelper que origina la llamada a OpenAI
+
+    En los flujos sans-IO quien llama es run_steps; el método real es el
+    generador *_steps más interno de la cadena de yield from.
+    """
+    name = frame.f_code.co_name
+    if name.startswith('run_steps'):
+        steps = frame.f_locals.get('steps')
+        while inspect.isgenerator(getattr(steps, 'gi_yieldfrom', None)):
+            steps = steps.gi_yieldfrom
+        if steps is not None:
+            name = steps.__name__
+    return name[:-len('_steps')] if name.endswith('_steps') else name
+
+
+def _record_openai_call(model: str, method: str, started: float, response=None, error: bool = False) -> None:
+    OPENAI_REQUESTS.inc(model=model, method=method, outcome='error' if error else 'ok')
+    OPENAI_REQUEST_DURATION.observe(time.perf_counter() - started, model=model, method=method)
+    usage = getattr(response, 'usage', None)
+    if usage is not None:
+        OPENAI_TOKENS.inc(getattr(usage, 'prompt_tokens', 0) or 0, model=model, method=method, kind='prompt')
+        OPENAI_TOKENS.inc(getattr(usage, 'completion_tokens', 0) or 0, model=model, method=method, kind='completion')
+
+
+def _instrument_create(create):
+    if getattr(create, '_metrics_instrumented', False):
+        return create
+
+    if inspect.iscoroutinefunction(create):
+        @wraps(create)
+        async def instrumented(*args, **request):
+            method = _caller_method(sys._getframe(1))
+            started = time.perf_counter()
+            try:
+                response = await create(*args, **request)
+            except Exception:
+                _record_openai_call(request.get('model', 'unknown'), method, started, error=True)
+                raise
+            _record_openai_call(request.get('model', 'unknown'), method, started, response)
+            return response
+    else:
+        @wraps(create)
+        def instrumented(*args, **request):
+            method = _caller_method(sys._getframe(1))
+            started = time.perf_counter()
+            try:
+                response = create(*args, **request)
+            except Exception:
+                _record_openai_call(request.get('model', 'unknown'), method, started, error=True)
+                raise
+            _record_openai_call(request.get('model', 'unknown'), method, started, response)
+            return response
+
+    instrumented._metrics_instrumented = True
+    return instrumented
+
+
+def instrument_openai(client):
+    """
+    Medir las llamadas de un cliente de OpenAI (síncrono o asíncrono)
+
+    Envuelve chat.completions.create y audio.transcriptions.create del propio
+    cliente: número de llamadas, latencia y tokens por modelo y método.
+
+    :param client: OpenAI o AsyncOpenAI
+    :return: El mismo cliente
+    """
+    completions = client.chat.completions
+    completions.create = _instrument_create(completions.create)
+    audio = getattr(client, 'audio', None)
+    if audio is not None:
+        audio.transcriptions.create = _instrument_create(audio.transcriptions.create)
+    return client
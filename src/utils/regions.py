@@ -0,0 +1,515 @@
+import re
+import unicodedata
+from functools import lru_cache
+from typing import FrozenSet, Optional, Tuple
+
+from .script_classifier import script_of
+
+# Regiones con las que trabaja el bot (ver VALID_REGIONS en config.py) más
+# las regiones fuera de cobertura, para poder descartar candidatos de ellas
+NORTH_AMERICA = 'North America'
+EUROPE = 'Europe'
+ASIA = 'Asia'
+SOUTH_AMERICA = 'South America'
+AFRICA = 'Africa'
+OCEANIA = 'Oceania'
+
+REGION_ALIASES = {
+    NORTH_AMERICA: ['north america', 'north american', 'norteamerica', 'america del norte',
+                    'amerique du nord', 'nordamerika', 'nord america', 'america do norte', 'latam north'],
+    EUROPE: ['europe', 'european', 'europa', 'europeo', 'europea', 'eu', 'european union',
+             'union europea', 'western europe', 'eastern europe', 'northern europe', 'southern europe',
+             'nordics', 'scandinavia', 'benelux', 'dach', 'iberia', 'balkans', 'baltics'],
+    ASIA: ['asia', 'asian', 'asie', 'asien', 'southeast asia', 'south east asia',
+           'east asia', 'south asia', 'central asia', 'middle east', 'oriente medio', 'medio oriente',
+           'far east', 'gulf', 'gcc', 'asean'],
+    SOUTH_AMERICA: ['south america', 'south american', 'sudamerica', 'suramerica', 'america del sur',
+                    'amerique du sud', 'sudamerika', 'latin america', 'latinoamerica', 'latam'],
+    AFRICA: ['africa', 'african', 'afrique', 'afrika', 'sub saharan africa', 'north africa'],
+    OCEANIA: ['oceania', 'australasia', 'pacific', 'oceanie', 'ozeanien'],
+}
+
+# Alias que abarcan varias regiones; Oriente Medio está en ASIA en estas tablas.
+# La primera región es la que devuelve resolve_region()
+MULTI_REGION_ALIASES = {
+    'americas': (NORTH_AMERICA, SOUTH_AMERICA),
+    'the americas': (NORTH_AMERICA, SOUTH_AMERICA),
+    'americas region': (NORTH_AMERICA, SOUTH_AMERICA),
+    'emea': (EUROPE, ASIA, AFRICA),
+    'mena': (ASIA, AFRICA),
+    'apac': (ASIA, OCEANIA),
+    'asia pacific': (ASIA, OCEANIA),
+    'asia pacifico': (ASIA, OCEANIA),
+    'asie pacifique': (ASIA, OCEANIA),
+    'asien pazifik': (ASIA, OCEANIA),
+}
+
+COUNTRY_REGIONS = {
+    # Norteamérica (incluye Centroamérica y el Caribe)
+    NORTH_AMERICA: [
+        'united states', 'united states of america', 'usa', 'us', 'u s a', 'u s', 'america', 'canada',
+        'mexico', 'guatemala', 'belize', 'honduras', 'el salvador', 'nicaragua', 'costa rica', 'panama',
+        'cuba', 'dominican republic', 'haiti', 'jamaica', 'puerto rico', 'bahamas', 'barbados',
+        'trinidad and tobago', 'greenland', 'bermuda',
+    ],
+    EUROPE: [
+        'united kingdom', 'uk', 'u k', 'great britain', 'britain', 'england', 'scotland', 'wales',
+        'northern ireland', 'ireland', 'spain', 'portugal', 'france', 'germany', 'italy', 'netherlands',
+        'holland', 'belgium', 'luxembourg', 'switzerland', 'austria', 'liechtenstein', 'monaco', 'andorra',
+        'san marino', 'vatican', 'malta', 'denmark', 'sweden', 'norway', 'finland', 'iceland', 'estonia',
+        'latvia', 'lithuania', 'poland', 'czech republic', 'czechia', 'slovakia', 'hungary', 'slovenia',
+        'croatia', 'bosnia and herzegovina', 'serbia', 'montenegro', 'north macedonia', 'macedonia',
+        'albania', 'kosovo', 'greece', 'cyprus', 'bulgaria', 'romania', 'moldova', 'ukraine', 'belarus',
+        'russia', 'russian federation', 'turkey', 'turkiye', 'georgia', 'armenia', 'azerbaijan',
+    ],
+    ASIA: [
+        'china', 'hong kong', 'macau', 'taiwan', 'japan', 'south korea', 'korea', 'north korea', 'mongolia',
+        'india', 'pakistan', 'bangladesh', 'sri lanka', 'nepal', 'bhutan', 'maldives', 'afghanistan',
+        'kazakhstan', 'uzbekistan', 'turkmenistan', 'kyrgyzstan', 'tajikistan', 'singapore', 'malaysia',
+        'indonesia', 'thailand', 'vietnam', 'viet nam', 'philippines', 'myanmar', 'cambodia', 'laos',
+        'brunei', 'timor leste', 'united arab emirates', 'uae', 'saudi arabia', 'qatar', 'kuwait',
+        'bahrain', 'oman', 'yemen', 'israel', 'palestine', 'jordan', 'lebanon', 'syria', 'iraq', 'iran',
+    ],
+    SOUTH_AMERICA: [
+        'brazil', 'argentina', 'chile', 'uruguay', 'paraguay', 'bolivia', 'peru', 'ecuador', 'colombia',
+        'venezuela', 'guyana', 'suriname', 'french guiana',
+    ],
+    AFRICA: [
+        'south africa', 'nigeria', 'kenya', 'egypt', 'morocco', 'algeria', 'tunisia', 'libya', 'ethiopia',
+        'ghana', 'ivory coast', 'cote d ivoire', 'senegal', 'cameroon', 'uganda', 'tanzania', 'rwanda',
+        'angola', 'mozambique', 'zambia', 'zimbabwe', 'botswana', 'namibia', 'sudan', 'mauritius',
+        'madagascar', 'democratic republic of the congo', 'congo',
+    ],
+    OCEANIA: [
+        'australia', 'new zealand', 'fiji', 'papua new guinea', 'samoa', 'tonga',
+    ],
+}
+
+CITY_REGIONS = {
+    NORTH_AMERICA: [
+        'new york', 'nyc', 'los angeles', 'san francisco', 'chicago', 'boston', 'seattle', 'austin',
+        'houston', 'dallas', 'miami', 'atlanta', 'washington', 'denver', 'philadelphia', 'san diego',
+        'san jose', 'palo alto', 'silicon valley', 'toronto', 'vancouver', 'montreal', 'calgary', 'ottawa',
+        'mexico city', 'ciudad de mexico', 'monterrey', 'guadalajara',
+        'las vegas', 'phoenix', 'detroit', 'minneapolis', 'pittsburgh', 'nashville', 'raleigh',
+        'tampa', 'baltimore', 'cleveland', 'st louis', 'saint louis', 'kansas city', 'salt lake city',
+        'quebec city', 'winnipeg', 'edmonton', 'tijuana', 'puebla', 'cancun', 'nueva york', 'nova york',
+    ],
+    EUROPE: [
+        'london', 'manchester', 'edinburgh', 'dublin', 'madrid', 'barcelona', 'valencia', 'seville',
+        'lisbon', 'porto', 'paris', 'lyon', 'marseille', 'berlin', 'munich', 'frankfurt', 'hamburg',
+        'cologne', 'rome', 'milan', 'turin', 'naples', 'amsterdam', 'rotterdam', 'the hague', 'brussels',
+        'antwerp', 'zurich', 'geneva', 'basel', 'vienna', 'copenhagen', 'stockholm', 'oslo', 'helsinki',
+        'reykjavik', 'warsaw', 'krakow', 'prague', 'budapest', 'bucharest', 'sofia', 'athens', 'istanbul',
+        'moscow', 'saint petersburg', 'kyiv', 'kiev', 'tallinn', 'riga', 'vilnius', 'zagreb', 'belgrade',
+        'bilbao', 'malaga', 'zaragoza', 'sevilla', 'lisboa', 'londres', 'londra', 'munchen', 'roma',
+        'milano', 'milan', 'florence', 'firenze', 'venice', 'venezia', 'genoa', 'bologna', 'bruselas',
+        'bruxelles', 'ginebra', 'geneve', 'viena', 'wien', 'praga', 'prag', 'varsovia', 'warszawa',
+        'atenas', 'estambul', 'moscu', 'moskau', 'bordeaux', 'toulouse', 'lille', 'nantes', 'strasbourg',
+        'stuttgart', 'dusseldorf', 'leipzig', 'dresden', 'hanover', 'hannover', 'glasgow', 'birmingham',
+        'liverpool', 'leeds', 'bristol', 'oxford', 'cork', 'gothenburg', 'goteborg', 'malmo', 'bergen',
+        'aarhus', 'gdansk', 'wroclaw', 'bratislava', 'ljubljana', 'sarajevo', 'skopje', 'tirana',
+        'chisinau', 'minsk', 'tbilisi', 'yerevan', 'baku', 'ankara', 'izmir', 'thessaloniki', 'nicosia',
+        'valletta', 'luxembourg city', 'eindhoven', 'utrecht', 'ghent', 'lausanne', 'salzburg',
+    ],
+    ASIA: [
+        'tokyo', 'osaka', 'beijing', 'shanghai', 'shenzhen', 'guangzhou', 'seoul', 'busan', 'taipei',
+        'mumbai', 'bombay', 'delhi', 'new delhi', 'bangalore', 'bengaluru', 'hyderabad', 'chennai', 'pune',
+        'kolkata', 'karachi', 'lahore', 'dhaka', 'kuala lumpur', 'jakarta', 'bangkok', 'manila',
+        'ho chi minh city', 'hanoi', 'dubai', 'abu dhabi', 'riyadh', 'jeddah', 'doha', 'tel aviv',
+        'jerusalem', 'tehran', 'almaty', 'kyoto', 'yokohama', 'nagoya', 'fukuoka', 'incheon', 'hangzhou',
+        'chengdu', 'wuhan', 'nanjing', 'tianjin', 'chongqing', 'xian', 'kaohsiung', 'ahmedabad', 'jaipur',
+        'noida', 'gurgaon', 'gurugram', 'colombo', 'kathmandu', 'islamabad', 'yangon', 'phnom penh', 'cebu',
+        'surabaya', 'penang', 'muscat', 'kuwait city', 'manama', 'amman', 'beirut', 'baghdad', 'haifa',
+        'tokio', 'pekin', 'seul', 'nueva delhi', 'tashkent', 'astana', 'ulaanbaatar', 'macao',
+    ],
+    SOUTH_AMERICA: [
+        'sao paulo', 'rio de janeiro', 'buenos aires', 'santiago', 'lima', 'bogota', 'medellin', 'quito',
+        'caracas', 'montevideo', 'asuncion', 'la paz', 'brasilia', 'belo horizonte', 'porto alegre',
+        'curitiba', 'recife', 'salvador de bahia', 'fortaleza', 'valparaiso', 'cali',
+        'barranquilla', 'cartagena de indias', 'guayaquil', 'arequipa', 'maracaibo',
+    ],
+    AFRICA: [
+        'johannesburg', 'cape town', 'lagos', 'nairobi', 'cairo', 'casablanca', 'accra', 'addis ababa',
+        'tunis', 'algiers', 'durban', 'pretoria', 'abuja', 'kampala', 'dar es salaam', 'kigali', 'dakar',
+        'abidjan', 'alexandria', 'marrakech', 'rabat', 'el cairo', 'ciudad del cabo', 'le caire',
+    ],
+    OCEANIA: [
+        'sydney', 'melbourne', 'brisbane', 'perth', 'auckland', 'wellington', 'adelaide', 'canberra',
+        'gold coast', 'hobart', 'christchurch', 'sidney',
+    ],
+}
+
+# Estados, provincias y regiones administrativas
+STATE_REGIONS = {
+    NORTH_AMERICA: [
+        'california', 'texas', 'florida', 'georgia',
+        'alabama', 'alaska', 'arizona', 'arkansas', 'colorado', 'connecticut', 'delaware', 'hawaii',
+        'idaho', 'illinois', 'indiana', 'iowa', 'kansas', 'kentucky', 'louisiana', 'maine', 'maryland',
+        'massachusetts', 'michigan', 'minnesota', 'mississippi', 'missouri', 'montana', 'nebraska',
+        'nevada', 'new hampshire', 'new jersey', 'new mexico', 'north carolina', 'north dakota', 'ohio',
+        'oklahoma', 'oregon', 'pennsylvania', 'rhode island', 'south carolina', 'south dakota',
+        'tennessee', 'utah', 'vermont', 'virginia', 'west virginia', 'wisconsin', 'wyoming',
+        'washington state', 'washington dc', 'district of columbia', 'new york state', 'bay area',
+        'ontario', 'quebec', 'british columbia', 'alberta', 'manitoba', 'saskatchewan', 'nova scotia',
+        'new brunswick', 'newfoundland', 'jalisco', 'nuevo leon', 'yucatan', 'baja california',
+        'quintana roo',
+    ],
+    EUROPE: [
+        'catalonia', 'cataluna', 'catalunya', 'andalusia', 'andalucia', 'basque country', 'pais vasco',
+        'euskadi', 'galicia', 'bavaria', 'bayern', 'baden wurttemberg', 'north rhine westphalia',
+        'nordrhein westfalen', 'hessen', 'saxony', 'sachsen', 'lombardy', 'lombardia', 'tuscany', 'toscana',
+        'sicily', 'sicilia', 'sardinia', 'ile de france', 'provence', 'brittany', 'bretagne', 'normandy',
+        'flanders', 'wallonia', 'silesia', 'transylvania', 'crimea', 'siberia', 'lapland',
+    ],
+    ASIA: [
+        'maharashtra', 'karnataka', 'tamil nadu', 'kerala', 'gujarat', 'telangana', 'west bengal',
+        'uttar pradesh', 'rajasthan', 'punjab', 'guangdong', 'zhejiang', 'jiangsu', 'sichuan', 'fujian',
+        'shandong', 'hokkaido', 'okinawa', 'kyushu', 'bali', 'sumatra', 'borneo', 'sabah',
+        'sarawak', 'mindanao', 'luzon',
+    ],
+    SOUTH_AMERICA: [
+        'minas gerais', 'bahia', 'rio grande do sul', 'parana', 'santa catarina', 'pernambuco',
+        'patagonia', 'antioquia', 'cundinamarca',
+    ],
+    AFRICA: [
+        'gauteng', 'western cape', 'kwazulu natal', 'sahara',
+    ],
+    OCEANIA: [
+        'new south wales', 'queensland', 'western australia', 'south australia', 'tasmania',
+        'northern territory',
+    ],
+}
+
+# Nombres de países y ciudades en otros idiomas (exónimos)
+EXONYM_REGIONS = {
+    NORTH_AMERICA: [
+        # es / pt / fr / de / it / nl
+        'estados unidos', 'eeuu', 'ee uu', 'eua', 'norteamerica', 'mexique', 'mexiko', 'messico', 'kanada',
+        'etats unis', 'vereinigte staaten', 'stati uniti', 'verenigde staten', 'amerique',
+        # ru / zh / ja / ko / ar
+        'сша', 'соединенные штаты', 'америка', 'канада', 'мексика', 'нью йорк',
+        '美国', '加拿大', '墨西哥', '纽约', 'アメリカ', 'カナダ', 'メキシコ', 'ニューヨーク',
+        '미국', '캐나다', '멕시코', '뉴욕', 'الولايات المتحدة', 'أمريكا', 'كندا', 'المكسيك',
+    ],
+    EUROPE: [
+        'espana', 'espanha', 'espagne', 'spanien', 'spagna', 'spanje', 'alemania', 'alemanha', 'allemagne',
+        'deutschland', 'germania', 'duitsland', 'francia', 'franca', 'frankreich', 'frankrijk', 'italia',
+        'italie', 'italien', 'reino unido', 'royaume uni', 'vereinigtes konigreich', 'regno unito',
+        'verenigd koninkrijk', 'gran bretana', 'grande bretagne', 'grossbritannien', 'inglaterra',
+        'angleterre', 'inghilterra', 'engeland', 'escocia', 'ecosse', 'schottland', 'gales', 'irlanda',
+        'irlande', 'irland', 'holanda', 'paises bajos', 'paises baixos', 'pays bas', 'niederlande',
+        'paesi bassi', 'nederland', 'belgica', 'belgique', 'belgien', 'belgio', 'belgie', 'suiza', 'suica',
+        'suisse', 'schweiz', 'svizzera', 'zwitserland', 'osterreich', 'autriche', 'oostenrijk', 'suecia',
+        'suede', 'schweden', 'svezia', 'zweden', 'sverige', 'noruega', 'norvege', 'norwegen', 'norvegia',
+        'noorwegen', 'norge', 'dinamarca', 'danemark', 'danimarca', 'denemarken', 'finlandia',
+        'finlande', 'finnland', 'suomi', 'islandia', 'islande', 'polonia', 'pologne', 'polen', 'polska',
+        'grecia', 'grece', 'griechenland', 'griekenland', 'turquia', 'turquie', 'turkei', 'turchia',
+        'turkije', 'rusia', 'russie', 'russland', 'russia', 'rusland', 'ucrania', 'ukraine', 'ucraina',
+        'chequia', 'republica checa', 'tschechien', 'hungria', 'hongrie', 'ungarn', 'ungheria', 'rumania',
+        'roumanie', 'rumanien', 'croacia', 'croatie', 'kroatien', 'eslovaquia', 'eslovenia', 'lituania',
+        'letonia', 'estonie', 'portogallo',
+        'россия', 'германия', 'франция', 'испания', 'италия', 'великобритания', 'англия', 'украина',
+        'польша', 'турция', 'москва', 'лондон', 'париж', 'берлин', 'киев',
+        '英国', '法国', '德国', '西班牙', '意大利', '荷兰', '俄罗斯', '伦敦', '巴黎', '柏林', '欧盟',
+        'イギリス', 'フランス', 'ドイツ', 'スペイン', 'イタリア', 'ロシア', 'ロンドン', 'パリ',
+        '영국', '프랑스', '독일', '스페인', '이탈리아', '러시아', '런던', '파리',
+        'فرنسا', 'ألمانيا', 'إسبانيا', 'بريطانيا', 'إيطاليا', 'روسيا', 'تركيا',
+    ],
+    ASIA: [
+        'japon', 'japao', 'giappone', 'corea', 'corea del sur', 'coreia do sul', 'coree du sud',
+        'sudkorea', 'zuid korea', 'chine', 'cina', 'inde', 'indien', 'filipinas', 'philippinen',
+        'tailandia', 'thailande', 'singapur', 'singapour', 'malasia', 'malaisie', 'arabia saudita',
+        'arabia saudi', 'arabie saoudite', 'emiratos arabes unidos', 'emiratos', 'emirats arabes unis',
+        'catar', 'irak', 'libano', 'jordania',
+        'китай', 'япония', 'корея', 'индия', 'сингапур', 'пекин', 'токио',
+        '中国', '日本', '韩国', '印度', '新加坡', '香港', '台湾', '北京', '上海', '深圳', '广州', '东京',
+        '首尔', '韓国', '東京', '大阪', 'インド', 'シンガポール',
+        '중국', '일본', '한국', '인도', '싱가포르', '서울', '부산', '도쿄',
+        'الصين', 'اليابان', 'الهند', 'السعودية', 'الإمارات', 'قطر', 'دبي', 'الكويت',
+        'भारत', 'दिल्ली', 'मुंबई',
+    ],
+    SOUTH_AMERICA: [
+        'brasil', 'bresil', 'brasilien', 'brasile', 'brazilie', 'argentine', 'argentinien', 'colombie',
+        'kolumbien', 'perou', 'chili',
+        'бразилия', 'аргентина', '巴西', '阿根廷', 'ブラジル', '브라질', 'البرازيل',
+    ],
+    AFRICA: [
+        'sudafrica', 'africa do sul', 'afrique du sud', 'sudafrika', 'zuid afrika', 'egipto', 'egito',
+        'egypte', 'agypten', 'egitto', 'marruecos', 'marrocos', 'maroc', 'marokko', 'marocco', 'argelia',
+        'tunez', 'nigerie', 'kenia',
+        'египет', '南非', '埃及', 'مصر', 'المغرب', 'الجزائر', 'تونس',
+    ],
+    OCEANIA: [
+        'australie', 'australien', 'nueva zelanda', 'nova zelandia', 'nouvelle zelande', 'neuseeland',
+        'nieuw zeeland', 'австралия', '澳大利亚', '澳洲', 'オーストラリア', '호주', 'أستراليا',
+    ],
+}
+
+# Nombres de región por idioma: además de la región, indican el idioma del usuario
+REGION_EXONYMS = {
+    EUROPE: {
+        'es': ['europa', 'europeo', 'europea'],
+        'en': ['europe', 'european'],
+        'fr': ['europe', 'européen', 'européenne'],
+        'de': ['europa', 'europäisch'],
+        'it': ['europa', 'europeo', 'europea'],
+        'pt': ['europa', 'europeu', 'europeia'],
+        'ru': ['европа', 'европейский'],
+        'pl': ['europa', 'europejski'],
+        'nl': ['europa', 'europees'],
+        'el': ['ευρώπη', 'ευρωπαϊκός'],
+        'ar': ['أوروبا', 'أوروبي'],
+        'zh': ['欧洲', '欧洲的'],
+        'ja': ['ヨーロッパ', '欧州'],
+        'ko': ['유럽'],
+    },
+    NORTH_AMERICA: {
+        'es': ['norteamérica', 'norte de america', 'america del norte'],
+        'en': ['north america', 'north american'],
+        'fr': ['amérique du nord', 'nord-américain'],
+        'pt': ['norte da america', 'america do norte'],
+        'it': ['nord america', 'nord americano'],
+        'de': ['nordamerika', 'nordamerikanisch'],
+        'ru': ['северная америка', 'североамериканский'],
+        'ar': ['أمريكا الشمالية'],
+        'zh': ['北美', '北美洲'],
+        'ja': ['北アメリカ', '北米'],
+        'ko': ['북미', '북아메리카'],
+    },
+    ASIA: {
+        'es': ['asia', 'asiático', 'asiática'],
+        'en': ['asia', 'asian'],
+        'fr': ['asie', 'asiatique'],
+        'de': ['asien', 'asiatisch'],
+        'pt': ['ásia', 'asiático', 'asiática'],
+        'ru': ['азия', 'азиатский'],
+        'ar': ['آسيا', 'آسيوي'],
+        'hi': ['एशिया', 'एशियाई'],
+        'zh': ['亚洲', '亚洲的'],
+        'ja': ['アジア', 'アジア人'],
+        'ko': ['아시아', '아시아인'],
+    },
+}
+
+_NON_ALNUM = re.compile(r'[\W_]+')
+# Scripts sin espacios entre palabras: un nombre puede empezar y acabar en cualquier carácter
+_UNSPACED_SCRIPTS = frozenset(['han', 'hiragana', 'katakana', 'hangul', 'thai'])
+
+
+def fold(text: str) -> str:
+    """
+    Normalizar texto para búsquedas: minúsculas, sin acentos ni signos
+
+    'São Paulo, Brasil' -> 'sao paulo brasil', 'Straße' -> 'strasse'. Las
+    letras de otros alfabetos (cirílico, CJK, árabe...) se conservan.
+    """
+    if not text:
+        return ''
+    decomposed = unicodedata.normalize('NFKD', str(text).casefold())
+    stripped = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    return _NON_ALNUM.sub(' ', stripped).strip()
+
+
+# Especificidad de cada tabla al desambiguar varios nombres en un texto: el
+# calificativo más amplio decide ('Paris, Texas' -> Texas, 'London, Ontario' -> Ontario)
+REGION_KIND = 4
+COUNTRY_KIND = 3
+STATE_KIND = 2
+CITY_KIND = 1
+# Nombre que designa lugares de regiones distintas ('georgia': país y estado)
+AMBIGUOUS_KIND = 0
+
+
+def _location_tables():
+    """(tabla, especificidad) en orden de prioridad: alias de región > país > ciudad > estado"""
+    region_names = {
+        region: [name for names in translations.values() for name in names]
+        for region, translations in REGION_EXONYMS.items()
+    }
+    return [
+        (REGION_ALIASES, REGION_KIND), (region_names, REGION_KIND), (COUNTRY_REGIONS, COUNTRY_KIND),
+        (EXONYM_REGIONS, COUNTRY_KIND), (CITY_REGIONS, CITY_KIND), (STATE_REGIONS, STATE_KIND),
+    ]
+
+
+def _build_lookup():
+    lookup = {fold(name): regions[0] for name, regions in MULTI_REGION_ALIASES.items()}
+    # Los primeros no se sobrescriben
+    for table, _ in _location_tables():
+        for region, names in table.items():
+            for name in names:
+                lookup.setdefault(fold(name), region)
+    return lookup
+
+
+def _build_kinds():
+    kinds = {fold(name): REGION_KIND for name in MULTI_REGION_ALIASES}
+    regions = {}
+    for table, kind in _location_tables():
+        for region, names in table.items():
+            for name in names:
+                folded = fold(name)
+                kinds[folded] = max(kinds.get(folded, kind), kind)
+                regions.setdefault(folded, set()).add(region)
+    for folded, found in regions.items():
+        if len(found) > 1:
+            kinds[folded] = AMBIGUOUS_KIND
+    return kinds
+
+
+def _build_language_lookup():
+    lookup = {}
+    for region, translations in REGION_EXONYMS.items():
+        for language, names in translations.items():
+            for name in names:
+                # Ante nombres compartidos ('europa') gana el primer idioma
+                lookup.setdefault(fold(name), (region, language))
+    return lookup
+
+
+def _build_trie(lookup):
+    """
+    Trie por caracteres de los nombres normalizados; la región se guarda bajo la clave ''
+
+    Los alias latinos de dos letras ('us', 'uk', 'eu') quedan fuera: en texto
+    libre son palabras corrientes ('contact us'). Sólo cuentan si son el texto
+    completo.
+    """
+    root = {}
+    for name, region in lookup.items():
+        if len(name) <= 2 and name.isascii():
+            continue
+        node = root
+        for char in name:
+            node = node.setdefault(char, {})
+        node[''] = region
+    return root
+
+
+# Tabla precalculada: nombre normalizado -> región
+LOCATION_REGIONS = _build_lookup()
+# Nombre normalizado -> especificidad (*_KIND)
+LOCATION_KINDS = _build_kinds()
+# Alias normalizado -> todas las regiones que abarca
+REGION_SETS = {fold(name): frozenset(regions) for name, regions in MULTI_REGION_ALIASES.items()}
+# Nombre de región normalizado -> (región, idioma)
+REGION_LANGUAGES = _build_language_lookup()
+_LOCATION_TRIE = _build_trie(LOCATION_REGIONS)
+
+
+def _is_boundary(folded: str, index: int) -> bool:
+    """Hay límite de palabra en index (inicio/fin del texto, espacio o script sin espacios)"""
+    if index <= 0 or index >= len(folded):
+        return True
+    return folded[index] == ' ' or folded[index - 1] == ' ' or \
+        script_of(folded[index]) in _UNSPACED_SCRIPTS or script_of(folded[index - 1]) in _UNSPACED_SCRIPTS
+
+
+def find_location(text: str) -> Optional[Tuple[str, str]]:
+    """
+    Buscar la ubicación conocida dentro de un texto
+
+    Recorre el texto una vez con el trie de nombres: 'I work in New York'
+    -> ('new york', 'North America'), '我在北京工作' -> ('北京', 'Asia').
+
+    Si aparecen varios nombres de regiones distintas decide el más amplio
+    ('Paris, Texas' -> Texas; un nombre ambiguo como 'Georgia' cede ante
+    'USA'). Si aun así no hay una única región ('Brazil or Japan') no se
+    adivina: se devuelve None y decide el LLM.
+
+    :param text: Texto libre
+    :return: (nombre normalizado, región) o None
+    """
+    folded = fold(text)
+    matches = []
+    for start in range(len(folded)):
+        if not _is_boundary(folded, start) or folded[start] == ' ':
+            continue
+        node = _LOCATION_TRIE
+        longest = None
+        for end in range(start, len(folded)):
+            node = node.get(folded[end])
+            if node is None:
+                break
+            if '' in node and _is_boundary(folded, end + 1):
+                longest = (start, end + 1, node[''])
+        # Descartar los nombres contenidos en otro ('york' dentro de 'new york')
+        if longest and not (matches and matches[-1][1] >= longest[1]):
+            matches.append(longest)
+    if not matches:
+        return None
+
+    located = [(folded[start:end], region) for start, end, region in matches]
+    if len({region for _, region in located}) > 1:
+        top = max(LOCATION_KINDS.get(name, CITY_KIND) for name, _ in located)
+        located = [match for match in located if LOCATION_KINDS.get(match[0], CITY_KIND) == top]
+        if len({region for _, region in located}) > 1:
+            return None
+    return max(located, key=lambda match: len(match[0]))
+
+
+@lru_cache(maxsize=4096)
+def resolve_region(location: str) -> Optional[str]:
+    """
+    Obtener la región de una ubicación (región, país, estado o ciudad, en
+    varios idiomas)
+
+    Primero se busca el texto completo y después el nombre conocido más largo
+    que aparezca en él, para casos como 'Madrid, Spain'.
+
+    :param location: Texto de la ubicación
+    :return: Nombre de la región o None si no se reconoce
+    """
+    folded = fold(location)
+    if not folded:
+        return None
+    if folded in LOCATION_REGIONS:
+        return LOCATION_REGIONS[folded]
+
+    match = find_location(folded)
+    return match[1] if match else None
+
+
+@lru_cache(maxsize=4096)
+def resolve_regions(location: str) -> FrozenSet[str]:
+    """
+    Obtener todas las regiones que abarca una ubicación
+
+    Igual que resolve_region(), pero los alias de varias regiones se
+    expanden: 'EMEA' -> {Europe, Asia, Africa}, 'APAC' -> {Asia, Oceania}.
+
+    :param location: Texto de la ubicación
+    :return: Conjunto de regiones (vacío si no se reconoce)
+    """
+    folded = fold(location)
+    if not folded:
+        return frozenset()
+    if folded in REGION_SETS:
+        return REGION_SETS[folded]
+    if folded in LOCATION_REGIONS:
+        return frozenset([LOCATION_REGIONS[folded]])
+
+    match = find_location(folded)
+    if not match:
+        return frozenset()
+    return REGION_SETS.get(match[0], frozenset([match[1]]))
+
+
+def resolve_region_language(text: str) -> Optional[Tuple[str, str]]:
+    """
+    Obtener región e idioma cuando el texto es el nombre de una región ('Europa', 'アジア')
+
+    :return: (región, código de idioma) o None
+    """
+    return REGION_LANGUAGES.get(fold(text))
+
+
+def resolve_candidate_region(candidate: dict) -> Optional[str]:
+    """
+    Obtener la región de un candidato de Zoho a partir de Country y, si no, de City
+
+    :param candidate: Candidato de Zoho
+    :return: Nombre de la región o None si no se reconoce
+    """
+    return resolve_region(candidate.get('Country') or '') or resolve_region(candidate.get('City') or '')
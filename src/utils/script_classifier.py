@@ -0,0 +1,205 @@
+import re
+from bisect import bisect_right
+from typing import Dict, List
+
+# Tablas de rangos de codepoints (inicio, fin, script), ordenadas por inicio
+SCRIPT_RANGES = [
+    (0x00C0, 0x00D6, 'latin'),
+    (0x00D8, 0x00F6, 'latin'),
+    (0x00F8, 0x024F, 'latin'),
+    (0x0370, 0x03FF, 'greek'),
+    (0x0400, 0x052F, 'cyrillic'),
+    (0x0530, 0x058F, 'armenian'),
+    (0x0590, 0x05FF, 'hebrew'),
+    (0x0600, 0x06FF, 'arabic'),
+    (0x0750, 0x077F, 'arabic'),
+    (0x08A0, 0x08FF, 'arabic'),
+    (0x0900, 0x097F, 'devanagari'),
+    (0x0E00, 0x0E7F, 'thai'),
+    (0x10A0, 0x10FF, 'georgian'),
+    (0x1100, 0x11FF, 'hangul'),
+    (0x1E00, 0x1EFF, 'latin'),
+    (0x1F00, 0x1FFF, 'greek'),
+    (0x3040, 0x309F, 'hiragana'),
+    (0x30A0, 0x30FF, 'katakana'),
+    (0x3130, 0x318F, 'hangul'),
+    (0x31F0, 0x31FF, 'katakana'),
+    (0x3400, 0x4DBF, 'han'),
+    (0x4E00, 0x9FFF, 'han'),
+    (0xAC00, 0xD7AF, 'hangul'),
+    (0xF900, 0xFAFF, 'han'),
+    (0xFB1D, 0xFB4F, 'hebrew'),
+    (0xFB50, 0xFDFF, 'arabic'),
+    (0xFE70, 0xFEFF, 'arabic'),
+    (0xFF10, 0xFF19, 'digit'),
+    (0xFF21, 0xFF3A, 'latin'),
+    (0xFF41, 0xFF5A, 'latin'),
+    (0xFF66, 0xFF9F, 'katakana'),
+]
+_RANGE_STARTS = [start for start, _, _ in SCRIPT_RANGES]
+_RANGE_ENDS = [end for _, end, _ in SCRIPT_RANGES]
+_RANGE_SCRIPTS = [script for _, _, script in SCRIPT_RANGES]
+
+RTL_SCRIPTS = frozenset(['hebrew', 'arabic'])
+# Categorías que no son un sistema de escritura
+NON_SCRIPT_CATEGORIES = frozenset(['digit', 'separator', 'space', 'symbol', 'other'])
+
+# Bloques demasiado grandes para expandirlos carácter a carácter: el idioma
+# se decide una vez por bloque (p. ej. todo el bloque han es 'zh')
+_BLOCK_THRESHOLD = 0x1000
+
+
+def _ascii_category(code: int) -> str:
+    char = chr(code)
+    if char.isalpha():
+        return 'latin'
+    if char.isdigit():
+        return 'digit'
+    if char in '._-':
+        return 'separator'
+    if char.isspace():
+        return 'space'
+    return 'symbol'
+
+
+_ASCII_SCRIPTS = [_ascii_category(code) for code in range(128)]
+
+
+def script_of(char: str) -> str:
+    """
+    Script de un carácter ('latin', 'cyrillic', 'han'...) o categoría
+    ('digit', 'separator', 'space', 'symbol', 'other')
+    """
+    code = ord(char)
+    if code < 128:
+        return _ASCII_SCRIPTS[code]
+    index = bisect_right(_RANGE_STARTS, code) - 1
+    if index >= 0 and code <= _RANGE_ENDS[index]:
+        return _RANGE_SCRIPTS[index]
+    if char.isspace():
+        return 'space'
+    if char.isalnum():
+        return 'other'
+    return 'symbol'
+
+
+class ScriptProfile:
+    """Resultado de clasificar un texto: histograma de scripts, dirección e idiomas candidatos"""
+
+    __slots__ = ('histogram', 'languages', 'rtl', 'ltr', 'length', '_order')
+
+    def __init__(self, histogram, languages, rtl, ltr, length, order):
+        self.histogram = histogram
+        self.languages = languages
+        self.rtl = rtl
+        self.ltr = ltr
+        self.length = length
+        self._order = order
+
+    @property
+    def has_rtl(self) -> bool:
+        return self.rtl > 0
+
+    @property
+    def has_ltr(self) -> bool:
+        return self.ltr > 0
+
+    @property
+    def is_mixed_direction(self) -> bool:
+        return self.rtl > 0 and self.ltr > 0
+
+    @property
+    def scripts(self) -> List[str]:
+        """Scripts presentes, del más al menos frecuente"""
+        return sorted(
+            (name for name in self.histogram if name not in NON_SCRIPT_CATEGORIES),
+            key=lambda name: -self.histogram[name]
+        )
+
+    @property
+    def dominant_script(self) -> str:
+        scripts = self.scripts
+        return scripts[0] if scripts else 'latin'
+
+    @property
+    def candidate_languages(self) -> List[str]:
+        """Idiomas cuyos caracteres aparecen, por número de caracteres y luego por orden de configuración"""
+        return sorted(self.languages, key=lambda lang: (-self.languages[lang], self._order[lang]))
+
+    def has_language(self, lang: str) -> bool:
+        return lang in self.languages
+
+    def only(self, *categories: str) -> bool:
+        """El texto sólo contiene las categorías o scripts indicados"""
+        return bool(self.histogram) and all(name in categories for name in self.histogram)
+
+
+class ScriptClassifier:
+    """
+    Clasificador de scripts e idiomas en una sola pasada
+
+    Los patrones de idioma (clases de caracteres como '[áéíóúñ]' o
+    '[\\u0600-\\u06FF]') se expanden una vez, al construir el clasificador, a
+    una tabla carácter -> idiomas; clasificar un texto es después una
+    búsqueda por carácter (tabla ASCII o bisect sobre los rangos) sin
+    ejecutar ninguna expresión regular.
+    """
+
+    def __init__(self, language_patterns: Dict[str, str]):
+        """
+        :param language_patterns: Idioma -> clase de caracteres (en orden de prioridad)
+        """
+        self.order = {lang: position for position, lang in enumerate(language_patterns)}
+        compiled = [(lang, re.compile(pattern)) for lang, pattern in language_patterns.items()]
+
+        # Muestra con todos los caracteres de los rangos pequeños (y ASCII)
+        sample = ''.join(chr(code) for code in range(128)) + ''.join(
+            chr(code)
+            for start, end, _ in SCRIPT_RANGES if end - start < _BLOCK_THRESHOLD
+            for code in range(start, end + 1)
+        )
+        char_languages = {}
+        for lang, pattern in compiled:
+            for char in set(pattern.findall(sample)):
+                char_languages.setdefault(char, []).append(lang)
+        self.char_languages = {char: tuple(langs) for char, langs in char_languages.items()}
+
+        # Bloques grandes: se decide con su primer carácter
+        self.block_languages = {}
+        for index, (start, end, _) in enumerate(SCRIPT_RANGES):
+            if end - start >= _BLOCK_THRESHOLD:
+                langs = tuple(lang for lang, pattern in compiled if pattern.match(chr(start)))
+                if langs:
+                    self.block_languages[index] = langs
+
+    def classify(self, text: str) -> ScriptProfile:
+        """Recorrer el texto una vez y devolver su perfil de scripts e idiomas"""
+        histogram = {}
+        languages = {}
+        rtl = ltr = 0
+        char_languages = self.char_languages
+
+        for char in text or '':
+            code = ord(char)
+            if code < 128:
+                script = _ASCII_SCRIPTS[code]
+                langs = char_languages.get(char)
+            else:
+                index = bisect_right(_RANGE_STARTS, code) - 1
+                if index >= 0 and code <= _RANGE_ENDS[index]:
+                    script = _RANGE_SCRIPTS[index]
+                    langs = char_languages.get(char) or self.block_languages.get(index)
+                else:
+                    script = script_of(char)
+                    langs = None
+
+            histogram[script] = histogram.get(script, 0) + 1
+            if script in RTL_SCRIPTS:
+                rtl += 1
+            elif script not in NON_SCRIPT_CATEGORIES:
+                ltr += 1
+            if langs:
+                for lang in langs:
+                    languages[lang] = languages.get(lang, 0) + 1
+
+        return ScriptProfile(histogram, languages, rtl, ltr, len(text or ''), self.order)
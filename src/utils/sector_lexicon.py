@@ -0,0 +1,418 @@
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional
+
+from .domain_index import BKTree, typo_distance
+from .regions import fold
+from .script_classifier import script_of
+
+# Sectores con los que trabaja el bot (en el orden en que se muestran)
+SECTORS = [
+    "Technology", "Financial Services", "Manufacturing",
+    "Healthcare", "Retail", "Energy", "Education",
+    "Real Estate", "Transportation", "Media", "Agriculture"
+]
+
+# Términos por sector e idioma. Un '*' final indica prefijo ('tecnolog*'
+# cubre tecnología, tecnológico, tecnologías...)
+SECTOR_TERMS = {
+    "Technology": {
+        'en': ['technology', 'technologies', 'tech', 'it', 'information technology', 'software', 'hardware',
+               'computing', 'computers', 'saas', 'digital', 'internet', 'telecom', 'telecommunications',
+               'ai', 'artificial intelligence', 'cybersecurity', 'semiconductors', 'technolog*'],
+        'es': ['tecnolog*', 'informatica', 'ti', 'telecomunicaciones', 'inteligencia artificial'],
+        'fr': ['technologie', 'informatique', 'numerique', 'telecoms'],
+        'de': ['technologie', 'informationstechnik', 'edv', 'telekommunikation'],
+        'it': ['tecnologia', 'informatica'],
+        'pt': ['tecnologia', 'informatica'],
+        'nl': ['technologie', 'ict'],
+        'ru': ['технологии', 'информационные технологии', 'ит', 'айти', 'технолог*'],
+        'zh': ['科技', '技术', '信息技术', '互联网', '软件'],
+        'ja': ['テクノロジー', '技術', 'ソフトウェア'],
+        'ko': ['기술', '테크', '소프트웨어'],
+        'ar': ['تكنولوجيا', 'التكنولوجيا', 'تقنية'],
+    },
+    "Financial Services": {
+        'en': ['financial services', 'finan*', 'fintech', 'banking', 'bank', 'banks', 'insurance', 'investment',
+               'investments', 'asset management', 'wealth management', 'capital markets'],
+        'es': ['servicios financieros', 'banca', 'banco', 'bancos', 'seguros', 'inversion', 'inversiones'],
+        'fr': ['services financiers', 'banque', 'banques', 'assurance', 'assurances'],
+        'de': ['finanzdienstleistungen', 'banken', 'versicherung', 'versicherungen'],
+        'it': ['servizi finanziari', 'assicurazioni'],
+        'pt': ['servicos financeiros', 'bancario', 'bancaria'],
+        'nl': ['financiele dienstverlening', 'bankwezen', 'verzekeringen'],
+        'ru': ['финанс*', 'банки', 'банковское дело', 'страхование'],
+        'zh': ['金融', '金融服务', '银行', '保险'],
+        'ja': ['銀行', '保険'],
+        'ko': ['금융', '은행', '보험'],
+        'ar': ['الخدمات المالية', 'مالية', 'البنوك'],
+    },
+    "Manufacturing": {
+        'en': ['manufactur*', 'industrial', 'production', 'factory', 'factories'],
+        'es': ['manufactura', 'fabricacion', 'fabricas', 'produccion industrial'],
+        'fr': ['fabrication', 'industrie manufacturiere', 'usines'],
+        'de': ['fertigung', 'herstellung', 'produktion', 'verarbeitendes gewerbe'],
+        'it': ['manifattura', 'manifatturiero', 'produzione'],
+        'pt': ['manufatura', 'fabricacao', 'industria transformadora'],
+        'nl': ['productie', 'maakindustrie'],
+        'ru': ['производство', 'промышленность'],
+        'zh': ['制造', '制造业'],
+        'ja': ['製造', '製造業'],
+        'ko': ['제조', '제조업'],
+        'ar': ['التصنيع', 'صناعة'],
+    },
+    "Healthcare": {
+        'en': ['healthcare', 'health care', 'health', 'medical', 'medicine', 'pharma', 'pharmaceutic*', 'biotech',
+               'biotechnology', 'hospitals', 'life sciences'],
+        'es': ['salud', 'sanidad', 'sanitario', 'medico', 'medicina', 'farmac*', 'hospitales', 'biotecnologia'],
+        'fr': ['sante', 'medical', 'pharmaceutique'],
+        'de': ['gesundheitswesen', 'gesundheit', 'medizin', 'pharmaindustrie'],
+        'it': ['sanita', 'salute', 'farmaceutico'],
+        'pt': ['saude'],
+        'nl': ['gezondheidszorg', 'zorg'],
+        'ru': ['здравоохранение', 'медицина', 'фармацевтика'],
+        'zh': ['医疗', '医疗保健', '医药', '健康'],
+        'ja': ['医療', 'ヘルスケア', '製薬'],
+        'ko': ['의료', '헬스케어', '제약'],
+        'ar': ['الرعاية الصحية', 'الصحة', 'طب'],
+    },
+    "Retail": {
+        'en': ['retail', 'commerce', 'e commerce', 'ecommerce', 'shopping', 'stores', 'consumer goods'],
+        'es': ['comercio', 'comercio minorista', 'venta al por menor', 'minorista', 'tiendas'],
+        'fr': ['commerce de detail', 'vente au detail', 'distribution'],
+        'de': ['einzelhandel', 'handel'],
+        'it': ['vendita al dettaglio', 'commercio'],
+        'pt': ['varejo', 'retalho', 'comercio retalhista'],
+        'nl': ['detailhandel'],
+        'ru': ['розничная торговля', 'ритейл', 'торговля'],
+        'zh': ['零售'],
+        'ja': ['小売', '小売業'],
+        'ko': ['소매', '유통'],
+        'ar': ['التجزئة', 'تجارة التجزئة'],
+    },
+    "Energy": {
+        'en': ['energy', 'oil', 'gas', 'oil and gas', 'electricity', 'utilities', 'renewables',
+               'renewable energy', 'power', 'solar'],
+        'es': ['energia', 'petroleo', 'electricidad', 'renovables', 'energias renovables'],
+        'fr': ['energie', 'petrole'],
+        'de': ['energiewirtschaft', 'strom'],
+        'it': ['energia'],
+        'pt': ['energia'],
+        'nl': ['energie'],
+        'ru': ['энергетика', 'энергия', 'нефть'],
+        'zh': ['能源', '电力'],
+        'ja': ['エネルギー', '電力'],
+        'ko': ['에너지'],
+        'ar': ['الطاقة', 'النفط'],
+    },
+    "Education": {
+        'en': ['education', 'edtech', 'academic', 'schools', 'universities', 'training', 'e learning'],
+        'es': ['educacion', 'ensenanza', 'formacion', 'universidades', 'escuelas'],
+        'fr': ['enseignement', 'formation'],
+        'de': ['bildung', 'bildungswesen', 'ausbildung'],
+        'it': ['istruzione', 'educazione', 'formazione'],
+        'pt': ['educacao', 'ensino'],
+        'nl': ['onderwijs'],
+        'ru': ['образование'],
+        'zh': ['教育'],
+        'ko': ['교육'],
+        'ar': ['التعليم'],
+    },
+    "Real Estate": {
+        'en': ['real estate', 'property', 'properties', 'construction', 'realty', 'proptech'],
+        'es': ['bienes raices', 'inmobiliari*', 'sector inmobiliario', 'construccion'],
+        'fr': ['immobilier'],
+        'de': ['immobilien', 'bauwesen'],
+        'it': ['immobiliare', 'edilizia'],
+        'pt': ['imobiliari*', 'construcao'],
+        'nl': ['vastgoed'],
+        'ru': ['недвижимость', 'строительство'],
+        'zh': ['房地产', '地产', '建筑'],
+        'ja': ['不動産', '建設'],
+        'ko': ['부동산', '건설'],
+        'ar': ['العقارات'],
+    },
+    "Transportation": {
+        'en': ['transportation', 'transport', 'logistics', 'shipping', 'freight', 'aviation', 'airlines',
+               'railways', 'mobility', 'supply chain'],
+        'es': ['transporte', 'transportes', 'logistica', 'aviacion'],
+        'fr': ['transports', 'logistique'],
+        'de': ['logistik', 'verkehr'],
+        'it': ['trasporti', 'trasporto'],
+        'pt': ['transporte'],
+        'nl': ['logistiek'],
+        'ru': ['транспорт', 'логистика'],
+        'zh': ['交通', '运输', '物流'],
+        'ja': ['運輸', '物流'],
+        'ko': ['운송', '물류'],
+        'ar': ['النقل', 'الخدمات اللوجستية'],
+    },
+    "Media": {
+        'en': ['media', 'entertainment', 'publishing', 'broadcasting', 'advertising', 'film', 'television',
+               'music', 'news'],
+        'es': ['medios', 'medios de comunicacion', 'entretenimiento', 'publicidad', 'editorial'],
+        'fr': ['medias', 'divertissement', 'edition'],
+        'de': ['medien', 'unterhaltung', 'verlagswesen'],
+        'it': ['intrattenimento', 'editoria'],
+        'pt': ['midia'],
+        'ru': ['медиа', 'сми', 'развлечения'],
+        'zh': ['媒体', '传媒', '娱乐'],
+        'ja': ['メディア', 'エンタメ'],
+        'ko': ['미디어', '엔터테인먼트'],
+        'ar': ['الإعلام', 'وسائل الإعلام'],
+    },
+    "Agriculture": {
+        'en': ['agriculture', 'farming', 'agribusiness', 'agtech', 'food production', 'agrifood'],
+        'es': ['agricultura', 'agropecuario', 'agroindustria', 'ganaderia'],
+        'fr': ['agroalimentaire'],
+        'de': ['landwirtschaft', 'agrar'],
+        'it': ['agricoltura'],
+        'pt': ['agronegocio'],
+        'nl': ['landbouw'],
+        'ru': ['сельское хозяйство'],
+        'zh': ['农业'],
+        'ja': ['農業'],
+        'ko': ['농업'],
+        'ar': ['الزراعة'],
+    },
+}
+
+# Nombre del sector para mostrar al usuario, por idioma (sin llamar al traductor)
+SECTOR_DISPLAY_NAMES = {
+    "Technology": {'es': 'Tecnología', 'fr': 'Technologie', 'de': 'Technologie', 'it': 'Tecnologia',
+                   'pt': 'Tecnologia', 'nl': 'Technologie', 'ru': 'Технологии', 'zh': '科技',
+                   'ja': 'テクノロジー', 'ko': '기술', 'ar': 'التكنولوجيا'},
+    "Financial Services": {'es': 'Servicios financieros', 'fr': 'Services financiers',
+                           'de': 'Finanzdienstleistungen', 'it': 'Servizi finanziari',
+                           'pt': 'Serviços financeiros', 'nl': 'Financiële dienstverlening',
+                           'ru': 'Финансовые услуги', 'zh': '金融服务', 'ja': '金融サービス',
+                           'ko': '금융 서비스', 'ar': 'الخدمات المالية'},
+    "Manufacturing": {'es': 'Manufactura', 'fr': 'Industrie manufacturière', 'de': 'Fertigung',
+                      'it': 'Manifattura', 'pt': 'Manufatura', 'nl': 'Maakindustrie', 'ru': 'Производство',
+                      'zh': '制造业', 'ja': '製造業', 'ko': '제조업', 'ar': 'التصنيع'},
+    "Healthcare": {'es': 'Salud', 'fr': 'Santé', 'de': 'Gesundheitswesen', 'it': 'Sanità', 'pt': 'Saúde',
+                   'nl': 'Gezondheidszorg', 'ru': 'Здравоохранение', 'zh': '医疗保健', 'ja': 'ヘルスケア',
+                   'ko': '헬스케어', 'ar': 'الرعاية الصحية'},
+    "Retail": {'es': 'Comercio minorista', 'fr': 'Commerce de détail', 'de': 'Einzelhandel',
+               'it': 'Commercio al dettaglio', 'pt': 'Comércio a retalho', 'nl': 'Detailhandel',
+               'ru': 'Розничная торговля', 'zh': '零售', 'ja': '小売', 'ko': '소매', 'ar': 'تجارة التجزئة'},
+    "Energy": {'es': 'Energía', 'fr': 'Énergie', 'de': 'Energie', 'it': 'Energia', 'pt': 'Energia',
+               'nl': 'Energie', 'ru': 'Энергетика', 'zh': '能源', 'ja': 'エネルギー', 'ko': '에너지',
+               'ar': 'الطاقة'},
+    "Education": {'es': 'Educación', 'fr': 'Éducation', 'de': 'Bildung', 'it': 'Istruzione', 'pt': 'Educação',
+                  'nl': 'Onderwijs', 'ru': 'Образование', 'zh': '教育', 'ja': '教育', 'ko': '교육',
+                  'ar': 'التعليم'},
+    "Real Estate": {'es': 'Bienes raíces', 'fr': 'Immobilier', 'de': 'Immobilien', 'it': 'Immobiliare',
+                    'pt': 'Imobiliário', 'nl': 'Vastgoed', 'ru': 'Недвижимость', 'zh': '房地产', 'ja': '不動産',
+                    'ko': '부동산', 'ar': 'العقارات'},
+    "Transportation": {'es': 'Transporte', 'fr': 'Transport', 'de': 'Transport', 'it': 'Trasporti',
+                       'pt': 'Transporte', 'nl': 'Transport', 'ru': 'Транспорт', 'zh': '交通运输', 'ja': '運輸',
+                       'ko': '운송', 'ar': 'النقل'},
+    "Media": {'es': 'Medios', 'fr': 'Médias', 'de': 'Medien', 'it': 'Media', 'pt': 'Média', 'nl': 'Media',
+              'ru': 'Медиа', 'zh': '媒体', 'ja': 'メディア', 'ko': '미디어', 'ar': 'الإعلام'},
+    "Agriculture": {'es': 'Agricultura', 'fr': 'Agriculture', 'de': 'Landwirtschaft', 'it': 'Agricoltura',
+                    'pt': 'Agricultura', 'nl': 'Landbouw', 'ru': 'Сельское хозяйство', 'zh': '农业', 'ja': '農業',
+                    'ko': '농업', 'ar': 'الزراعة'},
+}
+
+# Confianza de cada tipo de coincidencia
+EXACT_CONFIDENCE = 1.0
+PHRASE_CONFIDENCE = 0.9
+# Frase que no decide por sí sola: términos de varios sectores ('digital media') o
+# palabras del texto sin reconocer ('film production'). Queda por debajo del
+# umbral de 0.7 para que decida el LLM
+PARTIAL_PHRASE_CONFIDENCE = 0.6
+PREFIX_CONFIDENCE = 0.85
+TYPO_CONFIDENCE = {1: 0.8, 2: 0.7}
+
+# Términos muy cortos ('it', 'ai', 'ti') sólo cuentan en textos de dos palabras ('IT sector'),
+# no dentro de frases ('I want it')
+SHORT_TERM_LENGTH = 3
+SHORT_TEXT_WORDS = 2
+# Palabras que acompañan al término sin cambiar su sentido ('tech sector', 'empresas de energía')
+GENERIC_WORDS = frozenset([
+    'sector', 'sectors', 'industry', 'industries', 'field', 'area', 'market', 'business', 'businesses',
+    'company', 'companies', 'firm', 'firms', 'space', 'the', 'and', 'of', 'in',
+    'sectores', 'industria', 'industrias', 'empresa', 'empresas', 'compania', 'companias',
+    'mercado', 'negocio', 'el', 'la', 'los', 'las', 'de', 'del', 'y', 'en',
+    'secteur', 'industrie', 'entreprise', 'entreprises', 'domaine', 'le', 'les', 'des', 'du', 'et',
+    'branche', 'bereich', 'unternehmen', 'der', 'die', 'das', 'im', 'und',
+    'settore', 'aziende', 'azienda', 'il', 'di', 'e', 'setor', 'da', 'do', 'dos', 'das',
+    'сектор', 'отрасль', 'индустрия', 'компании',
+    '行业', '产业', '领域', '公司', '業界', '産業', '業', '分野', '会社', '企業', '산업', '업계', '분야', '회사', '기업',
+])
+# Longitud mínima de una palabra para corregir erratas
+MIN_FUZZY_LENGTH = 5
+_UNSPACED_SCRIPTS = frozenset(['han', 'hiragana', 'katakana', 'hangul', 'thai'])
+
+
+class TermMatch(NamedTuple):
+    value: str
+    confidence: float
+    term: str
+    method: str
+
+
+class TermMatcher:
+    """
+    Índice de términos multilingüe con coincidencia exacta, por frase,
+    por prefijo y con erratas
+
+    Los términos se normalizan una vez con fold(); buscar un texto son
+    consultas a diccionarios (n-gramas de palabras y prefijos) más un BK-tree
+    para las erratas ('technolgy' -> 'technology').
+    """
+
+    def __init__(self, terms: Dict[str, str]):
+        """
+        :param terms: Término -> valor, en orden de prioridad (el primero gana ante duplicados)
+        """
+        self.terms = {}
+        self.prefixes = {}
+        self.unspaced_terms = {}
+        for term, value in terms.items():
+            if term.endswith('*'):
+                self.prefixes.setdefault(fold(term[:-1]), value)
+                continue
+            folded = fold(term)
+            self.terms.setdefault(folded, value)
+            if any(script_of(char) in _UNSPACED_SCRIPTS for char in folded):
+                self.unspaced_terms.setdefault(folded, value)
+
+        self.max_words = max((len(term.split()) for term in self.terms), default=1)
+        self.min_prefix = min((len(prefix) for prefix in self.prefixes), default=0)
+        self.fuzzy_tree = BKTree(
+            term for term in self.terms if ' ' not in term and len(term) >= MIN_FUZZY_LENGTH
+        )
+        self._match_cached = lru_cache(maxsize=4096)(self._match)
+
+    def match(self, text: str) -> Optional[TermMatch]:
+        """
+        Buscar el término que mejor encaja con el texto
+
+        :return: TermMatch(valor, confianza, término, método) o None
+        """
+        folded = fold(text)
+        if not folded:
+            return None
+        return self._match_cached(folded)
+
+    def _match(self, folded: str) -> Optional[TermMatch]:
+        if folded in self.terms:
+            return TermMatch(self.terms[folded], EXACT_CONFIDENCE, folded, 'exact')
+
+        # Frase conocida dentro del texto (la más larga); sólo decide si es la
+        # única lectura y cubre el texto salvo palabras genéricas
+        phrases = self._outermost(self._phrases(folded))
+        if phrases:
+            term, value = phrases[0]
+            decisive = len({phrase_value for _, phrase_value in phrases}) == 1 and \
+                self._covers(folded, [phrase for phrase, _ in phrases])
+            return TermMatch(value, PHRASE_CONFIDENCE if decisive else PARTIAL_PHRASE_CONFIDENCE, term, 'phrase')
+
+        tokens = folded.split()
+
+        # Prefijos ('tecnológicas' -> 'tecnolog')
+        for token in tokens:
+            for length in range(len(token), self.min_prefix - 1 if self.min_prefix else len(token), -1):
+                value = self.prefixes.get(token[:length])
+                if value:
+                    return TermMatch(value, PREFIX_CONFIDENCE, token[:length], 'prefix')
+
+        # Erratas, de menor a mayor distancia
+        best = None
+        for token in tokens:
+            if len(token) < MIN_FUZZY_LENGTH:
+                continue
+            max_typos = 2 if len(token) >= 8 else 1
+            # Una transposición cuesta 2 en Levenshtein y 1 en typo_distance
+            for _, candidate in self.fuzzy_tree.search(token, max_typos + 1):
+                distance = typo_distance(token, candidate)
+                if distance <= max_typos and (best is None or distance < best[0]):
+                    best = (distance, candidate)
+        if best:
+            distance, candidate = best
+            return TermMatch(self.terms[candidate], TYPO_CONFIDENCE[distance], candidate, 'typo')
+
+        return None
+
+    @staticmethod
+    def _outermost(phrases):
+        """Frases de más larga a más corta, sin las contenidas en otra ya elegida"""
+        selected = []
+        for term, value in sorted(set(phrases), key=lambda phrase: (-len(phrase[0]), phrase[0])):
+            if not any(term in chosen for chosen, _ in selected):
+                selected.append((term, value))
+        return selected
+
+    @staticmethod
+    def _covers(folded: str, terms) -> bool:
+        """El texto no tiene más palabras que los términos y las palabras genéricas"""
+        rest = f" {folded} "
+        for term in terms:
+            rest = rest.replace(f" {term} ", " ") if f" {term} " in rest else rest.replace(term, " ")
+        return all(word in GENERIC_WORDS for word in rest.split())
+
+    def _phrases(self, folded: str):
+        """Términos que aparecen como n-gramas de palabras (o subcadenas en CJK)"""
+        tokens = folded.split()
+        allow_short = len(tokens) <= SHORT_TEXT_WORDS
+        for size in range(min(self.max_words, len(tokens)), 0, -1):
+            for start in range(len(tokens) - size + 1):
+                phrase = ' '.join(tokens[start:start + size])
+                value = self.terms.get(phrase)
+                if value and (allow_short or len(phrase) > SHORT_TERM_LENGTH):
+                    yield phrase, value
+        for term, value in self.unspaced_terms.items():
+            if term in folded:
+                yield term, value
+
+
+def _build_sector_terms():
+    terms = {}
+    for sector in SECTORS:
+        terms.setdefault(sector, sector)
+    for sector, translations in SECTOR_TERMS.items():
+        for names in translations.values():
+            for name in names:
+                terms.setdefault(name, sector)
+    return terms
+
+
+SECTOR_MATCHER = TermMatcher(_build_sector_terms())
+
+
+def match_sector(text: str) -> Optional[TermMatch]:
+    """
+    Identificar el sector de un texto en cualquiera de los idiomas soportados
+
+    'tecnología' -> Technology (1.0), 'logistique' -> Transportation (1.0),
+    'empresas farmacéuticas' -> Healthcare (0.85), 'technolgy' -> Technology (0.8)
+
+    :param text: Texto del usuario
+    :return: TermMatch con el sector en inglés, o None
+    """
+    return SECTOR_MATCHER.match(text)
+
+
+def language_code(language: str) -> str:
+    """'es-ES' -> 'es'"""
+    return (language or 'en').split('-')[0].lower()
+
+
+def sector_display_name(sector: str, language: str) -> Optional[str]:
+    """
+    Nombre del sector en el idioma del usuario
+
+    :return: Nombre traducido, el nombre en inglés para 'en', o None si el
+             idioma no tiene traducción precalculada
+    """
+    code = language_code(language)
+    if code == 'en':
+        return sector
+    return SECTOR_DISPLAY_NAMES.get(sector, {}).get(code)
+
+
+def sectors_display_list(language: str, sectors: List[str] = None) -> Optional[str]:
+    """Lista de sectores separada por comas en el idioma del usuario (None si falta alguna traducción)"""
+    names = [sector_display_name(sector, language) for sector in (sectors or SECTORS)]
+    return None if None in names else ", ".join(names)
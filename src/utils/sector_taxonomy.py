@@ -0,0 +1,376 @@
+from typing import Optional
+
+from .sector_lexicon import TermMatch, TermMatcher
+
+# Áreas específicas por sector: nombre estandarizado -> palabras clave en
+# varios idiomas ('*' final = prefijo). El nombre del área también cuenta
+# como palabra clave.
+SECTOR_AREAS = {
+    "Technology": {
+        "Software Development": [
+            'software', 'software development', 'programming', 'development', 'app', 'apps', 'mobile',
+            'mobile apps', 'web', 'web development', 'saas', 'platform', 'platforms',
+            'desarrollo de software', 'desarrollo', 'programacion', 'aplicaciones', 'developpement logiciel',
+            'logiciel', 'softwareentwicklung', 'sviluppo software', 'desenvolvimento de software',
+            'разработка программного обеспечения', '软件开发', 'ソフトウェア開発', '소프트웨어 개발',
+        ],
+        "Cybersecurity": [
+            'cyber security', 'cyber', 'security', 'infosec', 'ciberseguridad', 'seguridad informatica',
+            'cybersecurite', 'cybersicherheit', 'sicurezza informatica', 'ciberseguranca', 'кибербезопасность',
+            '网络安全', 'サイバーセキュリティ', '사이버 보안',
+        ],
+        "Cloud Computing": [
+            'cloud', 'devops', 'infrastructure', 'nube', 'computacion en la nube', 'informatique en nuage',
+            'nuvem', 'облачные вычисления', '云计算', 'クラウド', '클라우드',
+        ],
+        "Artificial Intelligence": [
+            'ai', 'machine learning', 'ml', 'deep learning', 'generative ai', 'ia', 'inteligencia artificial',
+            'intelligence artificielle', 'kunstliche intelligenz', 'ki', 'intelligenza artificiale',
+            'искусственный интеллект', 'ии', '人工智能', '人工知能', '인공지능',
+        ],
+        "Data & Analytics": [
+            'data', 'big data', 'analytics', 'data analytics', 'data science', 'business intelligence', 'bi',
+            'datos', 'analitica', 'donnees', 'daten', 'dati', 'dados', 'данные', '数据', 'データ', '데이터',
+        ],
+        "Hardware & Semiconductors": [
+            'hardware', 'semiconductors', 'chips', 'semiconductores', 'puces', 'halbleiter', 'semiconduttori',
+            'полупроводники', '半导体', '半導体', '반도체',
+        ],
+        "Telecommunications": [
+            'telecom', 'telecoms', 'network', 'networks', '5g', 'telecomunicaciones', 'redes', 'telekommunikation',
+            'telecomunicazioni', 'телеком', '电信', '通信', '통신',
+        ],
+        "IT Services": [
+            'it', 'it services', 'consulting', 'it consulting', 'outsourcing', 'digital', 'digital transformation',
+            'internet', 'computing', 'computer', 'computers', 'tech', 'servicios ti', 'consultoria',
+            'transformacion digital', 'services informatiques', 'it dienstleistungen',
+        ],
+    },
+    "Financial Services": {
+        "Banking": [
+            'bank', 'banks', 'banking', 'retail banking', 'banca', 'banco', 'bancos', 'banque', 'banken',
+            'банк*', '银行', '銀行', '은행',
+        ],
+        "Insurance": [
+            'insurtech', 'reinsurance', 'seguros', 'aseguradoras', 'assurance', 'assurances', 'versicherung*',
+            'assicurazion*', 'страхование', '保险', '保険', '보험',
+        ],
+        "Investment": [
+            'invest*', 'investment banking', 'private equity', 'venture capital', 'trading', 'capital markets',
+            'stock', 'stocks', 'equity', 'bonds', 'broker', 'brokerage', 'fund', 'funds', 'hedge funds',
+            'inversion', 'inversiones', 'bolsa', 'fondos', 'capital riesgo', 'инвестиции', '投资', '投資', '투자',
+        ],
+        "Wealth Management": [
+            'wealth', 'asset management', 'private banking', 'gestion patrimonial', 'gestion de activos',
+            'gestion de patrimoine', 'vermogensverwaltung', 'gestione patrimoniale', 'управление активами',
+            '资产管理', '資産運用', '자산관리',
+        ],
+        "Payments & Fintech": [
+            'payments', 'payment', 'fintech', 'crypto', 'cryptocurrency', 'blockchain', 'money', 'pagos',
+            'criptomonedas', 'paiements', 'zahlungen', 'pagamenti', 'pagamentos', 'платежи', '支付', '決済',
+            '결제',
+        ],
+        "Lending & Credit": [
+            'credit', 'loan', 'loans', 'lending', 'mortgage', 'mortgages', 'credito', 'creditos', 'prestamos',
+            'hipotecas', 'pret', 'prets', 'kredit*', 'кредит*', '贷款', '융자',
+        ],
+        "Accounting & Tax": [
+            'accounting', 'tax', 'taxes', 'audit', 'contabilidad', 'impuestos', 'auditoria', 'comptabilite',
+            'buchhaltung', 'steuer*', 'contabilita', 'бухгалтерия', '会计', '会計', '회계',
+        ],
+    },
+    "Manufacturing": {
+        "Automotive": [
+            'automotive', 'cars', 'automobile', 'vehicles', 'electric vehicles', 'ev', 'automotriz',
+            'automocion', 'automobil*', 'autoindustrie', 'automobilistico', 'automotivo', 'автомобил*', '汽车',
+            '自動車', '자동차',
+        ],
+        "Electronics": [
+            'electronics', 'electronica', 'electronique', 'elektronik', 'elettronica', 'eletronica', 'электроника',
+            '电子', 'エレクトロニクス', '전자',
+        ],
+        "Textiles": [
+            'textile', 'apparel manufacturing', 'textil', 'textiles', 'textilindustrie', 'tessile', 'текстиль',
+            '纺织', '繊維', '섬유',
+        ],
+        "Food Processing": [
+            'food', 'beverages', 'alimentos', 'alimentaria', 'bebidas', 'agroalimentaire', 'lebensmittel',
+            'alimentare', 'пищев*', '食品', '식품',
+        ],
+        "Aerospace & Defense": [
+            'aerospace', 'defense', 'defence', 'aeroespacial', 'defensa', 'aeronautique', 'luft und raumfahrt',
+            'aerospaziale', 'аэрокосмическ*', '航空航天', '航空宇宙', '항공우주',
+        ],
+        "Chemicals": [
+            'chemicals', 'chemical', 'quimica', 'quimicos', 'chimie', 'chemie', 'chimica', 'химическ*', '化工',
+            '化学', '화학',
+        ],
+        "Industrial Machinery": [
+            'machinery', 'industrial equipment', 'maquinaria', 'machines', 'maschinenbau', 'macchinari',
+            'оборудование', '机械', '機械', '기계',
+        ],
+        "Metals & Materials": [
+            'steel', 'metals', 'materials', 'plastics', 'acero', 'metales', 'acier', 'stahl', 'acciaio', 'сталь',
+            '钢铁', '鉄鋼', '철강',
+        ],
+    },
+    "Healthcare": {
+        "Pharmaceuticals": [
+            'pharma', 'pharmaceutic*', 'drugs', 'farmac*', 'medicamentos', 'pharmazie', 'arzneimittel',
+            'фармацевтика', '制药', '製薬', '제약',
+        ],
+        "Medical Devices": [
+            'medtech', 'dispositivos medicos', 'dispositifs medicaux', 'medizintechnik', 'dispositivi medici',
+            'медицинские изделия', '医疗器械', '医療機器', '의료기기',
+        ],
+        "Healthcare IT": [
+            'health it', 'digital health', 'health tech', 'healthtech', 'telemedicine', 'telehealth',
+            'salud digital', 'telemedicina', 'e sante', 'digitale gesundheit', 'телемедицина', '数字医疗',
+            '医療it', '디지털 헬스',
+        ],
+        "Biotechnology": [
+            'biotech', 'life sciences', 'genomics', 'biotecnologia', 'biotechnologie', 'биотехнологии',
+            '生物技术', 'バイオテクノロジー', '바이오',
+        ],
+        "Hospitals & Care Providers": [
+            'hospitals', 'hospital', 'clinics', 'clinic', 'care', 'patient care', 'nursing', 'elderly care',
+            'hospitales', 'clinicas', 'hopitaux', 'kliniken', 'krankenhaus*', 'ospedali', 'больницы', '医院',
+            '病院', '병원',
+        ],
+        "Diagnostics": [
+            'diagnostics', 'laboratory', 'labs', 'diagnostico', 'laboratorios', 'diagnostic', 'diagnostik',
+            'диагностика', '诊断', '診断', '진단',
+        ],
+    },
+    "Retail": {
+        "E-commerce": [
+            'e commerce', 'ecommerce', 'online retail', 'online shopping', 'marketplace', 'comercio electronico',
+            'tienda online', 'commerce en ligne', 'onlinehandel', 'commercio elettronico', 'comercio eletronico',
+            'интернет торговля', '电商', '电子商务', 'eコマース', '전자상거래',
+        ],
+        "Fashion": [
+            'apparel', 'clothing', 'luxury', 'moda', 'ropa', 'lujo', 'mode', 'vetements', 'luxe', 'bekleidung',
+            'abbigliamento', 'мода', '时尚', 'ファッション', '패션',
+        ],
+        "Grocery": [
+            'groceries', 'supermarkets', 'supermarket', 'supermercados', 'alimentacion', 'supermarches',
+            'lebensmittelhandel', 'supermercati', 'супермаркеты', '超市', 'スーパー', '슈퍼마켓',
+        ],
+        "Consumer Electronics": [
+            'electronica de consumo', 'electronique grand public', 'unterhaltungselektronik', '消费电子', '家電',
+            '가전',
+        ],
+        "Home & Furniture": [
+            'furniture', 'home improvement', 'muebles', 'mobilier', 'mobel', 'arredamento', 'мебель', '家具',
+        ],
+        "Beauty & Personal Care": [
+            'beauty', 'cosmetics', 'personal care', 'belleza', 'cosmeticos', 'beaute', 'cosmetiques', 'kosmetik',
+            'bellezza', 'косметика', '美妆', '化粧品', '화장품',
+        ],
+    },
+    "Energy": {
+        "Renewable Energy": [
+            'renewable', 'renewables', 'solar', 'wind', 'clean energy', 'green energy', 'energias renovables',
+            'renovables', 'eolica', 'energie renouvelable', 'erneuerbare energien', 'rinnovabili', 'renovaveis',
+            'возобновляем*', '可再生能源', '再生可能エネルギー', '재생에너지',
+        ],
+        "Oil & Gas": [
+            'oil', 'gas', 'oil and gas', 'petroleum', 'upstream', 'downstream', 'petroleo', 'petroleo y gas',
+            'petrole', 'erdol', 'erdgas', 'petrolio', 'нефть', 'газ', 'нефтегаз*', '石油', '石油天然气', '석유',
+        ],
+        "Utilities": [
+            'electricity', 'power', 'grid', 'water', 'electricidad', 'servicios publicos', 'electricite',
+            'stadtwerke', 'versorger', 'strom', 'электроэнергетика', '电力', '電力', '전력',
+        ],
+        "Energy Storage": [
+            'batteries', 'battery', 'hydrogen', 'almacenamiento de energia', 'baterias', 'hidrogeno', 'hydrogene',
+            'batterien', 'wasserstoff', 'batterie', 'аккумулятор*', '储能', '蓄電', '배터리',
+        ],
+        "Nuclear": [
+            'nuclear', 'nuclear energy', 'nuclear power', 'energia nuclear', 'nucleaire', 'kernenergie',
+            'атомн*', '核电', '原子力', '원자력',
+        ],
+    },
+    "Education": {
+        "K-12": [
+            'k 12', 'k12', 'primary school', 'secondary school', 'high school', 'schools', 'school', 'colegios',
+            'escuelas', 'primaria', 'secundaria', 'ecoles', 'schulen', 'scuole', 'escolas', 'школы', '中小学',
+            '学校', '학교',
+        ],
+        "Higher Education": [
+            'university', 'universities', 'college', 'educacion superior', 'universidades', 'universidad',
+            'enseignement superieur', 'universite', 'hochschule', 'universitat', 'universita', 'universidade',
+            'университет*', '高等教育', '大学', '대학',
+        ],
+        "EdTech": [
+            'e learning', 'elearning', 'online learning', 'online education', 'educational technology',
+            'educacion online', 'formacion online', 'tecnologia educativa', '在线教育', '에듀테크',
+        ],
+        "Professional Training": [
+            'corporate training', 'training', 'upskilling', 'certification', 'formacion profesional',
+            'capacitacion', 'formation professionnelle', 'weiterbildung', 'formazione professionale',
+            '职业培训', '研修',
+        ],
+        "Language Learning": [
+            'languages', 'idiomas', 'langues', 'sprachen', 'lingue', '语言学习', '語学', '어학',
+        ],
+    },
+    "Real Estate": {
+        "Commercial": [
+            'commercial real estate', 'offices', 'office space', 'retail space', 'industrial real estate',
+            'inmobiliario comercial', 'oficinas', 'locales comerciales', 'immobilier commercial', 'bureaux',
+            'gewerbeimmobilien', 'коммерческая недвижимость', '商业地产',
+        ],
+        "Residential": [
+            'housing', 'homes', 'apartments', 'residencial', 'vivienda', 'viviendas', 'residentiel', 'logement',
+            'wohnimmobilien', 'wohnungen', 'residenziale', 'жилая недвижимость', '住宅', '주거',
+        ],
+        "Property Management": [
+            'facility management', 'facilities', 'gestion de propiedades', 'administracion de fincas',
+            'gestion immobiliere', 'hausverwaltung', 'управление недвижимостью', '物业管理',
+        ],
+        "Development": [
+            'real estate development', 'property development', 'construction', 'desarrollo inmobiliario',
+            'promocion inmobiliaria', 'construccion', 'promotion immobiliere', 'projektentwicklung', 'bau',
+            'строительство', '开发', '建設', '건설',
+        ],
+        "Real Estate Investment": [
+            'reit', 'reits', 'inversion inmobiliaria', 'investissement immobilier', 'immobilieninvestment',
+        ],
+        "PropTech": [],
+    },
+    "Transportation": {
+        "Logistics": [
+            'supply chain', 'warehousing', 'freight', 'last mile', 'courier', 'parcel', 'logistica',
+            'cadena de suministro', 'almacenes', 'logistique', 'logistik', 'lieferkette', 'логистика', '物流',
+            '물류',
+        ],
+        "Aviation": [
+            'airlines', 'airline', 'airports', 'aviacion', 'aerolineas', 'aeropuertos', 'compagnies aeriennes',
+            'luftfahrt', 'aviazione', 'авиация', '航空', '항공',
+        ],
+        "Maritime": [
+            'shipping', 'ports', 'marine', 'maritimo', 'transporte maritimo', 'puertos', 'naval', 'schifffahrt',
+            'hafen', 'marittimo', 'морск*', '海运', '海運', '해운',
+        ],
+        "Railways": [
+            'railway', 'rail', 'trains', 'ferrocarril', 'ferrocarriles', 'trenes', 'ferroviaire', 'bahn',
+            'eisenbahn', 'ferroviario', 'железн*', '铁路', '鉄道', '철도',
+        ],
+        "Road Transport & Mobility": [
+            'trucking', 'road freight', 'mobility', 'ride sharing', 'public transport', 'fleet',
+            'transporte por carretera', 'movilidad', 'transporte publico', 'flotas', 'mobilite', 'mobilitat',
+            'mobilita', '出行',
+        ],
+    },
+    "Media": {
+        "Digital Media": [
+            'online media', 'streaming', 'content', 'medios digitales', 'contenido digital', 'medias numeriques',
+            'digitale medien', 'цифровые медиа', '数字媒体',
+        ],
+        "Publishing": [
+            'books', 'magazines', 'newspapers', 'editorial', 'editoriales', 'libros', 'revistas', 'periodicos',
+            'edition', 'presse', 'verlag*', 'editoria', 'издательств*', '出版', '출판',
+        ],
+        "Broadcasting": [
+            'television', 'tv', 'radio', 'radiodifusion', 'audiovisual', 'rundfunk', 'fernsehen', 'televisione',
+            'телевидение', '广播', '放送', '방송',
+        ],
+        "Social Media": [
+            'social networks', 'social network', 'influencer*', 'redes sociales', 'reseaux sociaux',
+            'soziale medien', 'социальные сети', '社交媒体', 'ソーシャルメディア', '소셜 미디어',
+        ],
+        "Advertising & Marketing": [
+            'advertising', 'marketing', 'adtech', 'publicidad', 'mercadotecnia', 'publicite', 'werbung',
+            'pubblicita', 'реклама', '广告', '広告', '광고',
+        ],
+        "Entertainment": [
+            'film', 'movies', 'cinema', 'music', 'gaming', 'video games', 'entretenimiento', 'cine', 'musica',
+            'videojuegos', 'divertissement', 'jeux video', 'unterhaltung', 'musik', 'intrattenimento',
+            'развлечения', '娱乐', 'エンタメ', '게임',
+        ],
+    },
+    "Agriculture": {
+        "Crop Production": [
+            'crop', 'crops', 'farming', 'grains', 'cultivos', 'cereales', 'cultures', 'ackerbau', 'coltivazioni',
+            'растениеводство', '种植',
+        ],
+        "Livestock": [
+            'cattle', 'dairy', 'poultry', 'ganaderia', 'ganado', 'lacteos', 'elevage', 'viehzucht', 'tierhaltung',
+            'allevamento', 'pecuaria', 'животноводство', '畜牧',
+        ],
+        "AgTech": [
+            'agritech', 'precision agriculture', 'smart farming', 'agricultura de precision',
+            'agriculture de precision', '农业科技',
+        ],
+        "Food Processing": [
+            'agrifood', 'agroindustria', 'agroalimentaire', 'procesamiento de alimentos',
+            'lebensmittelverarbeitung', '食品加工',
+        ],
+        "Forestry & Fisheries": [
+            'forestry', 'fishing', 'fisheries', 'aquaculture', 'silvicultura', 'pesca', 'acuicultura',
+            'sylviculture', 'peche', 'forstwirtschaft', 'fischerei', '渔业',
+        ],
+        "Agricultural Inputs": [
+            'fertilizers', 'seeds', 'agrochemicals', 'fertilizantes', 'semillas', 'engrais', 'semences', 'dunger',
+            'saatgut',
+        ],
+    },
+}
+
+# Ejemplos de áreas específicas por sector para los mensajes de error
+SECTOR_AREA_EXAMPLES = {
+    "Technology": "Software Development, Cybersecurity, Cloud Computing, AI",
+    "Financial Services": "Banking, Insurance, Investment, Wealth Management",
+    "Manufacturing": "Automotive, Electronics, Textiles, Food Processing",
+    "Healthcare": "Pharmaceuticals, Medical Devices, Healthcare IT, Biotechnology",
+    "Retail": "E-commerce, Fashion, Grocery, Consumer Electronics",
+    "Energy": "Renewable Energy, Oil & Gas, Utilities, Energy Storage",
+    "Education": "K-12, Higher Education, EdTech, Professional Training",
+    "Real Estate": "Commercial, Residential, Property Management, Development",
+    "Transportation": "Logistics, Aviation, Maritime, Railways",
+    "Media": "Digital Media, Publishing, Broadcasting, Social Media",
+    "Agriculture": "Crop Production, Livestock, AgTech, Food Processing"
+}
+
+# Confianza mínima para aceptar un área sin consultar al LLM
+MIN_AREA_CONFIDENCE = 0.7
+
+
+def _build_area_matchers():
+    """Un índice invertido por sector: palabra clave normalizada -> área estandarizada"""
+    matchers = {}
+    for sector, areas in SECTOR_AREAS.items():
+        terms = {}
+        for area in areas:
+            terms.setdefault(area, area)
+        for area, keywords in areas.items():
+            for keyword in keywords:
+                terms.setdefault(keyword, area)
+        matchers[sector] = TermMatcher(terms)
+    return matchers
+
+
+AREA_MATCHERS = _build_area_matchers()
+
+
+def match_specific_area(sector: str, specific_area: str) -> Optional[TermMatch]:
+    """
+    Estandarizar un área específica dentro de un sector sin llamar al LLM
+
+    'ciberseguridad' en Technology -> Cybersecurity, 'fintech' en
+    Financial Services -> Payments & Fintech. El resultado queda en caché por
+    (sector, área normalizada).
+
+    :param sector: Sector en inglés ya validado
+    :param specific_area: Texto del usuario
+    :return: TermMatch con el nombre estandarizado del área, o None si el
+             sector no tiene taxonomía o el área no se reconoce con confianza
+    """
+    matcher = AREA_MATCHERS.get(sector)
+    if not matcher:
+        return None
+    match = matcher.match(specific_area)
+    if match and match.confidence >= MIN_AREA_CONFIDENCE:
+        return match
+    return None
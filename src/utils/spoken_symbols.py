@@ -0,0 +1,208 @@
+import re
+import unicodedata
+from typing import Dict
+
+# Mapeo mejorado de símbolos por idioma (COMPLETO)
+SYMBOL_MAPPING = {
+    '.': {
+        'es': ['punto', 'puntos', 'dot'],
+        'en': ['dot', 'point', 'period', 'full stop'],
+        'fr': ['point', 'points'],
+        'de': ['punkt'],
+        'it': ['punto'],
+        'pt': ['ponto'],
+        'ru': ['точка', 'точки'],
+        'ja': ['テン', 'ドット'],
+        'zh': ['点', '點', 'dian'],
+        'ko': ['점', '닷']
+    },
+    '_': {
+        'es': ['guion bajo', 'subrayado', 'subraya'],
+        'en': ['underscore', 'underline'],
+        'fr': ['souligne', 'soulignement'],
+        'de': ['unterstrich'],
+        'it': ['sottolineato', 'sottolineatura'],
+        'pt': ['sublinhado'],
+        'ru': ['подчеркивание', 'нижнее подчеркивание'],
+        'ja': ['アンダースコア', 'アンダーバー'],
+        'zh': ['下划线', '底線'],
+        'ko': ['밑줄']
+    },
+    '-': {
+        'es': ['guion', 'raya', 'menos'],
+        'en': ['hyphen', 'dash', 'minus'],
+        'fr': ['tiret', 'trait'],
+        'de': ['bindestrich', 'strich'],
+        'it': ['trattino', 'tratto'],
+        'pt': ['hífen', 'traço'],
+        'ru': ['дефис', 'тире'],
+        'ja': ['ハイフン'],
+        'zh': ['连字符', '破折号'],
+        'ko': ['하이픈', '대시']
+    },
+    '@': {
+        'es': ['arroba', 'at'],
+        'en': ['at', 'at sign'],
+        'fr': ['arobase', 'at'],
+        'de': ['at', 'klammeraffe'],
+        'it': ['chiocciola'],
+        'pt': ['arroba'],
+        'ru': ['собака', 'собачка'],
+        'ja': ['アット', 'アットマーク'],
+        'zh': ['艾特', '@符号'],
+        'ko': ['골뱅이']
+    }
+}
+
+# Nuevo mapa de transliteración completo
+TRANSLITERATION_MAP = {
+    'russian': {
+        'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'д': 'd', 'е': 'e', 'ё': 'yo',
+        'ж': 'zh', 'з': 'z', 'и': 'i', 'й': 'y', 'к': 'k', 'л': 'l', 'м': 'm',
+        'н': 'n', 'о': 'o', 'п': 'p', 'р': 'r', 'с': 's', 'т': 't', 'у': 'u',
+        'ф': 'f', 'х': 'h', 'ц': 'ts', 'ч': 'ch', 'ш': 'sh', 'щ': 'sch',
+        'ъ': '', 'ы': 'y', 'ь': '', 'э': 'e', 'ю': 'yu', 'я': 'ya',
+        'А': 'a', 'Б': 'b', 'В': 'v', 'Г': 'g', 'Д': 'd', 'Е': 'e', 'Ё': 'yo',
+        'Ж': 'zh', 'З': 'z', 'И': 'i', 'Й': 'y', 'К': 'k', 'Л': 'l', 'М': 'm',
+        'Н': 'n', 'О': 'o', 'П': 'p', 'Р': 'r', 'С': 's', 'Т': 't', 'У': 'u',
+        'Ф': 'f', 'Х': 'h', 'Ц': 'ts', 'Ч': 'ch', 'Ш': 'sh', 'Щ': 'sch',
+        'Ъ': '', 'Ы': 'y', 'Ь': '', 'Э': 'e', 'Ю': 'yu', 'Я': 'ya'
+    },
+    'japanese': {
+        'あ': 'a', 'い': 'i', 'う': 'u', 'え': 'e', 'お': 'o',
+        'か': 'ka', 'き': 'ki', 'く': 'ku', 'け': 'ke', 'こ': 'ko',
+        'さ': 'sa', 'し': 'shi', 'す': 'su', 'せ': 'se', 'そ': 'so',
+        'た': 'ta', 'ち': 'chi', 'つ': 'tsu', 'て': 'te', 'と': 'to',
+        'な': 'na', 'に': 'ni', 'ぬ': 'nu', 'ね': 'ne', 'の': 'no',
+        'は': 'ha', 'ひ': 'hi', 'ふ': 'fu', 'へ': 'he', 'ほ': 'ho',
+        'ま': 'ma', 'み': 'mi', 'む': 'mu', 'め': 'me', 'も': 'mo',
+        'や': 'ya', 'ゆ': 'yu', 'よ': 'yo',
+        'ら': 'ra', 'り': 'ri', 'る': 'ru', 'れ': 're', 'ろ': 'ro',
+        'わ': 'wa', 'を': 'wo', 'ん': 'n'
+    },
+    'chinese': {
+        '阿': 'a', '伯': 'bo', '茨': 'ci', '德': 'de', '俄': 'e',
+        '佛': 'fo', '哥': 'ge', '海': 'hai', '艾': 'ai', '杰': 'jie',
+        '卡': 'ka', '拉': 'la', '马': 'ma', '娜': 'na', '欧': 'ou',
+        '帕': 'pa', '奇': 'qi', '热': 're', '萨': 'sa', '特': 'te',
+        '维': 'wei', '西': 'xi', '雅': 'ya', '扎': 'zha'
+    },
+    'korean': {
+        '김': 'kim', '이': 'lee', '박': 'park', '정': 'jung', '최': 'choi',
+        '강': 'kang', '조': 'cho', '윤': 'yoon', '장': 'jang', '임': 'lim',
+        '한': 'han', '오': 'oh', '서': 'seo', '신': 'shin', '권': 'kwon',
+        '황': 'hwang', '안': 'ahn', '송': 'song', '전': 'jeon', '홍': 'hong'
+    }
+}
+
+# Proveedores y TLDs dictados en cirílico; se resuelven antes de transliterar
+# porque la transliteración letra a letra no da el nombre real ('яндекс' -> 'yandeks')
+SPOKEN_DOMAIN_NAMES = {
+    'яндекс': 'yandex', 'яндэкс': 'yandex',
+    'мейл': 'mail', 'мэйл': 'mail', 'маил': 'mail', 'майл': 'mail',
+    'гмейл': 'gmail', 'гмэйл': 'gmail', 'гмайл': 'gmail', 'джимейл': 'gmail', 'джимэйл': 'gmail',
+    'рамблер': 'rambler', 'хотмейл': 'hotmail', 'хотмэйл': 'hotmail', 'аутлук': 'outlook',
+    'яху': 'yahoo', 'айклауд': 'icloud', 'инбокс': 'inbox', 'лист': 'list', 'бк': 'bk',
+    'ру': 'ru', 'ком': 'com', 'нет': 'net', 'орг': 'org',
+}
+
+# Scripts que se escriben sin espacios: sus formas habladas no llevan límites de palabra
+_UNSPACED_SCRIPTS = ('CJK', 'HIRAGANA', 'KATAKANA', 'HANGUL')
+
+
+def _is_unspaced(form: str) -> bool:
+    return any(unicodedata.name(char, '').startswith(_UNSPACED_SCRIPTS) for char in form)
+
+
+def _normalize_form(form: str) -> str:
+    return ' '.join(form.lower().split())
+
+
+def _build_spoken_symbols() -> Dict[str, str]:
+    """Forma hablada (en cualquier idioma) -> símbolo"""
+    spoken = {}
+    for symbol, lang_mappings in SYMBOL_MAPPING.items():
+        for forms in lang_mappings.values():
+            for form in forms:
+                spoken.setdefault(_normalize_form(form), symbol)
+    return spoken
+
+
+def _compile_spoken_symbol_pattern(spoken: Dict[str, str]):
+    """
+    Una sola alternancia con todas las formas habladas
+
+    Las formas más largas van primero ('guion bajo' antes que 'guion'). Las
+    formas en alfabetos con espacios sólo coinciden como palabra completa
+    (para que 'at' no se reemplace dentro de 'kate'); las de CJK, kana y
+    hangul coinciden en cualquier posición.
+    """
+    alternatives = []
+    for form in sorted(spoken, key=len, reverse=True):
+        escaped = r'\s+'.join(re.escape(part) for part in form.split())
+        if _is_unspaced(form) or not any(char.isalnum() for char in form):
+            alternatives.append(escaped)
+        else:
+            alternatives.append(rf'(?<!\w){escaped}(?!\w)')
+    return re.compile('|'.join(alternatives), re.IGNORECASE)
+
+
+SPOKEN_SYMBOLS = _build_spoken_symbols()
+SPOKEN_SYMBOL_PATTERN = _compile_spoken_symbol_pattern(SPOKEN_SYMBOLS)
+SPOKEN_DOMAIN_PATTERN = _compile_spoken_symbol_pattern(SPOKEN_DOMAIN_NAMES)
+
+# Tablas de str.translate precalculadas por idioma
+TRANSLITERATION_TABLES = {
+    language: str.maketrans(mapping)
+    for language, mapping in TRANSLITERATION_MAP.items()
+}
+
+
+def rewrite_spoken_symbols(text: str) -> str:
+    """
+    Sustituir en una sola pasada las formas habladas de símbolos por el símbolo
+
+    'juan punto perez arroba gmail dot com' -> 'juan . perez @ gmail . com'
+    """
+    if not text:
+        return ''
+    return SPOKEN_SYMBOL_PATTERN.sub(
+        lambda match: SPOKEN_SYMBOLS[_normalize_form(match.group(0))],
+        text
+    )
+
+
+def rewrite_spoken_domain(domain: str) -> str:
+    """
+    Sustituir los proveedores y TLDs dictados en cirílico por su nombre real
+
+    'яндекс.ру' -> 'yandex.ru'. Pensado para la parte tras la arroba: en el
+    resto del texto 'нет' o 'лист' son palabras normales.
+    """
+    if not domain:
+        return ''
+    return SPOKEN_DOMAIN_PATTERN.sub(
+        lambda match: SPOKEN_DOMAIN_NAMES[_normalize_form(match.group(0))],
+        domain
+    )
+
+
+def transliterate(text: str, language: str) -> str:
+    """
+    Transliterar con la tabla del idioma ('russian', 'japanese', 'chinese', 'korean')
+
+    Los caracteres sin entrada en la tabla se mantienen.
+    """
+    table = TRANSLITERATION_TABLES.get(language)
+    return text.translate(table) if table else text
+
+
+def clean_username(username: str) -> str:
+    """
+    Limpiar y formatear un nombre de usuario
+
+    'Juan Perez.' -> 'juan_perez.': minúsculas, espacios como guiones bajos y
+    sólo letras, números y '_', '.', '-'.
+    """
+    cleaned = "_".join(username.lower().split())
+    return ''.join(c for c in cleaned if c.isalnum() or c in '_.-')
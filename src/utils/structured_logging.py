@@ -0,0 +1,174 @@
+import re
+import json
+import random
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from src.utils.conversation_context import get_current_conversation_id
+from src.utils.tracing import current_trace
+
+# Atributos estándar de LogRecord: el resto son campos estructurados (extra=...)
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+# Cabeceras y claves cuyo valor nunca debe llegar a los logs
+SENSITIVE_KEYS = frozenset([
+    'authorization', 'cookie', 'set-cookie', 'x-api-key', 'api_key', 'apikey',
+    'access_token', 'refresh_token', 'client_secret', 'password', 'token'
+])
+
+_EMAIL_PATTERN = re.compile(r'([A-Za-z0-9._%+-])[A-Za-z0-9._%+-]*@([A-Za-z0-9.-]+\.[A-Za-z]{2,})')
+_BEARER_PATTERN = re.compile(r'(?i)\b(bearer|zoho-oauthtoken)\s+[A-Za-z0-9._~+/=-]+')
+_SECRET_PATTERN = re.compile(
+    r"""(?i)(['"]?(?:%s)['"]?\s*[:=]\s*)(['"]?)[^'",\s}]+""" % '|'.join(re.escape(key) for key in SENSITIVE_KEYS)
+)
+_OPENAI_KEY_PATTERN = re.compile(r'\bsk-[A-Za-z0-9_-]{8,}')
+
+# Tasa por defecto para los eventos de alto volumen (extra={'sample_rate': SAMPLED})
+SAMPLED = 0.01
+
+
+def redact(text: str) -> str:
+    """
+    Ocultar emails, tokens y secretos en un texto de log
+
+    'ana.garcia@empresa.com' -> 'a***@empresa.com', 'Bearer abc...' -> 'Bearer ***'
+    """
+    text = _EMAIL_PATTERN.sub(r'\1***@\2', text)
+    text = _BEARER_PATTERN.sub(r'\1 ***', text)
+    text = _SECRET_PATTERN.sub(r'\1\2***', text)
+    return _OPENAI_KEY_PATTERN.sub('sk-***', text)
+
+
+def redact_headers(headers) -> Dict[str, str]:
+    """Copia de las cabeceras con los valores sensibles sustituidos por '***'"""
+    return {
+        name: '***' if name.lower() in SENSITIVE_KEYS else value
+        for name, value in dict(headers).items()
+    }
+
+
+class LazyJson:
+    """Argumento de log que se serializa a JSON sólo si el registro se emite"""
+
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __str__(self) -> str:
+        return json.dumps(self.value, default=str, ensure_ascii=False)
+
+
+def lazy_json(value) -> LazyJson:
+    """
+    Envolver un payload para loguearlo como JSON de forma perezosa
+
+    logger.debug("Resultado: %s", lazy_json(result)) no cuesta nada con DEBUG
+    desactivado, a diferencia de json.dumps(result).
+    """
+    return LazyJson(value)
+
+
+class RedactionFilter(logging.Filter):
+    """
+    Aplicar redact() al mensaje ya formateado
+
+    Los filtros de handler sólo se ejecutan para registros que superan el
+    nivel, así que el formateo de los argumentos sigue siendo perezoso.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.msg = redact(record.getMessage())
+        record.args = None
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Muestrear los eventos de alto volumen (bucles por candidato, por empresa...)
+
+    Sólo afecta a los registros con extra={'sample_rate': r}: se deja pasar
+    una fracción r de ellos. Los avisos y errores nunca se muestrean.
+    """
+
+    def __init__(self, rng: random.Random = None):
+        super().__init__()
+        self._random = rng or random.Random()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        rate = getattr(record, 'sample_rate', None)
+        if rate is None or record.levelno >= logging.WARNING:
+            return True
+        return self._random.random() < rate
+
+
+class ContextFilter(logging.Filter):
+    """Añadir la conversación y la traza de la petición en curso a cada registro"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.conversation_id = get_current_conversation_id()
+        trace = current_trace()
+        record.trace_id = trace.trace_id if trace is not None else None
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Una línea JSON por registro, con los campos de extra=... como claves propias"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and key != 'sample_rate' and value is not None:
+                entry[key] = value
+        if record.exc_info:
+            entry['exception'] = redact(self.formatException(record.exc_info))
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - [%(conversation_id)s] %(message)s'
+
+
+def parse_module_levels(spec: Optional[str]) -> Dict[str, str]:
+    """
+    Interpretar LOG_LEVELS: 'src.services.external=WARNING,app.controllers=INFO'
+
+    :param spec: Pares módulo=nivel separados por comas
+    :return: Diccionario módulo -> nivel
+    """
+    levels = {}
+    for item in (spec or '').split(','):
+        if '=' not in item:
+            continue
+        module, level = item.split('=', 1)
+        levels[module.strip()] = level.strip().upper()
+    return levels
+
+
+def configure_logging(level: str = 'INFO', module_levels: Dict[str, str] = None, fmt: str = 'text') -> None:
+    """
+    Configurar el logging de la aplicación (un único handler en el logger raíz)
+
+    :param level: Nivel global
+    :param module_levels: Nivel por módulo (prefijo del nombre del logger)
+    :param fmt: 'json' para logs estructurados o 'text' para desarrollo
+    """
+    handler = logging.StreamHandler()
+    handler.addFilter(SamplingFilter())
+    handler.addFilter(ContextFilter())
+    handler.addFilter(RedactionFilter())
+    handler.setFormatter(JsonFormatter() if fmt == 'json' else logging.Formatter(TEXT_FORMAT))
+
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(level.upper())
+
+    for module, module_level in (module_levels or {}).items():
+        logging.getLogger(module).setLevel(module_level)
@@ -0,0 +1,216 @@
+import json
+import time
+import uuid
+import inspect
+import threading
+import contextvars
+from contextlib import contextmanager
+from functools import wraps
+from typing import Dict, List, Optional
+
+# Límite de spans por traza (un bucle con llamadas trazadas no debe crecer sin fin)
+MAX_SPANS_PER_TRACE = 500
+
+_current_trace = contextvars.ContextVar('current_trace', default=None)
+_current_span = contextvars.ContextVar('current_span', default=None)
+
+
+class Span:
+    """Intervalo con nombre dentro de una traza ('gpt.translate_message', 'zoho.request'...)"""
+
+    __slots__ = ('name', 'parent', 'start', 'end', 'attributes', 'error')
+
+    def __init__(self, name: str, parent: Optional['Span'], attributes: Dict):
+        self.name = name
+        self.parent = parent
+        self.start = time.perf_counter()
+        self.end = None
+        self.attributes = attributes
+        self.error = None
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end if self.end is not None else time.perf_counter()
+        return round((end - self.start) * 1000, 2)
+
+
+class Trace:
+    """Spans de una petición, con desglose por etapa para la cabecera Server-Timing"""
+
+    def __init__(self, name: str, attributes: Dict = None):
+        self.trace_id = uuid.uuid4().hex[:16]
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.started_at = time.time()
+        self.start = time.perf_counter()
+        self.end = None
+        self.spans = []
+        self.dropped = 0
+
+    def add(self, span: Span) -> None:
+        if len(self.spans) < MAX_SPANS_PER_TRACE:
+            self.spans.append(span)
+        else:
+            self.dropped += 1
+
+    def finish(self, **attributes) -> None:
+        self.attributes.update(attributes)
+        if self.end is None:
+            self.end = time.perf_counter()
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end if self.end is not None else time.perf_counter()
+        return round((end - self.start) * 1000, 2)
+
+    def breakdown(self) -> Dict[str, Dict]:
+        """
+        Duración y número de spans por nombre
+
+        'app' es el tiempo propio de la petición (fuera de cualquier span de
+        primer nivel: validación, matching, serialización...) y 'total' la
+        duración completa.
+        """
+        stages = {}
+        top_level_ms = 0.0
+        for span in self.spans:
+            stage = stages.setdefault(span.name, {'dur': 0.0, 'count': 0})
+            stage['dur'] += span.duration_ms
+            stage['count'] += 1
+            if span.parent is None:
+                top_level_ms += span.duration_ms
+
+        total_ms = self.duration_ms
+        stages['app'] = {'dur': max(0.0, total_ms - top_level_ms), 'count': 1}
+        stages['total'] = {'dur': total_ms, 'count': 1}
+        return stages
+
+    def server_timing(self) -> str:
+        """Valor de la cabecera Server-Timing ('gpt.translate_message;desc="x3";dur=120.5, ...')"""
+        metrics = []
+        for name, stage in self.breakdown().items():
+            description = f';desc="x{stage["count"]}"' if stage['count'] > 1 else ''
+            metrics.append(f"{name}{description};dur={stage['dur']:.1f}")
+        return ', '.join(metrics)
+
+    def to_dict(self) -> Dict:
+        return {
+            'trace_id': self.trace_id,
+            'name': self.name,
+            'started_at': self.started_at,
+            'duration_ms': self.duration_ms,
+            'attributes': self.attributes,
+            'dropped_spans': self.dropped,
+            'spans': [
+                {
+                    'name': span.name,
+                    'parent': span.parent.name if span.parent else None,
+                    'offset_ms': round((span.start - self.start) * 1000, 2),
+                    'duration_ms': span.duration_ms,
+                    'attributes': span.attributes,
+                    'error': span.error
+                }
+                for span in self.spans
+            ]
+        }
+
+
+class JsonlSpanExporter:
+    """Añadir cada traza terminada como una línea JSON a un fichero local"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, trace: Trace) -> None:
+        line = json.dumps(trace.to_dict(), default=str, ensure_ascii=False)
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as handle:
+                handle.write(line + '\n')
+
+
+def start_trace(name: str, **attributes) -> contextvars.Token:
+    """
+    Empezar una traza en el contexto actual (petición o tarea asíncrona)
+
+    :return: Token para end_trace
+    """
+    return _current_trace.set(Trace(name, attributes))
+
+
+def end_trace(token: contextvars.Token, exporter: JsonlSpanExporter = None, **attributes) -> Optional[Trace]:
+    """
+    Cerrar la traza del contexto actual y, si hay exportador, guardarla
+
+    :return: Traza terminada
+    """
+    trace = _current_trace.get()
+    _current_trace.reset(token)
+    if trace is None:
+        return None
+    trace.finish(**attributes)
+    if exporter is not None:
+        exporter.export(trace)
+    return trace
+
+
+def current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+
+@contextmanager
+def span(name: str, **attributes):
+    """
+    Medir un bloque como span de la traza actual
+
+    Sin traza activa (hilos de fondo, scripts) sólo se mide la duración, que
+    sigue disponible en span.duration_ms.
+    """
+    parent = _current_span.get()
+    current = Span(name, parent, attributes)
+    trace = _current_trace.get()
+    token = _current_span.set(current) if trace is not None else None
+    try:
+        yield current
+    except Exception as e:
+        current.error = type(e).__name__
+        raise
+    finally:
+        current.end = time.perf_counter()
+        if token is not None:
+            _current_span.reset(token)
+            trace.add(current)
+
+
+def traced(name: str):
+    """Decorador: ejecutar la función dentro de un span con el nombre dado"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current_trace.get() is None:
+                return func(*args, **kwargs)
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def trace_methods(prefix: str, exclude: List[str] = ()):
+    """
+    Decorador de clase: un span '<prefix>.<método>' por cada método público
+
+    Se omiten los generadores (*_steps), las corrutinas y los métodos de
+    'exclude'; estos no representan una etapa completa al llamarlos.
+    """
+    def decorator(cls):
+        for attribute, value in list(vars(cls).items()):
+            if (
+                attribute.startswith('_') or attribute in exclude or
+                not inspect.isfunction(value) or
+                inspect.isgeneratorfunction(value) or inspect.iscoroutinefunction(value)
+            ):
+                continue
+            setattr(cls, attribute, traced(f"{prefix}.{attribute}")(value))
+        return cls
+    return decorator
+
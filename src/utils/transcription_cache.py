@@ -0,0 +1,102 @@
+import sys
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+
+class TranscriptionCache:
+    """
+    Caché de transcripciones indexada por el hash del audio, el paso y el preprocesado
+
+    Los reintentos del frontend y los usuarios que reenvían la misma grabación
+    producen exactamente los mismos bytes, así que se reutiliza el resultado
+    sin volver a llamar a Whisper. La caché está acotada por TTL, por número
+    de entradas y por memoria aproximada (tamaño de los textos guardados).
+    """
+
+    def __init__(self, ttl_minutes=30, max_entries=1000, max_bytes=4 * 1024 * 1024):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.ttl = timedelta(minutes=ttl_minutes)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(audio_bytes, step: str, preprocess: bool = False) -> str:
+        """
+        Clave de caché: sha256 del audio, el paso de procesamiento y si se
+        preprocesó (el texto y las estadísticas de 'preprocessing' pueden variar)
+        """
+        return f"{hashlib.sha256(audio_bytes).hexdigest()}:{step}:{'pre' if preprocess else 'raw'}"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Obtener un resultado vigente
+
+        :return: Copia del resultado guardado o None (cuenta como acierto o fallo)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry['expires_at'] <= datetime.now():
+                self._remove(key)
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(entry['value'])
+
+    def set(self, key: str, value: Dict) -> None:
+        """Guardar un resultado (sólo los que han tenido éxito)"""
+        size = self._estimate_size(value)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = {
+                'value': dict(value),
+                'size': size,
+                'expires_at': datetime.now() + self.ttl
+            }
+            self._total_bytes += size
+
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes
+            ):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+
+    def stats(self) -> Dict:
+        """Aciertos, fallos, tasa de aciertos y ocupación"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'entries': len(self._entries),
+                'bytes': self._total_bytes,
+                'max_bytes': self.max_bytes
+            }
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self._total_bytes -= entry['size']
+
+    @staticmethod
+    def _estimate_size(value: Dict) -> int:
+        return sys.getsizeof(value) + sum(
+            sys.getsizeof(item_key) + sys.getsizeof(item_value)
+            for item_key, item_value in value.items()
+        )
@@ -0,0 +1,26 @@
+import unittest
+from unittest import mock
+
+from src.handlers.enhanced_username_processor import EnhancedUsernameProcessor
+
+
+class LanguageDetectionTest(unittest.TestCase):
+    """Idiomas que comparten script: gana el que tiene letras propias en el texto"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.processor = EnhancedUsernameProcessor(client=mock.Mock())
+
+    def test_persian_letters_win_over_arabic_block(self):
+        self.assertEqual(self.processor._detect_language_enhanced('فارسی گ'), 'fa')
+        self.assertEqual(self.processor._detect_language_enhanced('علی نقطه رضایی'), 'fa')
+
+    def test_arabic_without_persian_letters(self):
+        self.assertEqual(self.processor._detect_language_enhanced('محمد نقطة أحمد'), 'ar')
+
+    def test_other_scripts_unchanged(self):
+        self.assertEqual(self.processor._detect_language_enhanced('דוד נקודה כהן'), 'he')
+
+
+if __name__ == '__main__':
+    unittest.main()
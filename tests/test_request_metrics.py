@@ -0,0 +1,51 @@
+import unittest
+from unittest import mock
+
+from app import factory
+from src.utils.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_FLIGHT
+
+ROUTE = '/api/controllers/stats'
+
+
+def route_count(route: str) -> int:
+    """Peticiones observadas en el histograma para una ruta (cualquier método y estado)"""
+    labelnames = HTTP_REQUEST_DURATION.labelnames
+    return sum(
+        series['count']
+        for key, series in HTTP_REQUEST_DURATION.values().items()
+        if dict(zip(labelnames, key))['route'] == route
+    )
+
+
+class RequestMetricsTest(unittest.TestCase):
+    """Las métricas HTTP de la app no deben depender de los hooks de cada blueprint"""
+
+    def setUp(self):
+        # Servicios externos fuera: sólo interesan los hooks de la app y del blueprint
+        services = ['test_zoho_token', 'ZohoService', 'VoiceHandler', 'ChatGPTHelper',
+                    'VoiceJobQueue', 'MetricsService', 'ServerMonitoringService']
+        patchers = [mock.patch.object(factory, name) for name in services]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.client = factory.create_app().test_client()
+
+    def test_conversation_route_is_recorded(self):
+        in_flight = HTTP_REQUESTS_IN_FLIGHT.values().get(('wsgi',), 0)
+        observed = route_count(ROUTE)
+
+        response = self.client.get(ROUTE)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(HTTP_REQUESTS_IN_FLIGHT.values().get(('wsgi',), 0), in_flight)
+        self.assertEqual(route_count(ROUTE), observed + 1)
+
+    def test_first_request_timing_is_kept(self):
+        self.client.get(ROUTE)
+        stats = self.client.get(ROUTE).get_json()['controllers']
+
+        self.assertIn('conversation.controller_stats', stats['first_requests_ms'])
+
+
+if __name__ == '__main__':
+    unittest.main()